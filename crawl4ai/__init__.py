@@ -3,7 +3,7 @@ import warnings
 
 from .async_webcrawler import AsyncWebCrawler, CacheMode
 # MODIFIED: Add SeedingConfig and VirtualScrollConfig here
-from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, MatchMode
+from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, ScreenshotConfig, PreflightConfig, MatchMode
 
 from .content_scraping_strategy import (
     ContentScrapingStrategy,
@@ -28,22 +28,27 @@ from .extraction_strategy import (
     RegexExtractionStrategy
 )
 from .chunking_strategy import ChunkingStrategy, RegexChunking
-from .markdown_generation_strategy import DefaultMarkdownGenerator
+from .markdown_generation_strategy import DefaultMarkdownGenerator, FastMarkdownGenerator
 from .table_extraction import (
     TableExtractionStrategy,
     DefaultTableExtraction,
     NoTableExtraction,
     LLMTableExtraction,
 )
+from .template_cache import SiteTemplateCache
+from .url_canonicalizer import URLCanonicalizer, canonicalize_url
 from .content_filter_strategy import (
     PruningContentFilter,
     BM25ContentFilter,
+    BM25Context,
     LLMContentFilter,
     RelevantContentFilter,
 )
 from .models import CrawlResult, MarkdownGenerationResult, DisplayMode
 from .components.crawler_monitor import CrawlerMonitor
 from .link_preview import LinkPreview
+from .result_sinks import ResultSink, JSONLSink, ParquetSink, FileTreeSink
+from .llm_cache import LLMResponseCache, SQLiteLLMCache, set_llm_cache
 from .async_dispatcher import (
     MemoryAdaptiveDispatcher,
     SemaphoreDispatcher,
@@ -162,14 +167,23 @@ __all__ = [
     "ChunkingStrategy",
     "RegexChunking",
     "DefaultMarkdownGenerator",
+    "FastMarkdownGenerator",
     "TableExtractionStrategy",
     "DefaultTableExtraction",
     "NoTableExtraction",
     "RelevantContentFilter",
     "PruningContentFilter",
     "BM25ContentFilter",
+    "BM25Context",
     "LLMContentFilter",
     "BaseDispatcher",
+    "ResultSink",
+    "JSONLSink",
+    "ParquetSink",
+    "FileTreeSink",
+    "LLMResponseCache",
+    "SQLiteLLMCache",
+    "set_llm_cache",
     "MemoryAdaptiveDispatcher",
     "SemaphoreDispatcher",
     "RateLimiter",
@@ -194,7 +208,12 @@ __all__ = [
     "BrowserAdapter",
     "PlaywrightAdapter", 
     "UndetectedAdapter",
-    "LinkPreviewConfig"
+    "LinkPreviewConfig",
+    "ScreenshotConfig",
+    "PreflightConfig",
+    "SiteTemplateCache",
+    "URLCanonicalizer",
+    "canonicalize_url",
 ]
 
 
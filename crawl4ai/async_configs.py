@@ -21,6 +21,9 @@ from .markdown_generation_strategy import MarkdownGenerationStrategy, DefaultMar
 from .content_scraping_strategy import ContentScrapingStrategy, LXMLWebScrapingStrategy
 from .deep_crawling import DeepCrawlStrategy
 from .table_extraction import TableExtractionStrategy, DefaultTableExtraction
+from .template_cache import SiteTemplateCache
+from .url_canonicalizer import URLCanonicalizer
+from .models import PROJECTABLE_FIELDS
 
 from .cache_context import CacheMode
 from .proxy_strategy import ProxyRotationStrategy
@@ -393,6 +396,12 @@ class BrowserConfig:
                            Default: [].
         enable_stealth (bool): If True, applies playwright-stealth to bypass basic bot detection.
                               Cannot be used with use_undetected browser mode. Default: False.
+        crash_recovery (bool): If True, restart the browser transparently when it disconnects or crashes and
+                               re-create its contexts, so dispatchers can requeue the affected URLs.
+                               Default: False.
+        max_browser_restarts (int): Maximum number of crash restarts allowed within browser_restart_window.
+                                    Default: 3.
+        browser_restart_window (float): Sliding window in seconds for max_browser_restarts. Default: 300.0.
     """
 
     def __init__(
@@ -434,6 +443,9 @@ class BrowserConfig:
         debugging_port: int = 9222,
         host: str = "localhost",
         enable_stealth: bool = False,
+        crash_recovery: bool = False,
+        max_browser_restarts: int = 3,
+        browser_restart_window: float = 300.0,
     ):
         self.browser_type = browser_type
         self.headless = headless 
@@ -479,6 +491,9 @@ class BrowserConfig:
         self.debugging_port = debugging_port
         self.host = host
         self.enable_stealth = enable_stealth
+        self.crash_recovery = crash_recovery
+        self.max_browser_restarts = max_browser_restarts
+        self.browser_restart_window = browser_restart_window
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -554,6 +569,9 @@ class BrowserConfig:
             debugging_port=kwargs.get("debugging_port", 9222),
             host=kwargs.get("host", "localhost"),
             enable_stealth=kwargs.get("enable_stealth", False),
+            crash_recovery=kwargs.get("crash_recovery", False),
+            max_browser_restarts=kwargs.get("max_browser_restarts", 3),
+            browser_restart_window=kwargs.get("browser_restart_window", 300.0),
         )
 
     def to_dict(self):
@@ -589,6 +607,9 @@ class BrowserConfig:
             "debugging_port": self.debugging_port,
             "host": self.host,
             "enable_stealth": self.enable_stealth,
+            "crash_recovery": self.crash_recovery,
+            "max_browser_restarts": self.max_browser_restarts,
+            "browser_restart_window": self.browser_restart_window,
         }
 
                 
@@ -760,6 +781,181 @@ class LinkPreviewConfig:
         return LinkPreviewConfig.from_dict(config_dict)
 
 
+class ScreenshotConfig:
+    """Configuration for CDP-based full page screenshots.
+
+    When set on CrawlerRunConfig, the screenshot is captured in a single
+    `Page.captureScreenshot` call with `captureBeyondViewport`, encoded by
+    Chromium itself (JPEG/WebP/PNG), and never decoded into a bitmap in Python.
+    """
+
+    def __init__(
+        self,
+        format: str = "jpeg",
+        quality: int = 80,
+        scale: float = 1.0,
+        max_height: int = 16384,
+        output: str = "base64",
+        output_dir: Optional[str] = None,
+    ):
+        """
+        Initialize screenshot configuration.
+
+        Args:
+            format: Image format, one of "jpeg", "webp" or "png"
+            quality: Compression quality 0-100 (ignored for png)
+            scale: Scale factor applied to the captured page
+            max_height: Maximum output height in pixels. Taller pages are scaled
+                        down to fit instead of being captured in segments
+            output: How the screenshot is returned:
+                - "base64": base64 `str` in result.screenshot (default, backward compatible)
+                - "bytes": raw image `bytes` in result.screenshot
+                - "file": written to disk, path in result.screenshot_path
+            output_dir: Directory for "file" output. Defaults to the screenshots
+                        folder of the Crawl4AI content store
+        """
+        self.format = format
+        self.quality = quality
+        self.scale = scale
+        self.max_height = max_height
+        self.output = output
+        self.output_dir = output_dir
+
+        # Validation
+        if format not in ("jpeg", "webp", "png"):
+            raise ValueError("format must be 'jpeg', 'webp' or 'png'")
+        if not (0 <= quality <= 100):
+            raise ValueError("quality must be between 0 and 100")
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        if max_height <= 0:
+            raise ValueError("max_height must be positive")
+        if output not in ("base64", "bytes", "file"):
+            raise ValueError("output must be 'base64', 'bytes' or 'file'")
+
+    @staticmethod
+    def from_dict(config_dict: Dict[str, Any]) -> "ScreenshotConfig":
+        """Create ScreenshotConfig from dictionary."""
+        if not config_dict:
+            return None
+        return ScreenshotConfig(**config_dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "format": self.format,
+            "quality": self.quality,
+            "scale": self.scale,
+            "max_height": self.max_height,
+            "output": self.output,
+            "output_dir": self.output_dir,
+        }
+
+    def clone(self, **kwargs) -> "ScreenshotConfig":
+        """Create a copy with updated values."""
+        config_dict = self.to_dict()
+        config_dict.update(kwargs)
+        return ScreenshotConfig.from_dict(config_dict)
+
+
+class PreflightConfig:
+    """Configuration for the content-type preflight that runs before the crawler strategy.
+
+    URLs are classified into a content category (html, pdf, image, video, audio,
+    archive, feed, json, text, binary or unknown) from their extension, from rules
+    learned per host, or from a cheap network probe. Each category is then routed
+    to an action, so non-HTML content never ties up a browser page.
+    """
+
+    DEFAULT_ROUTES = {
+        "html": "browser",
+        "pdf": "pdf",
+        "image": "download",
+        "video": "skip",
+        "audio": "skip",
+        "archive": "download",
+        "binary": "download",
+        "feed": "browser",
+        "json": "browser",
+        "text": "browser",
+        "unknown": "browser",
+    }
+    ACTIONS = ("browser", "download", "pdf", "skip")
+
+    def __init__(
+        self,
+        probe: Optional[str] = "head",
+        routes: Optional[Dict[str, str]] = None,
+        use_extensions: bool = True,
+        host_rule_min_samples: int = 3,
+        timeout: float = 10.0,
+        download_dir: Optional[str] = None,
+        max_download_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize preflight configuration.
+
+        Args:
+            probe: Network probe for URLs the extension and host rules cannot classify:
+                - "head": HEAD request, falling back to a ranged GET when the server
+                          rejects HEAD or omits Content-Type (default)
+                - "range": GET of the first bytes only, sniffed for magic numbers
+                - None: never touch the network, unknown URLs use the "unknown" route
+            routes: Category -> action overrides merged over DEFAULT_ROUTES.
+                    Actions are "browser", "download", "pdf" and "skip"
+            use_extensions: Classify URLs with a well-known file extension without a probe
+            host_rule_min_samples: Consistent probe results needed before a host's rule
+                                   for an extension is trusted and probing stops
+            timeout: Timeout in seconds for probes and downloads
+            download_dir: Directory for the "download" action. Defaults to the
+                          downloads folder of the Crawl4AI content store
+            max_download_bytes: Abort downloads larger than this. None means no limit
+        """
+        self.probe = probe
+        self.routes = {**self.DEFAULT_ROUTES, **(routes or {})}
+        self.use_extensions = use_extensions
+        self.host_rule_min_samples = host_rule_min_samples
+        self.timeout = timeout
+        self.download_dir = download_dir
+        self.max_download_bytes = max_download_bytes
+
+        # Validation
+        if probe not in ("head", "range", None):
+            raise ValueError("probe must be 'head', 'range' or None")
+        for category, action in self.routes.items():
+            if action not in self.ACTIONS:
+                raise ValueError(
+                    f"Invalid action '{action}' for '{category}', must be one of {self.ACTIONS}"
+                )
+        if host_rule_min_samples < 1:
+            raise ValueError("host_rule_min_samples must be at least 1")
+
+    @staticmethod
+    def from_dict(config_dict: Dict[str, Any]) -> "PreflightConfig":
+        """Create PreflightConfig from dictionary."""
+        if not config_dict:
+            return None
+        return PreflightConfig(**config_dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format."""
+        return {
+            "probe": self.probe,
+            "routes": dict(self.routes),
+            "use_extensions": self.use_extensions,
+            "host_rule_min_samples": self.host_rule_min_samples,
+            "timeout": self.timeout,
+            "download_dir": self.download_dir,
+            "max_download_bytes": self.max_download_bytes,
+        }
+
+    def clone(self, **kwargs) -> "PreflightConfig":
+        """Create a copy with updated values."""
+        config_dict = self.to_dict()
+        config_dict.update(kwargs)
+        return PreflightConfig.from_dict(config_dict)
+
+
 class HTTPCrawlerConfig:
     """HTTP-specific crawler configuration"""
 
@@ -769,6 +965,9 @@ class HTTPCrawlerConfig:
     json: Optional[Dict[str, Any]] = None
     follow_redirects: bool = True
     verify_ssl: bool = True
+    max_body_bytes: Optional[int] = None
+    max_body_action: str = "abort"
+    stream_parse: bool = False
 
     def __init__(
         self,
@@ -778,6 +977,9 @@ class HTTPCrawlerConfig:
         json: Optional[Dict[str, Any]] = None,
         follow_redirects: bool = True,
         verify_ssl: bool = True,
+        max_body_bytes: Optional[int] = None,
+        max_body_action: str = "abort",
+        stream_parse: bool = False,
     ):
         self.method = method
         self.headers = headers
@@ -785,6 +987,14 @@ class HTTPCrawlerConfig:
         self.json = json
         self.follow_redirects = follow_redirects
         self.verify_ssl = verify_ssl
+        # Cap on the decoded response body. "abort" raises, "truncate" keeps the first max_body_bytes
+        self.max_body_bytes = max_body_bytes
+        self.max_body_action = max_body_action
+        if max_body_action not in ("abort", "truncate"):
+            raise ValueError("max_body_action must be 'abort' or 'truncate'")
+        # Feed body chunks into an incremental lxml parser as they arrive and hand the
+        # finished tree to the scraping strategy, instead of parsing the string afterwards
+        self.stream_parse = stream_parse
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "HTTPCrawlerConfig":
@@ -795,6 +1005,9 @@ class HTTPCrawlerConfig:
             json=kwargs.get("json"),
             follow_redirects=kwargs.get("follow_redirects", True),
             verify_ssl=kwargs.get("verify_ssl", True),
+            max_body_bytes=kwargs.get("max_body_bytes"),
+            max_body_action=kwargs.get("max_body_action", "abort"),
+            stream_parse=kwargs.get("stream_parse", False),
         )
 
     def to_dict(self):
@@ -805,6 +1018,9 @@ class HTTPCrawlerConfig:
             "json": self.json,
             "follow_redirects": self.follow_redirects,
             "verify_ssl": self.verify_ssl,
+            "max_body_bytes": self.max_body_bytes,
+            "max_body_action": self.max_body_action,
+            "stream_parse": self.stream_parse,
         }
 
     def clone(self, **kwargs):
@@ -882,6 +1098,10 @@ class CrawlerRunConfig():
                                       Default: [].
         remove_forms (bool): If True, remove all `<form>` elements from the HTML.
                              Default: False.
+        template_cache (SiteTemplateCache or None): Learns the navigation, footers and other subtrees each
+                                                    host repeats on its pages and strips them from later
+                                                    pages before scraping. Share one instance across a crawl.
+                                                    Default: None.
         prettiify (bool): If True, apply `fast_format_html` to produce prettified HTML output.
                           Default: False.
         parser_type (str): Type of parser to use for HTML parsing.
@@ -933,6 +1153,13 @@ class CrawlerRunConfig():
                                 Default: False.
         delay_before_return_html (float): Delay in seconds before retrieving final HTML.
                                           Default: 0.1.
+        wait_for_quiescence (bool): If True, replace the fixed delay_before_return_html sleep with an
+                                    in-page wait that returns as soon as the DOM has stopped mutating and
+                                    no fetch/XHR requests are in flight for quiescence_idle_ms.
+                                    Default: False.
+        quiescence_idle_ms (int): Quiet period in ms that counts as "settled" when wait_for_quiescence is True.
+                                  Default: 500.
+        quiescence_timeout (int): Hard cap in ms for the quiescence wait. Default: 10000.
         mean_delay (float): Mean base delay between requests when calling arun_many.
                             Default: 0.1.
         max_range (float): Max random additional delay range for requests in arun_many.
@@ -953,6 +1180,15 @@ class CrawlerRunConfig():
                               Default: 0.2.
         max_scroll_steps (Optional[int]): Maximum number of scroll steps to perform during full page scan.
                                          If None, scrolls until the entire page is loaded. Default: None.
+        scan_mode (str): How scan_full_page scrolls the page. "steps" scrolls one viewport per round trip
+                         and sleeps scroll_delay between steps. "observer" runs the whole scan in a single
+                         in-page call and advances as soon as lazy media brought into view (tracked with an
+                         IntersectionObserver) has fired its load/error events.
+                         Default: "steps".
+        scan_step_timeout (float): Upper bound in seconds to wait for lazy content after each step in
+                                   "observer" mode. Default: 2.0.
+        scan_growth_budget (Optional[int]): Stop an "observer" scan once the document has grown by more than
+                                            this many pixels. Guards against infinite feeds. Default: None.
         process_iframes (bool): If True, attempts to process and inline iframe content.
                                 Default: False.
         remove_overlay_elements (bool): If True, remove overlays/popups before extracting HTML.
@@ -973,6 +1209,9 @@ class CrawlerRunConfig():
                                              Default: None.
         screenshot_height_threshold (int): Threshold for page height to decide screenshot strategy.
                                            Default: SCREENSHOT_HEIGHT_TRESHOLD (from config, e.g. 20000).
+        screenshot_config (ScreenshotConfig or dict or None): Capture the screenshot through CDP in the
+                                                             given format/scale/quality instead of the
+                                                             segment-and-stitch path. Default: None.
         pdf (bool): Whether to generate a PDF of the page.
                     Default: False.
         image_description_min_word_threshold (int): Minimum words for image description extraction.
@@ -1008,6 +1247,9 @@ class CrawlerRunConfig():
         score_links (bool): If True, calculate intrinsic quality scores for all links using URL structure,
                            text quality, and contextual relevance metrics. Separate from link_preview_config.
                            Default: False.
+        url_canonicalizer (URLCanonicalizer or None): Resolves and canonicalizes the links found on a page.
+                                                      Deep crawl strategies should be given the same instance.
+                                                      Default: None (the shared default canonicalizer).
 
         # Debugging and Logging Parameters
         verbose (bool): Enable verbose logging.
@@ -1026,8 +1268,23 @@ class CrawlerRunConfig():
         stream (bool): If True, enables streaming of crawled URLs as they are processed when used with arun_many.
                       Default: False.
 
+        # Result Parameters
+        result_fields (list of str or None): CrawlResult fields to return, e.g. ["markdown", "links"].
+                                             Others are left empty, and are not produced when nothing
+                                             else needs them (markdown generation, link previews ...).
+                                             url, success, status_code, error_message and the other
+                                             status fields are always kept, and deep crawls always keep
+                                             links. Results are still cached in full. Default: None (all).
+        spill_threshold (int or None): Write html, cleaned_html, screenshot, pdf and mhtml values larger
+                                       than this many bytes to disk and keep a file-backed handle in the
+                                       result, see CrawlResult.spilled(). Default: None (keep in memory).
+        spill_dir (str or None): Directory for spilled fields. Default: None (the system temp directory).
+
         check_robots_txt (bool): Whether to check robots.txt rules before crawling. Default: False
                                  Default: False.
+        preflight_config (PreflightConfig or dict or None): Classify http(s) URLs by content type before
+                                                           crawling and route PDFs, images, archives etc.
+                                                           away from the browser. Default: None.
         user_agent (str): Custom User-Agent string to use.
                           Default: None.
         user_agent_mode (str or None): Mode for generating the user agent (e.g., "random"). If None, use the provided user_agent as-is.
@@ -1059,6 +1316,7 @@ class CrawlerRunConfig():
         keep_data_attributes: bool = False,
         keep_attrs: list = None,
         remove_forms: bool = False,
+        template_cache: Optional[SiteTemplateCache] = None,
         prettiify: bool = False,
         parser_type: str = "lxml",
         scraping_strategy: ContentScrapingStrategy = None,
@@ -1085,6 +1343,9 @@ class CrawlerRunConfig():
         wait_for_timeout: int = None,
         wait_for_images: bool = False,
         delay_before_return_html: float = 0.1,
+        wait_for_quiescence: bool = False,
+        quiescence_idle_ms: int = 500,
+        quiescence_timeout: int = 10000,
         mean_delay: float = 0.1,
         max_range: float = 0.3,
         semaphore_count: int = 5,
@@ -1096,6 +1357,9 @@ class CrawlerRunConfig():
         scan_full_page: bool = False,
         scroll_delay: float = 0.2,
         max_scroll_steps: Optional[int] = None,
+        scan_mode: str = "steps",
+        scan_step_timeout: float = 2.0,
+        scan_growth_budget: Optional[int] = None,
         process_iframes: bool = False,
         remove_overlay_elements: bool = False,
         simulate_user: bool = False,
@@ -1106,6 +1370,7 @@ class CrawlerRunConfig():
         screenshot: bool = False,
         screenshot_wait_for: float = None,
         screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        screenshot_config: Union[ScreenshotConfig, Dict[str, Any]] = None,
         pdf: bool = False,
         capture_mhtml: bool = False,
         image_description_min_word_threshold: int = IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
@@ -1121,6 +1386,7 @@ class CrawlerRunConfig():
         exclude_domains: list = None,
         exclude_internal_links: bool = False,
         score_links: bool = False,
+        url_canonicalizer: Optional[URLCanonicalizer] = None,
         # Debugging and Logging Parameters
         verbose: bool = True,
         log_console: bool = False,
@@ -1131,7 +1397,12 @@ class CrawlerRunConfig():
         method: str = "GET",
         stream: bool = False,
         url: str = None,
+        # Result Parameters
+        result_fields: Optional[List[str]] = None,
+        spill_threshold: Optional[int] = None,
+        spill_dir: Optional[str] = None,
         check_robots_txt: bool = False,
+        preflight_config: Union[PreflightConfig, Dict[str, Any]] = None,
         user_agent: str = None,
         user_agent_mode: str = None,
         user_agent_generator_config: dict = {},
@@ -1163,6 +1434,7 @@ class CrawlerRunConfig():
         self.keep_data_attributes = keep_data_attributes
         self.keep_attrs = keep_attrs or []
         self.remove_forms = remove_forms
+        self.template_cache = template_cache
         self.prettiify = prettiify
         self.parser_type = parser_type
         self.scraping_strategy = scraping_strategy or LXMLWebScrapingStrategy()
@@ -1198,6 +1470,9 @@ class CrawlerRunConfig():
         self.wait_for_timeout = wait_for_timeout
         self.wait_for_images = wait_for_images
         self.delay_before_return_html = delay_before_return_html
+        self.wait_for_quiescence = wait_for_quiescence
+        self.quiescence_idle_ms = quiescence_idle_ms
+        self.quiescence_timeout = quiescence_timeout
         self.mean_delay = mean_delay
         self.max_range = max_range
         self.semaphore_count = semaphore_count
@@ -1210,6 +1485,11 @@ class CrawlerRunConfig():
         self.scan_full_page = scan_full_page
         self.scroll_delay = scroll_delay
         self.max_scroll_steps = max_scroll_steps
+        if scan_mode not in ("steps", "observer"):
+            raise ValueError("scan_mode must be 'steps' or 'observer'")
+        self.scan_mode = scan_mode
+        self.scan_step_timeout = scan_step_timeout
+        self.scan_growth_budget = scan_growth_budget
         self.process_iframes = process_iframes
         self.remove_overlay_elements = remove_overlay_elements
         self.simulate_user = simulate_user
@@ -1221,6 +1501,14 @@ class CrawlerRunConfig():
         self.screenshot = screenshot
         self.screenshot_wait_for = screenshot_wait_for
         self.screenshot_height_threshold = screenshot_height_threshold
+        if screenshot_config is None:
+            self.screenshot_config = None
+        elif isinstance(screenshot_config, ScreenshotConfig):
+            self.screenshot_config = screenshot_config
+        elif isinstance(screenshot_config, dict):
+            self.screenshot_config = ScreenshotConfig.from_dict(screenshot_config)
+        else:
+            raise ValueError("screenshot_config must be ScreenshotConfig object or dict")
         self.pdf = pdf
         self.capture_mhtml = capture_mhtml
         self.image_description_min_word_threshold = image_description_min_word_threshold
@@ -1244,6 +1532,7 @@ class CrawlerRunConfig():
         self.exclude_domains = exclude_domains or []
         self.exclude_internal_links = exclude_internal_links
         self.score_links = score_links
+        self.url_canonicalizer = url_canonicalizer
 
         # Debugging and Logging Parameters
         self.verbose = verbose
@@ -1257,9 +1546,30 @@ class CrawlerRunConfig():
         self.stream = stream
         self.method = method
 
+        # Result Parameters
+        if result_fields is not None:
+            unknown = set(result_fields) - PROJECTABLE_FIELDS
+            if unknown:
+                raise ValueError(
+                    f"Unknown result_fields {sorted(unknown)}, choose from {sorted(PROJECTABLE_FIELDS)}"
+                )
+        self.result_fields = result_fields
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+
         # Robots.txt Handling Parameters
         self.check_robots_txt = check_robots_txt
 
+        # Content-type preflight
+        if preflight_config is None:
+            self.preflight_config = None
+        elif isinstance(preflight_config, PreflightConfig):
+            self.preflight_config = preflight_config
+        elif isinstance(preflight_config, dict):
+            self.preflight_config = PreflightConfig.from_dict(preflight_config)
+        else:
+            raise ValueError("preflight_config must be PreflightConfig object or dict")
+
         # User Agent Parameters
         self.user_agent = user_agent
         self.user_agent_mode = user_agent_mode
@@ -1447,6 +1757,7 @@ class CrawlerRunConfig():
             keep_data_attributes=kwargs.get("keep_data_attributes", False),
             keep_attrs=kwargs.get("keep_attrs", []),
             remove_forms=kwargs.get("remove_forms", False),
+            template_cache=kwargs.get("template_cache"),
             prettiify=kwargs.get("prettiify", False),
             parser_type=kwargs.get("parser_type", "lxml"),
             scraping_strategy=kwargs.get("scraping_strategy"),
@@ -1473,6 +1784,9 @@ class CrawlerRunConfig():
             wait_for_timeout=kwargs.get("wait_for_timeout"),
             wait_for_images=kwargs.get("wait_for_images", False),
             delay_before_return_html=kwargs.get("delay_before_return_html", 0.1),
+            wait_for_quiescence=kwargs.get("wait_for_quiescence", False),
+            quiescence_idle_ms=kwargs.get("quiescence_idle_ms", 500),
+            quiescence_timeout=kwargs.get("quiescence_timeout", 10000),
             mean_delay=kwargs.get("mean_delay", 0.1),
             max_range=kwargs.get("max_range", 0.3),
             semaphore_count=kwargs.get("semaphore_count", 5),
@@ -1483,6 +1797,9 @@ class CrawlerRunConfig():
             scan_full_page=kwargs.get("scan_full_page", False),
             scroll_delay=kwargs.get("scroll_delay", 0.2),
             max_scroll_steps=kwargs.get("max_scroll_steps"),
+            scan_mode=kwargs.get("scan_mode", "steps"),
+            scan_step_timeout=kwargs.get("scan_step_timeout", 2.0),
+            scan_growth_budget=kwargs.get("scan_growth_budget"),
             process_iframes=kwargs.get("process_iframes", False),
             remove_overlay_elements=kwargs.get("remove_overlay_elements", False),
             simulate_user=kwargs.get("simulate_user", False),
@@ -1495,6 +1812,7 @@ class CrawlerRunConfig():
             screenshot_height_threshold=kwargs.get(
                 "screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD
             ),
+            screenshot_config=kwargs.get("screenshot_config"),
             pdf=kwargs.get("pdf", False),
             capture_mhtml=kwargs.get("capture_mhtml", False),
             image_description_min_word_threshold=kwargs.get(
@@ -1517,6 +1835,7 @@ class CrawlerRunConfig():
             exclude_domains=kwargs.get("exclude_domains", []),
             exclude_internal_links=kwargs.get("exclude_internal_links", False),
             score_links=kwargs.get("score_links", False),
+            url_canonicalizer=kwargs.get("url_canonicalizer"),
             # Debugging and Logging Parameters
             verbose=kwargs.get("verbose", True),
             log_console=kwargs.get("log_console", False),
@@ -1526,7 +1845,12 @@ class CrawlerRunConfig():
             # Connection Parameters
             method=kwargs.get("method", "GET"),
             stream=kwargs.get("stream", False),
+            # Result Parameters
+            result_fields=kwargs.get("result_fields"),
+            spill_threshold=kwargs.get("spill_threshold"),
+            spill_dir=kwargs.get("spill_dir"),
             check_robots_txt=kwargs.get("check_robots_txt", False),
+            preflight_config=kwargs.get("preflight_config"),
             user_agent=kwargs.get("user_agent"),
             user_agent_mode=kwargs.get("user_agent_mode"),
             user_agent_generator_config=kwargs.get("user_agent_generator_config", {}),
@@ -1569,6 +1893,7 @@ class CrawlerRunConfig():
             "keep_data_attributes": self.keep_data_attributes,
             "keep_attrs": self.keep_attrs,
             "remove_forms": self.remove_forms,
+            "template_cache": self.template_cache,
             "prettiify": self.prettiify,
             "parser_type": self.parser_type,
             "scraping_strategy": self.scraping_strategy,
@@ -1591,6 +1916,9 @@ class CrawlerRunConfig():
             "wait_for_timeout": self.wait_for_timeout,
             "wait_for_images": self.wait_for_images,
             "delay_before_return_html": self.delay_before_return_html,
+            "wait_for_quiescence": self.wait_for_quiescence,
+            "quiescence_idle_ms": self.quiescence_idle_ms,
+            "quiescence_timeout": self.quiescence_timeout,
             "mean_delay": self.mean_delay,
             "max_range": self.max_range,
             "semaphore_count": self.semaphore_count,
@@ -1600,6 +1928,9 @@ class CrawlerRunConfig():
             "scan_full_page": self.scan_full_page,
             "scroll_delay": self.scroll_delay,
             "max_scroll_steps": self.max_scroll_steps,
+            "scan_mode": self.scan_mode,
+            "scan_step_timeout": self.scan_step_timeout,
+            "scan_growth_budget": self.scan_growth_budget,
             "process_iframes": self.process_iframes,
             "remove_overlay_elements": self.remove_overlay_elements,
             "simulate_user": self.simulate_user,
@@ -1609,6 +1940,7 @@ class CrawlerRunConfig():
             "screenshot": self.screenshot,
             "screenshot_wait_for": self.screenshot_wait_for,
             "screenshot_height_threshold": self.screenshot_height_threshold,
+            "screenshot_config": self.screenshot_config.to_dict() if self.screenshot_config else None,
             "pdf": self.pdf,
             "capture_mhtml": self.capture_mhtml,
             "image_description_min_word_threshold": self.image_description_min_word_threshold,
@@ -1623,13 +1955,18 @@ class CrawlerRunConfig():
             "exclude_domains": self.exclude_domains,
             "exclude_internal_links": self.exclude_internal_links,
             "score_links": self.score_links,
+            "url_canonicalizer": self.url_canonicalizer,
             "verbose": self.verbose,
             "log_console": self.log_console,
             "capture_network_requests": self.capture_network_requests,
             "capture_console_messages": self.capture_console_messages,
             "method": self.method,
             "stream": self.stream,
+            "result_fields": self.result_fields,
+            "spill_threshold": self.spill_threshold,
+            "spill_dir": self.spill_dir,
             "check_robots_txt": self.check_robots_txt,
+            "preflight_config": self.preflight_config.to_dict() if self.preflight_config else None,
             "user_agent": self.user_agent,
             "user_agent_mode": self.user_agent_mode,
             "user_agent_generator_config": self.user_agent_generator_config,
@@ -1680,8 +2017,14 @@ class LLMConfig:
         presence_penalty: Optional[float] = None,
         stop: Optional[List[str]] = None,
         n: Optional[int] = None,    
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
     ):
-        """Configuaration class for LLM provider and API token."""
+        """Configuaration class for LLM provider and API token.
+
+        requests_per_minute and tokens_per_minute set the provider's process-wide
+        budget, shared by every call to it (see crawl4ai.llm_scheduler).
+        """
         self.provider = provider
         if api_token and not api_token.startswith("env:"):
             self.api_token = api_token
@@ -1708,6 +2051,8 @@ class LLMConfig:
         self.presence_penalty = presence_penalty
         self.stop = stop
         self.n = n
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "LLMConfig":
@@ -1721,7 +2066,9 @@ class LLMConfig:
             frequency_penalty=kwargs.get("frequency_penalty"),
             presence_penalty=kwargs.get("presence_penalty"),
             stop=kwargs.get("stop"),
-            n=kwargs.get("n")
+            n=kwargs.get("n"),
+            requests_per_minute=kwargs.get("requests_per_minute"),
+            tokens_per_minute=kwargs.get("tokens_per_minute"),
         )
 
     def to_dict(self):
@@ -1735,7 +2082,9 @@ class LLMConfig:
             "frequency_penalty": self.frequency_penalty,
             "presence_penalty": self.presence_penalty,
             "stop": self.stop,
-            "n": self.n
+            "n": self.n,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
         }
 
     def clone(self, **kwargs):
@@ -4,9 +4,12 @@ import asyncio
 import base64
 import time
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, List, Union
+from typing import Callable, Dict, Any, List, Union, Tuple
 from typing import Optional, AsyncGenerator, Final
+import math
 import os
+import re
+from pathlib import Path
 from playwright.async_api import Page, Error
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from io import BytesIO
@@ -16,7 +19,7 @@ import uuid
 from .js_snippet import load_js_script
 from .models import AsyncCrawlResponse
 from .config import SCREENSHOT_HEIGHT_TRESHOLD
-from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
+from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, ScreenshotConfig
 from .async_logger import AsyncLogger
 from .ssl_certificate import SSLCertificate
 from .user_agent_generator import ValidUAGenerator
@@ -28,6 +31,8 @@ import aiohttp
 import chardet
 from aiohttp.client import ClientTimeout
 from urllib.parse import urlparse
+from lxml import etree
+from lxml import html as lhtml
 from types import MappingProxyType
 import contextlib
 from functools import partial
@@ -338,6 +343,44 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # For timeout or other cases, just return False
             return False
 
+    async def wait_for_dom_quiescence(
+        self, page: Page, idle_ms: int = 500, timeout: float = 10000
+    ) -> Dict[str, Any]:
+        """
+        Wait until the page has been quiet for `idle_ms` milliseconds, capped at `timeout`.
+
+        "Quiet" means no DOM mutations (observed with a MutationObserver) and no
+        fetch/XHR requests in flight. The whole wait runs inside a single evaluate
+        call, so it returns as soon as the page settles instead of after a fixed delay.
+
+        Args:
+            page: Playwright page object
+            idle_ms: Quiet period in milliseconds that counts as settled
+            timeout: Hard cap in milliseconds
+
+        Returns:
+            Dict[str, Any]: Wait statistics: settled, waited_ms, mutations, requests, inflight
+        """
+        start = time.perf_counter()
+        try:
+            stats = await self.adapter.evaluate(
+                page,
+                load_js_script("dom_quiescence"),
+                {"idleMs": idle_ms, "timeoutMs": timeout},
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="DOM quiescence wait failed: {error}",
+                tag="WAIT",
+                params={"error": str(e)},
+            )
+            stats = {
+                "settled": False,
+                "waited_ms": int((time.perf_counter() - start) * 1000),
+                "error": str(e),
+            }
+        return stats
+
     async def process_iframes(self, page):
         """
         Process iframes on a page. This function will extract the content of each iframe and replace it with a div containing the extracted content.
@@ -520,6 +563,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         execution_result = None
         status_code = None
         redirected_url = url 
+        wait_stats = None
 
         # Reset downloaded files list for new crawl
         self._downloaded_files = []
@@ -870,7 +914,16 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # Handle full page scanning
             if config.scan_full_page:
                 # await self._handle_full_page_scan(page, config.scroll_delay)
-                await self._handle_full_page_scan(page, config.scroll_delay, config.max_scroll_steps)
+                if config.scan_mode == "observer":
+                    await self._handle_observer_page_scan(
+                        page,
+                        max_scroll_steps=config.max_scroll_steps,
+                        step_timeout=config.scan_step_timeout,
+                        growth_budget=config.scan_growth_budget,
+                        max_duration=config.page_timeout,
+                    )
+                else:
+                    await self._handle_full_page_scan(page, config.scroll_delay, config.max_scroll_steps)
 
             # Handle virtual scroll if configured
             if config.virtual_scroll_config:
@@ -945,7 +998,21 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Pre-content retrieval hooks and delay
             await self.execute_hook("before_retrieve_html", page, context=context, config=config)
-            if config.delay_before_return_html:
+            if config.wait_for_quiescence:
+                wait_stats = await self.wait_for_dom_quiescence(
+                    page,
+                    idle_ms=config.quiescence_idle_ms,
+                    timeout=config.quiescence_timeout,
+                )
+                self.logger.debug(
+                    message="Page settled={settled} after {waited_ms}ms",
+                    tag="WAIT",
+                    params={
+                        "settled": wait_stats.get("settled"),
+                        "waited_ms": wait_stats.get("waited_ms"),
+                    },
+                )
+            elif config.delay_before_return_html:
                 await asyncio.sleep(config.delay_before_return_html)
 
             # Handle overlay removal
@@ -986,6 +1053,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             start_export_time = time.perf_counter()
             pdf_data = None
             screenshot_data = None
+            screenshot_path = None
             mhtml_data = None
 
             if config.pdf:
@@ -997,11 +1065,16 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if config.screenshot:
                 if config.screenshot_wait_for:
                     await asyncio.sleep(config.screenshot_wait_for)
-                screenshot_data = await self.take_screenshot(
-                    page, screenshot_height_threshold=config.screenshot_height_threshold
-                )
+                if config.screenshot_config:
+                    screenshot_data, screenshot_path = await self.take_screenshot_cdp(
+                        page, config.screenshot_config
+                    )
+                else:
+                    screenshot_data = await self.take_screenshot(
+                        page, screenshot_height_threshold=config.screenshot_height_threshold
+                    )
 
-            if screenshot_data or pdf_data or mhtml_data:
+            if screenshot_data or screenshot_path or pdf_data or mhtml_data:
                 self.logger.info(
                     message="Exporting media (PDF/MHTML/screenshot) took {duration:.2f}s",
                     tag="EXPORT",
@@ -1030,6 +1103,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 js_execution_result=execution_result,
                 status_code=status_code,
                 screenshot=screenshot_data,
+                screenshot_path=screenshot_path,
                 pdf_data=pdf_data,
                 mhtml_data=mhtml_data,
                 get_delayed_content=get_delayed_content,
@@ -1041,6 +1115,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 # Include captured data if enabled
                 network_requests=captured_requests if config.capture_network_requests else None,
                 console_messages=captured_console if config.capture_console_messages else None,
+                wait_stats=wait_stats,
             )
 
         except Exception as e:
@@ -1151,6 +1226,61 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await self.safe_scroll(page, 0, total_height)
 
+    async def _handle_observer_page_scan(
+        self,
+        page: Page,
+        max_scroll_steps: Optional[int] = None,
+        step_timeout: float = 2.0,
+        growth_budget: Optional[int] = None,
+        max_duration: float = 60000,
+    ) -> Dict[str, Any]:
+        """
+        Scan the full page in a single in-page call.
+
+        How it works:
+        1. An IntersectionObserver watches every img/iframe, including ones injected while scrolling.
+        2. The page scrolls one viewport at a time.
+        3. After each step, it waits only until the media that came into view has fired load/error
+           (capped at step_timeout), instead of sleeping a fixed delay.
+        4. It stops at the bottom, after max_scroll_steps, once the page grew more than growth_budget
+           pixels, or after max_duration.
+
+        Args:
+            page (Page): The Playwright page object
+            max_scroll_steps (Optional[int]): Maximum number of scroll steps. If None, scrolls until end.
+            step_timeout (float): Maximum seconds to wait for lazy content after each step
+            growth_budget (Optional[int]): Maximum pixels the document may grow before the scan stops
+            max_duration (float): Hard cap for the whole scan in milliseconds
+
+        Returns:
+            Dict[str, Any]: Scan progress reported by the page (steps, stop_reason, heights, media counts)
+        """
+        try:
+            progress = await self.adapter.evaluate(
+                page,
+                load_js_script("full_page_scan"),
+                {
+                    "maxSteps": max_scroll_steps,
+                    "growthBudget": growth_budget,
+                    "stepTimeoutMs": step_timeout * 1000,
+                    "maxDurationMs": max_duration,
+                },
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="Failed to perform full page scan: {error}",
+                tag="PAGE_SCAN",
+                params={"error": str(e)},
+            )
+            return {"success": False, "error": str(e)}
+
+        self.logger.debug(
+            message="Scanned {steps} steps in {elapsed_ms}ms (stop: {stop_reason})",
+            tag="PAGE_SCAN",
+            params=progress,
+        )
+        return progress
+
     async def _handle_virtual_scroll(self, page: Page, config: "VirtualScrollConfig"):
         """
         Handle virtual scroll containers (e.g., Twitter-like feeds) by capturing
@@ -1672,6 +1802,83 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # finally:
         #     await page.close()
 
+    async def take_screenshot_cdp(
+        self, page: Page, screenshot_config: ScreenshotConfig
+    ) -> Tuple[Optional[Union[str, bytes]], Optional[str]]:
+        """
+        Capture the full page through CDP without resizing the viewport or stitching.
+
+        How it works:
+        1. Read the content size with `Page.getLayoutMetrics`.
+        2. Capture the whole page in one `Page.captureScreenshot` call with
+           `captureBeyondViewport` and a clip covering the content. Pages taller than
+           `max_height` are scaled down to fit.
+        3. Chromium encodes the image (JPEG/WebP/PNG) and hands it back base64-encoded,
+           so "base64" output needs no work in Python. Decoding for "bytes"/"file"
+           output runs in a worker thread.
+
+        Args:
+            page (Page): The Playwright page object
+            screenshot_config (ScreenshotConfig): Format, quality, scale and output settings
+
+        Returns:
+            Tuple[Optional[Union[str, bytes]], Optional[str]]: The screenshot data (None for
+            "file" output) and the written file path (None unless "file" output)
+        """
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            try:
+                metrics = await cdp.send("Page.getLayoutMetrics")
+                content_size = metrics.get("cssContentSize") or metrics["contentSize"]
+                width = math.ceil(content_size["width"])
+                height = math.ceil(content_size["height"])
+
+                scale = screenshot_config.scale
+                if height * scale > screenshot_config.max_height:
+                    scale = screenshot_config.max_height / height
+
+                params = {
+                    "format": screenshot_config.format,
+                    "captureBeyondViewport": True,
+                    "fromSurface": True,
+                    "clip": {"x": 0, "y": 0, "width": width, "height": height, "scale": scale},
+                }
+                if screenshot_config.format != "png":
+                    params["quality"] = screenshot_config.quality
+                capture = await cdp.send("Page.captureScreenshot", params)
+            finally:
+                await cdp.detach()
+        except Exception as e:
+            self.logger.error(
+                message="CDP screenshot failed: {error}",
+                tag="ERROR",
+                params={"error": str(e)},
+            )
+            return None, None
+
+        data = capture["data"]
+        if screenshot_config.output == "base64":
+            return data, None
+        if screenshot_config.output == "bytes":
+            return await asyncio.to_thread(base64.b64decode, data), None
+        path = await asyncio.to_thread(self._write_screenshot, data, screenshot_config)
+        return None, path
+
+    @staticmethod
+    def _write_screenshot(data: str, screenshot_config: ScreenshotConfig) -> str:
+        """Decode a base64 screenshot and write it into the content store."""
+        output_dir = screenshot_config.output_dir or os.path.join(
+            os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()), ".crawl4ai", "screenshots"
+        )
+        os.makedirs(output_dir, exist_ok=True)
+        raw = base64.b64decode(data)
+        file_name = f"{hashlib.sha256(raw).hexdigest()[:32]}.{screenshot_config.format}"
+        file_path = os.path.join(output_dir, file_name)
+        if not os.path.exists(file_path):
+            with open(file_path, "wb") as f:
+                f.write(raw)
+        return file_path
+
     async def take_screenshot_naive(self, page: Page) -> str:
         """
         Takes a screenshot of the current page.
@@ -2150,16 +2357,25 @@ class HTTPStatusError(HTTPCrawlerError):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class BodyTooLargeError(HTTPCrawlerError):
+    """Raised when a response body exceeds max_body_bytes and the action is 'abort'"""
+    pass
+
+
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = (
+        'logger', 'max_connections', 'max_connections_per_host', 'dns_cache_ttl', 'chunk_size',
+        'http2', 'accept_encoding', '_session', '_client', '_host_semaphores', 'hooks', 'browser_config', 'stats'
+    )
 
     DEFAULT_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
+    DEFAULT_MAX_CONNECTIONS_PER_HOST: Final[int] = 8
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
 
@@ -2178,15 +2394,42 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        http2: bool = False,
     ):
-        """Initialize the HTTP crawler with config"""
+        """
+        Initialize the HTTP crawler with config.
+
+        Args:
+            browser_config: Request settings (method, headers, body limits, ...)
+            logger: Logger instance for recording events and errors
+            max_connections: Total connection pool size
+            dns_cache_ttl: Seconds to cache DNS lookups (aiohttp backend)
+            chunk_size: Read size when streaming bodies and files
+            max_connections_per_host: Concurrent requests per host. 0 means no limit
+            http2: Use an httpx client with HTTP/2 instead of aiohttp. Requests to the
+                   same host are multiplexed over one connection
+        """
         self.browser_config = browser_config or HTTPCrawlerConfig()
         self.logger = logger
         self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
+        self.http2 = http2
+        self.accept_encoding = self._accept_encoding()
         self._session: Optional[aiohttp.ClientSession] = None
+        self._client = None  # httpx.AsyncClient when http2 is enabled
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats: Dict[str, float] = {
+            "requests": 0,
+            "bytes": 0,
+            "time_to_headers": 0.0,
+            "time_total": 0.0,
+            "truncated": 0,
+            "aborted": 0,
+        }
         
         self.hooks = {
             k: partial(self._execute_hook, k) 
@@ -2209,7 +2452,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     @contextlib.asynccontextmanager
     async def _session_context(self):
         try:
-            if not self._session:
+            if not (self._client if self.http2 else self._session):
                 await self.start()
             yield self._session
         finally:
@@ -2232,21 +2475,69 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             return await hook_func(*args, **kwargs)
         return hook_func(*args, **kwargs)
 
+    def _accept_encoding(self) -> str:
+        """Advertise only the encodings the active backend can decode."""
+        encodings = ["gzip", "deflate"]
+        if self.http2:
+            from importlib.util import find_spec
+
+            has_brotli = find_spec("brotli") is not None or find_spec("brotlicffi") is not None
+            # httpx decodes zstd through the zstandard package
+            has_zstd = find_spec("zstandard") is not None
+        else:
+            try:
+                from aiohttp.compression_utils import HAS_BROTLI as has_brotli
+            except ImportError:
+                has_brotli = False
+            try:
+                from aiohttp.compression_utils import HAS_ZSTD as has_zstd
+            except ImportError:
+                has_zstd = False
+        if has_zstd:
+            encodings.append("zstd")
+        if has_brotli:
+            encodings.append("br")
+        return ", ".join(encodings)
+
     async def start(self) -> None:
+        if self.http2:
+            if not self._client:
+                import httpx
+
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    headers={**self._BASE_HEADERS, 'Accept-Encoding': self.accept_encoding},
+                    limits=httpx.Limits(max_connections=self.max_connections),
+                    timeout=self.DEFAULT_TIMEOUT,
+                    verify=self.browser_config.verify_ssl,
+                )
+            return
         if not self._session:
             connector = aiohttp.TCPConnector(
                 limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
                 ttl_dns_cache=self.dns_cache_ttl,
                 use_dns_cache=True,
                 force_close=False
             )
             self._session = aiohttp.ClientSession(
-                headers=dict(self._BASE_HEADERS),
+                headers={**self._BASE_HEADERS, 'Accept-Encoding': self.accept_encoding},
                 connector=connector,
                 timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT)
             )
 
     async def close(self) -> None:
+        if self._client is not None:
+            try:
+                await asyncio.wait_for(self._client.aclose(), timeout=5.0)
+            except asyncio.TimeoutError:
+                if self.logger:
+                    self.logger.warning(
+                        message="Client cleanup timed out",
+                        tag="CLEANUP"
+                    )
+            finally:
+                self._client = None
         if self._session and not self._session.closed:
             try:
                 await asyncio.wait_for(self._session.close(), timeout=5.0)
@@ -2286,6 +2577,132 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         )
 
 
+    async def _read_body(
+        self,
+        url: str,
+        chunks: AsyncGenerator[bytes, None],
+        content_length: Optional[int],
+        parser: Optional[etree.HTMLParser] = None
+    ) -> bytes:
+        """
+        Accumulate decoded body chunks, enforcing max_body_bytes as they arrive.
+        When a parser is given, each chunk is also fed to it so parsing overlaps the download.
+        """
+        limit = self.browser_config.max_body_bytes
+        abort = self.browser_config.max_body_action == "abort"
+        if limit and abort and content_length and content_length > limit:
+            self.stats["aborted"] += 1
+            raise BodyTooLargeError(
+                f"Response for {url} declares {content_length} bytes, above max_body_bytes={limit}"
+            )
+
+        body = bytearray()
+        async for chunk in chunks:
+            if limit and len(body) + len(chunk) > limit:
+                if abort:
+                    self.stats["aborted"] += 1
+                    raise BodyTooLargeError(
+                        f"Response for {url} exceeded max_body_bytes={limit}"
+                    )
+                chunk = chunk[:limit - len(body)]
+                body.extend(chunk)
+                if parser is not None:
+                    parser.feed(chunk)
+                self.stats["truncated"] += 1
+                if self.logger:
+                    self.logger.warning(
+                        message="Truncated response for {url} at {limit} bytes",
+                        tag="FETCH",
+                        params={"url": url, "limit": limit}
+                    )
+                break
+            body.extend(chunk)
+            if parser is not None:
+                parser.feed(chunk)
+        self.stats["bytes"] += len(body)
+        return bytes(body)
+
+    def _stream_parser(self, charset: Optional[str]) -> Optional[etree.HTMLParser]:
+        if not self.browser_config.stream_parse:
+            return None
+        # Without a declared charset libxml2 sniffs the BOM and <meta charset> itself
+        return lhtml.HTMLParser(encoding=charset) if charset else lhtml.HTMLParser()
+
+    @staticmethod
+    def _close_parser(parser: Optional[etree.HTMLParser]):
+        if parser is None:
+            return None
+        try:
+            return parser.close()
+        except etree.XMLSyntaxError:
+            # Empty or hopeless documents, the scraping strategy parses the string instead
+            return None
+
+    def _decode(self, content: bytes, charset: Optional[str]) -> str:
+        encoding = charset or chardet.detect(content)['encoding'] or 'utf-8'
+        return content.decode(encoding, errors='replace')
+
+    def _host_semaphore(self, url: str) -> Optional[asyncio.Semaphore]:
+        # aiohttp enforces the per-host limit in its connector, httpx has no equivalent
+        if not self.http2 or not self.max_connections_per_host:
+            return None
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return semaphore
+
+    async def _handle_http_httpx(
+        self,
+        url: str,
+        request_kwargs: Dict[str, Any],
+        started: float
+    ) -> AsyncCrawlResponse:
+        import httpx
+
+        timeout = request_kwargs['timeout']
+        kwargs = {
+            'headers': request_kwargs['headers'],
+            'follow_redirects': request_kwargs['allow_redirects'],
+            'timeout': httpx.Timeout(timeout.total, connect=timeout.connect, read=timeout.sock_read),
+        }
+        if 'data' in request_kwargs:
+            kwargs['data'] = request_kwargs['data']
+        if 'json' in request_kwargs:
+            kwargs['json'] = request_kwargs['json']
+
+        semaphore = self._host_semaphore(url)
+        async with semaphore or contextlib.nullcontext():
+            try:
+                async with self._client.stream(self.browser_config.method, url, **kwargs) as response:
+                    self.stats["time_to_headers"] += time.perf_counter() - started
+                    if not (200 <= response.status_code < 300):
+                        raise HTTPStatusError(
+                            response.status_code,
+                            f"Unexpected status code for {url}"
+                        )
+                    content_length = response.headers.get('content-length')
+                    parser = self._stream_parser(response.charset_encoding)
+                    content = await self._read_body(
+                        url,
+                        response.aiter_bytes(self.chunk_size),
+                        int(content_length) if content_length and content_length.isdigit() else None,
+                        parser
+                    )
+                    return AsyncCrawlResponse(
+                        html=self._decode(content, response.charset_encoding),
+                        response_headers=dict(response.headers),
+                        status_code=response.status_code,
+                        redirected_url=str(response.url),
+                        html_tree=self._close_parser(parser)
+                    )
+            except httpx.TimeoutException as e:
+                raise asyncio.exceptions.TimeoutError(str(e)) from e
+            except httpx.ConnectError as e:
+                raise ConnectionError(str(e)) from e
+            except httpx.HTTPError as e:
+                raise HTTPCrawlerError(f"HTTP client error: {str(e)}") from e
+
     async def _handle_http(
         self, 
         url: str, 
@@ -2298,7 +2715,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 sock_read=30
             )
             
-            headers = dict(self._BASE_HEADERS)
+            headers = {**self._BASE_HEADERS, 'Accept-Encoding': self.accept_encoding}
             if self.browser_config.headers:
                 headers.update(self.browser_config.headers)
 
@@ -2317,35 +2734,48 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
             await self.hooks['before_request'](url, request_kwargs)
 
+            started = time.perf_counter()
+            self.stats["requests"] += 1
             try:
-                async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    content = memoryview(await response.read())
-                    
-                    if not (200 <= response.status < 300):
-                        raise HTTPStatusError(
-                            response.status,
-                            f"Unexpected status code for {url}"
+                if self.http2:
+                    result = await self._handle_http_httpx(url, request_kwargs, started)
+                else:
+                    async with session.request(self.browser_config.method, url, **request_kwargs) as response:
+                        self.stats["time_to_headers"] += time.perf_counter() - started
+                        if not (200 <= response.status < 300):
+                            raise HTTPStatusError(
+                                response.status,
+                                f"Unexpected status code for {url}"
+                            )
+
+                        # aiohttp decompresses gzip/br/zstd incrementally as the stream is read
+                        parser = self._stream_parser(response.charset)
+                        content = await self._read_body(
+                            url,
+                            response.content.iter_chunked(self.chunk_size),
+                            response.content_length,
+                            parser
                         )
-                    
-                    encoding = response.charset
-                    if not encoding:
-                        encoding = chardet.detect(content.tobytes())['encoding'] or 'utf-8'                    
-                    
-                    result = AsyncCrawlResponse(
-                        html=content.tobytes().decode(encoding, errors='replace'),
-                        response_headers=dict(response.headers),
-                        status_code=response.status,
-                        redirected_url=str(response.url)
-                    )
-                    
-                    await self.hooks['after_request'](result)
-                    return result
+                        result = AsyncCrawlResponse(
+                            html=self._decode(content, response.charset),
+                            response_headers=dict(response.headers),
+                            status_code=response.status,
+                            redirected_url=str(response.url),
+                            html_tree=self._close_parser(parser)
+                        )
+
+                await self.hooks['after_request'](result)
+                return result
+
+            except HTTPCrawlerError as e:
+                await self.hooks['on_error'](e)
+                raise
 
             except aiohttp.ServerTimeoutError as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
                 
-            except aiohttp.ClientConnectorError as e:
+            except (aiohttp.ClientConnectorError, ConnectionError) as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionError(f"Connection failed: {str(e)}")
                 
@@ -2361,6 +2791,9 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 await self.hooks['on_error'](e)
                 raise HTTPCrawlerError(f"HTTP request failed: {str(e)}")
 
+            finally:
+                self.stats["time_total"] += time.perf_counter() - started
+
     async def crawl(
         self, 
         url: str, 
@@ -2391,3 +2824,306 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     params={"error": str(e), "url": url}
                 )
             raise
+
+
+class JSRequiredDetector:
+    """
+    Decides whether a plain HTTP response still needs a browser to render.
+
+    Each check is cheap and runs on the raw HTML returned by aiohttp. `detect`
+    returns the name of the first check that fired, or None if the page looks
+    server-rendered.
+
+    Checks:
+        - empty_body: the body has no visible text at all
+        - spa_shell: an empty framework mount point (`<div id="root"></div>` etc.)
+        - noscript: a `<noscript>` block asking the user to enable JavaScript
+        - word_count: visible text is below `min_word_count` words
+        - missing_selector: one of `required_selectors` matches nothing
+    """
+
+    DEFAULT_SPA_SHELL_PATTERNS: Final = (
+        r'<div[^>]+id=["\'](?:root|app|__next|__nuxt|svelte|main-app)["\'][^>]*>\s*</div>',
+        r'<app-root[^>]*>\s*</app-root>',
+        r'<div[^>]+data-reactroot[^>]*>\s*</div>',
+    )
+    DEFAULT_NOSCRIPT_PHRASES: Final = (
+        "enable javascript",
+        "javascript is required",
+        "javascript is disabled",
+        "requires javascript",
+        "turn on javascript",
+        "javascript to run this app",
+    )
+
+    def __init__(
+        self,
+        min_word_count: int = 50,
+        spa_shell_patterns: Optional[List[str]] = None,
+        noscript_phrases: Optional[List[str]] = None,
+        required_selectors: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            min_word_count: Pages with fewer visible words are treated as client-rendered.
+                            Set to 0 to disable the check.
+            spa_shell_patterns: Regexes matching empty SPA mount points.
+                                Defaults to DEFAULT_SPA_SHELL_PATTERNS.
+            noscript_phrases: Lowercase phrases that mark a `<noscript>` block as a
+                              "please enable JavaScript" warning.
+            required_selectors: CSS selectors that must match in a usable page.
+        """
+        self.min_word_count = min_word_count
+        self.spa_shell_patterns = [
+            re.compile(p, re.IGNORECASE)
+            for p in (spa_shell_patterns if spa_shell_patterns is not None else self.DEFAULT_SPA_SHELL_PATTERNS)
+        ]
+        self.noscript_phrases = tuple(
+            noscript_phrases if noscript_phrases is not None else self.DEFAULT_NOSCRIPT_PHRASES
+        )
+        self.required_selectors = list(required_selectors or [])
+
+    def detect(self, html: str) -> Optional[str]:
+        """Return the reason a browser is needed, or None if the HTML is usable as is."""
+        if not html or not html.strip():
+            return "empty_body"
+
+        for pattern in self.spa_shell_patterns:
+            if pattern.search(html):
+                return "spa_shell"
+
+        try:
+            root = lhtml.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            return "empty_body"
+
+        for noscript in root.iter("noscript"):
+            text = (noscript.text_content() or "").lower()
+            if any(phrase in text for phrase in self.noscript_phrases):
+                return "noscript"
+
+        body = root.find("body")
+        if body is None:
+            return "empty_body"
+        # Only visible text counts; an app bundle in a <script> is not content
+        for element in body.xpath(".//script|.//style|.//noscript|.//template"):
+            element.drop_tree()
+        words = body.text_content().split()
+        if not words:
+            return "empty_body"
+        if len(words) < self.min_word_count:
+            return "word_count"
+
+        for selector in self.required_selectors:
+            if not root.cssselect(selector):
+                return "missing_selector"
+
+        return None
+
+
+class HybridCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Fetches with AsyncHTTPCrawlerStrategy first and escalates to
+    AsyncPlaywrightCrawlerStrategy only when the page needs a browser.
+
+    A page is escalated when the run config asks for something only a browser can
+    do (js_code, screenshots, wait_for, ...), when the HTTP fetch fails with a
+    status or protocol error, or when the JSRequiredDetector fires on the response.
+
+    Escalations are counted per domain. Once a domain has been seen
+    `min_domain_samples` times with an escalation rate of at least
+    `escalation_threshold`, its URLs go straight to the browser. Every
+    `reprobe_interval` browser-only crawls the HTTP path is tried again, so a
+    site that moves to server-side rendering is picked back up.
+
+    The browser is only launched on the first escalation, so a crawl over a
+    server-rendered corpus never starts Chromium.
+    """
+
+    BROWSER_ONLY_OPTIONS: Final = (
+        "js_code",
+        "js_only",
+        "wait_for",
+        "session_id",
+        "screenshot",
+        "pdf",
+        "capture_mhtml",
+        "scan_full_page",
+        "simulate_user",
+        "override_navigator",
+        "magic",
+        "process_iframes",
+        "remove_overlay_elements",
+        "capture_network_requests",
+        "capture_console_messages",
+        "virtual_scroll_config",
+        "wait_for_quiescence",
+    )
+
+    def __init__(
+        self,
+        browser_config: Optional[BrowserConfig] = None,
+        http_config: Optional[HTTPCrawlerConfig] = None,
+        logger: Optional[AsyncLogger] = None,
+        detector: Optional[JSRequiredDetector] = None,
+        min_domain_samples: int = 5,
+        escalation_threshold: float = 0.8,
+        reprobe_interval: int = 50,
+        browser_adapter: Optional[BrowserAdapter] = None,
+    ):
+        """
+        Args:
+            browser_config: Configuration for the Playwright fallback.
+            http_config: Configuration for the aiohttp fast path.
+            logger: Logger shared by both strategies.
+            detector: Decides when an HTTP response needs a browser.
+                      Defaults to JSRequiredDetector().
+            min_domain_samples: Crawls of a domain needed before its escalation
+                                rate is trusted.
+            escalation_threshold: Escalation rate above which a domain skips the
+                                  HTTP attempt.
+            reprobe_interval: Retry HTTP for a browser-only domain after this many
+                              browser crawls. 0 disables re-probing.
+            browser_adapter: Browser adapter passed to AsyncPlaywrightCrawlerStrategy.
+        """
+        self.logger = logger
+        self.detector = detector or JSRequiredDetector()
+        self.min_domain_samples = min_domain_samples
+        self.escalation_threshold = escalation_threshold
+        self.reprobe_interval = reprobe_interval
+
+        self.http_strategy = AsyncHTTPCrawlerStrategy(browser_config=http_config, logger=logger)
+        self.browser_strategy = AsyncPlaywrightCrawlerStrategy(
+            browser_config=browser_config, logger=logger, browser_adapter=browser_adapter
+        )
+        self.browser_config = self.browser_strategy.browser_config
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+
+        # domain -> {"http": HTTP attempts, "escalated": escalations, "skipped": browser-only crawls}
+        self.domain_stats: Dict[str, Dict[str, int]] = {}
+        self.stats: Dict[str, int] = {"http": 0, "browser": 0, "escalated": 0, "skipped_http": 0}
+
+    async def __aenter__(self) -> HybridCrawlerStrategy:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        await self.http_strategy.start()
+
+    async def close(self) -> None:
+        await self.http_strategy.close()
+        if self._browser_started:
+            await self.browser_strategy.close()
+            self._browser_started = False
+
+    async def _ensure_browser(self) -> None:
+        if self._browser_started:
+            return
+        async with self._browser_lock:
+            if not self._browser_started:
+                await self.browser_strategy.start()
+                self._browser_started = True
+
+    def set_hook(self, hook_type: str, hook: Callable) -> None:
+        """Route the hook to whichever underlying strategy defines it."""
+        if hook_type in self.browser_strategy.hooks:
+            self.browser_strategy.set_hook(hook_type, hook)
+        elif hook_type in self.http_strategy.hooks:
+            self.http_strategy.set_hook(hook_type, hook)
+        else:
+            raise ValueError(f"Invalid hook type: {hook_type}")
+
+    def update_user_agent(self, user_agent: str) -> None:
+        self.browser_strategy.update_user_agent(user_agent)
+        http_config = self.http_strategy.browser_config
+        headers = dict(http_config.headers or {})
+        headers["User-Agent"] = user_agent
+        self.http_strategy.browser_config = http_config.clone(headers=headers)
+
+    async def kill_session(self, session_id: str) -> None:
+        if self._browser_started:
+            await self.browser_strategy.kill_session(session_id)
+
+    def requires_browser(self, config: CrawlerRunConfig) -> bool:
+        """True when the run config uses options the HTTP path cannot honour."""
+        return any(getattr(config, option, None) for option in self.BROWSER_ONLY_OPTIONS)
+
+    def _skip_http(self, domain: str) -> bool:
+        stats = self.domain_stats.get(domain)
+        if not stats or stats["http"] < self.min_domain_samples:
+            return False
+        if stats["escalated"] / stats["http"] < self.escalation_threshold:
+            return False
+        if self.reprobe_interval and stats["skipped"] and stats["skipped"] % self.reprobe_interval == 0:
+            # Time to check whether the domain still needs a browser
+            stats["skipped"] += 1
+            return False
+        return True
+
+    def _record(self, domain: str, escalated: bool) -> None:
+        stats = self.domain_stats.setdefault(domain, {"http": 0, "escalated": 0, "skipped": 0})
+        stats["http"] += 1
+        if escalated:
+            stats["escalated"] += 1
+
+    def escalation_rate(self, domain: str) -> Optional[float]:
+        """Fraction of HTTP attempts on `domain` that had to be escalated, if any were made."""
+        stats = self.domain_stats.get(domain)
+        if not stats or not stats["http"]:
+            return None
+        return stats["escalated"] / stats["http"]
+
+    async def _crawl_browser(self, url: str, config: CrawlerRunConfig) -> AsyncCrawlResponse:
+        await self._ensure_browser()
+        self.stats["browser"] += 1
+        return await self.browser_strategy.crawl(url, config=config)
+
+    async def crawl(
+        self,
+        url: str,
+        config: Optional[CrawlerRunConfig] = None,
+        **kwargs
+    ) -> AsyncCrawlResponse:
+        config = config or CrawlerRunConfig.from_kwargs(kwargs)
+
+        if self.requires_browser(config):
+            return await self._crawl_browser(url, config)
+
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            # raw: and file: content is already final, nothing to learn from it
+            self.stats["http"] += 1
+            return await self.http_strategy.crawl(url, config=config)
+
+        domain = parsed.netloc.lower()
+        if self._skip_http(domain):
+            self.domain_stats[domain]["skipped"] += 1
+            self.stats["skipped_http"] += 1
+            return await self._crawl_browser(url, config)
+
+        self.stats["http"] += 1
+        try:
+            response = await self.http_strategy.crawl(url, config=config)
+            reason = self.detector.detect(response.html)
+        except ConnectionError:
+            # DNS failures and refused connections will not fare better in a browser
+            raise
+        except HTTPCrawlerError as e:
+            reason = f"http_error: {e}"
+
+        self._record(domain, escalated=reason is not None)
+        if reason is None:
+            return response
+
+        self.stats["escalated"] += 1
+        if self.logger:
+            self.logger.debug(
+                message="Escalating {url} to browser ({reason})",
+                tag="HYBRID",
+                params={"url": url, "reason": reason},
+            )
+        return await self._crawl_browser(url, config)
@@ -5,13 +5,16 @@ import asyncio
 from typing import Optional, Dict
 from contextlib import asynccontextmanager
 import json  
-from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
+import base64
+from .models import CRAWL_RESULT_FIELDS, CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
 import aiofiles
 from .async_logger import AsyncLogger
 
 from .utils import ensure_content_dirs, generate_content_hash
 from .utils import VersionManager
 from .utils import get_error_context, create_box_message
+from .url_canonicalizer import CACHE_KEY_CANONICALIZER
+from .serialization import json_dumps_str, json_loads
 
 base_directory = DB_PATH = os.path.join(
     os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()), ".crawl4ai"
@@ -285,12 +288,23 @@ class AsyncDatabaseManager:
             params={"column": new_column},
         )
 
+    @staticmethod
+    def cache_key(url: str) -> str:
+        """Canonical URL a page is cached under, so spellings of one URL share an entry"""
+        try:
+            return CACHE_KEY_CANONICALIZER.canonicalize(url) or url
+        except ValueError:
+            return url
+
     async def aget_cached_url(self, url: str) -> Optional[CrawlResult]:
         """Retrieve cached URL data as CrawlResult"""
+        key = self.cache_key(url)
 
         async def _get(db):
+            # Rows cached before keys were canonical are stored under the URL as given
             async with db.execute(
-                "SELECT * FROM crawled_data WHERE url = ?", (url,)
+                "SELECT * FROM crawled_data WHERE url IN (?, ?) ORDER BY url = ? DESC LIMIT 1",
+                (key, url, key),
             ) as cursor:
                 row = await cursor.fetchone()
                 if not row:
@@ -332,7 +346,7 @@ class AsyncDatabaseManager:
                 for field in json_fields:
                     try:
                         row_dict[field] = (
-                            json.loads(row_dict[field]) if row_dict[field] else {}
+                            json_loads(row_dict[field]) if row_dict[field] else {}
                         )
                     except json.JSONDecodeError:
                         # Very UGLY, never mention it to me please
@@ -354,7 +368,7 @@ class AsyncDatabaseManager:
                 # Parse downloaded_files
                 try:
                     row_dict["downloaded_files"] = (
-                        json.loads(row_dict["downloaded_files"])
+                        json_loads(row_dict["downloaded_files"])
                         if row_dict["downloaded_files"]
                         else []
                     )
@@ -362,9 +376,9 @@ class AsyncDatabaseManager:
                     row_dict["downloaded_files"] = []
 
                 # Remove any fields not in CrawlResult model
-                valid_fields = CrawlResult.__annotations__.keys()
-                filtered_dict = {k: v for k, v in row_dict.items() if k in valid_fields}
+                filtered_dict = {k: v for k, v in row_dict.items() if k in CRAWL_RESULT_FIELDS}
                 filtered_dict["markdown"] = row_dict["markdown"]
+                filtered_dict["url"] = url
                 return CrawlResult(**filtered_dict)
 
         try:
@@ -381,12 +395,20 @@ class AsyncDatabaseManager:
     async def acache_url(self, result: CrawlResult):
         """Cache CrawlResult data"""
         # Store content files and get hashes
+        screenshot = result.screenshot or ""
+        if isinstance(screenshot, bytes):
+            screenshot = base64.b64encode(screenshot).decode("utf-8")
         content_map = {
             "html": (result.html, "html"),
             "cleaned_html": (result.cleaned_html or "", "cleaned"),
             "markdown": None,
-            "extracted_content": (result.extracted_content or "", "extracted"),
-            "screenshot": (result.screenshot or "", "screenshots"),
+            "extracted_content": (
+                # Compact JSON straight from the structured output if it was never rendered
+                json_dumps_str(result.extracted_data) if result.extracted_content_deferred
+                else result.extracted_content or "",
+                "extracted",
+            ),
+            "screenshot": (screenshot, "screenshots"),
         }
 
         try:
@@ -448,18 +470,18 @@ class AsyncDatabaseManager:
                     downloaded_files = excluded.downloaded_files
             """,
                 (
-                    result.url,
+                    self.cache_key(result.url),
                     content_hashes["html"],
                     content_hashes["cleaned_html"],
                     content_hashes["markdown"],
                     content_hashes["extracted_content"],
                     result.success,
-                    json.dumps(result.media),
-                    json.dumps(result.links),
-                    json.dumps(result.metadata or {}),
+                    json_dumps_str(result.media),
+                    json_dumps_str(result.links),
+                    json_dumps_str(result.metadata or {}),
                     content_hashes["screenshot"],
-                    json.dumps(result.response_headers or {}),
-                    json.dumps(result.downloaded_files or []),
+                    json_dumps_str(result.response_headers or {}),
+                    json_dumps_str(result.downloaded_files or []),
                 ),
             )
 
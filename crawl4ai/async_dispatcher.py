@@ -4,8 +4,10 @@ from .models import (
     CrawlResult,
     CrawlerTaskResult,
     CrawlStatus,
+    DispatchResult,
     DomainState,
 )
+from .result_sinks import ResultSink
 
 from .components.crawler_monitor import CrawlerMonitor
 
@@ -24,6 +26,15 @@ from abc import ABC, abstractmethod
 
 from .utils import get_true_memory_usage_percent
 
+# Error fragments Playwright reports when a page or browser died underneath a crawl
+BROWSER_CRASH_MARKERS = (
+    "Target crashed",
+    "has been closed",
+    "Browser closed",
+    "Connection closed",
+    "disconnected",
+)
+
 
 class RateLimiter:
     def __init__(
@@ -91,12 +102,15 @@ class BaseDispatcher(ABC):
         self,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        result_sink: Optional[ResultSink] = None,
     ):
         self.crawler = None
         self._domain_last_hit: Dict[str, float] = {}
         self.concurrent_sessions = 0
         self.rate_limiter = rate_limiter
         self.monitor = monitor
+        # Finished results go to the sink instead of the returned list
+        self.result_sink = result_sink
 
     def select_config(self, url: str, configs: Union[CrawlerRunConfig, List[CrawlerRunConfig]]) -> Optional[CrawlerRunConfig]:
         """Select the appropriate config for a given URL.
@@ -124,6 +138,38 @@ class BaseDispatcher(ABC):
         # No match found - return None to indicate URL should be skipped
         return None
 
+    def _crash_generation(self) -> Optional[int]:
+        """Crash counter of the crawler's browser manager, or None if it has none."""
+        crawler_strategy = getattr(self.crawler, "crawler_strategy", None)
+        browser_manager = getattr(crawler_strategy, "browser_manager", None)
+        return getattr(browser_manager, "crash_generation", None)
+
+    def _failed_from_crash(self, result: CrawlResult, crash_generation: Optional[int]) -> bool:
+        """True if a failed result was caused by a browser/renderer crash during the crawl."""
+        if result.success or crash_generation is None:
+            return False
+        if self._crash_generation() == crash_generation:
+            return False
+        error_message = result.error_message or ""
+        return any(marker in error_message for marker in BROWSER_CRASH_MARKERS)
+
+    @staticmethod
+    def _is_requeued(task_result: CrawlerTaskResult) -> bool:
+        metadata = task_result.result.metadata or {}
+        return metadata.get("status") == "requeued"
+
+    async def _to_sink(self, task_result: CrawlerTaskResult):
+        """Write a finished task's result to the result sink, waiting while the sink is behind."""
+        task_result.result.dispatch_result = DispatchResult(
+            task_id=task_result.task_id,
+            memory_usage=task_result.memory_usage,
+            peak_memory=task_result.peak_memory,
+            start_time=task_result.start_time,
+            end_time=task_result.end_time,
+            error_message=task_result.error_message,
+        )
+        await self.result_sink.put(task_result.result)
+
     @abstractmethod
     async def crawl_url(
         self,
@@ -157,8 +203,10 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         memory_wait_timeout: Optional[float] = 600.0,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        max_crash_retries: int = 2,
+        result_sink: Optional[ResultSink] = None,
     ):
-        super().__init__(rate_limiter, monitor)
+        super().__init__(rate_limiter, monitor, result_sink)
         self.memory_threshold_percent = memory_threshold_percent
         self.critical_threshold_percent = critical_threshold_percent
         self.recovery_threshold_percent = recovery_threshold_percent
@@ -171,6 +219,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
+        self.max_crash_retries = max_crash_retries
+        self.crash_requeues = 0
         
     async def _memory_monitor_task(self):
         """Background task to continuously monitor memory usage and update state"""
@@ -224,6 +274,38 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             return -wait_time
         # Standard priority based on retries
         return retry_count
+
+    async def _requeue(
+        self, url: str, task_id: str, retry_count: int, start_time: float, reason: str
+    ) -> CrawlerTaskResult:
+        """Put a task back on the queue with an increased retry count and return its placeholder result."""
+        enqueue_time = time.time()
+        priority = self._get_priority_score(enqueue_time - start_time, retry_count + 1)
+        await self.task_queue.put((priority, (url, task_id, retry_count + 1, enqueue_time)))
+
+        # Update monitoring
+        if self.monitor:
+            self.monitor.update_task(
+                task_id,
+                status=CrawlStatus.QUEUED,
+                error_message=reason
+            )
+
+        # Return placeholder result with requeued status
+        return CrawlerTaskResult(
+            task_id=task_id,
+            url=url,
+            result=CrawlResult(
+                url=url, html="", metadata={"status": "requeued"},
+                success=False, error_message=reason
+            ),
+            memory_usage=0,
+            peak_memory=0,
+            start_time=start_time,
+            end_time=time.time(),
+            error_message=reason,
+            retry_count=retry_count + 1
+        )
     
     async def crawl_url(
         self,
@@ -288,36 +370,23 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             # Check if we're in critical memory state
             if self.current_memory_percent >= self.critical_threshold_percent:
                 # Requeue this task with increased priority and retry count
-                enqueue_time = time.time()
-                priority = self._get_priority_score(enqueue_time - start_time, retry_count + 1)
-                await self.task_queue.put((priority, (url, task_id, retry_count + 1, enqueue_time)))
-                
-                # Update monitoring
-                if self.monitor:
-                    self.monitor.update_task(
-                        task_id,
-                        status=CrawlStatus.QUEUED,
-                        error_message="Requeued due to critical memory pressure"
-                    )
-                
-                # Return placeholder result with requeued status
-                return CrawlerTaskResult(
-                    task_id=task_id,
-                    url=url,
-                    result=CrawlResult(
-                        url=url, html="", metadata={"status": "requeued"}, 
-                        success=False, error_message="Requeued due to critical memory pressure"
-                    ),
-                    memory_usage=0,
-                    peak_memory=0,
-                    start_time=start_time,
-                    end_time=time.time(),
-                    error_message="Requeued due to critical memory pressure",
-                    retry_count=retry_count + 1
+                return await self._requeue(
+                    url, task_id, retry_count, start_time,
+                    "Requeued due to critical memory pressure"
                 )
             
             # Execute the crawl with selected config
+            crash_generation = self._crash_generation()
             result = await self.crawler.arun(url, config=selected_config, session_id=task_id)
+
+            # The browser or renderer died mid-crawl: the browser manager restarts it
+            # on next use, so retry the URL instead of reporting a failure
+            if retry_count < self.max_crash_retries and self._failed_from_crash(result, crash_generation):
+                self.crash_requeues += 1
+                return await self._requeue(
+                    url, task_id, retry_count, start_time,
+                    "Requeued after browser crash"
+                )
             
             # Measure memory usage
             end_memory = process.memory_info().rss / (1024 * 1024)
@@ -445,7 +514,14 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     # Process completed tasks
                     for completed_task in done:
                         result = await completed_task
-                        results.append(result)
+                        # Requeued tasks report again once they actually run
+                        if self._is_requeued(result):
+                            continue
+                        # Blocks while the sink is behind, so no new crawls start meanwhile
+                        if self.result_sink:
+                            await self._to_sink(result)
+                        else:
+                            results.append(result)
                         
                     # Update active tasks list
                     active_tasks = list(pending)
@@ -600,8 +676,10 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                         result = await completed_task
                         
                         # Only count as completed if it wasn't requeued
-                        if "requeued" not in result.error_message:
+                        if not self._is_requeued(result):
                             completed_count += 1
+                            if self.result_sink:
+                                await self._to_sink(result)
                             yield result
                         
                     # Update active tasks list
@@ -627,8 +705,9 @@ class SemaphoreDispatcher(BaseDispatcher):
         max_session_permit: int = 20,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        result_sink: Optional[ResultSink] = None,
     ):
-        super().__init__(rate_limiter, monitor)
+        super().__init__(rate_limiter, monitor, result_sink)
         self.semaphore_count = semaphore_count
         self.max_session_permit = max_session_permit
 
@@ -755,18 +834,35 @@ class SemaphoreDispatcher(BaseDispatcher):
 
         try:
             semaphore = asyncio.Semaphore(self.semaphore_count)
+            # With a sink, a crawl only starts once the sink has room and holds
+            # its slot until the result is handed over
+            admission = asyncio.Semaphore(self.semaphore_count)
             tasks = []
 
+            async def crawl_to_sink(url: str, task_id: str):
+                async with admission:
+                    await self.result_sink.wait_ready()
+                    await self._to_sink(await self.crawl_url(url, config, task_id, semaphore))
+
             for url in urls:
                 task_id = str(uuid.uuid4())
                 if self.monitor:
                     self.monitor.add_task(task_id, url)
-                task = asyncio.create_task(
-                    self.crawl_url(url, config, task_id, semaphore)
-                )
+                if self.result_sink:
+                    task = asyncio.create_task(crawl_to_sink(url, task_id))
+                else:
+                    task = asyncio.create_task(
+                        self.crawl_url(url, config, task_id, semaphore)
+                    )
                 tasks.append(task)
 
-            return await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if self.result_sink:
+                for result in results:
+                    if isinstance(result, Exception):
+                        raise result
+                return []
+            return results
         finally:
             if self.monitor:
                 self.monitor.stop()
\ No newline at end of file
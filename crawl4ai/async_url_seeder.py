@@ -53,6 +53,7 @@ except ImportError:
 # You might need to adjust this import based on your exact file structure
 # Import AsyncLogger for default if needed
 from .async_logger import AsyncLoggerBase, AsyncLogger
+from .url_canonicalizer import URLCanonicalizer, DEFAULT_CANONICALIZER
 
 # Import SeedingConfig for type hints
 from typing import TYPE_CHECKING
@@ -203,8 +204,12 @@ class AsyncUrlSeeder:
         # NEW: Add base_directory
         base_directory: Optional[Union[str, pathlib.Path]] = None,
         cache_root: Optional[Union[str, Path]] = None,
+        canonicalizer: Optional[URLCanonicalizer] = None,
     ):
         self.ttl = ttl
+        # Duplicates are detected on canonical URLs, so sitemap and Common Crawl
+        # spellings of the same page are only validated once
+        self.canonicalizer = canonicalizer or DEFAULT_CANONICALIZER
         self._owns_client = client is None  # Track if we created the client
         self.client = client or httpx.AsyncClient(http2=True, timeout=20, headers={
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) +AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
@@ -347,7 +352,8 @@ class AsyncUrlSeeder:
         async def producer():
             try:
                 async for u in gen():
-                    if u in seen:
+                    key = self.canonicalizer.canonicalize_many([u])[0] or u
+                    if key in seen:
                         self._log("debug", "Skipping duplicate URL: {url}",
                                   params={"url": u}, tag="URL_SEED")
                         continue
@@ -355,7 +361,7 @@ class AsyncUrlSeeder:
                         self._log(
                             "info", "Producer stopping due to max_urls limit.", tag="URL_SEED")
                         break
-                    seen.add(u)
+                    seen.add(key)
                     await queue.put(u)  # Will block if queue is full, providing backpressure
             except Exception as e:
                 self._log("error", "Producer encountered an error: {error}", params={
@@ -551,14 +557,15 @@ class AsyncUrlSeeder:
         async def producer():
             """Producer to feed URLs into the queue."""
             try:
-                for url in urls:
-                    if url in seen:
+                for url, key in zip(urls, self.canonicalizer.canonicalize_many(urls)):
+                    key = key or url
+                    if key in seen:
                         self._log("debug", "Skipping duplicate URL: {url}",
                                   params={"url": url}, tag="URL_SEED")
                         continue
                     if stop_event.is_set():
                         break
-                    seen.add(url)
+                    seen.add(key)
                     await queue.put(url)
             finally:
                 producer_done.set()
@@ -4,8 +4,8 @@ import sys
 import time
 from pathlib import Path
 from typing import Optional, List
-import json
 import asyncio
+from functools import partial
 
 # from contextlib import nullcontext, asynccontextmanager
 from contextlib import asynccontextmanager
@@ -15,14 +15,18 @@ from .models import (
     DispatchResult,
     ScrapingResult,
     CrawlResultContainer,
-    RunManyReturn
+    RunManyReturn,
+    Link,
+    Links,
+    PROJECTABLE_FIELDS,
+    SPILLABLE_FIELDS,
 )
 from .async_database import async_db_manager
 from .chunking_strategy import *  # noqa: F403
 from .chunking_strategy import IdentityChunking
 from .content_filter_strategy import *  # noqa: F403
 from .extraction_strategy import *  # noqa: F403
-from .extraction_strategy import NoExtractionStrategy
+from .extraction_strategy import NoExtractionStrategy, JsonElementExtractionStrategy
 from .async_crawler_strategy import (
     AsyncCrawlerStrategy,
     AsyncPlaywrightCrawlerStrategy,
@@ -39,6 +43,10 @@ from .async_configs import BrowserConfig, CrawlerRunConfig, ProxyConfig, Seeding
 from .async_dispatcher import *  # noqa: F403
 from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter
 from .async_url_seeder import AsyncUrlSeeder
+from .link_preview import LinkPreview
+from .parsed_document import ParsedDocument
+from .preflight import ContentTypePreflight
+from .spill import SpilledField
 
 from .utils import (
     sanitize_input_encode,
@@ -49,6 +57,15 @@ from .utils import (
     preprocess_html_for_schema,
 )
 
+# Options of the fit_html preprocessing
+FIT_HTML_OPTIONS = {"text_threshold": 500, "max_size": 300_000}
+# Values of projectable CrawlResult fields left out by result_fields, None if not listed
+EMPTY_RESULT_FIELDS = {"html": "", "media": {}, "links": {}, "tables": []}
+
+
+def _fit_html_from_file(html: SpilledField) -> str:
+    return preprocess_html_for_schema(html_content=html.read(), **FIT_HTML_OPTIONS)
+
 
 class AsyncWebCrawler:
     """
@@ -166,6 +183,8 @@ class AsyncWebCrawler:
         self.arun = self._deep_handler(self.arun)
         
         self.url_seeder: Optional[AsyncUrlSeeder] = None
+        self.link_preview: Optional[LinkPreview] = None
+        self.preflight: Optional[ContentTypePreflight] = None
 
     async def start(self):
         """
@@ -189,6 +208,14 @@ class AsyncWebCrawler:
         2. Close any open pages and contexts
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        if self.preflight:
+            await self.preflight.close()
+        if self.link_preview:
+            await self.link_preview.close()
+            self.link_preview = None
+        if self.url_seeder:
+            await self.url_seeder.close()
+            self.url_seeder = None
 
     async def __aenter__(self):
         return await self.start()
@@ -196,6 +223,109 @@ class AsyncWebCrawler:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
+    def _get_preflight(self) -> ContentTypePreflight:
+        """Crawler-wide preflight, so probes share one connection pool and host rules."""
+        if self.preflight is None:
+            self.preflight = ContentTypePreflight(logger=self.logger)
+        return self.preflight
+
+    def _get_url_seeder(self) -> AsyncUrlSeeder:
+        """Crawler-wide URL seeder, shared by seeding and link previews so they use one HTTP/2 client."""
+        if self.url_seeder is None:
+            # Pass the crawler's base_directory for seeder's cache management
+            # Pass the crawler's logger for consistent logging
+            self.url_seeder = AsyncUrlSeeder(
+                base_directory=self.crawl4ai_folder,
+                logger=self.logger
+            )
+        return self.url_seeder
+
+    def _get_link_preview(self) -> LinkPreview:
+        """Crawler-wide link preview, so head data fetched for one page is reused by the next."""
+        if self.link_preview is None:
+            self.link_preview = LinkPreview(logger=self.logger, seeder=self._get_url_seeder())
+        return self.link_preview
+
+    async def _preview_links(self, links: dict, config: CrawlerRunConfig) -> dict:
+        """
+        Attach head data of linked pages to a page's links.
+
+        Args:
+            links: The page's links, as {"internal": [...], "external": [...]}
+            config: Configuration with link_preview_config set
+
+        Returns:
+            dict: The links with head data, or the original links if extraction failed
+        """
+        verbose = config.link_preview_config.verbose
+        try:
+            if verbose:
+                self.logger.info(
+                    message="Starting link head extraction for {internal} internal and {external} external links",
+                    tag="LINK_EXTRACT",
+                    params={"internal": len(links.get("internal", [])), "external": len(links.get("external", []))},
+                )
+
+            # Link and LinkRecord both unpack into Link
+            page_links = Links(
+                internal=[Link(**link) for link in links.get("internal", [])],
+                external=[Link(**link) for link in links.get("external", [])],
+            )
+            updated_links = await self._get_link_preview().extract_link_heads(page_links, config)
+
+            if verbose:
+                self.logger.info(
+                    message="Link head extraction completed: {internal_success}/{internal_total} internal, {external_success}/{external_total} external",
+                    tag="LINK_EXTRACT",
+                    params={
+                        "internal_success": sum(l.head_extraction_status == "valid" for l in updated_links.internal),
+                        "internal_total": len(updated_links.internal),
+                        "external_success": sum(l.head_extraction_status == "valid" for l in updated_links.external),
+                        "external_total": len(updated_links.external),
+                    },
+                )
+            return updated_links.model_dump()
+        except Exception as e:
+            self.logger.error(
+                message="Error during link head extraction: {error}",
+                tag="LINK_EXTRACT",
+                params={"error": str(e)},
+            )
+            # Continue with original links if head extraction fails
+            return links
+
+    @staticmethod
+    def _result_fields(config: CrawlerRunConfig) -> Optional[frozenset]:
+        """Projectable fields the result keeps, None for all."""
+        if config.result_fields is None:
+            return None
+        fields = frozenset(config.result_fields)
+        # Deep crawls find the next pages through the links of each result
+        if DeepCrawlDecorator.deep_crawl_active.get():
+            fields |= {"links"}
+        return fields
+
+    async def _finish_result(self, result: CrawlResult, config: CrawlerRunConfig):
+        """Apply CrawlerRunConfig.result_fields and spill_threshold to a result about to be returned."""
+        fields = self._result_fields(config)
+        if fields is not None:
+            for name in PROJECTABLE_FIELDS - fields:
+                setattr(result, name, EMPTY_RESULT_FIELDS.get(name))
+        if config.spill_threshold is not None:
+            await asyncio.to_thread(self._spill_result, result, config)
+
+    @staticmethod
+    def _spill_result(result: CrawlResult, config: CrawlerRunConfig):
+        """Move large fields of the result to files, see crawl4ai.spill."""
+        for name in SPILLABLE_FIELDS:
+            value = getattr(result, name)
+            if isinstance(value, (str, bytes)) and len(value) > config.spill_threshold:
+                setattr(result, name, SpilledField.write(value, config.spill_dir))
+        # A deferred fit_html holds on to the raw HTML, build it from the file instead
+        spilled_html = result.spilled("html")
+        if spilled_html is not None and result.fit_html_deferred:
+            result.fit_html = partial(_fit_html_from_file, spilled_html)
+
     @asynccontextmanager
     async def nullcontext(self):
         """异步空上下文管理器"""
@@ -330,13 +460,57 @@ class AsyncWebCrawler:
                                 },
                             )
 
+                    # Keep non-HTML content away from the crawler strategy
+                    preflight = None
+                    if config.preflight_config and url.startswith(("http://", "https://")):
+                        preflight = await self._get_preflight().check(url, config.preflight_config)
+                        if preflight.action == "skip":
+                            return CrawlResultContainer(
+                                CrawlResult(
+                                    url=url,
+                                    html="",
+                                    success=False,
+                                    status_code=preflight.status_code,
+                                    response_headers=preflight.headers,
+                                    error_message=f"Skipped by preflight: {preflight.content_type or preflight.category}",
+                                )
+                            )
+                        if preflight.action == "download":
+                            async_response = await self._get_preflight().download(url, config.preflight_config)
+                            self.logger.url_status(
+                                url=cache_context.display_url,
+                                success=True,
+                                timing=time.perf_counter() - start_time,
+                                tag="DOWNLOAD",
+                            )
+                            return CrawlResultContainer(
+                                CrawlResult(
+                                    url=url,
+                                    html="",
+                                    success=True,
+                                    status_code=async_response.status_code,
+                                    response_headers=async_response.response_headers,
+                                    downloaded_files=async_response.downloaded_files,
+                                    redirected_url=async_response.redirected_url,
+                                )
+                            )
+                        if preflight.action == "pdf":
+                            from .processors.pdf import PDFCrawlerStrategy, PDFContentScrapingStrategy
+
+                            config = config.clone(
+                                scraping_strategy=PDFContentScrapingStrategy(logger=self.logger)
+                            )
+
                     ##############################
                     # Call CrawlerStrategy.crawl #
                     ##############################
-                    async_response = await self.crawler_strategy.crawl(
-                        url,
-                        config=config,  # Pass the entire config object
-                    )
+                    if preflight and preflight.action == "pdf":
+                        async_response = await PDFCrawlerStrategy(logger=self.logger).crawl(url)
+                    else:
+                        async_response = await self.crawler_strategy.crawl(
+                            url,
+                            config=config,  # Pass the entire config object
+                        )
 
                     html = sanitize_input_encode(async_response.html)
                     screenshot_data = async_response.screenshot
@@ -364,6 +538,9 @@ class AsyncWebCrawler:
                         verbose=config.verbose,
                         is_raw_html=True if url.startswith("raw:") else False,
                         redirected_url=async_response.redirected_url,
+                        html_tree=async_response.html_tree,
+                        # Results are cached in full, whatever the caller asked for
+                        result_fields=None if cache_context.should_write() else self._result_fields(config),
                         **kwargs,
                     )
 
@@ -377,6 +554,8 @@ class AsyncWebCrawler:
                     # Add captured network and console data if available
                     crawl_result.network_requests = async_response.network_requests
                     crawl_result.console_messages = async_response.console_messages
+                    crawl_result.wait_stats = async_response.wait_stats
+                    crawl_result.screenshot_path = async_response.screenshot_path
 
                     crawl_result.success = bool(html)
                     crawl_result.session_id = getattr(
@@ -393,6 +572,7 @@ class AsyncWebCrawler:
                     if cache_context.should_write() and not bool(cached_result):
                         await async_db_manager.acache_url(crawl_result)
 
+                    await self._finish_result(crawl_result, config)
                     return CrawlResultContainer(crawl_result)
 
                 else:
@@ -406,6 +586,7 @@ class AsyncWebCrawler:
                     cached_result.session_id = getattr(
                         config, "session_id", None)
                     cached_result.redirected_url = cached_result.redirected_url or url
+                    await self._finish_result(cached_result, config)
                     return CrawlResultContainer(cached_result)
 
             except Exception as e:
@@ -439,6 +620,7 @@ class AsyncWebCrawler:
         screenshot_data: str,
         pdf_data: str,
         verbose: bool,
+        result_fields: Optional[frozenset] = None,
         **kwargs,
     ) -> CrawlResult:
         """
@@ -452,11 +634,15 @@ class AsyncWebCrawler:
             screenshot_data: Screenshot data (if any)
             pdf_data: PDF data (if any)
             verbose: Whether to enable verbose logging
+            result_fields: Projectable CrawlResult fields to produce, None for all
             **kwargs: Additional parameters for backwards compatibility
 
         Returns:
             CrawlResult: Processed result containing extracted and formatted content
         """
+        def wants(field: str) -> bool:
+            return result_fields is None or field in result_fields
+
         cleaned_html = ""
         try:
             _url = url if not kwargs.get("is_raw_html", False) else "Raw HTML"
@@ -467,12 +653,21 @@ class AsyncWebCrawler:
             if not scraping_strategy.logger:
                 scraping_strategy.logger = self.logger
 
+            # Parse once, share the trees between scraping, filters, markdown and extraction
+            document = ParsedDocument(
+                html,
+                url=url,
+                tree=kwargs.pop("html_tree", None),
+                retain_tree=getattr(config.extraction_strategy, "document_source", None) == "raw_html",
+            )
+
             # Process HTML content
             params = config.__dict__.copy()
             params.pop("url", None)
             # add keys from kwargs to params that doesn't exist in params
             params.update({k: v for k, v in kwargs.items()
                           if k not in params.keys()})
+            params["document"] = document
 
             ################################
             # Scraping Strategy Execution  #
@@ -502,69 +697,98 @@ class AsyncWebCrawler:
             metadata = result.get("metadata", {})
         else:
             cleaned_html = sanitize_input_encode(result.cleaned_html)
-            # media = result.media.model_dump()
-            # tables = media.pop("tables", [])
-            # links = result.links.model_dump()
-            media = result.media.model_dump() if hasattr(result.media, 'model_dump') else result.media
+            if isinstance(result, ScrapingResult):
+                # Scraped records go to the CrawlResult as they are, no models or dicts are built
+                media = result.dump_media()
+                links = result.dump_links()
+            else:
+                media = result.media.model_dump() if hasattr(result.media, 'model_dump') else result.media
+                links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
             tables = media.pop("tables", []) if isinstance(media, dict) else []
-            links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
             metadata = result.metadata
 
-        fit_html = preprocess_html_for_schema(html_content=html, text_threshold= 500, max_size= 300_000)
+        ################################
+        # Link Preview                 #
+        ################################
+        # Runs on the crawler's event loop, with a seeder and head cache shared by all pages
+        if config.link_preview_config is not None and wants("links"):
+            links = await self._preview_links(links, config)
+
+        # Scraping strategies that don't know about the document only return a string
+        if document.cleaned_html is None:
+            document.set_cleaned(cleaned_html)
+
+        # fit_html is a full re-parse and serialization of the raw HTML, only build it on demand
+        fit_html_factory = partial(preprocess_html_for_schema, html_content=html, **FIT_HTML_OPTIONS)
+        document.set_fit_html(fit_html_factory)
 
         ################################
         # Generate Markdown            #
         ################################
-        markdown_generator: Optional[MarkdownGenerationStrategy] = (
-            config.markdown_generator or DefaultMarkdownGenerator()
+        # Skipped when the result leaves markdown out and extraction doesn't read it
+        extracting = (
+            not bool(extracted_content)
+            and config.extraction_strategy
+            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
         )
+        needs_markdown = wants("markdown") or (
+            extracting and config.extraction_strategy.input_format not in ("html", "cleaned_html", "fit_html")
+        )
+        markdown_result: Optional[MarkdownGenerationResult] = None
+        if needs_markdown:
+            markdown_generator: Optional[MarkdownGenerationStrategy] = (
+                config.markdown_generator or DefaultMarkdownGenerator()
+            )
 
-        # --- SELECT HTML SOURCE BASED ON CONTENT_SOURCE ---
-        # Get the desired source from the generator config, default to 'cleaned_html'
-        selected_html_source = getattr(markdown_generator, 'content_source', 'cleaned_html')
+            # --- SELECT HTML SOURCE BASED ON CONTENT_SOURCE ---
+            # Get the desired source from the generator config, default to 'cleaned_html'
+            selected_html_source = getattr(markdown_generator, 'content_source', 'cleaned_html')
 
-        # Define the source selection logic using dict dispatch
-        html_source_selector = {
-            "raw_html": lambda: html,  # The original raw HTML
-            "cleaned_html": lambda: cleaned_html,  # The HTML after scraping strategy
-            "fit_html": lambda: fit_html,  # The HTML after preprocessing for schema
-        }
+            # Define the source selection logic using dict dispatch
+            html_source_selector = {
+                "raw_html": lambda: html,  # The original raw HTML
+                "cleaned_html": lambda: cleaned_html,  # The HTML after scraping strategy
+                "fit_html": lambda: document.fit_html,  # The HTML after preprocessing for schema
+            }
 
-        markdown_input_html = cleaned_html  # Default to cleaned_html
+            markdown_input_html = cleaned_html  # Default to cleaned_html
+            markdown_document = document if selected_html_source in html_source_selector else None
 
-        try:
-            # Get the appropriate lambda function, default to returning cleaned_html if key not found
-            source_lambda = html_source_selector.get(selected_html_source, lambda: cleaned_html)
-            # Execute the lambda to get the selected HTML
-            markdown_input_html = source_lambda()
+            try:
+                # Get the appropriate lambda function, default to returning cleaned_html if key not found
+                source_lambda = html_source_selector.get(selected_html_source, lambda: cleaned_html)
+                # Execute the lambda to get the selected HTML
+                markdown_input_html = source_lambda()
 
-            # Log which source is being used (optional, but helpful for debugging)
-            # if self.logger and verbose:
-            #     actual_source_used = selected_html_source if selected_html_source in html_source_selector else 'cleaned_html (default)'
-            #     self.logger.debug(f"Using '{actual_source_used}' as source for Markdown generation for {url}", tag="MARKDOWN_SRC")
+                # Log which source is being used (optional, but helpful for debugging)
+                # if self.logger and verbose:
+                #     actual_source_used = selected_html_source if selected_html_source in html_source_selector else 'cleaned_html (default)'
+                #     self.logger.debug(f"Using '{actual_source_used}' as source for Markdown generation for {url}", tag="MARKDOWN_SRC")
 
-        except Exception as e:
-            # Handle potential errors, especially from preprocess_html_for_schema
-            if self.logger:
-                self.logger.warning(
-                    f"Error getting/processing '{selected_html_source}' for markdown source: {e}. Falling back to cleaned_html.",
-                    tag="MARKDOWN_SRC"
+            except Exception as e:
+                # Handle potential errors, especially from preprocess_html_for_schema
+                if self.logger:
+                    self.logger.warning(
+                        f"Error getting/processing '{selected_html_source}' for markdown source: {e}. Falling back to cleaned_html.",
+                        tag="MARKDOWN_SRC"
+                    )
+                # Ensure markdown_input_html is still the default cleaned_html in case of error
+                markdown_input_html = cleaned_html
+                markdown_document = None
+            # --- END: HTML SOURCE SELECTION ---
+
+            # Uncomment if by default we want to use PruningContentFilter
+            # if not config.content_filter and not markdown_generator.content_filter:
+            #     markdown_generator.content_filter = PruningContentFilter()
+
+            markdown_result = (
+                markdown_generator.generate_markdown(
+                    input_html=markdown_input_html,
+                    base_url=params.get("redirected_url", url),
+                    document=markdown_document,
+                    # html2text_options=kwargs.get('html2text', {})
                 )
-            # Ensure markdown_input_html is still the default cleaned_html in case of error
-            markdown_input_html = cleaned_html
-        # --- END: HTML SOURCE SELECTION ---
-
-        # Uncomment if by default we want to use PruningContentFilter
-        # if not config.content_filter and not markdown_generator.content_filter:
-        #     markdown_generator.content_filter = PruningContentFilter()
-
-        markdown_result: MarkdownGenerationResult = (
-            markdown_generator.generate_markdown(
-                input_html=markdown_input_html,
-                base_url=params.get("redirected_url", url)
-                # html2text_options=kwargs.get('html2text', {})
             )
-        )
 
         # Log processing completion
         self.logger.url_status(
@@ -582,11 +806,8 @@ class AsyncWebCrawler:
         ################################
         # Structured Content Extraction           #
         ################################
-        if (
-            not bool(extracted_content)
-            and config.extraction_strategy
-            and not isinstance(config.extraction_strategy, NoExtractionStrategy)
-        ):
+        extracted_data = None
+        if extracting:
             t1 = time.perf_counter()
             # Choose content based on input_format
             content_format = config.extraction_strategy.input_format
@@ -601,12 +822,12 @@ class AsyncWebCrawler:
                 content_format = "markdown"
 
             content = {
-                "markdown": markdown_result.raw_markdown,
-                "html": html,
-                "fit_html": fit_html,
-                "cleaned_html": cleaned_html,
-                "fit_markdown": markdown_result.fit_markdown,
-            }.get(content_format, markdown_result.raw_markdown)
+                "markdown": lambda: markdown_result.raw_markdown,
+                "html": lambda: html,
+                "fit_html": lambda: document.fit_html,
+                "cleaned_html": lambda: cleaned_html,
+                "fit_markdown": lambda: markdown_result.fit_markdown,
+            }.get(content_format, lambda: markdown_result.raw_markdown)()
 
             # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
             chunking = (
@@ -615,10 +836,11 @@ class AsyncWebCrawler:
                 else config.chunking_strategy
             )
             sections = chunking.chunk(content)
-            extracted_content = config.extraction_strategy.run(url, sections)
-            extracted_content = json.dumps(
-                extracted_content, indent=4, default=str, ensure_ascii=False
-            )
+            # Kept structured, CrawlResult renders the JSON string when it is read
+            if isinstance(config.extraction_strategy, JsonElementExtractionStrategy):
+                extracted_data = config.extraction_strategy.run(url, sections, document=document)
+            else:
+                extracted_data = await config.extraction_strategy.arun(url, sections)
 
             # Log extraction completion
             self.logger.url_status(
@@ -636,16 +858,21 @@ class AsyncWebCrawler:
         return CrawlResult(
             url=url,
             html=html,
-            fit_html=fit_html,
+            # Deferred unless a stage above already needed it
+            fit_html=(
+                (document.fit_html if document.has_fit_html else fit_html_factory)
+                if wants("fit_html") else None
+            ),
             cleaned_html=cleaned_html,
             markdown=markdown_result,
-            media=media,
-            tables=tables,                       # NEW
-            links=links,
+            media=media if wants("media") else {},
+            tables=tables if wants("tables") else [],  # NEW
+            links=links if wants("links") else {},
             metadata=metadata,
             screenshot=screenshot_data,
             pdf=pdf_data,
             extracted_content=extracted_content,
+            extracted_data=extracted_data,
             success=True,
             error_message="",
         )
@@ -682,7 +909,9 @@ class AsyncWebCrawler:
 
         Returns:
         Union[List[CrawlResult], AsyncGenerator[CrawlResult, None]]:
-            Either a list of all results or an async generator yielding results
+            Either a list of all results or an async generator yielding results.
+            With a dispatcher result_sink, batch mode writes the results to the
+            sink and returns an empty list.
 
         Examples:
 
@@ -700,6 +929,13 @@ class AsyncWebCrawler:
             config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True),
         ):
             print(f"Processed {result.url}: {len(result.markdown)} chars")
+
+        # Writing results to disk as they finish (see crawl4ai.result_sinks)
+        async with JSONLSink("results.jsonl") as sink:
+            await crawler.arun_many(
+                urls=urls,
+                dispatcher=MemoryAdaptiveDispatcher(result_sink=sink),
+            )
         """
         config = config or CrawlerRunConfig()
         # if config is None:
@@ -803,13 +1039,7 @@ class AsyncWebCrawler:
             >>> )
         """
         # Initialize AsyncUrlSeeder here if it hasn't been already
-        if not self.url_seeder:
-            # Pass the crawler's base_directory for seeder's cache management
-            # Pass the crawler's logger for consistent logging
-            self.url_seeder = AsyncUrlSeeder(
-                base_directory=self.crawl4ai_folder,
-                logger=self.logger
-            )                    
+        self._get_url_seeder()
 
         # Merge config object with direct kwargs, giving kwargs precedence
         seeding_config = config.clone(**kwargs) if config else SeedingConfig.from_kwargs(kwargs)
@@ -1,5 +1,7 @@
 import asyncio
 import time
+import weakref
+from collections import deque
 from typing import List, Optional
 import os
 import sys
@@ -568,6 +570,8 @@ class BrowserManager:
         playwright (Playwright): The Playwright instance
         sessions (dict): Dictionary to store session information
         session_ttl (int): Session timeout in seconds
+        crash_generation (int): Number of browser disconnects and renderer crashes seen so far
+        crash_stats (dict): Counters for disconnects, renderer crashes and restarts
     """
 
     _playwright_instance = None
@@ -617,17 +621,35 @@ class BrowserManager:
         self._stealth_instance = None
         self._stealth_cm = None 
 
+        # Crash recovery: configs behind each context signature, so contexts can be
+        # re-created after a restart, plus counters exported as metrics
+        self._context_configs = {}
+        self._closing = False
+        self._restart_lock = asyncio.Lock()
+        self._restart_times = deque()
+        self._crash_watched_pages = weakref.WeakSet()
+        self.crash_generation = 0
+        self.crash_stats = {
+            "disconnects": 0,
+            "renderer_crashes": 0,
+            "restarts": 0,
+            "restarts_rejected": 0,
+        }
+
         # Initialize ManagedBrowser if needed
         if self.config.use_managed_browser:
-            self.managed_browser = ManagedBrowser(
-                browser_type=self.config.browser_type,
-                user_data_dir=self.config.user_data_dir,
-                headless=self.config.headless,
-                logger=self.logger,
-                debugging_port=self.config.debugging_port,
-                cdp_url=self.config.cdp_url,
-                browser_config=self.config,
-            )
+            self.managed_browser = self._create_managed_browser()
+
+    def _create_managed_browser(self) -> ManagedBrowser:
+        return ManagedBrowser(
+            browser_type=self.config.browser_type,
+            user_data_dir=self.config.user_data_dir,
+            headless=self.config.headless,
+            logger=self.logger,
+            debugging_port=self.config.debugging_port,
+            cdp_url=self.config.cdp_url,
+            browser_config=self.config,
+        )
 
     async def start(self):
         """
@@ -683,6 +705,105 @@ class BrowserManager:
 
             self.default_context = self.browser
 
+        if self.config.crash_recovery:
+            self.browser.on("disconnected", self._on_browser_disconnected)
+
+    def _on_browser_disconnected(self, browser):
+        """Record an unexpected browser disconnect. The restart happens lazily in get_page."""
+        if self._closing or browser is not self.browser:
+            return
+        self.crash_generation += 1
+        self.crash_stats["disconnects"] += 1
+        if self.logger:
+            self.logger.error(
+                message="Browser disconnected unexpectedly, it will be restarted on next use",
+                tag="CRASH",
+            )
+
+    def _on_page_crash(self, page):
+        """Record a renderer crash. The page is unusable but the browser survives."""
+        self.crash_generation += 1
+        self.crash_stats["renderer_crashes"] += 1
+        if self.logger:
+            self.logger.error(
+                message="Renderer crashed for {url}",
+                tag="CRASH",
+                params={"url": page.url},
+            )
+
+    def is_browser_alive(self) -> bool:
+        """Return True if the browser is running and connected."""
+        if self.browser is None:
+            return False
+        is_connected = getattr(self.browser, "is_connected", None)
+        return is_connected() if callable(is_connected) else True
+
+    async def restart(self, force: bool = False):
+        """
+        Restart the browser after a crash and re-create its contexts.
+
+        How it works:
+        1. If the browser is alive again (another task already restarted it), return.
+        2. Enforce max_browser_restarts per browser_restart_window.
+        3. Tear down what is left of the old browser and start a new one.
+        4. Re-create each context from the config it was created with, under the same signature.
+           Sessions are dropped since their pages died with the browser.
+
+        Args:
+            force (bool): Restart even if the browser still looks connected
+
+        Raises:
+            RuntimeError: If the restart rate limit is exceeded
+        """
+        async with self._restart_lock:
+            if not force and self.is_browser_alive():
+                return
+
+            now = time.time()
+            while self._restart_times and now - self._restart_times[0] > self.config.browser_restart_window:
+                self._restart_times.popleft()
+            if len(self._restart_times) >= self.config.max_browser_restarts:
+                self.crash_stats["restarts_rejected"] += 1
+                raise RuntimeError(
+                    f"Browser restart limit reached: {self.config.max_browser_restarts} restarts "
+                    f"within {self.config.browser_restart_window}s"
+                )
+            self._restart_times.append(now)
+
+            if self.logger:
+                self.logger.warning(
+                    message="Restarting browser after crash ({count} recent restarts)",
+                    tag="CRASH",
+                    params={"count": len(self._restart_times)},
+                )
+
+            context_configs = dict(self._context_configs)
+            self.sessions.clear()
+            self.contexts_by_config.clear()
+            try:
+                await self.close()
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(
+                        message="Error tearing down crashed browser: {error}",
+                        tag="CRASH",
+                        params={"error": str(e)},
+                    )
+                self.browser = None
+                self.playwright = None
+            if self.config.use_managed_browser and not self.config.cdp_url and self.managed_browser is None:
+                self.managed_browser = self._create_managed_browser()
+
+            await self.start()
+
+            if not self.config.use_managed_browser:
+                for signature, crawler_config in context_configs.items():
+                    context = await self.create_browser_context(crawler_config)
+                    await self.setup_context(context, crawler_config)
+                    self.contexts_by_config[signature] = context
+            self._context_configs = context_configs
+            self.crash_generation += 1
+            self.crash_stats["restarts"] += 1
 
     def _build_browser_args(self) -> dict:
         """Build browser launch arguments from config."""
@@ -1019,6 +1140,9 @@ class BrowserManager:
         """
         self._cleanup_expired_sessions()
 
+        if self.config.crash_recovery and not self.is_browser_alive():
+            await self.restart()
+
         # If a session_id is provided and we already have it, reuse that page + context
         if crawlerRunConfig.session_id and crawlerRunConfig.session_id in self.sessions:
             context, page, _ = self.sessions[crawlerRunConfig.session_id]
@@ -1064,10 +1188,16 @@ class BrowserManager:
                     context = await self.create_browser_context(crawlerRunConfig)
                     await self.setup_context(context, crawlerRunConfig)
                     self.contexts_by_config[config_signature] = context
+                    if self.config.crash_recovery:
+                        self._context_configs[config_signature] = crawlerRunConfig
 
             # Create a new page from the chosen context
             page = await context.new_page()
 
+        if self.config.crash_recovery and page not in self._crash_watched_pages:
+            self._crash_watched_pages.add(page)
+            page.on("crash", self._on_page_crash)
+
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
             self.sessions[crawlerRunConfig.session_id] = (context, page, time.time())
@@ -1103,6 +1233,14 @@ class BrowserManager:
         """Close all browser resources and clean up."""
         if self.config.cdp_url:
             return
+
+        self._closing = True
+        try:
+            await self._close()
+        finally:
+            self._closing = False
+
+    async def _close(self):
         
         if self.config.sleep_on_close:
             await asyncio.sleep(0.5)
@@ -33,6 +33,7 @@ from crawl4ai import (
     BestFirstCrawlingStrategy,
 )
 from crawl4ai.config import USER_SETTINGS
+from crawl4ai.result_sinks import sink_for_path
 from litellm import completion
 from pathlib import Path
 
@@ -160,6 +161,25 @@ async def run_crawler(url: str, browser_cfg: BrowserConfig, crawler_cfg: Crawler
         except Exception as e:
             raise click.ClickException(f"Crawling failed: {str(e)}")
 
+async def run_crawler_to_sink(url: str, browser_cfg: BrowserConfig, crawler_cfg: CrawlerRunConfig, sink_path: str, verbose: bool) -> int:
+    """Crawl url and write every result (all pages of a deep crawl) to a result sink as it arrives."""
+    if verbose:
+        click.echo(f"Writing results to {sink_path}")
+    if crawler_cfg.deep_crawl_strategy:
+        crawler_cfg.stream = True
+
+    async with AsyncWebCrawler(config=browser_cfg) as crawler, sink_for_path(sink_path) as sink:
+        try:
+            results = await crawler.arun(url=url, config=crawler_cfg)
+            if isinstance(results, CrawlResult):
+                await sink.put(results)
+            else:
+                async for result in results:
+                    await sink.put(result)
+        except Exception as e:
+            raise click.ClickException(f"Crawling failed: {str(e)}")
+    return sink.written
+
 def show_examples():
     examples = """
 🚀 Crawl4AI CLI Examples
@@ -195,6 +215,11 @@ def show_examples():
     # Crawler settings
     crwl https://example.com -c "css_selector=#main,delay_before_return_html=2,scan_full_page=true"
 
+    # Stream every page of a deep crawl to a file as it finishes
+    crwl https://docs.example.com --deep-crawl bfs --max-pages 500 --sink pages.jsonl.zst
+    crwl https://docs.example.com --deep-crawl bfs --sink pages.parquet
+    crwl https://docs.example.com --deep-crawl bfs --sink pages/  # One directory per URL
+
 4️⃣  Profile Management for Identity-Based Crawling:
     # Launch interactive profile manager
     crwl profiles
@@ -1019,9 +1044,11 @@ def cdp_cmd(user_data_dir: Optional[str], port: int, browser_type: str, headless
 @click.option("--profile", "-p", help="Use a specific browser profile (by name)")
 @click.option("--deep-crawl", type=click.Choice(["bfs", "dfs", "best-first"]), help="Enable deep crawling with specified strategy (bfs, dfs, or best-first)")
 @click.option("--max-pages", type=int, default=10, help="Maximum number of pages to crawl in deep crawl mode")
+@click.option("--sink", type=click.Path(), help="Stream results to a .jsonl, .jsonl.zst or .parquet file, or a directory tree")
 def crawl_cmd(url: str, browser_config: str, crawler_config: str, filter_config: str, 
            extraction_config: str, json_extract: str, schema: str, browser: Dict, crawler: Dict,
-           output: str, output_file: str, bypass_cache: bool, question: str, verbose: bool, profile: str, deep_crawl: str, max_pages: int):
+           output: str, output_file: str, bypass_cache: bool, question: str, verbose: bool, profile: str, deep_crawl: str, max_pages: int,
+           sink: str = None):
     """Crawl a website and extract content
     
     Simple Usage:
@@ -1187,6 +1214,11 @@ Always return valid, properly formatted JSON."""
         browser_cfg.verbose = config.get("VERBOSE", False)
         crawler_cfg.verbose = config.get("VERBOSE", False)
         
+        if sink:
+            written = anyio.run(run_crawler_to_sink, url, browser_cfg, crawler_cfg, sink, verbose)
+            click.echo(f"Wrote {written} result(s) to {sink}")
+            return
+
         # Run crawler
         result : CrawlResult = anyio.run(
             run_crawler,
@@ -1403,9 +1435,11 @@ def profiles_cmd():
 @click.option("--profile", "-p", help="Use a specific browser profile (by name)")
 @click.option("--deep-crawl", type=click.Choice(["bfs", "dfs", "best-first"]), help="Enable deep crawling with specified strategy")
 @click.option("--max-pages", type=int, default=10, help="Maximum number of pages to crawl in deep crawl mode")
+@click.option("--sink", type=click.Path(), help="Stream results to a .jsonl, .jsonl.zst or .parquet file, or a directory tree")
 def default(url: str, example: bool, browser_config: str, crawler_config: str, filter_config: str, 
         extraction_config: str, json_extract: str, schema: str, browser: Dict, crawler: Dict,
-        output: str, bypass_cache: bool, question: str, verbose: bool, profile: str, deep_crawl: str, max_pages: int):
+        output: str, bypass_cache: bool, question: str, verbose: bool, profile: str, deep_crawl: str, max_pages: int,
+        sink: str = None):
     """Crawl4AI CLI - Web content extraction tool
 
     Simple Usage:
@@ -1457,7 +1491,8 @@ def default(url: str, example: bool, browser_config: str, crawler_config: str, f
         verbose=verbose,
         profile=profile,
         deep_crawl=deep_crawl,
-        max_pages=max_pages
+        max_pages=max_pages,
+        sink=sink
     )
 
 def main():
@@ -3,8 +3,7 @@ import re
 import time
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
-from rank_bm25 import BM25Okapi
-from collections import deque
+from collections import Counter, deque
 from bs4 import NavigableString, Comment
 
 from .utils import (
@@ -20,6 +19,8 @@ from .types import LLMConfig
 from .config import DEFAULT_PROVIDER, OVERLAP_RATE, WORD_TOKEN_RATE
 from abc import ABC, abstractmethod
 import math
+import threading
+import numpy as np
 from snowballstemmer import stemmer
 from .models import TokenUsage
 from .prompts import PROMPT_FILTER_CONTENT
@@ -27,9 +28,254 @@ import json
 import hashlib
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from lxml import html as lhtml
 from .async_logger import AsyncLogger, LogLevel, LogColor
 
 
+# How BeautifulSoup reads and renders HTML. The filters work on lxml trees but
+# reproduce these rules, so scores and the blocks kept match the BeautifulSoup
+# implementation they replace.
+BS4_VOID_ELEMENTS = frozenset(
+    (
+        "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+        "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+        "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+    )
+)
+# Attributes BeautifulSoup splits on whitespace and re-joins with single spaces
+BS4_LIST_ATTRIBUTES = {
+    "*": frozenset(("class", "accesskey", "dropzone")),
+    "a": frozenset(("rel", "rev")),
+    "link": frozenset(("rel", "rev")),
+    "area": frozenset(("rel",)),
+    "td": frozenset(("headers",)),
+    "th": frozenset(("headers",)),
+    "form": frozenset(("accept-charset",)),
+    "object": frozenset(("archive",)),
+    "icon": frozenset(("sizes",)),
+    "iframe": frozenset(("sandbox",)),
+    "output": frozenset(("for",)),
+}
+# Strings inside these elements are not part of get_text() on other elements
+BS4_STRING_CONTAINERS = frozenset(("rt", "rp", "style", "script", "template"))
+# Text directly inside these is serialized without escaping
+BS4_CDATA_CONTAINERS = frozenset(("script", "style"))
+# Whitespace-only strings are collapsed to one character outside these
+BS4_PRESERVE_WHITESPACE = frozenset(("pre", "textarea"))
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+# libxml2 reports these as name="name" when they are written without a value
+HTML_BOOLEAN_ATTRIBUTES = frozenset(
+    (
+        "checked", "compact", "declare", "defer", "disabled", "ismap", "multiple",
+        "nohref", "noresize", "noshade", "nowrap", "readonly", "selected",
+    )
+)
+
+
+# Tags to ignore - inline elements that shouldn't break text flow
+CHUNK_INLINE_TAGS = frozenset({
+    "a",
+    "abbr",
+    "acronym",
+    "b",
+    "bdo",
+    "big",
+    "br",
+    "button",
+    "cite",
+    "code",
+    "dfn",
+    "em",
+    "i",
+    "img",
+    "input",
+    "kbd",
+    "label",
+    "map",
+    "object",
+    "q",
+    "samp",
+    "script",
+    "select",
+    "small",
+    "span",
+    "strong",
+    "sub",
+    "sup",
+    "textarea",
+    "time",
+    "tt",
+    "var",
+})
+
+# Tags that typically contain meaningful headers
+CHUNK_HEADER_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6", "header"})
+
+
+def _parse_body(html: str):
+    """
+    Parse HTML the way the filters did with BeautifulSoup(html, "lxml").
+
+    Returns:
+        Tuple of the root element and the body, re-parsing inside a <body> when
+        the markup has none. Both are None if nothing could be parsed.
+    """
+    for markup in (html, f"<body>{html}</body>"):
+        try:
+            root = lhtml.document_fromstring(markup)
+        except ValueError:
+            # str input with an XML encoding declaration
+            try:
+                root = lhtml.document_fromstring(markup.encode("utf-8"))
+            except (etree.ParserError, ValueError):
+                continue
+        except etree.ParserError:
+            continue
+        body = root if root.tag == "body" else root.find("body")
+        if body is not None:
+            return root, body
+    return None, None
+
+
+def _document_body(root):
+    """Body of a ParsedDocument tree, or None when the tree is a fragment."""
+    if root.tag == "body":
+        return root
+    if root.tag == "html":
+        return root.find("body")
+    return None
+
+
+def _is_lxml(node) -> bool:
+    return isinstance(node, etree._Element)
+
+
+def _string_of(node) -> str:
+    """Text of a comment or processing instruction, as BeautifulSoup stores it."""
+    if node.tag is etree.PI:
+        return f"{node.target} {node.text or ''}"
+    return node.text or ""
+
+
+def _bs4_collapse(text: str, preserve_whitespace: bool) -> str:
+    """BeautifulSoup keeps whitespace-only strings as a single newline or space."""
+    if preserve_whitespace or text.strip(ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _bs4_strings(el):
+    """
+    The strings BeautifulSoup's get_text() joins for an lxml element.
+
+    Comments and processing instructions are left out, and so are strings inside
+    <script>, <style>, <template>, <rt> and <rp> unless get_text() is called on
+    that kind of element.
+    """
+    own = el.tag if el.tag in BS4_STRING_CONTAINERS else None
+    ancestors = [a.tag for a in el.iterancestors()]
+    if own is None and BS4_STRING_CONTAINERS.intersection(ancestors):
+        return
+    containers = [own]
+    preserve = sum(tag in BS4_PRESERVE_WHITESPACE for tag in ancestors)
+    for event, node in etree.iterwalk(el, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if node is not el and node.tag in BS4_STRING_CONTAINERS:
+                containers.append(node.tag)
+            preserve += node.tag in BS4_PRESERVE_WHITESPACE
+            if node.text and containers[-1] == own:
+                yield _bs4_collapse(node.text, preserve > 0)
+            continue
+        if event == "end":
+            if node is not el and node.tag in BS4_STRING_CONTAINERS:
+                containers.pop()
+            preserve -= node.tag in BS4_PRESERVE_WHITESPACE
+        if node is not el and node.tail and containers[-1] == own:
+            yield _bs4_collapse(node.tail, preserve > 0)
+
+
+def _bs4_get_text(el, strip: bool = False) -> str:
+    if strip:
+        return "".join(s.strip() for s in _bs4_strings(el))
+    return "".join(_bs4_strings(el))
+
+
+def _bs4_string(el, ignored=frozenset()):
+    """
+    BeautifulSoup's `.string` for an lxml element: the one string it holds,
+    directly or through a chain of single children, else None.
+
+    Elements whose tag is in `ignored` (and comments, when etree.Comment is in
+    it) are treated as removed from the tree, leaving their tails behind.
+    """
+    while True:
+        contents = [el.text] if el.text else []
+        for child in el:
+            if child.tag not in ignored:
+                contents.append(child)
+            if child.tail:
+                contents.append(child.tail)
+            if len(contents) > 1:
+                return None
+        if len(contents) != 1:
+            return None
+        content = contents[0]
+        if isinstance(content, str):
+            preserve = any(a.tag in BS4_PRESERVE_WHITESPACE for a in el.iterancestors())
+            return _bs4_collapse(content, preserve or el.tag in BS4_PRESERVE_WHITESPACE)
+        if not isinstance(content.tag, str):
+            return _string_of(content)
+        el = content
+
+
+def _bs4_escaped_len(text: Optional[str]) -> int:
+    """Length of text once BeautifulSoup's minimal formatter escapes &, < and >."""
+    if not text:
+        return 0
+    return len(text) + 4 * text.count("&") + 3 * (text.count("<") + text.count(">"))
+
+
+def _bs4_string_len(text: str, parent_tag: str, preserve_whitespace: bool) -> int:
+    """Serialized length of a string BeautifulSoup parsed into an element."""
+    if not preserve_whitespace and not text.strip(ASCII_SPACES):
+        return 1
+    if parent_tag in BS4_CDATA_CONTAINERS:
+        return len(text)
+    return _bs4_escaped_len(text)
+
+
+def _bs4_list_attribute(tag: str, key: str) -> bool:
+    return key in BS4_LIST_ATTRIBUTES["*"] or key in BS4_LIST_ATTRIBUTES.get(tag, ())
+
+
+def _bs4_attribute_value(key: str, value: str) -> str:
+    """
+    Attribute value as BeautifulSoup stores it. A bare boolean attribute is empty
+    there, while lxml repeats its name; disabled="disabled" can't be told apart.
+    """
+    if value == key and key in HTML_BOOLEAN_ATTRIBUTES:
+        return ""
+    return value
+
+
+def _bs4_tags_len(el) -> int:
+    """Length of BeautifulSoup's start and end tags for an lxml element."""
+    tag = el.tag
+    length = len(tag) + 2
+    for key, value in el.attrib.items():
+        value = _bs4_attribute_value(key, value)
+        if _bs4_list_attribute(tag, key):
+            value = " ".join(value.split())
+        # key="value", or 'value' when it holds double quotes
+        length += len(key) + 4 + _bs4_escaped_len(value)
+        if '"' in value and "'" in value:
+            length += 5 * value.count('"')
+    if tag in BS4_VOID_ELEMENTS and el.text is None and not len(el):
+        return length + 1
+    return length + len(tag) + 3
+
+
 class RelevantContentFilter(ABC):
     """Abstract base class for content filtering strategies"""
 
@@ -122,10 +368,26 @@ class RelevantContentFilter(ABC):
         """Abstract method to be implemented by specific filtering strategies"""
         pass
 
+    def filter_document(self, document, source: str = "cleaned_html") -> List[str]:
+        """
+        Filter one representation of a page's shared ParsedDocument.
+
+        The default filters the representation's string with filter_content, so
+        string-based filters keep working. Tree-based filters override this and
+        start from `document.copy_tree(source)` instead of parsing again.
+        """
+        return self.filter_content(document.html_for(source))
+
     def extract_page_query(self, soup: BeautifulSoup, body: Tag) -> str:
-        """Common method to extract page metadata with fallbacks"""
+        """
+        Common method to extract page metadata with fallbacks.
+
+        Accepts a BeautifulSoup document and body, or an lxml root and body.
+        """
         if self.user_query:
             return self.user_query
+        if _is_lxml(body):
+            return self._extract_page_query_lxml(soup, body)
 
         query_parts = []
 
@@ -158,57 +420,51 @@ class RelevantContentFilter(ABC):
 
         return " ".join(filter(None, query_parts))
 
+    def _extract_page_query_lxml(self, root, body) -> str:
+        query_parts = []
+
+        title = next(root.iter("title"), None)
+        if title is not None:
+            query_parts.append(_bs4_string(title))
+
+        h1 = next(root.iter("h1"), None)
+        if h1 is not None:
+            query_parts.append(_bs4_get_text(h1))
+
+        temp = ""
+        for meta_name in ["keywords", "description"]:
+            meta = next((m for m in root.iter("meta") if m.get("name") == meta_name), None)
+            if meta is not None and meta.get("content"):
+                query_parts.append(meta.get("content"))
+                temp += meta.get("content")
+
+        if not temp:
+            for p in body.iter("p"):
+                text = _bs4_get_text(p)
+                if len(text) > 150:
+                    query_parts.append(text[:150])
+                    break
+
+        return " ".join(filter(None, query_parts))
+
     def extract_text_chunks(
         self, body: Tag, min_word_threshold: int = None
     ) -> List[Tuple[str, str]]:
         """
-        Extracts text chunks from a BeautifulSoup body element while preserving order.
+        Extracts text chunks from a body element while preserving order.
         Returns list of tuples (text, tag_name) for classification.
 
         Args:
-            body: BeautifulSoup Tag object representing the body element
+            body: BeautifulSoup Tag or lxml element representing the body element
 
         Returns:
             List of (text, tag_name) tuples
         """
-        # Tags to ignore - inline elements that shouldn't break text flow
-        INLINE_TAGS = {
-            "a",
-            "abbr",
-            "acronym",
-            "b",
-            "bdo",
-            "big",
-            "br",
-            "button",
-            "cite",
-            "code",
-            "dfn",
-            "em",
-            "i",
-            "img",
-            "input",
-            "kbd",
-            "label",
-            "map",
-            "object",
-            "q",
-            "samp",
-            "script",
-            "select",
-            "small",
-            "span",
-            "strong",
-            "sub",
-            "sup",
-            "textarea",
-            "time",
-            "tt",
-            "var",
-        }
+        if _is_lxml(body):
+            return self._extract_text_chunks_lxml(body, min_word_threshold)
 
-        # Tags that typically contain meaningful headers
-        HEADER_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6", "header"}
+        INLINE_TAGS = CHUNK_INLINE_TAGS
+        HEADER_TAGS = CHUNK_HEADER_TAGS
 
         chunks = []
         current_text = []
@@ -270,6 +526,59 @@ class RelevantContentFilter(ABC):
 
         return chunks
 
+    def _extract_text_chunks_lxml(self, body, min_word_threshold: int = None):
+        chunks = []
+        current_text = []
+        chunk_index = 0
+
+        # Strings are pushed as str: text, tails, and comments and processing
+        # instructions, which BeautifulSoup also treats as strings
+        stack = deque([(body, False)])
+
+        while stack:
+            element, visited = stack.pop()
+
+            if visited:
+                if current_text and element.tag not in CHUNK_INLINE_TAGS and not (
+                    element.tag == "p" and len(current_text) == 0
+                ):
+                    text = " ".join("".join(current_text).split())
+                    if text:
+                        tag_type = "header" if element.tag in CHUNK_HEADER_TAGS else "content"
+                        chunks.append((chunk_index, text, tag_type, element))
+                        chunk_index += 1
+                    current_text = []
+                continue
+
+            if isinstance(element, str):
+                if element.strip():
+                    current_text.append(element.strip())
+                continue
+
+            children = [element.text] if element.text else []
+            for child in element:
+                children.append(child if isinstance(child.tag, str) else _string_of(child))
+                if child.tail:
+                    children.append(child.tail)
+            if not children:
+                continue
+
+            stack.append((element, True))
+            for child in reversed(children):
+                stack.append((child, False))
+
+        if current_text:
+            text = " ".join("".join(current_text).split())
+            if text:
+                chunks.append((chunk_index, text, "content", body))
+
+        if min_word_threshold:
+            chunks = [
+                chunk for chunk in chunks if len(chunk[1].split()) >= min_word_threshold
+            ]
+
+        return chunks
+
     def _deprecated_extract_text_chunks(
         self, soup: BeautifulSoup
     ) -> List[Tuple[int, str, Tag]]:
@@ -319,6 +628,13 @@ class RelevantContentFilter(ABC):
 
     def is_excluded(self, tag: Tag) -> bool:
         """Common method for exclusion logic"""
+        if _is_lxml(tag):
+            if tag.tag in self.excluded_tags:
+                return True
+            class_id = " ".join(
+                filter(None, [" ".join(tag.get("class", "").split()), tag.get("id", "")])
+            )
+            return bool(self.negative_patterns.search(class_id))
         if tag.name in self.excluded_tags:
             return True
         class_id = " ".join(
@@ -328,6 +644,8 @@ class RelevantContentFilter(ABC):
 
     def clean_element(self, tag: Tag) -> str:
         """Common method for cleaning HTML elements with minimal overhead"""
+        if _is_lxml(tag):
+            return self._clean_element_lxml(tag)
         if not tag or not isinstance(tag, Tag):
             return ""
 
@@ -377,6 +695,176 @@ class RelevantContentFilter(ABC):
         except Exception:
             return str(tag)  # Fallback to original if anything fails
 
+    def _clean_element_lxml(self, tag) -> str:
+        unwanted_tags = {"script", "style", "aside", "form", "iframe", "noscript"}
+        unwanted_attrs = {
+            "style",
+            "onclick",
+            "onmouseover",
+            "align",
+            "bgcolor",
+            "class",
+            "id",
+        }
+        builder = []
+
+        def render_tag(elem):
+            if not isinstance(elem.tag, str):
+                builder.append(_string_of(elem).strip())
+                return
+            if elem.tag in unwanted_tags:
+                return
+
+            builder.append(f"<{elem.tag}")
+            for key, value in elem.attrib.items():
+                if key in unwanted_attrs:
+                    continue
+                value = _bs4_attribute_value(key, value)
+                # BeautifulSoup holds these as lists, and they render as such
+                if _bs4_list_attribute(elem.tag, key):
+                    value = value.split()
+                builder.append(f' {key}="{value}"')
+            builder.append(">")
+
+            if elem.text:
+                builder.append(elem.text.strip())
+            for child in elem:
+                render_tag(child)
+                if child.tail:
+                    builder.append(child.tail.strip())
+
+            builder.append(f"</{elem.tag}>")
+
+        render_tag(tag)
+        return "".join(builder)
+
+
+def _bm25_scores(
+    tokenized_corpus: List[List[str]],
+    tokenized_query: List[str],
+    idf: Dict[str, float],
+    avgdl: float,
+    k1: float,
+    b: float,
+) -> np.ndarray:
+    """
+    BM25 score of every document for a query, vectorized over documents.
+
+    Term frequencies are counted once per document for the distinct query terms
+    only. Repeated query terms add up, and the arithmetic follows rank_bm25's
+    BM25Okapi.get_scores so the scores are identical given the same IDF.
+    """
+    score = np.zeros(len(tokenized_corpus))
+    if not tokenized_query or not avgdl:
+        return score
+    terms = list(dict.fromkeys(tokenized_query))
+    column = {term: i for i, term in enumerate(terms)}
+    counts = [Counter(document) for document in tokenized_corpus]
+    tf = np.array([[c.get(term, 0) for term in terms] for c in counts], dtype=float)
+    doc_len = np.array([len(document) for document in tokenized_corpus])
+    norm = k1 * (1 - b + b * doc_len / avgdl)
+    for q in tokenized_query:
+        q_freq = tf[:, column[q]]
+        score += (idf.get(q) or 0) * (q_freq * (k1 + 1) / (q_freq + norm))
+    return score
+
+
+def _okapi_idf(tokenized_corpus: List[List[str]], epsilon: float = 0.25) -> Dict[str, float]:
+    """IDF of every term of a single corpus, with BM25Okapi's epsilon floor."""
+    nd = {}
+    for document in tokenized_corpus:
+        for word in dict.fromkeys(document):
+            nd[word] = nd.get(word, 0) + 1
+    if not nd:
+        return {}
+
+    corpus_size = len(tokenized_corpus)
+    idf = {}
+    idf_sum = 0
+    negative_idfs = []
+    for word, freq in nd.items():
+        value = math.log(corpus_size - freq + 0.5) - math.log(freq + 0.5)
+        idf[word] = value
+        idf_sum += value
+        if value < 0:
+            negative_idfs.append(word)
+
+    eps = epsilon * (idf_sum / len(idf))
+    for word in negative_idfs:
+        idf[word] = eps
+    return idf
+
+
+class BM25Context:
+    """
+    BM25 corpus statistics shared by the pages of one crawl.
+
+    Every text chunk of every page filtered so far counts as one document, so a
+    term's IDF reflects the whole site instead of a single page. Navigation,
+    footers and other text that repeats on every page get a low IDF and stop
+    lifting boilerplate chunks above the threshold. The context also memoizes
+    stemming, which otherwise repeats for the same site vocabulary on each page.
+
+    Pass one instance to the BM25ContentFilter used for the crawl:
+
+        context = BM25Context()
+        content_filter = BM25ContentFilter(user_query="pricing", context=context)
+
+    Since N keeps growing, IDF uses the always-positive form
+    log(1 + (N - n + 0.5) / (n + 0.5)) rather than BM25Okapi's floor, which is
+    derived from one page.
+
+    Attributes:
+        k1 (float): Term frequency saturation (default: 1.5).
+        b (float): Document length normalization (default: 0.75).
+        num_documents (int): Chunks seen so far.
+        total_length (int): Tokens in those chunks.
+        pages (int): Pages seen so far.
+        document_frequencies (Dict[str, int]): Number of chunks containing each term.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.num_documents = 0
+        self.total_length = 0
+        self.pages = 0
+        self.document_frequencies: Dict[str, int] = {}
+        self._stems: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def stem_cache(self, language: str) -> Dict[str, str]:
+        """Word to stem memo for a language, shared by every filter using the context."""
+        return self._stems.setdefault(language, {})
+
+    def get_scores(self, tokenized_corpus: List[List[str]], tokenized_query: List[str]) -> np.ndarray:
+        """
+        Add one page's chunks to the statistics and score them against the query.
+
+        Args:
+            tokenized_corpus: Tokens of each chunk of the page.
+            tokenized_query: Query tokens.
+
+        Returns:
+            np.ndarray: BM25 score of each chunk.
+        """
+        terms = set(tokenized_query)
+        with self._lock:
+            frequencies = self.document_frequencies
+            for document in tokenized_corpus:
+                for word in set(document):
+                    frequencies[word] = frequencies.get(word, 0) + 1
+            self.num_documents += len(tokenized_corpus)
+            self.total_length += sum(len(document) for document in tokenized_corpus)
+            self.pages += 1
+            n = self.num_documents
+            avgdl = self.total_length / n if n else 0
+            idf = {
+                term: math.log(1 + (n - frequencies.get(term, 0) + 0.5) / (frequencies.get(term, 0) + 0.5))
+                for term in terms
+            }
+        return _bm25_scores(tokenized_corpus, tokenized_query, idf, avgdl, self.k1, self.b)
+
 
 class BM25ContentFilter(RelevantContentFilter):
     """
@@ -395,6 +883,7 @@ class BM25ContentFilter(RelevantContentFilter):
         user_query (str): User query for filtering (optional).
         bm25_threshold (float): BM25 threshold for filtering (default: 1.0).
         language (str): Language for stemming (default: 'english').
+        context (BM25Context): Crawl-wide statistics, or None to score each page on its own.
 
         Methods:
             filter_content(self, html: str, min_word_threshold: int = None)
@@ -406,6 +895,7 @@ class BM25ContentFilter(RelevantContentFilter):
         bm25_threshold: float = 1.0,
         language: str = "english",
         use_stemming: bool = True,
+        context: Optional[BM25Context] = None,
     ):
         """
         Initializes the BM25ContentFilter class, if not provided, falls back to page metadata.
@@ -418,10 +908,13 @@ class BM25ContentFilter(RelevantContentFilter):
             bm25_threshold (float): BM25 threshold for filtering (default: 1.0).
             language (str): Language for stemming (default: 'english').
             use_stemming (bool): Whether to apply stemming (default: True).
+            context (BM25Context): Statistics shared across the pages of a crawl (optional).
         """
         super().__init__(user_query=user_query)
         self.bm25_threshold = bm25_threshold
+        self.language = language
         self.use_stemming = use_stemming
+        self.context = context
         self.priority_tags = {
             "h1": 5.0,
             "h2": 4.0,
@@ -436,6 +929,28 @@ class BM25ContentFilter(RelevantContentFilter):
             "th": 1.5,  # Table headers
         }
         self.stemmer = stemmer(language) if use_stemming else None
+        self._stems = context.stem_cache(language) if context else {}
+        self._query_tokens = (None, [])
+
+    def _tokenize(self, text: str) -> List[str]:
+        """Lowercase, split and stem, memoizing stems across calls."""
+        words = text.lower().split()
+        if not self.use_stemming:
+            return words
+        stems = self._stems
+        tokens = []
+        for word in words:
+            stem = stems.get(word)
+            if stem is None:
+                stem = stems[word] = self.stemmer.stemWord(word)
+            tokens.append(stem)
+        return tokens
+
+    def _tokenize_query(self, query: str) -> List[str]:
+        # The query repeats on every page when it comes from user_query
+        if self._query_tokens[0] != query:
+            self._query_tokens = (query, clean_tokens(self._tokenize(query)))
+        return self._query_tokens[1]
 
     def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
         """
@@ -455,15 +970,30 @@ class BM25ContentFilter(RelevantContentFilter):
         if not html or not isinstance(html, str):
             return []
 
-        soup = BeautifulSoup(html, "lxml")
+        # Wraps the markup in a body tag if it has none
+        root, body = _parse_body(html)
+        if body is None:
+            return []
+
+        return self._filter_body(root, body, min_word_threshold)
 
-        # Check if body is present
-        if not soup.body:
-            # Wrap in body tag if missing
-            soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
-        body = soup.find("body")
+    def filter_document(self, document, source: str = "cleaned_html") -> List[str]:
+        """
+        Filter the shared tree of a ParsedDocument representation.
+
+        BM25 scoring only reads the tree, so no copy is made.
+        """
+        if not document.html_for(source):
+            return []
+        root = document.tree_for(source)
+        body = _document_body(root)
+        if body is None:
+            return super().filter_document(document, source)
+        return self._filter_body(root, body)
 
-        query = self.extract_page_query(soup, body)
+    def _filter_body(self, root, body, min_word_threshold: int = None) -> List[str]:
+        """Score the text chunks of a parsed lxml body and keep the relevant ones."""
+        query = self.extract_page_query(root, body)
 
         if not query:
             return []
@@ -474,43 +1004,26 @@ class BM25ContentFilter(RelevantContentFilter):
         if not candidates:
             return []
 
-        # Tokenize corpus
-        # tokenized_corpus = [chunk.lower().split() for _, chunk, _, _ in candidates]
-        # tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[ps.stem(word) for word in chunk.lower().split()]
-        #                 for _, chunk, _, _ in candidates]
-        # tokenized_query = [ps.stem(word) for word in query.lower().split()]
-
-        if self.use_stemming:
-            tokenized_corpus = [
-                [self.stemmer.stemWord(word) for word in chunk.lower().split()]
-                for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = [
-                self.stemmer.stemWord(word) for word in query.lower().split()
-            ]
-        else:
-            tokenized_corpus = [
-                chunk.lower().split() for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[self.stemmer.stemWord(word) for word in tokenize_text(chunk.lower())]
-        #            for _, chunk, _, _ in candidates]
-        # tokenized_query = [self.stemmer.stemWord(word) for word in tokenize_text(query.lower())]
-
         # Clean from stop words and noise
-        tokenized_corpus = [clean_tokens(tokens) for tokens in tokenized_corpus]
-        tokenized_query = clean_tokens(tokenized_query)
+        tokenized_corpus = [clean_tokens(self._tokenize(chunk)) for _, chunk, _, _ in candidates]
+        tokenized_query = self._tokenize_query(query)
 
-        bm25 = BM25Okapi(tokenized_corpus)
-        scores = bm25.get_scores(tokenized_query)
+        if self.context is not None:
+            scores = self.context.get_scores(tokenized_corpus, tokenized_query)
+        else:
+            scores = _bm25_scores(
+                tokenized_corpus,
+                tokenized_query,
+                _okapi_idf(tokenized_corpus),
+                sum(len(tokens) for tokens in tokenized_corpus) / len(tokenized_corpus),
+                k1=1.5,
+                b=0.75,
+            )
 
         # Adjust scores with tag weights
         adjusted_candidates = []
         for score, (index, chunk, tag_type, tag) in zip(scores, candidates):
-            tag_weight = self.priority_tags.get(tag.name, 1.0)
+            tag_weight = self.priority_tags.get(tag.tag, 1.0)
             adjusted_score = score * tag_weight
             adjusted_candidates.append((adjusted_score, index, chunk, tag))
 
@@ -641,97 +1154,197 @@ class PruningContentFilter(RelevantContentFilter):
         if not html or not isinstance(html, str):
             return []
 
-        soup = BeautifulSoup(html, "lxml")
-        if not soup.body:
-            soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+        _, body = _parse_body(html)
+        if body is None:
+            return []
+        return self._filter_body(body)
+
+    def filter_document(self, document, source: str = "cleaned_html") -> List[str]:
+        """
+        Filter a copy of the shared tree of a ParsedDocument representation.
 
-        # Remove comments and unwanted tags
-        self._remove_comments(soup)
-        self._remove_unwanted_tags(soup)
+        The cleaned tree lacks the whitespace pretty-printing adds to cleaned_html,
+        which counts towards tag_len, so cleaned_html is parsed from its string to
+        keep scores identical.
+        """
+        if source == "cleaned_html" or not document.html_for(source):
+            return super().filter_document(document, source)
+        body = _document_body(document.copy_tree(source))
+        if body is None:
+            return super().filter_document(document, source)
+        return self._filter_body(body)
+
+    def _filter_body(self, body) -> List[str]:
+        """Prune a parsed lxml body in place and return its remaining blocks."""
+        metrics = self._compute_metrics(body)
+        removed = self._prune_tree(body, metrics)
+        if body in removed:
+            return []
 
-        # Prune tree starting from body
-        body = soup.find("body")
-        self._prune_tree(body)
+        for element in removed:
+            element.drop_tree()
+        self._remove_comments(body)
+        self._remove_unwanted_tags(body)
 
         # Extract remaining content as list of HTML strings
         content_blocks = []
-        for element in body.children:
-            if isinstance(element, str) or not hasattr(element, "name"):
+        for element in body:
+            if not isinstance(element.tag, str):
                 continue
-            if len(element.get_text(strip=True)) > 0:
-                content_blocks.append(str(element))
+            if any(s.strip() for s in _bs4_strings(element)):
+                content_blocks.append(
+                    lhtml.tostring(element, encoding="unicode", method="html", with_tail=False)
+                )
 
         return content_blocks
 
-    def _remove_comments(self, soup):
+    def _remove_comments(self, body):
         """Removes HTML comments"""
-        for element in soup(text=lambda text: isinstance(text, Comment)):
-            element.extract()
+        for element in list(body.iter(etree.Comment)):
+            element.drop_tree()
 
-    def _remove_unwanted_tags(self, soup):
+    def _remove_unwanted_tags(self, body):
         """Removes unwanted tags"""
-        for tag in self.excluded_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
+        for element in list(body.iter(*self.excluded_tags)):
+            element.drop_tree()
 
-    def _prune_tree(self, node):
-        """
-        Prunes the tree starting from the given node.
-
-        Args:
-            node (Tag): The node from which the pruning starts.
+    def _compute_metrics(self, body) -> Dict:
         """
-        if not node or not hasattr(node, "name") or node.name is None:
-            return
-
-        text_len = len(node.get_text(strip=True))
-        tag_len = len(node.encode_contents().decode("utf-8"))
-        link_text_len = sum(
-            len(s.strip())
-            for s in (a.string for a in node.find_all("a", recursive=False))
-            if s
-        )
+        Measures every element under body in one bottom-up pass.
 
-        metrics = {
-            "node": node,
-            "tag_name": node.name,
-            "text_len": text_len,
-            "tag_len": tag_len,
-            "link_text_len": link_text_len,
-        }
+        The measures are those BeautifulSoup gave once comments and excluded tags
+        were removed: the length of get_text(strip=True), its number of spaces,
+        and the length of encode_contents(). Removed nodes are skipped but their
+        tails stay separate strings, as they did in BeautifulSoup's tree.
 
-        score = self._compute_composite_score(metrics, text_len, tag_len, link_text_len)
+        Returns:
+            Dict mapping each element to a (text_len, spaces, tag_len) tuple.
+        """
+        metrics = {}
+        # One [text_len, spaces, tag_len] accumulator per open element
+        open_elements = []
+        hidden = preserve = 0
+
+        def add_string(text, parent_tag):
+            acc = open_elements[-1]
+            if not hidden:
+                stripped = text.strip()
+                acc[0] += len(stripped)
+                acc[1] += stripped.count(" ")
+            acc[2] += _bs4_string_len(text, parent_tag, preserve > 0)
+
+        walker = etree.iterwalk(body, events=("start", "end", "comment", "pi"))
+        skipping = None
+        for event, node in walker:
+            if event == "start":
+                if node.tag in self.excluded_tags and node is not body:
+                    walker.skip_subtree()
+                    skipping = node
+                    continue
+                open_elements.append([0, 0, 0])
+                hidden += node.tag in BS4_STRING_CONTAINERS
+                preserve += node.tag in BS4_PRESERVE_WHITESPACE
+                if node.text:
+                    add_string(node.text, node.tag)
+                continue
 
-        if self.threshold_type == "fixed":
-            should_remove = score < self.threshold
-        else:  # dynamic
-            tag_importance = self.tag_importance.get(node.name, 0.7)
-            text_ratio = text_len / tag_len if tag_len > 0 else 0
-            link_ratio = link_text_len / text_len if text_len > 0 else 1
+            if node is body:
+                acc = open_elements.pop()
+                metrics[body] = self._element_metrics(body, acc)
+                break
+
+            parent_tag = node.getparent().tag
+            if event == "pi":
+                open_elements[-1][2] += len(_string_of(node)) + 3
+            elif event == "end" and node is not skipping:
+                acc = open_elements.pop()
+                hidden -= node.tag in BS4_STRING_CONTAINERS
+                preserve -= node.tag in BS4_PRESERVE_WHITESPACE
+                metrics[node] = self._element_metrics(node, acc)
+                parent = open_elements[-1]
+                parent[0] += acc[0]
+                parent[1] += acc[1]
+                parent[2] += _bs4_tags_len(node) + acc[2]
+            skipping = None
+            if node.tail:
+                add_string(node.tail, parent_tag)
+
+        return metrics
+
+    @staticmethod
+    def _element_metrics(node, acc) -> Tuple[int, int, int]:
+        if node.tag in BS4_STRING_CONTAINERS:
+            # Its own strings are hidden from its ancestors but not from itself
+            strings = [s.strip() for s in _bs4_strings(node)]
+            return sum(map(len, strings)), sum(s.count(" ") for s in strings), acc[2]
+        return acc[0], acc[1], acc[2]
+
+    def _prune_tree(self, node, metrics: Dict) -> List:
+        """
+        Decides which elements to prune, starting from the given node.
 
-            threshold = self.threshold  # base threshold
-            if tag_importance > 1:
-                threshold *= 0.8
-            if text_ratio > 0.4:
-                threshold *= 0.9
-            if link_ratio > 0.6:
-                threshold *= 1.2
+        Args:
+            node: The lxml element from which the pruning starts.
+            metrics: Element measures from _compute_metrics.
 
-            should_remove = score < threshold
+        Returns:
+            List of the elements to remove, outermost first. Their descendants
+            are not listed.
+        """
+        removed = []
+        ignored = self.excluded_tags | {etree.Comment}
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            text_len, spaces, tag_len = metrics[node]
+            link_text_len = sum(
+                len(s.strip())
+                for s in (_bs4_string(a, ignored) for a in node.iterchildren("a"))
+                if s
+            )
 
-        if should_remove:
-            node.decompose()
-        else:
-            children = [child for child in node.children if hasattr(child, "name")]
-            for child in children:
-                self._prune_tree(child)
+            node_metrics = {
+                "node": node,
+                "tag_name": node.tag,
+                "text_len": text_len,
+                "tag_len": tag_len,
+                "link_text_len": link_text_len,
+                "word_count": spaces + 1,
+            }
+
+            score = self._compute_composite_score(node_metrics, text_len, tag_len, link_text_len)
+
+            if self.threshold_type == "fixed":
+                should_remove = score < self.threshold
+            else:  # dynamic
+                tag_importance = self.tag_importance.get(node.tag, 0.7)
+                text_ratio = text_len / tag_len if tag_len > 0 else 0
+                link_ratio = link_text_len / text_len if text_len > 0 else 1
+
+                threshold = self.threshold  # base threshold
+                if tag_importance > 1:
+                    threshold *= 0.8
+                if text_ratio > 0.4:
+                    threshold *= 0.9
+                if link_ratio > 0.6:
+                    threshold *= 1.2
+
+                should_remove = score < threshold
+
+            if should_remove:
+                removed.append(node)
+            else:
+                stack.extend(
+                    child
+                    for child in reversed(node)
+                    if isinstance(child.tag, str) and child.tag not in self.excluded_tags
+                )
+        return removed
 
     def _compute_composite_score(self, metrics, text_len, tag_len, link_text_len):
         """Computes the composite score"""
         if self.min_word_threshold:
-            # Get raw text from metrics node - avoid extra processing
-            text = metrics["node"].get_text(strip=True)
-            word_count = text.count(" ") + 1
+            word_count = metrics["word_count"]
             if word_count < self.min_word_threshold:
                 return -1.0  # Guaranteed removal
         score = 0.0
@@ -766,12 +1379,12 @@ class PruningContentFilter(RelevantContentFilter):
     def _compute_class_id_weight(self, node):
         """Computes the class ID weight"""
         class_id_score = 0
-        if "class" in node.attrs:
-            classes = " ".join(node["class"])
+        if "class" in node.attrib:
+            classes = " ".join(node.get("class").split())
             if self.negative_patterns.match(classes):
                 class_id_score -= 0.5
-        if "id" in node.attrs:
-            element_id = node["id"]
+        if "id" in node.attrib:
+            element_id = node.get("id")
             if self.negative_patterns.match(element_id):
                 class_id_score -= 0.5
         return class_id_score
@@ -1000,25 +1613,9 @@ class LLMContentFilter(RelevantContentFilter):
                     response = future.result()
 
                     # Track usage
-                    usage = TokenUsage(
-                        completion_tokens=response.usage.completion_tokens,
-                        prompt_tokens=response.usage.prompt_tokens,
-                        total_tokens=response.usage.total_tokens,
-                        completion_tokens_details=(
-                            response.usage.completion_tokens_details.__dict__
-                            if response.usage.completion_tokens_details
-                            else {}
-                        ),
-                        prompt_tokens_details=(
-                            response.usage.prompt_tokens_details.__dict__
-                            if response.usage.prompt_tokens_details
-                            else {}
-                        ),
-                    )
+                    usage = TokenUsage.from_response(response)
                     self.usages.append(usage)
-                    self.total_usage.completion_tokens += usage.completion_tokens
-                    self.total_usage.prompt_tokens += usage.prompt_tokens
-                    self.total_usage.total_tokens += usage.total_tokens
+                    self.total_usage.add(usage)
 
                     blocks = extract_xml_data(
                         ["content"], response.choices[0].message.content
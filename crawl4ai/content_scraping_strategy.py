@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from itertools import chain
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
@@ -19,17 +20,18 @@ from urllib.parse import urljoin
 from requests.exceptions import InvalidSchema
 from .utils import (
     extract_metadata,
-    normalize_url,
     is_external_url,
     get_base_domain,
     extract_metadata_using_lxml,
     extract_page_context,
-    calculate_link_intrinsic_score,
+    calculate_link_intrinsic_scores,
+    classify_links,
 )
 from lxml import etree
 from lxml import html as lhtml
 from typing import List
-from .models import ScrapingResult, MediaItem, Link, Media, Links
+from .models import ScrapingResult, LinkRecord, MediaRecord
+from .url_canonicalizer import DEFAULT_CANONICALIZER
 import copy
 
 # Pre-compile regular expressions for Open Graph and Twitter metadata
@@ -88,6 +90,137 @@ def fetch_image_file_size(img, base_url):
         return
 
 
+# XPath expressions evaluated on every page, compiled once
+META_DESCRIPTION_XPATH = etree.XPath('//meta[@name="description"]/@content')
+BASE_HREF_XPATH = etree.XPath("//head/base[@href]")
+LINK_XPATH = etree.XPath(".//a[@href]")
+IMAGE_XPATH = etree.XPath(".//img")
+IMAGE_SRC_XPATH = etree.XPath(".//img[@src]")
+SOURCE_XPATH = etree.XPath(".//source")
+SOURCE_SRCSET_XPATH = etree.XPath(".//source[@srcset]")
+PICTURE_ANCESTOR_XPATH = etree.XPath("./ancestor::picture[1]")
+MEDIA_XPATHS = {
+    "video": etree.XPath(".//video"),
+    "audio": etree.XPath(".//audio"),
+}
+
+
+class ScrapingPlan:
+    """
+    Selectors and removal passes compiled from one set of scraping options.
+
+    Translating a CSS selector to XPath and compiling it costs more than running
+    it, so plans are built once per distinct set of options by `for_options` and
+    shared by every page scraped with the same CrawlerRunConfig settings.
+    Removals of several tags are merged into a single walk of the tree.
+    """
+
+    # Removed from every page once target_elements have been copied out
+    NON_CONTENT_TAGS = ("script", "style", "link", "meta", "noscript")
+
+    def __init__(
+        self,
+        excluded_tags: tuple = (),
+        excluded_selector: str = "",
+        target_elements: tuple = (),
+        remove_forms: bool = False,
+        remove_comments: bool = False,
+        exclude_all_images: bool = False,
+    ):
+        self.excluded_tags = frozenset(excluded_tags)
+        form_tags = ("form",) if remove_forms else ()
+
+        # Removed in one walk before metadata and target elements are read
+        early_removals = list(excluded_tags)
+        if exclude_all_images:
+            early_removals.append("img")
+        if remove_comments:
+            early_removals.append(etree.Comment)
+        self.early_removals = tuple(early_removals)
+        # Removed in one walk after target elements are copied
+        self.late_removals = self.NON_CONTENT_TAGS + form_tags
+        # Removed again by _process_element, which can run on its own
+        self.element_removals = form_tags + tuple(excluded_tags)
+
+        self.excluded_selector = None
+        self.excluded_selector_error = None
+        if excluded_selector:
+            try:
+                self.excluded_selector = self._compile(excluded_selector)
+            except Exception as e:
+                self.excluded_selector_error = e
+
+        self.target_selectors = None
+        self.target_error = None
+        if target_elements:
+            try:
+                self.target_selectors = [self._compile(target) for target in target_elements]
+            except Exception as e:
+                self.target_error = e
+
+    @staticmethod
+    def _compile(selector: str):
+        # Imported here so a missing cssselect surfaces as a selector error,
+        # as it does with HtmlElement.cssselect
+        from lxml.cssselect import CSSSelector
+
+        return CSSSelector(selector, translator="html")
+
+    @classmethod
+    def for_options(cls, **options) -> "ScrapingPlan":
+        """
+        Return the shared plan for a set of scraping options.
+
+        Args:
+            **options: excluded_tags, excluded_selector, target_elements, remove_forms,
+                remove_comments and exclude_all_images, as found in CrawlerRunConfig
+
+        Returns:
+            ScrapingPlan: A cached plan, built on first use
+        """
+        return _cached_plan(
+            tuple(sorted(set(options.get("excluded_tags") or ()))),
+            options.get("excluded_selector") or "",
+            tuple(options.get("target_elements") or ()),
+            bool(options.get("remove_forms", False)),
+            bool(options.get("remove_comments", False)),
+            bool(options.get("exclude_all_images", False)),
+        )
+
+    @staticmethod
+    def remove(root, tags) -> None:
+        """Remove every descendant of root matching one of tags, in a single walk."""
+        if not tags:
+            return
+        for element in list(root.iter(*tags)):
+            if element is root:
+                continue
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
+
+    def remove_excluded(self, root) -> None:
+        """Remove elements matching the compiled excluded_selector."""
+        if self.excluded_selector is None:
+            return
+        for element in self.excluded_selector(root):
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
+
+    def select_targets(self, root) -> list:
+        """Elements matching target_elements, in selector order."""
+        targets = []
+        for selector in self.target_selectors:
+            targets.extend(selector(root))
+        return targets
+
+
+@lru_cache(maxsize=64)
+def _cached_plan(*options) -> ScrapingPlan:
+    return ScrapingPlan(*options)
+
+
 class ContentScrapingStrategy(ABC):
     @abstractmethod
     def scrap(self, url: str, html: str, **kwargs) -> ScrapingResult:
@@ -137,50 +270,16 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             return ScrapingResult(
                 cleaned_html="",
                 success=False,
-                media=Media(),
-                links=Links(),
                 metadata={},
             )
 
-        # Convert media items
-        media = Media(
-            images=[
-                MediaItem(**img)
-                for img in raw_result.get("media", {}).get("images", [])
-                if img
-            ],
-            videos=[
-                MediaItem(**vid)
-                for vid in raw_result.get("media", {}).get("videos", [])
-                if vid
-            ],
-            audios=[
-                MediaItem(**aud)
-                for aud in raw_result.get("media", {}).get("audios", [])
-                if aud
-            ],
-            tables=raw_result.get("media", {}).get("tables", [])
-        )
-
-        # Convert links
-        links = Links(
-            internal=[
-                Link(**link)
-                for link in raw_result.get("links", {}).get("internal", [])
-                if link
-            ],
-            external=[
-                Link(**link)
-                for link in raw_result.get("links", {}).get("external", [])
-                if link
-            ],
-        )
-
+        # Media and links are LinkRecord / MediaRecord lists, the result turns
+        # them into models only if they are read
         return ScrapingResult(
             cleaned_html=raw_result.get("cleaned_html", ""),
             success=raw_result.get("success", False),
-            media=media,
-            links=links,
+            media=raw_result.get("media"),
+            links=raw_result.get("links"),
             metadata=raw_result.get("metadata", {}),
         )
 
@@ -236,14 +335,17 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         internal_links_dict: Dict[str, Any],
         external_links_dict: Dict[str, Any],
         page_context: dict = None,
+        plan: ScrapingPlan = None,
         **kwargs,
     ) -> bool:
         base_domain = kwargs.get("base_domain", get_base_domain(url))
         exclude_domains = set(kwargs.get("exclude_domains", []))
+        if plan is None:
+            plan = ScrapingPlan.for_options(**kwargs)
 
         # Process links
         try:
-            base_element = element.xpath("//head/base[@href]")
+            base_element = BASE_HREF_XPATH(element)
             if base_element:
                 base_href = base_element[0].get("href", "").strip()
                 if base_href:
@@ -252,62 +354,64 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             self._log("error", f"Error extracting base URL: {str(e)}", "SCRAPE")
             pass
 
-        for link in element.xpath(".//a[@href]"):
-            href = link.get("href", "").strip()
-            if not href:
+        # Resolve, canonicalize and classify the page's links in one batch
+        canonicalizer = kwargs.get("url_canonicalizer") or DEFAULT_CANONICALIZER
+        links = LINK_XPATH(element)
+        canonical_hrefs = canonicalizer.canonicalize_many(
+            [link.get("href", "").strip() for link in links], url
+        )
+        link_domains, link_is_external = classify_links(
+            [href or "" for href in canonical_hrefs], base_domain
+        )
+        exclude_external_links = kwargs.get("exclude_external_links", False)
+
+        # Only the first occurrence of a URL is reported, so text and scores
+        # are computed for those alone
+        reported = []
+        for link, normalized_href, link_base_domain, is_external in zip(
+            links, canonical_hrefs, link_domains, link_is_external
+        ):
+            if not normalized_href:
                 continue
 
-            try:
-                normalized_href = normalize_url(href, url)
-                link_data = {
-                    "href": normalized_href,
-                    "text": link.text_content().strip(),
-                    "title": link.get("title", "").strip(),
-                    "base_domain": base_domain,
-                }
-                
-                # Add intrinsic scoring if enabled
-                if kwargs.get("score_links", False) and page_context is not None:
-                    try:
-                        intrinsic_score = calculate_link_intrinsic_score(
-                            link_text=link_data["text"],
-                            url=normalized_href,
-                            title_attr=link_data["title"],
-                            class_attr=link.get("class", ""),
-                            rel_attr=link.get("rel", ""),
-                            page_context=page_context
-                        )
-                        link_data["intrinsic_score"] = intrinsic_score
-                    except Exception:
-                        # Fail gracefully - assign default score
-                        link_data["intrinsic_score"] = 0
-                else:
-                    # No scoring enabled - assign infinity (all links equal priority)
-                    link_data["intrinsic_score"] = 0
-
-                is_external = is_external_url(normalized_href, base_domain)
-                if is_external:
-                    link_base_domain = get_base_domain(normalized_href)
-                    link_data["base_domain"] = link_base_domain
-                    if (
-                        kwargs.get("exclude_external_links", False)
-                        or link_base_domain in exclude_domains
-                    ):
-                        link.getparent().remove(link)
-                        continue
-
-                    if normalized_href not in external_links_dict:
-                        external_links_dict[normalized_href] = link_data
-                else:
-                    if normalized_href not in internal_links_dict:
-                        internal_links_dict[normalized_href] = link_data
+            if is_external:
+                if exclude_external_links or link_base_domain in exclude_domains:
+                    parent = link.getparent()
+                    if parent is not None:
+                        parent.remove(link)
+                    continue
+                links_dict = external_links_dict
+            else:
+                links_dict = internal_links_dict
+                link_base_domain = base_domain
 
-            except Exception as e:
-                self._log("error", f"Error processing link: {str(e)}", "SCRAPE")
+            if normalized_href in links_dict:
                 continue
+            links_dict[normalized_href] = link_data = LinkRecord(
+                href=normalized_href,
+                text=link.text_content().strip(),
+                title=link.get("title", "").strip(),
+                base_domain=link_base_domain,
+                # Without scoring all links have equal priority
+                intrinsic_score=0.0,
+            )
+            reported.append((link, link_data))
+
+        # Add intrinsic scoring if enabled
+        if kwargs.get("score_links", False) and page_context is not None and reported:
+            scores = calculate_link_intrinsic_scores(
+                [link_data.text for _, link_data in reported],
+                [link_data.href for _, link_data in reported],
+                [link_data.title for _, link_data in reported],
+                [link.get("class", "") for link, _ in reported],
+                [link.get("rel", "") for link, _ in reported],
+                page_context,
+            )
+            for (_, link_data), score in zip(reported, scores):
+                link_data.intrinsic_score = float(score)
 
         # Process images
-        images = element.xpath(".//img")
+        images = IMAGE_XPATH(element)
         total_images = len(images)
 
         for idx, img in enumerate(images):
@@ -338,38 +442,22 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         # Process videos and audios
         for media_type in ["video", "audio"]:
-            for elem in element.xpath(f".//{media_type}"):
-                media_info = {
-                    "src": elem.get("src"),
-                    "alt": elem.get("alt"),
-                    "type": media_type,
-                    "description": self.find_closest_parent_with_useful_text(
-                        elem, **kwargs
-                    ),
-                }
-                media[f"{media_type}s"].append(media_info)
+            for elem in MEDIA_XPATHS[media_type](element):
+                alt = elem.get("alt")
+                media[f"{media_type}s"].append(
+                    MediaRecord(src=elem.get("src"), alt=alt, type=media_type)
+                )
 
                 # Process source tags within media elements
-                for source in elem.xpath(".//source"):
+                for source in SOURCE_XPATH(elem):
                     if src := source.get("src"):
-                        media[f"{media_type}s"].append({**media_info, "src": src})
+                        media[f"{media_type}s"].append(
+                            MediaRecord(src=src, alt=alt, type=media_type)
+                        )
 
         # Clean up unwanted elements
-        if kwargs.get("remove_forms", False):
-            for form in element.xpath(".//form"):
-                form.getparent().remove(form)
-
-        if excluded_tags := kwargs.get("excluded_tags", []):
-            for tag in excluded_tags:
-                for elem in element.xpath(f".//{tag}"):
-                    elem.getparent().remove(elem)
-
-        if excluded_selector := kwargs.get("excluded_selector", ""):
-            try:
-                for elem in element.cssselect(excluded_selector):
-                    elem.getparent().remove(elem)
-            except Exception:
-                pass  # Invalid selector
+        plan.remove(element, plan.element_removals)
+        plan.remove_excluded(element)
 
         return True
 
@@ -457,7 +545,7 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         if srcset or data_srcset:
             score += 1
 
-        if picture := img.xpath("./ancestor::picture[1]"):
+        if picture := PICTURE_ANCESTOR_XPATH(img):
             score += 1
 
         if score <= kwargs.get("image_score_threshold", IMAGE_SCORE_THRESHOLD):
@@ -466,22 +554,20 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         # Process image variants
         unique_urls = set()
         image_variants = []
-        base_info = {
-            "alt": alt,
-            "desc": self.find_closest_parent_with_useful_text(img, **kwargs),
-            "score": score,
-            "type": "image",
-            "group_id": index,
-            "format": detected_format,
-        }
+        desc = self.find_closest_parent_with_useful_text(img, **kwargs)
 
         def add_variant(src: str, width: Optional[str] = None):
             if src and not src.startswith("data:") and src not in unique_urls:
                 unique_urls.add(src)
-                variant = {**base_info, "src": src}
-                if width:
-                    variant["width"] = width
-                image_variants.append(variant)
+                image_variants.append(MediaRecord(
+                    src=src,
+                    alt=alt,
+                    desc=desc,
+                    score=score,
+                    group_id=index,
+                    format=detected_format,
+                    width=int(width) if width and width.isdigit() else None,
+                ))
 
         # Add variants from different sources
         add_variant(src)
@@ -494,7 +580,7 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         # Handle picture element
         if picture:
-            for source in picture[0].xpath(".//source[@srcset]"):
+            for source in SOURCE_SRCSET_XPATH(picture[0]):
                 if source_srcset := source.get("srcset"):
                     for src_data in parse_srcset(source_srcset):
                         add_variant(src_data["url"], src_data["width"])
@@ -601,33 +687,41 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         success = True
         try:
-            doc = lhtml.document_fromstring(html)
+            # Reuse the page's shared document (or a tree parsed while the response
+            # streamed in) instead of parsing the string again
+            document = kwargs.get("document")
+            if document is not None:
+                doc = document.mutable_tree()
+            else:
+                doc = kwargs.get("html_tree")
+                if doc is None:
+                    doc = lhtml.document_fromstring(html)
             # Match BeautifulSoup's behavior of using body or full doc
             # body = doc.xpath('//body')[0] if doc.xpath('//body') else doc
             body = doc
 
             base_domain = get_base_domain(url)
+            plan = ScrapingPlan.for_options(target_elements=target_elements, **kwargs)
             
             # Extract page context for link scoring (if enabled) - do this BEFORE any removals
             page_context = None
             if kwargs.get("score_links", False):
                 try:
                     # Extract title
-                    title_elements = doc.xpath('//title')
-                    page_title = title_elements[0].text_content() if title_elements else ""
+                    title_element = next(doc.iter("title"), None)
+                    page_title = title_element.text_content() if title_element is not None else ""
                     
                     # Extract headlines
                     headlines = []
                     for tag in ['h1', 'h2', 'h3']:
-                        elements = doc.xpath(f'//{tag}')
-                        for el in elements:
+                        for el in doc.iter(tag):
                             text = el.text_content().strip()
                             if text:
                                 headlines.append(text)
                     headlines_text = ' '.join(headlines)
                     
                     # Extract meta description
-                    meta_desc_elements = doc.xpath('//meta[@name="description"]/@content')
+                    meta_desc_elements = META_DESCRIPTION_XPATH(doc)
                     meta_description = meta_desc_elements[0] if meta_desc_elements else ""
                     
                     # Create page context
@@ -635,37 +729,28 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 except Exception:
                     page_context = {}  # Fail gracefully
             
-            # Early removal of all images if exclude_all_images is set
-            # This is more efficient in lxml as we remove elements before any processing
-            if kwargs.get("exclude_all_images", False):
-                for img in body.xpath('//img'):
-                    if img.getparent() is not None:
-                        img.getparent().remove(img)
-
-            # Add comment removal
-            if kwargs.get("remove_comments", False):
-                comments = body.xpath("//comment()")
-                for comment in comments:
-                    comment.getparent().remove(comment)
-
-            # Handle tag-based removal first
-            excluded_tags = set(kwargs.get("excluded_tags", []) or [])
-            if excluded_tags:
-                for tag in excluded_tags:
-                    for element in body.xpath(f".//{tag}"):
-                        if element.getparent() is not None:
-                            element.getparent().remove(element)
+            # Remove excluded tags, comments and (with exclude_all_images) images
+            # in one walk, before any processing
+            plan.remove(body, plan.early_removals)
 
             # Handle CSS selector-based exclusion
-            excluded_selector = kwargs.get("excluded_selector", "")
-            if excluded_selector:
-                try:
-                    for element in body.cssselect(excluded_selector):
-                        if element.getparent() is not None:
-                            element.getparent().remove(element)
-                except Exception as e:
+            if plan.excluded_selector_error is not None:
+                self._log(
+                    "error",
+                    f"Error with excluded CSS selector: {str(plan.excluded_selector_error)}",
+                    "SCRAPE",
+                )
+            plan.remove_excluded(body)
+
+            # Strip the navigation, footers and banners the site repeats on every page
+            template_cache = kwargs.get("template_cache")
+            if template_cache is not None:
+                stripped = template_cache.strip(url, doc.find("body"))
+                if stripped:
                     self._log(
-                        "error", f"Error with excluded CSS selector: {str(e)}", "SCRAPE"
+                        "debug",
+                        "Stripped {count} template blocks from {url}",
+                        params={"count": stripped, "url": url},
                     )
 
             # Extract metadata before any content filtering
@@ -680,9 +765,9 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             content_element = None
             if target_elements:
                 try:
-                    for_content_targeted_element = []
-                    for target_element in target_elements:
-                        for_content_targeted_element.extend(body.cssselect(target_element))
+                    if plan.target_error is not None:
+                        raise plan.target_error
+                    for_content_targeted_element = plan.select_targets(body)
                     content_element = lhtml.Element("div")
                     content_element.extend(copy.deepcopy(for_content_targeted_element))
                 except Exception as e:
@@ -691,11 +776,8 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             else:
                 content_element = body
 
-            # Remove script and style tags
-            for tag in ["script", "style", "link", "meta", "noscript"]:
-                for element in body.xpath(f".//{tag}"):
-                    if element.getparent() is not None:
-                        element.getparent().remove(element)
+            # Remove script, style and (with remove_forms) form tags
+            plan.remove(body, plan.late_removals)
 
             # Handle social media and domain exclusions
             kwargs["exclude_domains"] = set(kwargs.get("exclude_domains", []))
@@ -706,12 +788,6 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 )
                 kwargs["exclude_domains"].update(kwargs["exclude_social_media_domains"])
 
-            # Process forms if needed
-            if kwargs.get("remove_forms", False):
-                for form in body.xpath(".//form"):
-                    if form.getparent() is not None:
-                        form.getparent().remove(form)
-
             # Process content
             media = {"images": [], "videos": [], "audios": [], "tables": []}
             internal_links_dict = {}
@@ -724,12 +800,13 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 internal_links_dict,
                 external_links_dict,
                 page_context=page_context,
+                plan=plan,
                 base_domain=base_domain,
                 **kwargs,
             )
 
             # Extract tables using the table extraction strategy if provided
-            if 'table' not in excluded_tags:
+            if 'table' not in plan.excluded_tags:
                 table_extraction = kwargs.get('table_extraction')
                 if table_extraction:
                     # Pass logger to the strategy if it doesn't have one
@@ -741,8 +818,13 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
             # Handle only_text option
             if kwargs.get("only_text", False):
+                # Collected in one walk, but replaced tag by tag: replace() drops
+                # the tail, so the order changes the text of outer elements
+                eligible = {tag: [] for tag in ONLY_TEXT_ELIGIBLE_TAGS}
+                for element in body.iter(*ONLY_TEXT_ELIGIBLE_TAGS):
+                    eligible[element.tag].append(element)
                 for tag in ONLY_TEXT_ELIGIBLE_TAGS:
-                    for element in body.xpath(f".//{tag}"):
+                    for element in eligible[tag]:
                         if element.text:
                             new_text = lhtml.Element("span")
                             new_text.text = element.text_content()
@@ -750,7 +832,7 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                                 element.getparent().replace(element, new_text)
 
             # Clean base64 images
-            for img in body.xpath(".//img[@src]"):
+            for img in IMAGE_SRC_XPATH(body):
                 src = img.get("src", "")
                 if self.BASE64_PATTERN.match(src):
                     img.set("src", self.BASE64_PATTERN.sub("", src))
@@ -772,79 +854,14 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
                 method="html",
                 with_tail=False,
             ).strip()
+            if document is not None:
+                document.set_cleaned(cleaned_html, content_element)
             
-            # Create links dictionary in the format expected by LinkPreview
             links = {
                 "internal": list(internal_links_dict.values()),
                 "external": list(external_links_dict.values()),
             }
-            
-            # Extract head content for links if configured
-            link_preview_config = kwargs.get("link_preview_config")
-            if link_preview_config is not None:
-                try:
-                    import asyncio
-                    from .link_preview import LinkPreview
-                    from .models import Links, Link
-                    
-                    verbose = link_preview_config.verbose
-                    
-                    if verbose:
-                        self._log("info", "Starting link head extraction for {internal} internal and {external} external links",
-                                  params={"internal": len(links["internal"]), "external": len(links["external"])}, tag="LINK_EXTRACT")
-                    
-                    # Convert dict links to Link objects
-                    internal_links = [Link(**link_data) for link_data in links["internal"]]
-                    external_links = [Link(**link_data) for link_data in links["external"]]
-                    links_obj = Links(internal=internal_links, external=external_links)
-                    
-                    # Create a config object for LinkPreview
-                    class TempCrawlerRunConfig:
-                        def __init__(self, link_config, score_links):
-                            self.link_preview_config = link_config
-                            self.score_links = score_links
-                    
-                    config = TempCrawlerRunConfig(link_preview_config, kwargs.get("score_links", False))
-                    
-                    # Extract head content (run async operation in sync context)
-                    async def extract_links():
-                        async with LinkPreview(self.logger) as extractor:
-                            return await extractor.extract_link_heads(links_obj, config)
-                    
-                    # Run the async operation
-                    try:
-                        # Check if we're already in an async context
-                        loop = asyncio.get_running_loop()
-                        # If we're in an async context, we need to run in a thread
-                        import concurrent.futures
-                        with concurrent.futures.ThreadPoolExecutor() as executor:
-                            future = executor.submit(asyncio.run, extract_links())
-                            updated_links = future.result()
-                    except RuntimeError:
-                        # No running loop, we can use asyncio.run directly
-                        updated_links = asyncio.run(extract_links())
-                    
-                    # Convert back to dict format
-                    links["internal"] = [link.dict() for link in updated_links.internal]
-                    links["external"] = [link.dict() for link in updated_links.external]
-                    
-                    if verbose:
-                        successful_internal = len([l for l in updated_links.internal if l.head_extraction_status == "valid"])
-                        successful_external = len([l for l in updated_links.external if l.head_extraction_status == "valid"])
-                        self._log("info", "Link head extraction completed: {internal_success}/{internal_total} internal, {external_success}/{external_total} external",
-                                  params={
-                                      "internal_success": successful_internal,
-                                      "internal_total": len(updated_links.internal),
-                                      "external_success": successful_external,
-                                      "external_total": len(updated_links.external)
-                                  }, tag="LINK_EXTRACT")
-                    else:
-                        self._log("info", "Link head extraction completed successfully", tag="LINK_EXTRACT")
-                        
-                except Exception as e:
-                    self._log("error", f"Error during link head extraction: {str(e)}", tag="LINK_EXTRACT")
-                    # Continue with original links if head extraction fails
-            
+
             return {
                 "cleaned_html": cleaned_html,
                 "success": success,
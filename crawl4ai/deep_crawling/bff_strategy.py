@@ -11,7 +11,7 @@ from .scorers import URLScorer
 from . import DeepCrawlStrategy
 
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
-from ..utils import normalize_url_for_deep_crawl
+from ..url_canonicalizer import URLCanonicalizer, DEFAULT_CANONICALIZER
 
 from math import inf as infinity
 
@@ -41,6 +41,7 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         include_external: bool = False,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        canonicalizer: Optional[URLCanonicalizer] = None,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -48,6 +49,7 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         self.include_external = include_external
         self.max_pages = max_pages
         self.logger = logger or logging.getLogger(__name__)
+        self.canonicalizer = canonicalizer or DEFAULT_CANONICALIZER
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
@@ -105,9 +107,12 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
 
         # If we have more links than remaining capacity, limit how many we'll process
         valid_links = []
-        for link in links:
-            url = link.get("href")
-            base_url = normalize_url_for_deep_crawl(url, source_url)
+        urls = [link.get("href") for link in links]
+        canonical_urls = self.canonicalizer.canonicalize_many(urls, source_url)
+        for url, base_url in zip(urls, canonical_urls):
+            if base_url is None:
+                self.stats.urls_skipped += 1
+                continue
             if base_url in visited:
                 continue
             if not await self.can_process_url(url, new_depth):
@@ -165,9 +170,11 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
                     break
                 item = await queue.get()
                 score, depth, url, parent_url = item
-                if url in visited:
+                # Discovered links are already canonical, the start URL may not be
+                key = self.canonicalizer.canonicalize_many([url])[0] or url
+                if key in visited:
                     continue
-                visited.add(url)
+                visited.add(key)
                 batch.append(item)
 
             if not batch:
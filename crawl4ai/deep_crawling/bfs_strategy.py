@@ -10,7 +10,7 @@ from .filters import FilterChain
 from .scorers import URLScorer
 from . import DeepCrawlStrategy  
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
-from ..utils import normalize_url_for_deep_crawl, efficient_normalize_url_for_deep_crawl
+from ..url_canonicalizer import URLCanonicalizer, DEFAULT_CANONICALIZER
 from math import inf as infinity
 
 class BFSDeepCrawlStrategy(DeepCrawlStrategy):
@@ -31,6 +31,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         score_threshold: float = -infinity,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        canonicalizer: Optional[URLCanonicalizer] = None,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -39,6 +40,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self.score_threshold = score_threshold
         self.max_pages = max_pages
         self.logger = logger or logging.getLogger(__name__)
+        self.canonicalizer = canonicalizer or DEFAULT_CANONICALIZER
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
@@ -97,12 +99,13 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
 
         valid_links = []
         
-        # First collect all valid links
-        for link in links:
-            url = link.get("href")
-            # Strip URL fragments to avoid duplicate crawling
-            # base_url = url.split('#')[0] if url else url
-            base_url = normalize_url_for_deep_crawl(url, source_url)
+        # First collect all valid links, canonicalized so each page is crawled once
+        urls = [link.get("href") for link in links]
+        canonical_urls = self.canonicalizer.canonicalize_many(urls, source_url)
+        for url, base_url in zip(urls, canonical_urls):
+            if base_url is None:
+                self.stats.urls_skipped += 1
+                continue
             if base_url in visited:
                 continue
             if not await self.can_process_url(url, next_depth):
@@ -149,7 +152,8 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Batch (non-streaming) mode:
         Processes one BFS level at a time, then yields all the results.
         """
-        visited: Set[str] = set()
+        # Links back to the start page compare equal to its canonical form
+        visited: Set[str] = set(self.canonicalizer.canonicalize_many([start_url]))
         # current_level holds tuples: (url, parent_url)
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
@@ -201,7 +205,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Streaming mode:
         Processes one BFS level at a time and yields results immediately as they arrive.
         """
-        visited: Set[str] = set()
+        visited: Set[str] = set(self.canonicalizer.canonicalize_many([start_url]))
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
 
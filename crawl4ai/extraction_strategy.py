@@ -2,11 +2,12 @@ from abc import ABC, abstractmethod
 import inspect
 from typing import Any, List, Dict, Optional, Tuple, Pattern, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
 import json
 import time
 from enum import IntFlag, auto
 
-from .prompts import PROMPT_EXTRACT_BLOCKS, PROMPT_EXTRACT_BLOCKS_WITH_INSTRUCTION, PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION, JSON_SCHEMA_BUILDER_XPATH, PROMPT_EXTRACT_INFERRED_SCHEMA
+from .prompts import PROMPT_EXTRACT_BLOCKS, PROMPT_EXTRACT_BLOCKS_WITH_INSTRUCTION, PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION, JSON_SCHEMA_BUILDER_XPATH, PROMPT_EXTRACT_INFERRED_SCHEMA, PROMPT_EXTRACT_BATCH
 from .config import (
     DEFAULT_PROVIDER,
     DEFAULT_PROVIDER_API_KEY,
@@ -20,6 +21,7 @@ from .utils import (
     sanitize_html,
     escape_json_string,
     perform_completion_with_backoff,
+    aperform_completion_with_backoff,
     extract_xml_data,
     split_and_parse_json_objects,
     sanitize_input_encode,
@@ -28,6 +30,7 @@ from .utils import (
 from .models import * # noqa: F403
 
 from .models import TokenUsage
+from .llm_scheduler import estimate_tokens, get_llm_scheduler
 
 from .model_loader import * # noqa: F403
 from .model_loader import (
@@ -94,6 +97,17 @@ class ExtractionStrategy(ABC):
                 extracted_content.extend(future.result())
         return extracted_content
 
+    async def arun(self, url: str, sections: List[str], *q, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of run, used by the crawler. Runs run() by default,
+        strategies waiting on remote calls override it to not block the event loop.
+
+        :param url: The URL of the webpage.
+        :param sections: List of sections (strings) to process.
+        :return: A list of processed JSON blocks.
+        """
+        return self.run(url, sections, *q, **kwargs)
+
 
 class NoExtractionStrategy(ExtractionStrategy):
     """
@@ -492,6 +506,7 @@ class LLMExtractionStrategy(ExtractionStrategy):
         verbose: Whether to print verbose output.
         usages: List of individual token usages.
         total_usage: Accumulated token usage.
+        batch_token_budget: Token budget of calls shared by several small pages.
     """
     _UNWANTED_PROPS = {
             'provider' : 'Instead, use llm_config=LLMConfig(provider="...")',
@@ -512,6 +527,8 @@ class LLMExtractionStrategy(ExtractionStrategy):
         input_format: str = "markdown",
         force_json_response=False,
         verbose=False,
+        batch_token_budget: Optional[int] = None,
+        batch_wait: float = 0.2,
         # Deprecated arguments
         provider: str = DEFAULT_PROVIDER,
         api_token: Optional[str] = None,
@@ -535,6 +552,10 @@ class LLMExtractionStrategy(ExtractionStrategy):
                             Options: "markdown" (default), "html", "fit_markdown"
             force_json_response: Whether to force a JSON response from the LLM.
             verbose: Whether to print verbose output.
+            batch_token_budget: Pack pages that fit in one chunk, from concurrent
+                            arun calls (e.g. arun_many), into shared LLM calls of up to
+                            this many estimated tokens. None sends one call per page.
+            batch_wait: Seconds a batch waits for more pages before it is sent.
 
             # Deprecated arguments, will be removed very soon
             provider: The provider to use for extraction. It follows the format <provider_name>/<model_name>, e.g., "ollama/llama3.3".
@@ -566,6 +587,11 @@ class LLMExtractionStrategy(ExtractionStrategy):
         self.verbose = verbose
         self.usages = []  # Store individual usages
         self.total_usage = TokenUsage()  # Accumulated usage
+        self.batch_token_budget = batch_token_budget
+        self.batch_wait = batch_wait
+        self._batch = []  # (url, html, future) of pages waiting for a batched call
+        self._batch_tokens = 0
+        self._batch_timer = None
 
         self.provider = provider
         self.api_token = api_token
@@ -605,9 +631,52 @@ class LLMExtractionStrategy(ExtractionStrategy):
             # print("[LOG] Extracting blocks from URL:", url)
             print(f"[LOG] Call LLM for {url} - block index: {ix}")
 
+        try:
+            response = perform_completion_with_backoff(
+                self.llm_config.provider,
+                self._build_prompt(url, html),
+                self.llm_config.api_token,
+                **self._completion_kwargs(url),
+            )  # , json_response=self.extract_type == "schema")
+            return self._handle_response(url, ix, response)
+        except Exception as e:
+            return self._error_blocks(ix, e)
+
+    async def aextract(self, url: str, ix: int, html: str) -> List[Dict[str, Any]]:
+        """
+        extract() on the async completion call, waiting for the provider's budget
+        without blocking the event loop.
+
+        Args:
+            url: The URL of the webpage.
+            ix: Index of the block.
+            html: The HTML content of the webpage.
+
+        Returns:
+            A list of extracted blocks or chunks.
+        """
+        if self.verbose:
+            print(f"[LOG] Call LLM for {url} - block index: {ix}")
+
+        try:
+            response = await aperform_completion_with_backoff(
+                self.llm_config.provider,
+                self._build_prompt(url, html),
+                self.llm_config.api_token,
+                **self._completion_kwargs(url),
+            )
+            return self._handle_response(url, ix, response)
+        except Exception as e:
+            return self._error_blocks(ix, e)
+
+    def _build_prompt(self, url: str, html: str) -> str:
+        """Fill the extraction prompt for one chunk."""
+        return self._fill_prompt(url, escape_json_string(sanitize_html(html)))
+
+    def _fill_prompt(self, url: str, content: str) -> str:
         variable_values = {
             "URL": url,
-            "HTML": escape_json_string(sanitize_html(html)),
+            "HTML": content,
         }
 
         prompt_with_variables = PROMPT_EXTRACT_BLOCKS
@@ -626,90 +695,86 @@ class LLMExtractionStrategy(ExtractionStrategy):
             prompt_with_variables = prompt_with_variables.replace(
                 "{" + variable + "}", variable_values[variable]
             )
+        return prompt_with_variables
+
+    def _completion_kwargs(self, url: str) -> Dict[str, Any]:
+        """Arguments of the completion call, the page URL is its owner in the LLM scheduler."""
+        return dict(
+            base_url=self.llm_config.base_url,
+            json_response=self.force_json_response,
+            extra_args=self.extra_args,
+            requests_per_minute=getattr(self.llm_config, "requests_per_minute", None),
+            tokens_per_minute=getattr(self.llm_config, "tokens_per_minute", None),
+            owner=url,
+        )
 
-        try:
-            response = perform_completion_with_backoff(
-                self.llm_config.provider,
-                prompt_with_variables,
-                self.llm_config.api_token,
-                base_url=self.llm_config.base_url,
-                json_response=self.force_json_response,
-                extra_args=self.extra_args,
-            )  # , json_response=self.extract_type == "schema")
-            # Track usage
-            usage = TokenUsage(
-                completion_tokens=response.usage.completion_tokens,
-                prompt_tokens=response.usage.prompt_tokens,
-                total_tokens=response.usage.total_tokens,
-                completion_tokens_details=response.usage.completion_tokens_details.__dict__
-                if response.usage.completion_tokens_details
-                else {},
-                prompt_tokens_details=response.usage.prompt_tokens_details.__dict__
-                if response.usage.prompt_tokens_details
-                else {},
-            )
-            self.usages.append(usage)
+    def _track_usage(self, response):
+        usage = TokenUsage.from_response(response)
+        self.usages.append(usage)
 
-            # Update totals
-            self.total_usage.completion_tokens += usage.completion_tokens
-            self.total_usage.prompt_tokens += usage.prompt_tokens
-            self.total_usage.total_tokens += usage.total_tokens
+        # Update totals
+        self.total_usage.add(usage)
 
-            try:
-                content = response.choices[0].message.content
-                blocks = None
-
-                if self.force_json_response:
-                    blocks = json.loads(content)
-                    if isinstance(blocks, dict):
-                        # If it has only one key which calue is list then assign that to blocks, exampled: {"news": [..]}
-                        if len(blocks) == 1 and isinstance(list(blocks.values())[0], list):
-                            blocks = list(blocks.values())[0]
-                        else:
-                            # If it has only one key which value is not list then assign that to blocks, exampled: { "article_id": "1234", ... }
-                            blocks = [blocks]
-                    elif isinstance(blocks, list):
-                        # If it is a list then assign that to blocks
-                        blocks = blocks
-                else: 
-                    # blocks = extract_xml_data(["blocks"], response.choices[0].message.content)["blocks"]
-                    blocks = extract_xml_data(["blocks"], content)["blocks"]
-                    blocks = json.loads(blocks)
+    def _handle_response(self, url: str, ix: int, response) -> List[Dict[str, Any]]:
+        """Track the response's token usage and parse its blocks."""
+        self._track_usage(response)
 
-                for block in blocks:
-                    block["error"] = False
-            except Exception:
-                parsed, unparsed = split_and_parse_json_objects(
-                    response.choices[0].message.content
+        try:
+            content = response.choices[0].message.content
+            blocks = None
+
+            if self.force_json_response:
+                blocks = json.loads(content)
+                if isinstance(blocks, dict):
+                    # If it has only one key which calue is list then assign that to blocks, exampled: {"news": [..]}
+                    if len(blocks) == 1 and isinstance(list(blocks.values())[0], list):
+                        blocks = list(blocks.values())[0]
+                    else:
+                        # If it has only one key which value is not list then assign that to blocks, exampled: { "article_id": "1234", ... }
+                        blocks = [blocks]
+                elif isinstance(blocks, list):
+                    # If it is a list then assign that to blocks
+                    blocks = blocks
+            else: 
+                # blocks = extract_xml_data(["blocks"], response.choices[0].message.content)["blocks"]
+                blocks = extract_xml_data(["blocks"], content)["blocks"]
+                blocks = json.loads(blocks)
+
+            for block in blocks:
+                block["error"] = False
+        except Exception:
+            parsed, unparsed = split_and_parse_json_objects(
+                response.choices[0].message.content
+            )
+            blocks = parsed
+            if unparsed:
+                blocks.append(
+                    {"index": 0, "error": True, "tags": ["error"], "content": unparsed}
                 )
-                blocks = parsed
-                if unparsed:
-                    blocks.append(
-                        {"index": 0, "error": True, "tags": ["error"], "content": unparsed}
-                    )
 
-            if self.verbose:
-                print(
-                    "[LOG] Extracted",
-                    len(blocks),
-                    "blocks from URL:",
-                    url,
-                    "block index:",
-                    ix,
-                )
-            return blocks
-        except Exception as e:
-            if self.verbose:
-                print(f"[LOG] Error in LLM extraction: {e}")
-            # Add error information to extracted_content
-            return [
-                {
-                    "index": ix,
-                    "error": True,
-                    "tags": ["error"],
-                    "content": str(e),
-                }
-            ]
+        if self.verbose:
+            print(
+                "[LOG] Extracted",
+                len(blocks),
+                "blocks from URL:",
+                url,
+                "block index:",
+                ix,
+            )
+        return blocks
+
+    def _error_blocks(self, ix: int, error: Exception) -> List[Dict[str, Any]]:
+        if self.verbose:
+            print(f"[LOG] Error in LLM extraction: {error}")
+        # Add error information to extracted_content
+        return [
+            {
+                "index": ix,
+                "error": True,
+                "tags": ["error"],
+                "content": str(error),
+            }
+        ]
 
     def _merge(self, documents, chunk_token_threshold, overlap) -> List[str]:
         """
@@ -780,6 +845,153 @@ class LLMExtractionStrategy(ExtractionStrategy):
 
         return extracted_content
 
+    async def arun(self, url: str, sections: List[str]) -> List[Dict[str, Any]]:
+        """
+        Process sections concurrently on the async completion call.
+
+        All chunks are sent at once and wait for the provider's process-wide
+        budget (LLMConfig requests_per_minute / tokens_per_minute), where chunks
+        of concurrently crawled pages take turns. Blocks keep the chunk order.
+
+        Args:
+            url: The URL of the webpage.
+            sections: List of sections (strings) to process.
+
+        Returns:
+            A list of extracted blocks or chunks.
+        """
+        if type(self).extract is not LLMExtractionStrategy.extract and type(self).aextract is LLMExtractionStrategy.aextract:
+            # A subclass customizing extract() keeps its synchronous behaviour
+            return await asyncio.to_thread(self.run, url, sections)
+
+        merged_sections = self._merge(
+            sections,
+            self.chunk_token_threshold,
+            overlap=int(self.chunk_token_threshold * self.overlap_rate),
+        )
+        if (
+            self.batch_token_budget
+            and len(merged_sections) == 1
+            and estimate_tokens(merged_sections[0]) <= self.batch_token_budget
+        ):
+            return await self._abatched(url, sanitize_input_encode(merged_sections[0]))
+
+        calls = [
+            self.aextract(url, ix, sanitize_input_encode(section))
+            for ix, section in enumerate(merged_sections)
+        ]
+        if self.llm_config.provider.startswith("groq/") and not (
+            getattr(self.llm_config, "requests_per_minute", None)
+            or getattr(self.llm_config, "tokens_per_minute", None)
+            or get_llm_scheduler().budget(self.llm_config.provider)
+        ):
+            # Without a budget keep run()'s sequential processing with a delay
+            results = []
+            for call in calls:
+                try:
+                    results.append(await call)
+                except Exception as e:
+                    results.append(e)
+                await asyncio.sleep(0.5)
+        else:
+            results = await asyncio.gather(*calls, return_exceptions=True)
+        extracted_content = []
+        for ix, result in enumerate(results):
+            if isinstance(result, Exception):
+                extracted_content.extend(self._error_blocks(ix, result))
+            else:
+                extracted_content.extend(result)
+        return extracted_content
+
+    async def _abatched(self, url: str, html: str) -> List[Dict[str, Any]]:
+        """Queue a single-chunk page for a batched call and wait for its blocks."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        tokens = estimate_tokens(html)
+        if self._batch and self._batch_tokens + tokens > self.batch_token_budget:
+            self._flush_batch()
+        self._batch.append((url, html, future))
+        self._batch_tokens += tokens
+        if self._batch_tokens >= self.batch_token_budget:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.batch_wait, self._flush_batch)
+        return await future
+
+    def _flush_batch(self):
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        batch, self._batch, self._batch_tokens = self._batch, [], 0
+        if batch:
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch):
+        """Extract a batch of pages in one call, pages missing from its answer fall back to their own calls."""
+        try:
+            if len(batch) == 1:
+                url, html, future = batch[0]
+                future.set_result(await self.aextract(url, 0, html))
+                return
+
+            documents = "\n".join(
+                f'<document id="{i}" url="{url}">\n{escape_json_string(sanitize_html(html))}\n</document>'
+                for i, (url, html, _) in enumerate(batch)
+            )
+            prompt = self._fill_prompt(
+                "(the url attribute of each document)", documents
+            ) + PROMPT_EXTRACT_BATCH.replace("{COUNT}", str(len(batch)))
+            if self.verbose:
+                print(f"[LOG] Call LLM for a batch of {len(batch)} pages")
+
+            per_document = {}
+            try:
+                kwargs = self._completion_kwargs(None)
+                kwargs["json_response"] = False
+                response = await aperform_completion_with_backoff(
+                    self.llm_config.provider, prompt, self.llm_config.api_token, **kwargs
+                )
+                self._track_usage(response)
+                per_document = self._split_batch(response.choices[0].message.content, len(batch))
+            except Exception as e:
+                if self.verbose:
+                    print(f"[LOG] Batched LLM extraction failed, extracting pages one by one: {e}")
+
+            fallback = [item for i, item in enumerate(batch) if i not in per_document]
+            for i, (_, _, future) in enumerate(batch):
+                if i in per_document:
+                    future.set_result(per_document[i])
+            if fallback:
+                results = await asyncio.gather(
+                    *[self.aextract(url, 0, html) for url, html, _ in fallback]
+                )
+                for (_, _, future), blocks in zip(fallback, results):
+                    future.set_result(blocks)
+        except BaseException as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    @staticmethod
+    def _split_batch(content: str, count: int) -> Dict[int, List[Dict[str, Any]]]:
+        """Blocks of each document in a batched answer, documents without a valid list are left out."""
+        per_document = {}
+        for match in re.finditer(r'<blocks document="(\d+)">(.*?)</blocks>', content or "", re.DOTALL):
+            ix = int(match.group(1))
+            if ix >= count or ix in per_document:
+                continue
+            try:
+                blocks = json.loads(match.group(2))
+            except ValueError:
+                continue
+            if isinstance(blocks, list) and all(isinstance(block, dict) for block in blocks):
+                for block in blocks:
+                    block["error"] = False
+                per_document[ix] = blocks
+        return per_document
+
     def show_usage(self) -> None:
         """Print a detailed token usage report showing total and per-request usage."""
         print("\n=== Token Usage Summary ===")
@@ -788,6 +1000,10 @@ class LLMExtractionStrategy(ExtractionStrategy):
         print(f"{'Completion':<15} {self.total_usage.completion_tokens:>12,}")
         print(f"{'Prompt':<15} {self.total_usage.prompt_tokens:>12,}")
         print(f"{'Total':<15} {self.total_usage.total_tokens:>12,}")
+        if self.total_usage.cache_hits or self.total_usage.cache_misses:
+            print(f"{'Cache hits':<15} {self.total_usage.cache_hits:>12,}")
+            print(f"{'Cache misses':<15} {self.total_usage.cache_misses:>12,}")
+            print(f"{'Saved':<15} {self.total_usage.saved_tokens:>12,}")
 
         print("\n=== Usage History ===")
         print(f"{'Request #':<10} {'Completion':>12} {'Prompt':>12} {'Total':>12}")
@@ -833,6 +1049,10 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         _get_element_attribute(element, attribute): Extracts an attribute's value from an element.
     """
 
+    # ParsedDocument representation ("raw_html", "cleaned_html") whose shared lxml tree
+    # is identical to what _parse_html builds. None means always parse the input string.
+    document_source: Optional[str] = None
+
     DEL = "\n"
 
     def __init__(self, schema: Dict[str, Any], **kwargs):
@@ -867,7 +1087,12 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             List[Dict[str, Any]]: A list of extracted items, each represented as a dictionary.
         """
 
-        parsed_html = self._parse_html(html_content)
+        # Read the page's shared tree when this strategy's parser would build the same one
+        document = kwargs.get("document")
+        if document is not None and self.document_source and document.is_full_document:
+            parsed_html = document.tree_for(self.document_source)
+        else:
+            parsed_html = self._parse_html(html_content)
         base_elements = self._get_base_elements(
             parsed_html, self.schema["baseSelector"]
         )
@@ -1636,6 +1861,9 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
 
+    # html.fromstring on a full page yields the same tree as the shared raw document
+    document_source = "raw_html"
+
     def _parse_html(self, html_content: str):
         return html.fromstring(html_content)
 
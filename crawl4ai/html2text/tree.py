@@ -0,0 +1,631 @@
+"""
+html2text over an lxml tree.
+
+`CustomHTML2Text` re-tokenizes serialized HTML with `html.parser`. TreeHTML2Text
+replays the same formatting rules on the start/end events of an already parsed
+lxml tree, and builds the citation form of the markdown alongside the raw form,
+so no regex pass over the output is needed to number the links.
+
+Only the options the markdown generators use are implemented; see
+`TreeHTML2Text.supports()`.
+"""
+
+import re
+import string
+import urllib.parse as urlparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from . import config
+from .elements import ListElement
+from .utils import escape_md, escape_md_section, hn, list_numbering_start
+
+# Elements without an end tag in serialized HTML, html.parser never sees them close
+VOID_ELEMENTS = frozenset(
+    (
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "param", "source", "track", "wbr",
+    )
+)
+
+# Options that change the output in ways TreeHTML2Text does not replicate, with
+# the value under which they are inert
+UNSUPPORTED_OPTIONS = {
+    "body_width": 0,
+    "bypass_tables": False,
+    "pad_tables": False,
+    "images_as_html": False,
+    "images_with_size": False,
+    "inline_links": True,
+    "google_doc": False,
+    "unicode_snob": False,
+    "links_each_paragraph": False,
+    "tag_callback": None,
+}
+
+RE_WHITESPACE = re.compile(r"\s+")
+# Characters the HTML serializer turns into entities, html.parser hands them over separately
+RE_ENTITY_CHARS = re.compile(r"([&<>])")
+RE_AFTER_STRESS = re.compile(r"[^][(){}\s.!?]")
+RE_ABSOLUTE_URL = re.compile(r"^[a-zA-Z+]+://")
+
+
+class TreeHTML2Text:
+    """
+    Markdown writer that walks an lxml tree with CustomHTML2Text's rules.
+
+    Output goes to two aligned list buffers: the raw markdown with inline links,
+    and the same markdown with links replaced by ⟨n⟩ citations. Link numbers are
+    assigned when a link closes, in document order, and shared by every link or
+    image with the same URL.
+
+    Attributes:
+        baseurl (str): Base URL relative links and images are joined with
+        references (Dict[str, Tuple[int, str]]): URL -> (citation number, description)
+                                                  for the last handled tree
+        resolve_citation_url (Callable[[str], str]): Maps a markdown URL to the URL
+                                                     it is cited under
+    """
+
+    def __init__(self, baseurl: str = "", handle_code_in_pre: bool = False):
+        self.baseurl = baseurl
+        self.handle_code_in_pre = handle_code_in_pre
+        self.resolve_citation_url: Callable[[str], str] = lambda url: url
+
+        # Options, with CustomHTML2Text's defaults
+        self.ignore_emphasis = config.IGNORE_EMPHASIS
+        self.ignore_links = False
+        self.ignore_images = config.IGNORE_IMAGES
+        self.ignore_mailto_links = True
+        self.ignore_tables = config.IGNORE_TABLES
+        self.images_to_alt = config.IMAGES_TO_ALT
+        self.default_image_alt = config.DEFAULT_IMAGE_ALT
+        self.skip_internal_links = False
+        self.protect_links = config.PROTECT_LINKS
+        self.use_automatic_links = config.USE_AUTOMATIC_LINKS
+        self.single_line_break = False
+        self.mark_code = False
+        self.include_sup_sub = False
+        self.escape_snob = False
+        self.escape_dot = False
+        self.escape_plus = False
+        self.escape_dash = False
+        self.ul_item_mark = "*"
+        self.emphasis_mark = "_"
+        self.strong_mark = "**"
+        self.open_quote = config.OPEN_QUOTE
+        self.close_quote = config.CLOSE_QUOTE
+
+        self.raw: List[str] = []
+        self.cited: List[str] = []
+        self.references: Dict[str, Tuple[int, str]] = {}
+        self._url_cache: Dict[str, str] = {}
+        self.abbr_list: Dict[str, str] = {}
+
+        # Writer state, named after HTML2Text's
+        self.quiet = 0
+        self.p_p = 0
+        self.start = True
+        self.space = False
+        self.last_was_nl = False
+        self.last_was_list = False
+        self.br_toggle = ""
+        self.astack: List[Optional[Dict[str, str]]] = []
+        self.maybe_automatic_link: Optional[str] = None
+        self.empty_link = False
+        self.link_start = 0
+        self.list: List[ListElement] = []
+        self.blockquote = 0
+        self.code = False
+        self.quote = False
+        self.inheader = False
+        self.abbr_title: Optional[str] = None
+        self.abbr_data: Optional[str] = None
+        self.stressed = False
+        self.preceding_stressed = False
+        self.preceding_data = ""
+        self.current_tag = ""
+        self.split_next_td = False
+        self.td_count = 0
+        self.table_start = False
+        self.inside_pre = False
+        self.inside_code = False
+        self.inside_link = False
+
+    @staticmethod
+    def supports(options: Dict) -> bool:
+        """True if every option can be honoured without falling back to CustomHTML2Text."""
+        if options.get("preserve_tags"):
+            return False
+        return all(
+            options.get(name, inert) == inert for name, inert in UNSUPPORTED_OPTIONS.items()
+        )
+
+    def update_params(self, **kwargs) -> None:
+        for key, value in kwargs.items():
+            if key not in UNSUPPORTED_OPTIONS and key != "preserve_tags":
+                setattr(self, key, value)
+
+    def handle(self, root) -> Tuple[str, str]:
+        """
+        Convert a tree to markdown.
+
+        Args:
+            root: lxml element to convert, its tail is not part of the output.
+                  None converts an empty document.
+
+        Returns:
+            Tuple[str, str]: Raw markdown and markdown with citations
+        """
+        self.start = True
+        self.references = {}
+        if root is not None:
+            self._walk(root)
+        self.pbr()
+        self.o("", force="end")
+        raw, cited = "".join(self.raw), "".join(self.cited)
+        self.raw, self.cited = [], []
+        return raw, cited
+
+    def references_markdown(self) -> str:
+        """Reference table for the citations of the last handled tree."""
+        parts = ["\n\n## References\n\n"]
+        parts.extend(
+            f"⟨{num}⟩ {url}{desc}\n"
+            for url, (num, desc) in sorted(self.references.items(), key=lambda x: x[1][0])
+        )
+        return "".join(parts)
+
+    def _walk(self, root) -> None:
+        for event, el in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+            tag = el.tag
+            if event == "start":
+                self.handle_starttag(tag, el)
+                if el.text:
+                    self.handle_text(el.text)
+            elif event == "end":
+                if tag not in VOID_ELEMENTS:
+                    self.handle_endtag(tag)
+                if el is not root and el.tail:
+                    self.handle_text(el.tail)
+            elif el is not root and el.tail:
+                # Comments and processing instructions only contribute their tail
+                self.handle_text(el.tail)
+
+    # -- output -----------------------------------------------------------
+
+    def out(self, s: str, cited: Optional[str] = None) -> None:
+        self.raw.append(s)
+        self.cited.append(s if cited is None else cited)
+        if s:
+            self.last_was_nl = s[-1] == "\n"
+
+    def pbr(self) -> None:
+        if self.p_p == 0:
+            self.p_p = 1
+
+    def p(self) -> None:
+        self.p_p = 1 if self.single_line_break else 2
+
+    def soft_br(self) -> None:
+        self.pbr()
+        self.br_toggle = "  "
+
+    def o(self, data: str, puredata: bool = False, force=False, cited=None) -> None:
+        """Emit data after the pending line breaks and space, like HTML2Text.o."""
+        if self.abbr_data is not None:
+            self.abbr_data += data
+        if self.quiet:
+            return
+
+        if puredata:
+            data = RE_WHITESPACE.sub(" ", data)
+            if data and data[0] == " ":
+                self.space = True
+                data = data[1:]
+        if not data and not force:
+            return
+
+        bq = ">" * self.blockquote
+        if not (force and data and data[0] == ">") and self.blockquote:
+            bq += " "
+
+        if self.start:
+            self.space = False
+            self.p_p = 0
+            self.start = False
+
+        if force == "end":
+            self.p_p = 0
+            self.out("\n")
+            self.space = False
+
+        if self.p_p:
+            self.out((self.br_toggle + "\n" + bq) * self.p_p)
+            self.space = False
+            self.br_toggle = ""
+
+        if self.space:
+            if not self.last_was_nl:
+                self.out(" ")
+            self.space = False
+
+        if self.abbr_list and force == "end":
+            for abbr, definition in self.abbr_list.items():
+                self.out("  *[" + abbr + "]: " + definition + "\n")
+
+        self.p_p = 0
+        # A callable cited form is built after the pending space is written
+        self.out(data, cited() if callable(cited) else cited)
+
+    def _open_link_text(self) -> None:
+        """Start the bracketed text of a link, which citations leave out."""
+        self.o("[", cited="")
+        self.link_start = len(self.raw)
+        self.maybe_automatic_link = None
+        self.empty_link = False
+
+    def _url(self, href: str) -> str:
+        url = self._url_cache.get(href)
+        if url is None:
+            url = self._url_cache[href] = escape_md(urlparse.urljoin(self.baseurl, href))
+        return url
+
+    def _cite(self, url: str, title: str, text: str) -> int:
+        url = self.resolve_citation_url(url)
+        if url not in self.references:
+            desc = []
+            if title:
+                desc.append(title)
+            if text and text != title:
+                desc.append(text)
+            self.references[url] = (
+                len(self.references) + 1,
+                ": " + " - ".join(desc) if desc else "",
+            )
+        return self.references[url][0]
+
+    # -- text -------------------------------------------------------------
+
+    def handle_text(self, text: str) -> None:
+        if "&" in text or "<" in text or ">" in text:
+            for i, piece in enumerate(RE_ENTITY_CHARS.split(text)):
+                self.handle_data(piece, entity_char=bool(i % 2))
+        else:
+            self.handle_data(text)
+
+    def handle_data(self, data: str, entity_char: bool = False) -> None:
+        if not data:
+            return
+        if self.inside_pre:
+            self.o(data)
+            return
+        if self.inside_code:
+            self.o(data.replace("\n", " "))
+            return
+
+        if self.stressed:
+            data = data.strip()
+            self.stressed = False
+            self.preceding_stressed = True
+        elif self.preceding_stressed:
+            if (
+                RE_AFTER_STRESS.match(data[0])
+                and not hn(self.current_tag)
+                and self.current_tag not in ("a", "code", "pre")
+            ):
+                data = " " + data
+            self.preceding_stressed = False
+
+        if self.maybe_automatic_link is not None:
+            href = self.maybe_automatic_link
+            if href == data and RE_ABSOLUTE_URL.match(href) and self.use_automatic_links:
+                self.o("<" + data + ">")
+                self.empty_link = False
+                return
+            self._open_link_text()
+
+        if not self.code and not entity_char and (
+            "\\" in data or self.escape_snob or self.escape_dot or self.escape_plus or self.escape_dash
+        ):
+            data = escape_md_section(
+                data,
+                snob=self.escape_snob,
+                escape_dot=self.escape_dot,
+                escape_plus=self.escape_plus,
+                escape_dash=self.escape_dash,
+            )
+        self.preceding_data = data
+        self.o(data, puredata=True)
+
+    # -- tags -------------------------------------------------------------
+
+    def handle_starttag(self, tag: str, el) -> None:
+        if tag == "pre":
+            self.o("```\n")
+            self.inside_pre = True
+            return
+        if tag == "code":
+            if self.inside_pre and not self.handle_code_in_pre:
+                return
+            self.inside_code = True
+            if not self.inside_link:
+                self.o("`")
+                return
+
+        self.current_tag = tag
+        if (
+            self.maybe_automatic_link is not None
+            and tag not in ("p", "div", "style", "dl", "dt")
+            and (tag != "img" or self.ignore_images)
+        ):
+            self._open_link_text()
+
+        level = hn(tag)
+        if level:
+            self.inheader = True
+            if self.astack:
+                # Heading inside a link, the marker has to come before the bracket
+                if self.raw and self.raw[-1] == "[":
+                    self.raw.pop()
+                    self.cited.pop()
+                    self.space = False
+                    self.o("#" * level + " ")
+                    self._open_link_text()
+            else:
+                self.p()
+                self.o("#" * level + " ")
+        elif tag in ("p", "div"):
+            if not self.astack and not self.split_next_td:
+                self.p()
+        elif tag == "br":
+            self.o("  \n> " if self.blockquote > 0 else "  \n")
+        elif tag == "hr":
+            self.p()
+            self.o("* * *")
+            self.p()
+        elif tag in ("head", "style", "script"):
+            self.quiet += 1
+        elif tag == "body":
+            self.quiet = 0
+        elif tag == "blockquote":
+            self.p()
+            self.o("> ", force=True)
+            self.start = True
+            self.blockquote += 1
+        elif tag in ("em", "i", "u"):
+            if not self.ignore_emphasis:
+                self._open_stress(self.emphasis_mark, word_boundary=True)
+        elif tag in ("strong", "b"):
+            if not self.ignore_emphasis:
+                self._open_stress(self.strong_mark)
+        elif tag in ("del", "strike", "s"):
+            self._open_stress("~~")
+        elif tag in ("kbd", "code", "tt"):
+            self.o("`")
+            self.code = not self.code
+        elif tag == "abbr":
+            self.abbr_title = el.get("title")
+            self.abbr_data = ""
+        elif tag == "q":
+            self.o(self.close_quote if self.quote else self.open_quote)
+            self.quote = not self.quote
+        elif tag == "a":
+            if not self.ignore_links:
+                self._start_link(el)
+        elif tag == "img":
+            if not self.ignore_images:
+                self._image(el)
+        elif tag == "dl":
+            self.p()
+            self.p_p = 0
+        elif tag == "dt":
+            if self.p_p == 0:
+                self.o("\n\n")
+            self.p_p = 0
+        elif tag == "dd":
+            self.o("    ")
+        elif tag in ("ol", "ul"):
+            if not self.list and not self.last_was_list:
+                self.p()
+            self.list.append(ListElement(tag, list_numbering_start(el.attrib)))
+        elif tag == "li":
+            self._list_item()
+        elif tag in ("table", "tr", "td", "th"):
+            if not self.ignore_tables:
+                if tag == "table":
+                    self.table_start = True
+                elif tag == "tr":
+                    self.td_count = 0
+                else:
+                    if self.split_next_td:
+                        self.o("| ")
+                    self.split_next_td = True
+                    self.td_count += 1
+        elif tag in ("sup", "sub"):
+            if self.include_sup_sub:
+                self.o("<{}>".format(tag))
+
+        self.last_was_list = tag in ("ol", "ul")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "pre":
+            self.o("\n```\n")
+            self.inside_pre = False
+            return
+        if tag == "code":
+            if self.inside_pre and not self.handle_code_in_pre:
+                return
+            self.inside_code = False
+            if not self.inside_link:
+                self.o("`")
+                return
+
+        self.current_tag = tag
+
+        if hn(tag):
+            if self.astack:
+                self.p_p = 0  # don't break up link name
+            else:
+                self.p()
+            self.inheader = False
+            return
+        elif tag in ("p", "div"):
+            if not self.astack and not self.split_next_td:
+                self.p()
+        elif tag in ("head", "style", "script"):
+            self.quiet -= 1
+        elif tag == "body":
+            self.quiet = 0
+        elif tag == "blockquote":
+            self.blockquote -= 1
+            self.p()
+        elif tag in ("em", "i", "u"):
+            if not self.ignore_emphasis:
+                self.o(self.emphasis_mark)
+        elif tag in ("strong", "b"):
+            if not self.ignore_emphasis:
+                self.o(self.strong_mark)
+        elif tag in ("del", "strike", "s"):
+            self.o("~~")
+        elif tag in ("kbd", "code", "tt"):
+            self.o("`")
+            self.code = not self.code
+        elif tag == "abbr":
+            if self.abbr_title is not None:
+                self.abbr_list[self.abbr_data] = self.abbr_title
+                self.abbr_title = None
+            self.abbr_data = None
+        elif tag == "q":
+            self.o(self.close_quote if self.quote else self.open_quote)
+            self.quote = not self.quote
+        elif tag == "a":
+            if not self.ignore_links:
+                self._end_link()
+        elif tag == "dt":
+            self.o("\n")
+        elif tag == "dd":
+            self.p_p = 0
+        elif tag in ("ol", "ul"):
+            if not self.list and not self.last_was_list:
+                self.p()
+            if self.list:
+                self.list.pop()
+                if not self.list:
+                    self.o("\n")
+        elif tag == "li":
+            self.pbr()
+        elif tag == "tr":
+            if self.ignore_tables:
+                self.soft_br()
+            else:
+                self.split_next_td = False
+                self.soft_br()
+                if self.table_start:
+                    # Underline table header
+                    self.o("|".join(["---"] * self.td_count))
+                    self.soft_br()
+                    self.table_start = False
+        elif tag in ("sup", "sub"):
+            if self.include_sup_sub:
+                self.o("</{}>".format(tag))
+
+        self.last_was_list = tag in ("ol", "ul")
+
+    def _open_stress(self, mark: str, word_boundary: bool = False) -> None:
+        # Separate the mark from what precedes it when markdown would not render
+        # it otherwise: after a word for "_", after the same character for "**"/"~~"
+        last = self.preceding_data[-1:] if self.preceding_data else ""
+        if word_boundary:
+            separate = last and last not in string.whitespace and last not in string.punctuation
+        else:
+            separate = last and len(mark) > 0 and last == mark[0]
+        if separate:
+            mark = " " + mark
+            self.preceding_data += " "
+        self.o(mark)
+        self.stressed = True
+
+    def _list_item(self) -> None:
+        self.pbr()
+        li = self.list[-1] if self.list else ListElement("ul", 0)
+        # Two spaces per level, three for an unordered list inside an ordered one
+        parent_list = None
+        for lst in self.list:
+            self.o("   " if parent_list == "ol" and lst.name == "ul" else "  ")
+            parent_list = lst.name
+        if li.name == "ul":
+            self.o(self.ul_item_mark + " ")
+        elif li.name == "ol":
+            li.num += 1
+            self.o(str(li.num) + ". ")
+        self.start = True
+
+    def _start_link(self, el) -> None:
+        self.inside_link = True
+        href = el.get("href")
+        if (
+            href is not None
+            and not (self.skip_internal_links and href.startswith("#"))
+            and not (self.ignore_mailto_links and href.startswith("mailto:"))
+        ):
+            self.maybe_automatic_link = href
+            self.empty_link = True
+            if self.protect_links:
+                href = "<" + href + ">"
+            self.astack.append({"href": href, "title": el.get("title")})
+        else:
+            self.astack.append(None)
+
+    def _end_link(self) -> None:
+        self.inside_link = False
+        if not self.astack:
+            return
+        a = self.astack.pop()
+        if self.maybe_automatic_link and not self.empty_link:
+            # Written as <url>, which is not cited
+            self.maybe_automatic_link = None
+            return
+        if not a:
+            return
+
+        empty = self.empty_link
+        if empty:
+            self.o("[")
+            self.empty_link = False
+            self.maybe_automatic_link = None
+        self.p_p = 0
+        title = escape_md(a.get("title") or "")
+        url = self._url(a["href"])
+        target = "]({url}{title})".format(url=url, title=' "{}"'.format(title) if title.strip() else "")
+        if empty:
+            # "[](url)" has no text to cite
+            self.o(target)
+            return
+        self.o(
+            target,
+            cited=lambda: f"⟨{self._cite(url, title, ''.join(self.raw[self.link_start:]))}⟩",
+        )
+
+    def _image(self, el) -> None:
+        src = el.get("src")
+        if src is None:
+            return
+        alt = el.get("alt") or self.default_image_alt
+
+        if self.maybe_automatic_link is not None:
+            href = self.maybe_automatic_link
+            if self.images_to_alt and escape_md(alt) == href and RE_ABSOLUTE_URL.match(href):
+                self.o("<" + escape_md(alt) + ">")
+                self.empty_link = False
+                return
+            self._open_link_text()
+
+        alt = escape_md(alt)
+        if self.images_to_alt:
+            self.o(alt)
+            return
+        url = self._url(src)
+        markdown = "![" + alt + "](" + url + ")"
+        self.o(markdown, cited=f"![{alt}⟨{self._cite(url, '', alt)}⟩]" if alt else None)
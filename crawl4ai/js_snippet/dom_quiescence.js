@@ -0,0 +1,111 @@
+async ({ idleMs, timeoutMs }) => {
+    const start = performance.now();
+    let lastActivity = start;
+    let mutations = 0;
+    let requests = 0;
+    let inflight = 0;
+
+    const touch = () => {
+        lastActivity = performance.now();
+    };
+
+    // Track DOM changes anywhere in the document
+    const mutationObserver = new MutationObserver((records) => {
+        mutations += records.length;
+        touch();
+    });
+    mutationObserver.observe(document.documentElement || document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+
+    // Count in-flight fetch() calls
+    const originalFetch = window.fetch;
+    let patchedFetch = null;
+    if (typeof originalFetch === "function") {
+        patchedFetch = function (...args) {
+            inflight++;
+            requests++;
+            touch();
+            return originalFetch.apply(this, args).finally(() => {
+                inflight--;
+                touch();
+            });
+        };
+        window.fetch = patchedFetch;
+    }
+
+    // Count in-flight XMLHttpRequests
+    const originalSend = XMLHttpRequest.prototype.send;
+    const patchedSend = function (...args) {
+        inflight++;
+        requests++;
+        touch();
+        this.addEventListener(
+            "loadend",
+            () => {
+                inflight--;
+                touch();
+            },
+            { once: true }
+        );
+        return originalSend.apply(this, args);
+    };
+    XMLHttpRequest.prototype.send = patchedSend;
+
+    // Resources started before we were installed (images, scripts, css)
+    // still report their completion through the performance timeline
+    let performanceObserver = null;
+    try {
+        performanceObserver = new PerformanceObserver((list) => {
+            requests += list.getEntries().length;
+            touch();
+        });
+        performanceObserver.observe({ type: "resource" });
+    } catch (e) {
+        performanceObserver = null;
+    }
+
+    const settled = await new Promise((resolve) => {
+        const tick = () => {
+            const now = performance.now();
+            const busy = inflight > 0 || document.readyState === "loading";
+            if (busy) {
+                // The quiet window only starts once the network has drained
+                lastActivity = now;
+            }
+            if (!busy && now - lastActivity >= idleMs) {
+                resolve(true);
+                return;
+            }
+            if (now - start >= timeoutMs) {
+                resolve(false);
+                return;
+            }
+            setTimeout(tick, Math.min(50, Math.max(idleMs / 4, 10)));
+        };
+        tick();
+    });
+
+    mutationObserver.disconnect();
+    if (performanceObserver) {
+        performanceObserver.disconnect();
+    }
+    // Only restore what we patched, in case the page replaced them meanwhile
+    if (patchedFetch && window.fetch === patchedFetch) {
+        window.fetch = originalFetch;
+    }
+    if (XMLHttpRequest.prototype.send === patchedSend) {
+        XMLHttpRequest.prototype.send = originalSend;
+    }
+
+    return {
+        settled: settled,
+        waited_ms: Math.round(performance.now() - start),
+        mutations: mutations,
+        requests: requests,
+        inflight: Math.max(inflight, 0),
+    };
+}
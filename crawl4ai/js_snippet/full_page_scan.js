@@ -0,0 +1,141 @@
+async ({ maxSteps, growthBudget, stepTimeoutMs, maxDurationMs }) => {
+    const start = performance.now();
+    const viewportHeight = window.innerHeight || document.documentElement.clientHeight || 800;
+    const scrollHeight = () =>
+        Math.max(
+            document.documentElement.scrollHeight,
+            document.body ? document.body.scrollHeight : 0
+        );
+    const initialHeight = scrollHeight();
+
+    const pending = new Set();
+    const seen = new WeakSet();
+    let loaded = 0;
+    let failed = 0;
+    let lastMutation = performance.now();
+
+    const track = (el) => {
+        if (pending.has(el)) return;
+        const done = (ok) => {
+            if (!pending.delete(el)) return;
+            ok ? loaded++ : failed++;
+        };
+        pending.add(el);
+        el.addEventListener("load", () => done(true), { once: true });
+        el.addEventListener("error", () => done(false), { once: true });
+    };
+
+    // Lazy media only starts loading once it nears the viewport; the observer tells
+    // us which elements did, so we wait on exactly those instead of a fixed sleep.
+    const intersectionObserver = new IntersectionObserver(
+        (entries) => {
+            for (const entry of entries) {
+                if (!entry.isIntersecting) continue;
+                const el = entry.target;
+                intersectionObserver.unobserve(el);
+                if (el.tagName === "IMG" && !el.complete) {
+                    track(el);
+                } else if (el.tagName === "IFRAME" && el.getAttribute("loading") === "lazy") {
+                    track(el);
+                }
+            }
+        },
+        { rootMargin: "0px 0px " + viewportHeight + "px 0px" }
+    );
+
+    const observeMedia = (root) => {
+        if (!root.querySelectorAll) return;
+        if (root.tagName === "IMG" || root.tagName === "IFRAME") {
+            if (!seen.has(root)) {
+                seen.add(root);
+                intersectionObserver.observe(root);
+            }
+        }
+        root.querySelectorAll("img, iframe").forEach((el) => {
+            if (seen.has(el)) return;
+            seen.add(el);
+            intersectionObserver.observe(el);
+        });
+    };
+    observeMedia(document);
+
+    // Newly injected sections (infinite feeds, lazy components) get observed too
+    const mutationObserver = new MutationObserver((records) => {
+        lastMutation = performance.now();
+        for (const record of records) {
+            record.addedNodes.forEach((node) => {
+                if (node.nodeType === 1) observeMedia(node);
+            });
+        }
+    });
+    mutationObserver.observe(document.documentElement, { childList: true, subtree: true });
+
+    // rAF is throttled in background tabs, so never wait on it for long
+    const nextFrame = () =>
+        new Promise((resolve) => {
+            requestAnimationFrame(() => resolve());
+            setTimeout(resolve, 100);
+        });
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+    const settle = async () => {
+        const stepStart = performance.now();
+        // Two frames so layout and intersection callbacks have run
+        await nextFrame();
+        await nextFrame();
+        while (performance.now() - stepStart < stepTimeoutMs) {
+            const quiet = performance.now() - lastMutation >= 50;
+            if (pending.size === 0 && quiet) return true;
+            await sleep(25);
+        }
+        return false;
+    };
+
+    let y = window.scrollY;
+    let steps = 0;
+    let stepTimeouts = 0;
+    let stopReason = "end";
+
+    while (true) {
+        if (maxSteps !== null && maxSteps !== undefined && steps >= maxSteps) {
+            stopReason = "max_steps";
+            break;
+        }
+        if (performance.now() - start >= maxDurationMs) {
+            stopReason = "timeout";
+            break;
+        }
+        const height = scrollHeight();
+        if (growthBudget !== null && growthBudget !== undefined && height - initialHeight > growthBudget) {
+            stopReason = "growth_budget";
+            break;
+        }
+        if (y + viewportHeight >= height) {
+            break;
+        }
+        y = Math.min(y + viewportHeight, height - viewportHeight);
+        window.scrollTo(0, y);
+        steps++;
+        if (!(await settle())) {
+            stepTimeouts++;
+        }
+    }
+
+    mutationObserver.disconnect();
+    intersectionObserver.disconnect();
+
+    const finalHeight = scrollHeight();
+    window.scrollTo(0, finalHeight);
+
+    return {
+        steps: steps,
+        stop_reason: stopReason,
+        initial_height: initialHeight,
+        final_height: finalHeight,
+        media_loaded: loaded,
+        media_failed: failed,
+        media_pending: pending.size,
+        step_timeouts: stepTimeouts,
+        elapsed_ms: Math.round(performance.now() - start),
+    };
+}
@@ -3,6 +3,10 @@ Link Extractor for Crawl4AI
 
 Extracts head content from links discovered during crawling using URLSeeder's
 efficient parallel processing and caching infrastructure.
+
+AsyncWebCrawler keeps one LinkPreview for its lifetime. Navigation links repeat
+on every page of a site, so head data fetched for one page is kept in memory
+and reused for the rest of the crawl.
 """
 
 import asyncio
@@ -22,21 +26,26 @@ class LinkPreview:
     This class provides intelligent link filtering and head content extraction with:
     - Pattern-based inclusion/exclusion filtering
     - Parallel processing with configurable concurrency
-    - Caching for performance
+    - Caching for performance, in memory for the lifetime of the instance
     - BM25 relevance scoring
     - Memory-safe processing for large link sets
     """
     
-    def __init__(self, logger: Optional[AsyncLogger] = None):
+    def __init__(self, logger: Optional[AsyncLogger] = None, seeder: Optional[AsyncUrlSeeder] = None):
         """
         Initialize the LinkPreview.
         
         Args:
             logger: Optional logger instance for recording events
+            seeder: Optional URLSeeder to share, with its HTTP client. It is not closed by close()
         """
         self.logger = logger
-        self.seeder: Optional[AsyncUrlSeeder] = None
+        self.seeder: Optional[AsyncUrlSeeder] = seeder
         self._owns_seeder = False
+        # Head extraction results by URL, None when the URL gave no result
+        self.head_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        # URLs being fetched for another page, so concurrent pages don't fetch them twice
+        self._pending: Dict[str, asyncio.Future] = {}
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -55,11 +64,12 @@ class LinkPreview:
             self._owns_seeder = True
     
     async def close(self):
-        """Clean up resources."""
+        """Clean up resources and forget cached head data."""
         if self.seeder and self._owns_seeder:
             await self.seeder.__aexit__(None, None, None)
             self.seeder = None
             self._owns_seeder = False
+        self.head_cache.clear()
     
     def _log(self, level: str, message: str, tag: str = "LINK_EXTRACT", **kwargs):
         """Helper method to safely log messages."""
@@ -196,14 +206,12 @@ class LinkPreview:
             self._log("info", "Starting batch processing: {total} links with {concurrency} concurrent workers",
                       params={"total": len(urls), "concurrency": concurrency})
         
-        # Create SeedingConfig for URLSeeder
+        # Create SeedingConfig for URLSeeder. Cached head data is shared by pages
+        # with different queries, so scoring is applied below, per call
         seeding_config = SeedingConfig(
             extract_head=True,
             concurrency=concurrency,
             hits_per_sec=getattr(link_config, 'hits_per_sec', None),
-            query=link_config.query,
-            score_threshold=link_config.score_threshold,
-            scoring_method="bm25" if link_config.query else None,
             verbose=verbose
         )
         
@@ -212,13 +220,65 @@ class LinkPreview:
             # Create a wrapper to track progress
             results = await self._extract_with_progress(urls, seeding_config, link_config)
         else:
-            results = await self.seeder.extract_head_for_urls(
-                urls=urls,
-                config=seeding_config,
-                concurrency=concurrency,
-                timeout=link_config.timeout
-            )
+            results = await self._cached_heads(urls, seeding_config, link_config)
+        
+        if link_config.query:
+            seeding_config.query = link_config.query
+            results = await self.seeder._apply_bm25_scoring(results, seeding_config)
+        
+        if link_config.score_threshold is not None:
+            results = [r for r in results if r.get("relevance_score", 0) >= link_config.score_threshold]
+        
+        return results
+    
+    async def _cached_heads(
+        self,
+        urls: List[str],
+        seeding_config: SeedingConfig,
+        link_config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Head extraction results for URLs, fetching only those not seen earlier.
         
+        Returns copies of the cached results, so scoring one page's links
+        does not change the cache.
+        """
+        fetch = [url for url in urls if url not in self.head_cache and url not in self._pending]
+        waiting = {url: self._pending[url] for url in urls if url in self._pending}
+        
+        if fetch:
+            loop = asyncio.get_running_loop()
+            for url in fetch:
+                self._pending[url] = loop.create_future()
+            try:
+                results = await self.seeder.extract_head_for_urls(
+                    urls=fetch,
+                    config=seeding_config,
+                    concurrency=link_config.concurrency,
+                    timeout=link_config.timeout
+                )
+                # Redirected URLs are reported under their final URL
+                for result in results:
+                    self.head_cache[result["url"]] = result
+                for url in fetch:
+                    self.head_cache.setdefault(url, None)
+            finally:
+                for url in fetch:
+                    future = self._pending.pop(url)
+                    if not future.done():
+                        future.set_result(None)
+        
+        if waiting:
+            await asyncio.gather(*waiting.values())
+        
+        self._log("debug", "Head data for {cached} of {total} links came from the cache",
+                  params={"cached": len(urls) - len(fetch), "total": len(urls)})
+        
+        results = []
+        for url in urls:
+            result = self.head_cache.get(url)
+            if result is not None:
+                results.append({**result, "head_data": dict(result.get("head_data") or {})})
         return results
     
     async def _extract_with_progress(
@@ -230,7 +290,6 @@ class LinkPreview:
         """Extract head content with progress reporting."""
         
         total_urls = len(urls)
-        concurrency = link_config.concurrency
         batch_size = max(1, total_urls // 10)  # Report progress every 10%
         
         # Process URLs and track progress
@@ -247,12 +306,7 @@ class LinkPreview:
         self._log("info", "Processing links in batches...")
         
         # Use existing method
-        results = await self.seeder.extract_head_for_urls(
-            urls=urls,
-            config=seeding_config,
-            concurrency=concurrency,
-            timeout=link_config.timeout
-        )
+        results = await self._cached_heads(urls, seeding_config, link_config)
         
         # Count results
         for result in results:
@@ -0,0 +1,156 @@
+"""
+Persistent cache of LLM responses
+
+Re-running an extraction over the same pages would pay for every LLM call
+again. With a cache set, perform_completion_with_backoff and
+aperform_completion_with_backoff look each call up by a hash of its provider,
+normalized prompt (which holds the schema, instruction and chunk) and the
+arguments that change the answer, and only call the provider on a miss:
+
+    set_llm_cache(SQLiteLLMCache())  # ~/.crawl4ai/llm_cache.db
+
+Responses are marked in response._hidden_params["llm_cache"] ("hit" or
+"miss"), which TokenUsage.from_response counts, with the tokens hits saved, in
+the usage of the strategies tracking it. LLMResponseCache subclasses plug in
+other stores; pass use_cache=False to skip the cache for a call.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+# extra_args entries that do not change the answer
+_IGNORED_ARGS = {"api_key", "base_url", "api_base", "timeout", "num_retries", "metadata"}
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace, so re-indented prompt templates still hit."""
+    return re.sub(r"\s+", " ", prompt).strip()
+
+
+def llm_cache_key(
+    provider: str,
+    prompt: str,
+    json_response: bool = False,
+    base_url: Optional[str] = None,
+    extra_args: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Content hash of a completion call."""
+    args = {k: v for k, v in (extra_args or {}).items() if k not in _IGNORED_ARGS}
+    content = json.dumps(
+        [provider, base_url, json_response, args, normalize_prompt(prompt)],
+        sort_keys=True, default=str, ensure_ascii=False,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(ABC):
+    """
+    Store of LLM responses by llm_cache_key().
+
+    Values are the response's model_dump(), usage included. hits, misses and
+    saved_tokens count the lookups of this cache since it was created.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+        self._stats_lock = threading.Lock()
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored response for key, None if there is none."""
+
+    @abstractmethod
+    def _set(self, key: str, provider: str, response: Dict[str, Any]):
+        """Store a response."""
+
+    def clear(self):
+        """Remove all stored responses."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        response = self._get(key)
+        with self._stats_lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.saved_tokens += (response.get("usage") or {}).get("total_tokens") or 0
+        return response
+
+    def set(self, key: str, provider: str, response: Dict[str, Any]):
+        self._set(key, provider, response)
+
+
+class SQLiteLLMCache(LLMResponseCache):
+    """
+    LLM responses in a local SQLite file.
+
+    Args:
+        path: Database file, defaults to llm_cache.db in the Crawl4AI home folder
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__()
+        if path is None:
+            from .utils import get_home_folder
+
+            path = os.path.join(get_home_folder(), "llm_cache.db")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT,
+                    response TEXT,
+                    total_tokens INTEGER,
+                    created_at REAL
+                )"""
+            )
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key: str, provider: str, response: Dict[str, Any]):
+        total_tokens = (response.get("usage") or {}).get("total_tokens") or 0
+        data = json.dumps(response, default=str, ensure_ascii=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?)",
+                (key, provider, data, total_tokens, time.time()),
+            )
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM llm_responses")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_cache: Optional[LLMResponseCache] = None
+
+
+def set_llm_cache(cache: Optional[LLMResponseCache]):
+    """Set the process-wide LLM response cache, None turns caching off."""
+    global _cache
+    _cache = cache
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """The process-wide LLM response cache, None when caching is off."""
+    return _cache
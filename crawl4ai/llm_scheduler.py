@@ -0,0 +1,215 @@
+"""
+Process-wide request and token budgets for LLM calls
+
+Every perform_completion_with_backoff / aperform_completion_with_backoff call
+reserves one request and its estimated tokens from the budget of its provider
+before it is sent. Budgets are per minute and shared by all strategies,
+crawlers and threads of the process, so many pages extracting at once keep
+the provider at its limit instead of running into rate limit errors.
+
+    get_llm_scheduler().configure("openai/gpt-4o-mini", requests_per_minute=500, tokens_per_minute=200_000)
+
+or per strategy through LLMConfig(requests_per_minute=..., tokens_per_minute=...).
+
+Reservations follow the generic cell rate algorithm: each budget keeps the
+time at which its capacity is used up, and a reservation only has to wait
+until that time is within the budget's window. A caller reserves its next
+request only once its previous one has started, so pages waiting on the same
+budget take turns instead of one large page going first with all its chunks.
+
+A rate limit response blocks the whole budget for its Retry-After time.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class LLMBudget:
+    """
+    Request and token budget of one provider.
+
+    Args:
+        requests_per_minute: Requests allowed per minute, None for no limit
+        tokens_per_minute: Prompt plus completion tokens allowed per minute, None for no limit
+        window: Seconds of budget that may be used at once. The default lets a
+            full minute's budget go out in a burst, as providers count per minute.
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window = window
+        self.clock = clock
+        self.blocked_until = 0.0
+        self._request_tat = 0.0
+        self._token_tat = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve one request of tokens tokens, returns the seconds to wait before sending it."""
+        with self._lock:
+            now = self.clock()
+            start = max(now, self.blocked_until)
+            if self.requests_per_minute:
+                self._request_tat = max(self._request_tat, now) + 60.0 / self.requests_per_minute
+                start = max(start, self._request_tat - self.window)
+            if self.tokens_per_minute and tokens:
+                self._token_tat = max(self._token_tat, now) + tokens * 60.0 / self.tokens_per_minute
+                start = max(start, self._token_tat - self.window)
+            return start - now
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """Correct a reservation's token estimate once the response reports its usage."""
+        if not self.tokens_per_minute or actual_tokens == estimated_tokens:
+            return
+        with self._lock:
+            shift = (actual_tokens - estimated_tokens) * 60.0 / self.tokens_per_minute
+            self._token_tat = max(self.clock(), self._token_tat + shift)
+
+    def block(self, seconds: float):
+        """Hold all reservations for seconds, after a rate limit response."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, self.clock() + seconds)
+
+
+class LLMScheduler:
+    """
+    Budgets of all providers plus the per-caller turn taking, see the module docstring.
+
+    Use get_llm_scheduler() for the process-wide instance.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._budgets: Dict[str, LLMBudget] = {}
+        self._lock = threading.Lock()
+        # (provider, owner) -> [lock, users], the lock is held from reservation to start
+        self._async_turns: Dict[Tuple[str, Hashable], list] = {}
+        self._thread_turns: Dict[Tuple[str, Hashable], list] = {}
+
+    def configure(
+        self,
+        provider: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        window: float = 60.0,
+    ) -> LLMBudget:
+        """Set the budget of a provider (e.g. "openai/gpt-4o-mini"). Calls without one are not limited."""
+        with self._lock:
+            budget = self._budgets.get(provider)
+            if budget is None:
+                budget = self._budgets[provider] = LLMBudget(clock=self.clock)
+            budget.requests_per_minute = requests_per_minute
+            budget.tokens_per_minute = tokens_per_minute
+            budget.window = window
+            return budget
+
+    def budget(self, provider: str) -> Optional[LLMBudget]:
+        """The provider's budget, None if it has none."""
+        return self._budgets.get(provider)
+
+    def block(self, provider: str, seconds: float):
+        """Hold the provider's calls for seconds, e.g. for a Retry-After header."""
+        budget = self._budgets.get(provider) or self.configure(provider)
+        budget.block(seconds)
+
+    def settle(self, provider: str, estimated_tokens: int, actual_tokens: int):
+        budget = self._budgets.get(provider)
+        if budget is not None:
+            budget.settle(estimated_tokens, actual_tokens)
+
+    @asynccontextmanager
+    async def _async_turn(self, provider: str, owner: Hashable):
+        key = (provider, owner)
+        turn = self._async_turns.get(key)
+        if turn is None:
+            turn = self._async_turns[key] = [asyncio.Lock(), 0]
+        turn[1] += 1
+        try:
+            async with turn[0]:
+                yield
+        finally:
+            turn[1] -= 1
+            if not turn[1]:
+                del self._async_turns[key]
+
+    @contextmanager
+    def _thread_turn(self, provider: str, owner: Hashable):
+        key = (provider, owner)
+        with self._lock:
+            turn = self._thread_turns.get(key)
+            if turn is None:
+                turn = self._thread_turns[key] = [threading.Lock(), 0]
+            turn[1] += 1
+        try:
+            with turn[0]:
+                yield
+        finally:
+            with self._lock:
+                turn[1] -= 1
+                if not turn[1]:
+                    del self._thread_turns[key]
+
+    async def acquire(self, provider: str, tokens: int = 0, owner: Hashable = None):
+        """Wait until a call of tokens estimated tokens may be sent. owner is e.g. the page URL."""
+        budget = self._budgets.get(provider)
+        if budget is None:
+            return
+        async with self._async_turn(provider, owner):
+            delay = budget.reserve(tokens)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def acquire_blocking(self, provider: str, tokens: int = 0, owner: Hashable = None):
+        """acquire() for synchronous callers, sleeps the calling thread."""
+        budget = self._budgets.get(provider)
+        if budget is None:
+            return
+        with self._thread_turn(provider, owner):
+            delay = budget.reserve(tokens)
+            if delay > 0:
+                time.sleep(delay)
+
+
+_scheduler = LLMScheduler()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """The process-wide LLMScheduler."""
+    return _scheduler
+
+
+def estimate_tokens(prompt: str, max_tokens: Optional[int] = None) -> int:
+    """Rough token count of a call, about four characters per prompt token plus the completion allowance."""
+    return len(prompt) // 4 + (max_tokens or 0)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Seconds from a rate limit error's Retry-After (or retry-after-ms) header, None if it has none."""
+    headers = getattr(error, "headers", None)
+    if not headers:
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return float(value) / 1000.0
+        value = headers.get("retry-after")
+        if value is not None:
+            return float(value)
+    except (TypeError, ValueError):
+        # HTTP-date values are rare for LLM APIs, fall back to exponential backoff
+        return None
+    return None
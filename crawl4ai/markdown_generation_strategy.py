@@ -2,27 +2,18 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Tuple
 from .models import MarkdownGenerationResult
 from .html2text import CustomHTML2Text
+from .html2text.tree import TreeHTML2Text
 # from .types import RelevantContentFilter
 from .content_filter_strategy import RelevantContentFilter
 import re
-from urllib.parse import urljoin
+from .url_canonicalizer import DEFAULT_CANONICALIZER
+from lxml import etree
+from lxml import html as lhtml
 
 # Pre-compile the regex pattern
 LINK_PATTERN = re.compile(r'!?\[([^\]]+)\]\(([^)]+?)(?:\s+"([^"]*)")?\)')
 
 
-def fast_urljoin(base: str, url: str) -> str:
-    """Fast URL joining for common cases."""
-    if url.startswith(("http://", "https://", "mailto:", "//")):
-        return url
-    if url.startswith("/"):
-        # Handle absolute paths
-        if base.endswith("/"):
-            return base[:-1] + url
-        return base + url
-    return urljoin(base, url)
-
-
 class MarkdownGenerationStrategy(ABC):
     """Abstract base class for markdown generation strategies."""
 
@@ -113,7 +104,7 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
             # Use cached URL if available, otherwise compute and cache
             if base_url and not url.startswith(("http://", "https://", "mailto:")):
                 if url not in url_cache:
-                    url_cache[url] = fast_urljoin(base_url, url)
+                    url_cache[url] = DEFAULT_CANONICALIZER.resolve(url, base_url)
                 url = url_cache[url]
 
             if url not in link_map:
@@ -171,6 +162,8 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
             options (Optional[Dict[str, Any]]): Additional options for markdown generation.
             content_filter (Optional[RelevantContentFilter]): Content filter for generating fit markdown.
             citations (bool): Whether to generate citations.
+            document (Optional[ParsedDocument]): Page document whose `content_source`
+                representation is input_html. Lets the content filter reuse its tree.
 
         Returns:
             MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
@@ -232,7 +225,11 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
             if content_filter or self.content_filter:
                 try:
                     content_filter = content_filter or self.content_filter
-                    filtered_html = content_filter.filter_content(input_html)
+                    document = kwargs.get("document")
+                    if document is not None:
+                        filtered_html = content_filter.filter_document(document, self.content_source)
+                    else:
+                        filtered_html = content_filter.filter_content(input_html)
                     filtered_html = "\n".join(
                         "<div>{}</div>".format(s) for s in filtered_html
                     )
@@ -258,3 +255,157 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
                 fit_markdown="",
                 fit_html="",
             )
+
+
+class FastMarkdownGenerator(DefaultMarkdownGenerator):
+    """
+    Markdown generator that walks the lxml tree instead of re-tokenizing HTML.
+
+    Produces the same markdown as DefaultMarkdownGenerator. When the crawler
+    passes the page's ParsedDocument, the tree of `content_source` is read
+    directly and no HTML is parsed at all. The markdown and its citation form
+    are written in the same walk, so links are numbered without a regex pass.
+
+    Differences from DefaultMarkdownGenerator:
+    - An image inside a link gets its own citation instead of the malformed
+      reference the regex produces for "[![alt](src)](href)"
+    - html2text options it does not implement (body_width > 0, bypass_tables,
+      pad_tables, images_as_html, images_with_size, inline_links=False,
+      preserve_tags, ...) make it fall back to DefaultMarkdownGenerator
+
+    Args:
+        content_filter (Optional[RelevantContentFilter]): Content filter for generating fit markdown.
+        options (Optional[Dict[str, Any]]): Additional options for markdown generation. Defaults to None.
+        content_source (str): Source of content to generate markdown from. Options: "cleaned_html", "raw_html", "fit_html". Defaults to "cleaned_html".
+
+    Returns:
+        MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
+    """
+
+    @staticmethod
+    def _parse(html: str):
+        if not html or not html.strip():
+            return None
+        try:
+            return lhtml.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            return None
+
+    def generate_markdown(
+        self,
+        input_html: str,
+        base_url: str = "",
+        html2text_options: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        content_filter: Optional[RelevantContentFilter] = None,
+        citations: bool = True,
+        **kwargs,
+    ) -> MarkdownGenerationResult:
+        """
+        Generate markdown with citations from the provided input HTML.
+
+        Args:
+            input_html (str): The HTML content to process (selected based on content_source).
+            base_url (str): Base URL for URL joins.
+            html2text_options (Optional[Dict[str, Any]]): HTML2Text options.
+            options (Optional[Dict[str, Any]]): Additional options for markdown generation.
+            content_filter (Optional[RelevantContentFilter]): Content filter for generating fit markdown.
+            citations (bool): Whether to generate citations.
+            document (Optional[ParsedDocument]): Page document whose `content_source`
+                representation is input_html. Its tree is walked instead of parsing input_html.
+
+        Returns:
+            MarkdownGenerationResult: Result containing raw markdown, fit markdown, fit HTML, and references markdown.
+        """
+        user_options = html2text_options or options or self.options
+        if user_options and not TreeHTML2Text.supports(user_options):
+            return super().generate_markdown(
+                input_html,
+                base_url=base_url,
+                html2text_options=html2text_options,
+                options=options,
+                content_filter=content_filter,
+                citations=citations,
+                **kwargs,
+            )
+
+        try:
+            h = TreeHTML2Text(baseurl=base_url)
+            default_options = {
+                "ignore_emphasis": False,
+                "ignore_links": False,
+                "ignore_images": False,
+                "protect_links": False,
+                "single_line_break": True,
+                "mark_code": True,
+                "escape_snob": False,
+            }
+            if user_options:
+                default_options.update(user_options)
+            h.update_params(**default_options)
+
+            url_cache = {}
+
+            def citation_url(url: str) -> str:
+                if base_url and not url.startswith(("http://", "https://", "mailto:")):
+                    if url not in url_cache:
+                        url_cache[url] = DEFAULT_CANONICALIZER.resolve(url, base_url)
+                    return url_cache[url]
+                return url
+
+            h.resolve_citation_url = citation_url
+
+            document = kwargs.get("document")
+            if not isinstance(input_html, str):
+                input_html = str(input_html or "")
+
+            try:
+                if document is not None:
+                    root = document.tree_for(self.content_source)
+                else:
+                    root = self._parse(input_html)
+                raw_markdown, markdown_with_citations = h.handle(root)
+                references_markdown = h.references_markdown()
+            except Exception as e:
+                raw_markdown = f"Error converting HTML to markdown: {str(e)}"
+                markdown_with_citations, references_markdown = raw_markdown, ""
+
+            raw_markdown = raw_markdown.replace("    ```", "```")
+            if citations:
+                markdown_with_citations = markdown_with_citations.replace("    ```", "```")
+            else:
+                markdown_with_citations, references_markdown = raw_markdown, ""
+
+            fit_markdown: Optional[str] = ""
+            filtered_html: Optional[str] = ""
+            if content_filter or self.content_filter:
+                try:
+                    content_filter = content_filter or self.content_filter
+                    if document is not None:
+                        filtered_html = content_filter.filter_document(document, self.content_source)
+                    else:
+                        filtered_html = content_filter.filter_content(input_html)
+                    filtered_html = "\n".join(
+                        "<div>{}</div>".format(s) for s in filtered_html
+                    )
+                    fit_markdown, _ = h.handle(self._parse(filtered_html))
+                except Exception as e:
+                    fit_markdown = f"Error generating fit markdown: {str(e)}"
+                    filtered_html = ""
+
+            return MarkdownGenerationResult(
+                raw_markdown=raw_markdown or "",
+                markdown_with_citations=markdown_with_citations or "",
+                references_markdown=references_markdown or "",
+                fit_markdown=fit_markdown or "",
+                fit_html=filtered_html or "",
+            )
+        except Exception as e:
+            error_msg = f"Error in markdown generation: {str(e)}"
+            return MarkdownGenerationResult(
+                raw_markdown=error_msg,
+                markdown_with_citations=error_msg,
+                references_markdown="",
+                fit_markdown="",
+                fit_html="",
+            )
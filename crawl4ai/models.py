@@ -5,6 +5,8 @@ from typing import Generic, TypeVar
 from enum import Enum
 from dataclasses import dataclass
 from .ssl_certificate import SSLCertificate
+from .spill import SpilledField
+from .serialization import json_dumps_str, json_loads
 from datetime import datetime
 from datetime import timedelta
 
@@ -90,6 +92,39 @@ class TokenUsage:
     total_tokens: int = 0
     completion_tokens_details: Optional[dict] = None
     prompt_tokens_details: Optional[dict] = None
+    # LLM response cache lookups, tokens of cache hits are saved instead of spent
+    cache_hits: int = 0
+    cache_misses: int = 0
+    saved_tokens: int = 0
+
+    @classmethod
+    def from_response(cls, response) -> "TokenUsage":
+        """Usage of a litellm completion response, counting a cache hit as saved tokens."""
+        usage = response.usage
+        cache = (getattr(response, "_hidden_params", None) or {}).get("llm_cache")
+        if cache == "hit":
+            return cls(cache_hits=1, saved_tokens=usage.total_tokens)
+        return cls(
+            completion_tokens=usage.completion_tokens,
+            prompt_tokens=usage.prompt_tokens,
+            total_tokens=usage.total_tokens,
+            completion_tokens_details=usage.completion_tokens_details.__dict__
+            if usage.completion_tokens_details
+            else {},
+            prompt_tokens_details=usage.prompt_tokens_details.__dict__
+            if usage.prompt_tokens_details
+            else {},
+            cache_misses=1 if cache == "miss" else 0,
+        )
+
+    def add(self, other: "TokenUsage"):
+        """Accumulate another usage into this one."""
+        self.completion_tokens += other.completion_tokens
+        self.prompt_tokens += other.prompt_tokens
+        self.total_tokens += other.total_tokens
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.saved_tokens += other.saved_tokens
 
 class UrlModel(BaseModel):
     url: HttpUrl
@@ -126,21 +161,50 @@ class MarkdownGenerationResult(BaseModel):
     def __str__(self):
         return self.raw_markdown
     
+# Large CrawlResult fields that can be spilled to disk, see crawl4ai.spill
+SPILLABLE_FIELDS = ("html", "cleaned_html", "screenshot", "pdf", "mhtml")
+
+# CrawlResult fields that CrawlerRunConfig.result_fields can leave out. The
+# others (url, success, status_code, error_message ...) are always kept
+PROJECTABLE_FIELDS = frozenset((
+    "html", "cleaned_html", "fit_html", "markdown", "media", "links", "tables",
+    "metadata", "extracted_content", "screenshot", "pdf", "mhtml", "downloaded_files",
+    "js_execution_result", "response_headers", "ssl_certificate", "network_requests",
+    "console_messages", "wait_stats",
+))
+
+
+def _artifact(name: str) -> property:
+    """Property for a SPILLABLE_FIELDS field, which reads a spilled value back from disk."""
+
+    def getter(self):
+        value = self._artifacts.get(name)
+        return value.read() if isinstance(value, SpilledField) else value
+
+    def setter(self, value):
+        self._artifacts[name] = value
+
+    return property(getter, setter)
+
+
 class CrawlResult(BaseModel):
     url: str
-    html: str
-    fit_html: Optional[str] = None
+    _fit_html: Optional[str] = PrivateAttr(default=None)
+    _fit_html_factory: Optional[Callable[[], str]] = PrivateAttr(default=None)
     success: bool
-    cleaned_html: Optional[str] = None
-    media: Dict[str, List[Dict]] = {}
-    links: Dict[str, List[Dict]] = {}
+    # Dicts of lists, scraped links and media stay records until first read
+    _media: Dict[str, List[Any]] = PrivateAttr(default_factory=dict)
+    _links: Dict[str, List[Any]] = PrivateAttr(default_factory=dict)
+    _pending_records: bool = PrivateAttr(default=False)
+    # html, cleaned_html, screenshot (str or bytes), pdf (bytes) and mhtml, or SpilledField handles
+    _artifacts: Dict[str, Any] = PrivateAttr(default_factory=dict)
     downloaded_files: Optional[List[str]] = None
     js_execution_result: Optional[Dict[str, Any]] = None
-    screenshot: Optional[str] = None
-    pdf: Optional[bytes] = None
-    mhtml: Optional[str] = None
+    screenshot_path: Optional[str] = None
     _markdown: Optional[MarkdownGenerationResult] = PrivateAttr(default=None)
-    extracted_content: Optional[str] = None
+    # JSON string, or the structured extraction output until the string is read
+    _extracted_content: Optional[str] = PrivateAttr(default=None)
+    _extracted_data: Any = PrivateAttr(default=None)
     metadata: Optional[dict] = None
     error_message: Optional[str] = None
     session_id: Optional[str] = None
@@ -151,6 +215,7 @@ class CrawlResult(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    wait_stats: Optional[Dict[str, Any]] = None
     tables: List[Dict] = Field(default_factory=list)  # NEW – [{headers,rows,caption,summary}]
 
     class Config:
@@ -170,7 +235,23 @@ class CrawlResult(BaseModel):
     
     def __init__(self, **data):
         markdown_result = data.pop('markdown', None)
+        fit_html = data.pop('fit_html', None)
+        media = data.pop('media', None)
+        links = data.pop('links', None)
+        extracted_content = data.pop('extracted_content', None)
+        extracted_data = data.pop('extracted_data', None)
+        artifacts = {name: data.pop(name, None) for name in SPILLABLE_FIELDS}
         super().__init__(**data)
+        self.fit_html = fit_html
+        self.media = media
+        self.links = links
+        if extracted_data is not None:
+            self.extracted_data = extracted_data
+        else:
+            self.extracted_content = extracted_content
+        if artifacts["html"] is None:
+            artifacts["html"] = ""
+        self._artifacts.update(artifacts)
         if markdown_result is not None:
             self._markdown = (
                 MarkdownGenerationResult(**markdown_result)
@@ -228,14 +309,115 @@ class CrawlResult(BaseModel):
         )
     
     @property
-    def fit_html(self):
+    def fit_html(self) -> Optional[str]:
         """
-        Deprecated property that raises an AttributeError when accessed.
+        Raw HTML preprocessed for schema generation.
+
+        Building it re-parses the whole page, so aprocess_html hands over a
+        deferred factory unless a stage already needed it. The first access
+        builds the value and keeps it.
         """
-        raise AttributeError(
-            "The 'fit_html' attribute is deprecated and has been removed. "
-            "Please use 'markdown.fit_html' instead."
-        )
+        if self._fit_html is None and self._fit_html_factory is not None:
+            self._fit_html = self._fit_html_factory()
+            self._fit_html_factory = None
+        return self._fit_html
+
+    @fit_html.setter
+    def fit_html(self, value: Optional[Union[str, Callable[[], str]]]):
+        """Set the fit HTML, or a zero-argument callable that builds it on first access."""
+        if callable(value):
+            self._fit_html, self._fit_html_factory = None, value
+        else:
+            self._fit_html, self._fit_html_factory = value, None
+
+    @property
+    def fit_html_deferred(self) -> bool:
+        """Whether fit_html is still a factory that has not been called."""
+        return self._fit_html_factory is not None
+
+    @property
+    def extracted_content(self) -> Optional[str]:
+        """
+        Extraction output as a JSON string.
+
+        aprocess_html hands over the structured output (extracted_data); the
+        pretty-printed string is only rendered when this is first read.
+        """
+        if self._extracted_content is None and self._extracted_data is not None:
+            self._extracted_content = json_dumps_str(self._extracted_data, indent=True)
+        return self._extracted_content
+
+    @extracted_content.setter
+    def extracted_content(self, value: Optional[str]):
+        self._extracted_content, self._extracted_data = value, None
+
+    @property
+    def extracted_data(self) -> Any:
+        """Extraction output as Python objects, parsed from extracted_content if only the string is held."""
+        if self._extracted_data is None and self._extracted_content:
+            try:
+                self._extracted_data = json_loads(self._extracted_content)
+            except ValueError:
+                return None
+        return self._extracted_data
+
+    @extracted_data.setter
+    def extracted_data(self, value: Any):
+        self._extracted_data, self._extracted_content = value, None
+
+    @property
+    def extracted_content_deferred(self) -> bool:
+        """Whether the extraction output is held structured and not rendered to a string yet."""
+        return self._extracted_content is None and self._extracted_data is not None
+
+    html = _artifact("html")
+    cleaned_html = _artifact("cleaned_html")
+    screenshot = _artifact("screenshot")
+    pdf = _artifact("pdf")
+    mhtml = _artifact("mhtml")
+
+    def spilled(self, name: str) -> Optional["SpilledField"]:
+        """
+        The handle of a field spilled to disk, or None if it is held in memory.
+
+        Reading the field itself loads the whole value; the handle can map the
+        file instead (SpilledField.mmap()) or hand its path to other tools.
+        """
+        value = self._artifacts.get(name)
+        return value if isinstance(value, SpilledField) else None
+
+    @property
+    def media(self) -> Dict[str, List[Dict]]:
+        """
+        Media found on the page, {"images": [...], "videos": [...], "audios": [...]}.
+
+        The scraper hands over compact records, see _Record. They are turned
+        into dicts on the first access to media or links.
+        """
+        self._materialize_records()
+        return self._media
+
+    @media.setter
+    def media(self, value: Optional[Dict[str, List[Any]]]):
+        self._media = value or {}
+        self._pending_records = self._pending_records or _holds_records(self._media)
+
+    @property
+    def links(self) -> Dict[str, List[Dict]]:
+        """Links found on the page, {"internal": [...], "external": [...]}. See media."""
+        self._materialize_records()
+        return self._links
+
+    @links.setter
+    def links(self, value: Optional[Dict[str, List[Any]]]):
+        self._links = value or {}
+        self._pending_records = self._pending_records or _holds_records(self._links)
+
+    def _materialize_records(self):
+        if self._pending_records:
+            self._media = _records_to_dicts(self._media)
+            self._links = _records_to_dicts(self._links)
+            self._pending_records = False
 
     def model_dump(self, *args, **kwargs):
         """
@@ -255,8 +437,27 @@ class CrawlResult(BaseModel):
         result = super().model_dump(*args, **kwargs)
         if self._markdown is not None:
             result["markdown"] = self._markdown.model_dump() 
+        result["fit_html"] = self.fit_html
+        if _dumps_field("extracted_content", kwargs):
+            result["extracted_content"] = self.extracted_content
+        for name in SPILLABLE_FIELDS:
+            if _dumps_field(name, kwargs):
+                result[name] = getattr(self, name)
+        # Media and links are private attributes too, dumped as copies like model fields
+        for name in ("media", "links"):
+            if _dumps_field(name, kwargs):
+                result[name] = {
+                    key: [dict(item) if isinstance(item, dict) else item for item in items]
+                    for key, items in getattr(self, name).items()
+                }
         return result
 
+# Keyword arguments CrawlResult(**data) accepts: its model fields plus the
+# values kept in private attributes behind properties
+CRAWL_RESULT_FIELDS = frozenset(CrawlResult.model_fields) | {
+    "markdown", "fit_html", "media", "links", "extracted_content", "extracted_data", *SPILLABLE_FIELDS
+}
+
 class StringCompatibleMarkdown(str):
     """A string subclass that also provides access to MarkdownGenerationResult attributes"""
     def __new__(cls, markdown_result):
@@ -312,7 +513,8 @@ class AsyncCrawlResponse(BaseModel):
     response_headers: Dict[str, str]
     js_execution_result: Optional[Dict[str, Any]] = None
     status_code: int
-    screenshot: Optional[str] = None
+    screenshot: Optional[Union[str, bytes]] = None
+    screenshot_path: Optional[str] = None
     pdf_data: Optional[bytes] = None
     mhtml_data: Optional[str] = None
     get_delayed_content: Optional[Callable[[Optional[float]], Awaitable[str]]] = None
@@ -321,6 +523,9 @@ class AsyncCrawlResponse(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    wait_stats: Optional[Dict[str, Any]] = None
+    # lxml document parsed while the body streamed in (HTTPCrawlerConfig.stream_parse)
+    html_tree: Optional[Any] = Field(default=None, exclude=True)
 
     class Config:
         arbitrary_types_allowed = True
@@ -369,9 +574,201 @@ class Links(BaseModel):
     external: List[Link] = []
 
 
+class _Record:
+    """
+    Slotted stand-in for a scraping model, built by the scraper for every link
+    and media item on a page.
+
+    A record takes a fraction of the memory and construction time of the pydantic
+    model. Records are turned into models or dicts only when a caller reads them,
+    and support read-only mapping access (record["href"], Link(**record)) so code
+    written for the dict form keeps working.
+    """
+
+    __slots__ = ()
+    model = None
+
+    def keys(self):
+        return self.__slots__
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Same as model_dump() of the equivalent model."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_model(self) -> BaseModel:
+        # Records hold validated values, so the model is built without validation
+        return self.model.model_construct(**self.to_dict())
+
+    def __eq__(self, other):
+        if isinstance(other, _Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class LinkRecord(_Record):
+    """Compact form of Link."""
+
+    __slots__ = tuple(Link.model_fields)
+    model = Link
+
+    def __init__(
+        self,
+        href: str = "",
+        text: str = "",
+        title: str = "",
+        base_domain: str = "",
+        intrinsic_score: Optional[float] = None,
+    ):
+        self.href = href
+        self.text = text
+        self.title = title
+        self.base_domain = base_domain
+        self.head_data = None
+        self.head_extraction_status = None
+        self.head_extraction_error = None
+        self.intrinsic_score = intrinsic_score
+        self.contextual_score = None
+        self.total_score = None
+
+
+class MediaRecord(_Record):
+    """Compact form of MediaItem."""
+
+    __slots__ = tuple(MediaItem.model_fields)
+    model = MediaItem
+
+    def __init__(
+        self,
+        src: Optional[str] = "",
+        alt: Optional[str] = "",
+        desc: Optional[str] = "",
+        score: int = 0,
+        type: str = "image",
+        group_id: int = 0,
+        format: Optional[str] = None,
+        width: Optional[int] = None,
+    ):
+        self.src = src
+        self.data = ""
+        self.alt = alt
+        self.desc = desc
+        self.score = score
+        self.type = type
+        self.group_id = group_id
+        self.format = format
+        self.width = width
+
+
+def _holds_records(groups: Any) -> bool:
+    """Whether a {"internal": [...], ...} style dict holds records rather than dicts or models."""
+    return isinstance(groups, dict) and any(
+        isinstance(items, list) and items and isinstance(items[0], _Record)
+        for items in groups.values()
+    )
+
+
+def _dumps_field(name: str, dump_kwargs: Dict[str, Any]) -> bool:
+    """Whether model_dump(**dump_kwargs) should output the private-attribute field name."""
+    include, exclude = dump_kwargs.get("include"), dump_kwargs.get("exclude")
+    return (include is None or name in include) and (exclude is None or name not in exclude)
+
+
+def _records_to_dicts(groups: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    return {
+        key: [item.to_dict() if isinstance(item, _Record) else item for item in items]
+        for key, items in groups.items()
+    }
+
+
 class ScrapingResult(BaseModel):
     cleaned_html: str
     success: bool
-    media: Media = Media()
-    links: Links = Links()
+    # Links and media are kept as the scraper's records until read, see _Record
+    _media: Union[Media, Dict[str, List[Any]]] = PrivateAttr(default=None)
+    _links: Union[Links, Dict[str, List[Any]]] = PrivateAttr(default=None)
     metadata: Dict[str, Any] = {}
+
+    def __init__(self, **data):
+        media = data.pop("media", None)
+        links = data.pop("links", None)
+        super().__init__(**data)
+        self.media = media
+        self.links = links
+
+    @property
+    def media(self) -> Media:
+        if not isinstance(self._media, Media):
+            raw = self._media
+            self._media = Media.model_construct(
+                images=[item.to_model() for item in raw.get("images", [])],
+                videos=[item.to_model() for item in raw.get("videos", [])],
+                audios=[item.to_model() for item in raw.get("audios", [])],
+                tables=raw.get("tables", []),
+            )
+        return self._media
+
+    @media.setter
+    def media(self, value: Union[Media, Dict[str, List[Any]], None]):
+        """Set media as a Media model, a dict to validate, or a dict of MediaRecord lists."""
+        if value is None:
+            value = Media()
+        elif not isinstance(value, Media) and not _holds_records(value):
+            value = Media.model_validate(value)
+        self._media = value
+
+    @property
+    def links(self) -> Links:
+        if not isinstance(self._links, Links):
+            raw = self._links
+            self._links = Links.model_construct(
+                internal=[item.to_model() for item in raw.get("internal", [])],
+                external=[item.to_model() for item in raw.get("external", [])],
+            )
+        return self._links
+
+    @links.setter
+    def links(self, value: Union[Links, Dict[str, List[Any]], None]):
+        """Set links as a Links model, a dict to validate, or a dict of LinkRecord lists."""
+        if value is None:
+            value = Links()
+        elif not isinstance(value, Links) and not _holds_records(value):
+            value = Links.model_validate(value)
+        self._links = value
+
+    def dump_media(self) -> Dict[str, List[Any]]:
+        """
+        Media in the form CrawlResult takes, like media.model_dump().
+
+        Records that were never read are passed on as they are, so no models
+        are built on the way from the scraper to the crawl result.
+        """
+        if isinstance(self._media, Media):
+            return self._media.model_dump()
+        return {key: list(self._media.get(key, [])) for key in Media.model_fields}
+
+    def dump_links(self) -> Dict[str, List[Any]]:
+        """Links in the form CrawlResult takes, like links.model_dump(). See dump_media()."""
+        if isinstance(self._links, Links):
+            return self._links.model_dump()
+        return {key: list(self._links.get(key, [])) for key in Links.model_fields}
+
+    def model_dump(self, *args, **kwargs):
+        """Include the media and links private attributes, as model dumps."""
+        result = super().model_dump(*args, **kwargs)
+        mode = kwargs.get("mode", "python")
+        if _dumps_field("media", kwargs):
+            result["media"] = self.media.model_dump(mode=mode)
+        if _dumps_field("links", kwargs):
+            result["links"] = self.links.model_dump(mode=mode)
+        return result
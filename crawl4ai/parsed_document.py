@@ -0,0 +1,143 @@
+"""
+Parsed document shared by the processing stages of a single page.
+
+`aprocess_html` used to hand each stage a string, and each stage parsed it
+again: the scraping strategy, fit_html, the content filters, the markdown
+generator and the JSON extraction strategies. A ParsedDocument parses each
+representation at most once and lets stages read the shared tree, or take a
+cheap copy when they need to modify it.
+"""
+
+import copy
+from typing import Callable, Optional, Union
+
+from lxml import html as lhtml
+
+# Representations a stage can ask for, matching MarkdownGenerationStrategy.content_source
+SOURCES = ("raw_html", "cleaned_html", "fit_html")
+
+
+class ParsedDocument:
+    """
+    One page's HTML in its raw, cleaned and fit forms, each parsed at most once.
+
+    The raw tree is handed to the scraping strategy for in-place cleanup via
+    `mutable_tree()`. The scraping strategy then records the cleaned tree with
+    `set_cleaned()`, so filters and markdown generation start from a tree instead
+    of re-parsing `cleaned_html`. Stages that modify a tree must work on
+    `copy_tree()`; the shared trees are read-only for everyone else.
+
+    Attributes:
+        url (str): URL of the page
+        html (str): Raw HTML as fetched
+        cleaned_html (str): HTML after the scraping strategy, once available
+        retain_tree (bool): Keep the pristine raw tree after handing a copy to the
+                            scraping strategy, because a later stage will read it
+        parse_count (int): Number of HTML parses performed, for profiling
+    """
+
+    __slots__ = (
+        "url", "html", "cleaned_html", "retain_tree", "parse_count",
+        "_tree", "_cleaned_tree", "_fit_html", "_fit_factory", "_fit_tree",
+    )
+
+    def __init__(self, html: str, url: Optional[str] = None, tree=None, retain_tree: bool = False):
+        self.url = url
+        self.html = html or ""
+        self.cleaned_html: Optional[str] = None
+        self.retain_tree = retain_tree
+        self.parse_count = 0
+        self._tree = tree
+        self._cleaned_tree = None
+        self._fit_html: Optional[str] = None
+        self._fit_factory: Optional[Callable[[], str]] = None
+        self._fit_tree = None
+
+    @property
+    def is_full_document(self) -> bool:
+        """True when the raw HTML is a whole page rather than a fragment (e.g. from raw: URLs)."""
+        head = self.html[:1024].lstrip().lower()
+        return head.startswith(("<!doctype", "<html", "<?xml"))
+
+    def _parse(self, markup: str):
+        self.parse_count += 1
+        return lhtml.document_fromstring(markup)
+
+    @property
+    def tree(self):
+        """Pristine tree of the raw HTML. Read-only."""
+        if self._tree is None:
+            self._tree = self._parse(self.html)
+        return self._tree
+
+    def mutable_tree(self):
+        """
+        Tree of the raw HTML that the caller may modify in place.
+
+        Unless `retain_tree` is set, the document gives up its own reference, so
+        no copy is made. A later `tree` access then parses the string again.
+        """
+        tree = self.tree
+        if self.retain_tree:
+            return copy.deepcopy(tree)
+        self._tree = None
+        return tree
+
+    def set_cleaned(self, cleaned_html: str, tree=None) -> None:
+        """Record the scraping strategy's output and, if it has one, the tree it serialized."""
+        self.cleaned_html = cleaned_html
+        self._cleaned_tree = tree
+
+    @property
+    def cleaned_tree(self):
+        """Tree of the cleaned HTML. Read-only."""
+        if self._cleaned_tree is None:
+            self._cleaned_tree = self._parse(self.cleaned_html or "")
+        return self._cleaned_tree
+
+    def set_fit_html(self, fit_html: Union[str, Callable[[], str]]) -> None:
+        """Set the fit HTML, or a zero-argument callable that produces it on first use."""
+        if callable(fit_html):
+            self._fit_html, self._fit_factory = None, fit_html
+        else:
+            self._fit_html, self._fit_factory = fit_html, None
+        self._fit_tree = None
+
+    @property
+    def fit_html(self) -> Optional[str]:
+        if self._fit_html is None and self._fit_factory is not None:
+            self._fit_html = self._fit_factory()
+            self._fit_factory = None
+        return self._fit_html
+
+    @property
+    def has_fit_html(self) -> bool:
+        """True once the fit HTML exists, without computing it."""
+        return self._fit_html is not None
+
+    @property
+    def fit_tree(self):
+        """Tree of the fit HTML. Read-only."""
+        if self._fit_tree is None:
+            self._fit_tree = self._parse(self.fit_html or "")
+        return self._fit_tree
+
+    def html_for(self, source: str) -> str:
+        """String form of a representation ("raw_html", "cleaned_html" or "fit_html")."""
+        if source == "raw_html":
+            return self.html
+        if source == "fit_html":
+            return self.fit_html or ""
+        return self.cleaned_html or ""
+
+    def tree_for(self, source: str):
+        """Shared, read-only tree of a representation."""
+        if source == "raw_html":
+            return self.tree
+        if source == "fit_html":
+            return self.fit_tree
+        return self.cleaned_tree
+
+    def copy_tree(self, source: str):
+        """Private copy of a representation's tree for stages that modify it."""
+        return copy.deepcopy(self.tree_for(source))
@@ -0,0 +1,319 @@
+"""
+Content-type preflight for Crawl4AI
+
+Classifies URLs before they reach the crawler strategy, so PDFs, images,
+archives and other non-HTML content are downloaded, handed to the PDF
+processor or skipped instead of tying up a browser page.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import aiohttp
+
+from .async_configs import PreflightConfig
+from .async_logger import AsyncLogger
+from .models import AsyncCrawlResponse
+
+
+EXTENSION_CATEGORIES: Dict[str, str] = {
+    **dict.fromkeys(("html", "htm", "xhtml", "php", "asp", "aspx", "jsp", "cfm", "shtml"), "html"),
+    "pdf": "pdf",
+    **dict.fromkeys(("jpg", "jpeg", "png", "gif", "webp", "svg", "bmp", "ico", "tif", "tiff", "avif"), "image"),
+    **dict.fromkeys(("mp4", "webm", "mov", "avi", "mkv", "m4v", "wmv", "flv"), "video"),
+    **dict.fromkeys(("mp3", "wav", "ogg", "flac", "m4a", "aac"), "audio"),
+    **dict.fromkeys(("zip", "gz", "tgz", "tar", "bz2", "xz", "7z", "rar", "zst"), "archive"),
+    **dict.fromkeys(("rss", "atom"), "feed"),
+    "json": "json",
+    **dict.fromkeys(("txt", "csv", "md"), "text"),
+    **dict.fromkeys(
+        ("exe", "dmg", "msi", "bin", "iso", "apk", "doc", "docx", "xls", "xlsx", "ppt", "pptx", "odt", "epub"),
+        "binary",
+    ),
+}
+
+# Magic numbers checked against the first bytes of a ranged GET
+MAGIC_NUMBERS: Tuple[Tuple[bytes, str], ...] = (
+    (b"%PDF", "pdf"),
+    (b"\x89PNG", "image"),
+    (b"\xff\xd8\xff", "image"),
+    (b"GIF8", "image"),
+    (b"PK\x03\x04", "archive"),
+    (b"\x1f\x8b", "archive"),
+    (b"7z\xbc\xaf", "archive"),
+    (b"Rar!", "archive"),
+    (b"\x28\xb5\x2f\xfd", "archive"),
+    (b"ID3", "audio"),
+    (b"OggS", "audio"),
+    (b"fLaC", "audio"),
+)
+
+PROBE_BYTES = 1024
+
+
+def category_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Map a Content-Type header value to a preflight category."""
+    if not content_type:
+        return None
+    mime = content_type.split(";", 1)[0].strip().lower()
+    if mime in ("text/html", "application/xhtml+xml"):
+        return "html"
+    if mime == "application/pdf":
+        return "pdf"
+    if mime in ("application/rss+xml", "application/atom+xml", "application/xml", "text/xml"):
+        return "feed"
+    if mime == "application/json" or mime.endswith("+json"):
+        return "json"
+    if mime.startswith("text/"):
+        return "text"
+    major = mime.split("/", 1)[0]
+    if major in ("image", "video", "audio"):
+        return major
+    if any(token in mime for token in ("zip", "gzip", "tar", "compressed", "rar", "zstd")):
+        return "archive"
+    if mime.startswith("application/"):
+        return "binary"
+    return None
+
+
+def category_from_bytes(head: bytes) -> Optional[str]:
+    """Sniff the category from the first bytes of a response body."""
+    for magic, category in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return category
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image"
+    sample = head[:PROBE_BYTES].lstrip().lower()
+    if sample.startswith(b"<!doctype html") or b"<html" in sample:
+        return "html"
+    if sample.startswith(b"<?xml") or sample.startswith(b"<rss") or sample.startswith(b"<feed"):
+        return "html" if b"<html" in sample else "feed"
+    if sample.startswith((b"{", b"[")):
+        return "json"
+    return None
+
+
+def url_extension(url: str) -> str:
+    """Lowercase file extension of the URL path, or an empty string."""
+    path = urlparse(url).path
+    name = path.rsplit("/", 1)[-1]
+    if "." not in name:
+        return ""
+    return name.rsplit(".", 1)[-1].lower()
+
+
+@dataclass
+class PreflightResult:
+    """Outcome of classifying a single URL."""
+
+    url: str
+    category: str
+    action: str
+    source: str  # "extension", "host_rule", "probe" or "fallback"
+    content_type: Optional[str] = None
+    status_code: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    final_url: Optional[str] = None
+
+
+class ContentTypePreflight:
+    """
+    Classifies URLs by content type before they are crawled.
+
+    Classification is tried in order of cost:
+    1. Well-known file extensions (no network)
+    2. Host rules learned from earlier probes: once a host has served the same
+       category for an extension `host_rule_min_samples` times in a row, URLs with
+       that extension on the host are no longer probed
+    3. A HEAD request or a ranged GET of the first bytes over a shared connection pool
+
+    A failed probe never blocks the crawl, the URL is classified "unknown" and
+    follows that route (the browser by default).
+    """
+
+    def __init__(self, logger: Optional[AsyncLogger] = None, max_connections: int = 32):
+        """
+        Initialize the preflight.
+
+        Args:
+            logger: Optional logger instance for recording events
+            max_connections: Size of the connection pool shared by probes and downloads
+        """
+        self.logger = logger
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (host, extension) -> [category, consecutive observations]
+        self.host_rules: Dict[Tuple[str, str], list] = {}
+        self.stats: Dict[str, int] = {"extension": 0, "host_rule": 0, "probe": 0, "fallback": 0}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _result(self, url: str, category: str, source: str, config: PreflightConfig, **kwargs) -> PreflightResult:
+        self.stats[source] += 1
+        return PreflightResult(
+            url=url,
+            category=category,
+            action=config.routes.get(category, config.routes["unknown"]),
+            source=source,
+            **kwargs,
+        )
+
+    def _learn(self, host: str, extension: str, category: str) -> None:
+        rule = self.host_rules.get((host, extension))
+        if rule and rule[0] == category:
+            rule[1] += 1
+        else:
+            self.host_rules[(host, extension)] = [category, 1]
+
+    async def check(self, url: str, config: PreflightConfig) -> PreflightResult:
+        """
+        Classify a URL and pick the action configured for its category.
+
+        Args:
+            url: http(s) URL to classify
+            config: Preflight configuration
+
+        Returns:
+            PreflightResult: Category, action and whatever the probe learned
+        """
+        extension = url_extension(url)
+        if config.use_extensions and extension in EXTENSION_CATEGORIES:
+            return self._result(url, EXTENSION_CATEGORIES[extension], "extension", config)
+
+        host = urlparse(url).netloc.lower()
+        rule = self.host_rules.get((host, extension))
+        if rule and rule[1] >= config.host_rule_min_samples:
+            return self._result(url, rule[0], "host_rule", config)
+
+        if config.probe is None:
+            return self._result(url, "unknown", "fallback", config)
+
+        try:
+            category, content_type, status, headers, final_url = await self._probe(url, config)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if self.logger:
+                self.logger.debug(
+                    message="Preflight probe failed for {url}: {error}",
+                    tag="PREFLIGHT",
+                    params={"url": url, "error": str(e)},
+                )
+            return self._result(url, "unknown", "fallback", config)
+
+        if category is None:
+            return self._result(
+                url, "unknown", "fallback", config,
+                content_type=content_type, status_code=status, headers=headers, final_url=final_url,
+            )
+
+        if status is not None and status < 400:
+            self._learn(host, extension, category)
+        return self._result(
+            url, category, "probe", config,
+            content_type=content_type, status_code=status, headers=headers, final_url=final_url,
+        )
+
+    async def _probe(self, url: str, config: PreflightConfig):
+        session = await self._get_session()
+        timeout = aiohttp.ClientTimeout(total=config.timeout)
+
+        if config.probe == "head":
+            async with session.head(url, allow_redirects=True, timeout=timeout) as response:
+                content_type = response.headers.get("Content-Type")
+                category = category_from_content_type(content_type)
+                # Some servers reject HEAD or answer it without a Content-Type
+                if category is not None and response.status not in (405, 501):
+                    return category, content_type, response.status, dict(response.headers), str(response.url)
+
+        headers = {"Range": f"bytes=0-{PROBE_BYTES - 1}"}
+        async with session.get(url, headers=headers, allow_redirects=True, timeout=timeout) as response:
+            content_type = response.headers.get("Content-Type")
+            head = await response.content.read(PROBE_BYTES)
+            # A generic or missing Content-Type is common for downloads, trust the bytes
+            category = category_from_bytes(head)
+            declared = category_from_content_type(content_type)
+            if category is None or declared not in (None, "binary", "text"):
+                category = declared or category
+            return category, content_type, response.status, dict(response.headers), str(response.url)
+
+    @staticmethod
+    def _download_path(url: str, headers: Dict[str, str], download_dir: str) -> str:
+        filename = None
+        disposition = headers.get("Content-Disposition", "")
+        match = re.search(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)"?', disposition, re.IGNORECASE)
+        if match:
+            filename = os.path.basename(unquote(match.group(1)))
+        if not filename:
+            filename = os.path.basename(unquote(urlparse(url).path)) or "download"
+        # Different URLs often share a file name (index.pdf, download.zip)
+        prefix = hashlib.sha256(url.encode()).hexdigest()[:12]
+        return os.path.join(download_dir, f"{prefix}_{filename}")
+
+    async def download(self, url: str, config: PreflightConfig) -> AsyncCrawlResponse:
+        """
+        Stream a URL straight to disk without a browser.
+
+        Args:
+            url: URL to download
+            config: Preflight configuration (download_dir, max_download_bytes, timeout)
+
+        Returns:
+            AsyncCrawlResponse: Empty html with the saved path in downloaded_files
+        """
+        download_dir = config.download_dir or os.path.join(
+            os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()), ".crawl4ai", "downloads"
+        )
+        os.makedirs(download_dir, exist_ok=True)
+
+        session = await self._get_session()
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=config.timeout, sock_read=config.timeout)
+        async with session.get(url, allow_redirects=True, timeout=timeout) as response:
+            response.raise_for_status()
+            length = response.content_length
+            if config.max_download_bytes and length and length > config.max_download_bytes:
+                raise ValueError(
+                    f"Download of {url} is {length} bytes, above max_download_bytes={config.max_download_bytes}"
+                )
+
+            path = self._download_path(url, response.headers, download_dir)
+            written = 0
+            try:
+                with open(path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        written += len(chunk)
+                        if config.max_download_bytes and written > config.max_download_bytes:
+                            raise ValueError(
+                                f"Download of {url} exceeded max_download_bytes={config.max_download_bytes}"
+                            )
+                        f.write(chunk)
+            except BaseException:
+                Path(path).unlink(missing_ok=True)
+                raise
+
+            if self.logger:
+                self.logger.info(
+                    message="Downloaded {url} to {path} ({size} bytes)",
+                    tag="PREFLIGHT",
+                    params={"url": url, "path": path, "size": written},
+                )
+            return AsyncCrawlResponse(
+                html="",
+                response_headers=dict(response.headers),
+                status_code=response.status,
+                downloaded_files=[path],
+                redirected_url=str(response.url),
+            )
@@ -260,6 +260,14 @@ DO NOT ADD ANY PRE OR POST COMMENTS. JUST RETURN THE JSON OBJECTS INSIDE <blocks
 CRITICAL: The content inside the <blocks> tags MUST be a direct array of JSON objects (starting with '[' and ending with ']'), not a dictionary/object containing an array. For example, use <blocks>[{...}, {...}]</blocks> instead of <blocks>{"items": [{...}, {...}]}</blocks>. This is essential for proper parsing.
 """
 
+PROMPT_EXTRACT_BATCH = """
+
+<batch_instructions>
+The content above is not one page but {COUNT} separate pages, each wrapped in <document id="..." url="..."> tags. Handle every document on its own, exactly as if it were the only content given, and never mix information from different documents.
+
+Instead of a single <blocks> list, output one list per document, wrapped in <blocks document="ID">...</blocks> tags carrying that document's id, in document order. Output a tag for every document, with an empty list [] when nothing is found in it.
+</batch_instructions>"""
+
 PROMPT_FILTER_CONTENT = """Your task is to filter and convert HTML content into clean, focused markdown that's optimized for use with LLMs and information retrieval systems.
 
 TASK DETAILS:
@@ -0,0 +1,338 @@
+"""
+Streaming result sinks for large crawls
+
+Collecting arun_many results in a list keeps every page in memory until the
+batch ends. A ResultSink takes each result as soon as its crawl finishes and
+writes it out from a worker thread, so memory stays bounded by the number of
+crawls in flight plus the sink's queue:
+
+    async with JSONLSink("results.jsonl.zst") as sink:
+        dispatcher = MemoryAdaptiveDispatcher(result_sink=sink)
+        await crawler.arun_many(urls, config=config, dispatcher=dispatcher)
+
+When the queue is full, put() waits, and the dispatchers stop starting new
+crawls until the writer catches up.
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .models import CrawlResult
+from .serialization import json_dumps, json_dumps_str, result_to_dict
+
+_CLOSE = object()
+
+
+class ResultSink(ABC):
+    """
+    Base class for sinks that write crawl results as they arrive.
+
+    Results are queued by put() and written in batches by a background task that
+    runs the blocking serialization and I/O in a thread. Subclasses implement
+    _open, _write and _close, which always run in that thread.
+
+    Args:
+        max_pending: Results that may wait in the queue before put() blocks
+        batch_size: Most results handed to one _write call
+    """
+
+    def __init__(self, max_pending: int = 32, batch_size: int = 16):
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.written = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    @abstractmethod
+    def _open(self):
+        """Create the output, called once before the first write."""
+
+    @abstractmethod
+    def _write(self, results: List[CrawlResult]):
+        """Serialize and write a batch of results."""
+
+    def _close(self):
+        """Flush and close the output."""
+
+    async def start(self):
+        """Open the output and start the writer, put() does this on first use."""
+        if self._writer is None:
+            await asyncio.to_thread(self._open)
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._writer = asyncio.create_task(self._run())
+
+    async def put(self, result: CrawlResult):
+        """Queue a result for writing, waiting while the queue is full."""
+        await self.start()
+        self._raise_error()
+        await self._queue.put(result)
+
+    def full(self) -> bool:
+        """True while the writer is behind and put() would block."""
+        return self._queue is not None and self._queue.full()
+
+    async def wait_ready(self, interval: float = 0.05):
+        """Wait until put() would not block."""
+        while self.full() and self._error is None:
+            await asyncio.sleep(interval)
+        self._raise_error()
+
+    async def close(self):
+        """Write the queued results and close the output."""
+        if self._writer is None:
+            return
+        await self._queue.put(_CLOSE)
+        await self._writer
+        self._writer = None
+        await asyncio.to_thread(self._close)
+        self._raise_error()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"{type(self).__name__} failed: {self._error}") from self._error
+
+    async def _run(self):
+        closing = False
+        while not closing:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch[-1] is _CLOSE:
+                batch.pop()
+                closing = True
+            # After a failure keep draining so put() never blocks forever
+            if batch and self._error is None:
+                try:
+                    await asyncio.to_thread(self._write, batch)
+                    self.written += len(batch)
+                except Exception as e:
+                    self._error = e
+
+
+class JSONLSink(ResultSink):
+    """
+    Write one JSON object per result and line, optionally zstd compressed.
+
+    Args:
+        path: Output file, compression defaults to zstd when it ends in ".zst"
+        compression: None or "zstd" (needs the zstandard package)
+        level: zstd compression level
+    """
+
+    def __init__(self, path: str, compression: Optional[str] = None, level: int = 3, **kwargs):
+        super().__init__(**kwargs)
+        if compression is None and str(path).endswith(".zst"):
+            compression = "zstd"
+        if compression not in (None, "zstd"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd":
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise ImportError("zstd compression requires the zstandard package: pip install zstandard")
+        self.path = str(path)
+        self.compression = compression
+        self.level = level
+        self._file = None
+
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        raw = open(self.path, "wb")
+        if self.compression == "zstd":
+            import zstandard
+
+            self._file = zstandard.ZstdCompressor(level=self.level).stream_writer(raw, closefd=True)
+        else:
+            self._file = raw
+
+    def _write(self, results: List[CrawlResult]):
+        self._file.write(b"".join(json_dumps(result_to_dict(result)) + b"\n" for result in results))
+        self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ParquetSink(ResultSink):
+    """
+    Write results to a Parquet file, one row group per row_group_size results.
+
+    url, success, status_code and the text fields are plain columns. markdown
+    is split into raw_markdown and fit_markdown, the other structured fields
+    (links, media, metadata, ...) are stored as JSON strings.
+
+    Args:
+        path: Output file
+        row_group_size: Results buffered per row group
+        compression: Parquet codec, e.g. "zstd" or "snappy"
+    """
+
+    INT_COLUMNS = ("status_code",)
+    BOOL_COLUMNS = ("success",)
+    TEXT_COLUMNS = (
+        "url", "redirected_url", "error_message", "session_id", "html", "cleaned_html",
+        "fit_html", "raw_markdown", "fit_markdown", "extracted_content", "screenshot", "mhtml",
+    )
+    BINARY_COLUMNS = ("pdf",)
+    JSON_COLUMNS = (
+        "links", "media", "tables", "metadata", "response_headers", "downloaded_files",
+        "js_execution_result", "ssl_certificate", "network_requests", "console_messages",
+    )
+
+    def __init__(self, path: str, row_group_size: int = 1000, compression: str = "zstd", **kwargs):
+        super().__init__(**kwargs)
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("ParquetSink requires the pyarrow package: pip install pyarrow")
+        self.path = str(path)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._rows: List[Dict[str, Any]] = []
+        self._parquet = None
+
+    def _schema(self):
+        import pyarrow as pa
+
+        return pa.schema(
+            [(name, pa.int32()) for name in self.INT_COLUMNS]
+            + [(name, pa.bool_()) for name in self.BOOL_COLUMNS]
+            + [(name, pa.string()) for name in self.TEXT_COLUMNS]
+            + [(name, pa.binary()) for name in self.BINARY_COLUMNS]
+            + [(name, pa.string()) for name in self.JSON_COLUMNS]
+        )
+
+    def _row(self, result: CrawlResult) -> Dict[str, Any]:
+        data = result_to_dict(result, binary=True)
+        markdown = data.pop("markdown", None) or {}
+        data["raw_markdown"] = markdown.get("raw_markdown")
+        data["fit_markdown"] = markdown.get("fit_markdown")
+        screenshot = data.get("screenshot")
+        if isinstance(screenshot, bytes):
+            data["screenshot"] = base64.b64encode(screenshot).decode("ascii")
+        row = {name: data.get(name) for name in self.INT_COLUMNS + self.BOOL_COLUMNS + self.TEXT_COLUMNS + self.BINARY_COLUMNS}
+        for name in self.JSON_COLUMNS:
+            value = data.get(name)
+            row[name] = None if value is None else json_dumps_str(value)
+        return row
+
+    def _open(self):
+        import pyarrow.parquet as pq
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._parquet = pq.ParquetWriter(self.path, self._schema(), compression=self.compression)
+
+    def _write(self, results: List[CrawlResult]):
+        self._rows.extend(self._row(result) for result in results)
+        while len(self._rows) >= self.row_group_size:
+            self._write_row_group(self._rows[:self.row_group_size])
+            self._rows = self._rows[self.row_group_size:]
+
+    def _write_row_group(self, rows: List[Dict[str, Any]]):
+        import pyarrow as pa
+
+        self._parquet.write_table(pa.Table.from_pylist(rows, schema=self._schema()))
+
+    def _close(self):
+        if self._parquet is not None:
+            if self._rows:
+                self._write_row_group(self._rows)
+                self._rows = []
+            self._parquet.close()
+            self._parquet = None
+
+
+class FileTreeSink(ResultSink):
+    """
+    Write each result to its own directory, <root>/<host>/<sha1 of url>/.
+
+    The directory holds result.json (the record without its large fields) and,
+    when present, page.html, cleaned.html, page.md, fit.md, extracted.json,
+    page.mhtml, screenshot.png and page.pdf.
+
+    Args:
+        root: Directory the tree is created in
+    """
+
+    FILES = {
+        "html": "page.html",
+        "cleaned_html": "cleaned.html",
+        "raw_markdown": "page.md",
+        "fit_markdown": "fit.md",
+        "extracted_content": "extracted.json",
+        "mhtml": "page.mhtml",
+    }
+
+    def __init__(self, root: str, **kwargs):
+        super().__init__(**kwargs)
+        self.root = str(root)
+
+    def path_for(self, url: str) -> str:
+        """Directory the result for url is written to."""
+        host = re.sub(r"[^A-Za-z0-9.-]", "_", urlparse(url).netloc) or "_"
+        return os.path.join(self.root, host, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+    def _open(self):
+        os.makedirs(self.root, exist_ok=True)
+
+    def _write(self, results: List[CrawlResult]):
+        for result in results:
+            self._write_result(result)
+
+    def _write_result(self, result: CrawlResult):
+        directory = self.path_for(result.url)
+        os.makedirs(directory, exist_ok=True)
+        data = result_to_dict(result, binary=True)
+        markdown = data.pop("markdown", None) or {}
+        data["raw_markdown"] = markdown.get("raw_markdown")
+        data["fit_markdown"] = markdown.get("fit_markdown")
+        data.pop("fit_html", None)
+        files = []
+        for name, filename in self.FILES.items():
+            value = data.pop(name, None)
+            if value:
+                with open(os.path.join(directory, filename), "w", encoding="utf-8") as f:
+                    f.write(value)
+                files.append(filename)
+        screenshot = data.pop("screenshot", None)
+        if screenshot:
+            with open(os.path.join(directory, "screenshot.png"), "wb") as f:
+                f.write(screenshot if isinstance(screenshot, bytes) else base64.b64decode(screenshot))
+            files.append("screenshot.png")
+        pdf = data.pop("pdf", None)
+        if pdf:
+            with open(os.path.join(directory, "page.pdf"), "wb") as f:
+                f.write(pdf)
+            files.append("page.pdf")
+        data["files"] = files
+        with open(os.path.join(directory, "result.json"), "wb") as f:
+            f.write(json_dumps(data, indent=True))
+
+
+def sink_for_path(path: str, **kwargs) -> ResultSink:
+    """
+    Pick a sink from the output path: .parquet, .jsonl/.ndjson (plus .zst for
+    zstd), anything else is a directory for a FileTreeSink.
+    """
+    name = str(path).lower()
+    if name.endswith(".parquet"):
+        return ParquetSink(path, **kwargs)
+    if name.endswith((".jsonl", ".ndjson", ".jsonl.zst", ".ndjson.zst")):
+        return JSONLSink(path, **kwargs)
+    return FileTreeSink(path, **kwargs)
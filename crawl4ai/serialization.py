@@ -0,0 +1,126 @@
+"""
+Fast serialization of crawl results
+
+JSON goes through orjson when it is installed and falls back to the standard
+library otherwise, with equivalent output. msgpack is optional and
+keeps bytes (pdf, screenshots) binary instead of base64 encoding them.
+
+Used by the cache, the result sinks and the Docker server responses.
+"""
+
+import base64
+import json
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+if HAS_ORJSON:
+    # Accept int keys and numpy values as json.dumps(default=...) callers did
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_default(obj: Any):
+    """Fallback for values neither JSON encoder handles natively."""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(obj).decode("ascii")
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+def _msgpack_default(obj: Any):
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, memoryview):
+        return obj.tobytes()
+    return _json_default(obj)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode obj as UTF-8 JSON.
+
+    bytes become base64 strings, pydantic models their model_dump() and other
+    unknown values their str(). indent=True pretty-prints with two spaces.
+    """
+    if HAS_ORJSON:
+        options = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(obj, default=_json_default, option=options)
+        except TypeError:
+            # Integers beyond 64 bits and similar values orjson refuses
+            pass
+    return json.dumps(
+        obj, default=_json_default, ensure_ascii=False, indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def json_dumps_str(obj: Any, indent: bool = False) -> str:
+    """json_dumps() as a str."""
+    return json_dumps(obj, indent).decode("utf-8")
+
+
+def json_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Decode JSON, raises json.JSONDecodeError (orjson's is a subclass) on invalid input."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """Encode obj as msgpack, needs the msgpack package."""
+    if not HAS_MSGPACK:
+        raise ImportError("msgpack serialization requires the msgpack package: pip install msgpack")
+    return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Decode msgpack, needs the msgpack package."""
+    if not HAS_MSGPACK:
+        raise ImportError("msgpack serialization requires the msgpack package: pip install msgpack")
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+def result_to_dict(result, binary: bool = False, **dump_kwargs) -> Dict[str, Any]:
+    """
+    CrawlResult.model_dump() ready for an encoder.
+
+    extracted_content is rendered compactly from the structured extraction
+    output instead of the pretty-printed string. Unless binary is set (msgpack),
+    pdf and screenshot bytes are base64 encoded.
+
+    Args:
+        result: The CrawlResult
+        binary: Keep bytes values as bytes
+        **dump_kwargs: Passed on to model_dump (include, exclude, ...)
+    """
+    exclude = dump_kwargs.pop("exclude", None) or set()
+    data = result.model_dump(exclude=set(exclude) | {"extracted_content"}, **dump_kwargs)
+    if "extracted_content" not in exclude and (
+        dump_kwargs.get("include") is None or "extracted_content" in dump_kwargs["include"]
+    ):
+        if result.extracted_content_deferred:
+            data["extracted_content"] = json_dumps_str(result.extracted_data)
+        else:
+            data["extracted_content"] = result.extracted_content
+    if not binary:
+        for name in ("pdf", "screenshot"):
+            if isinstance(data.get(name), (bytes, bytearray)):
+                data[name] = base64.b64encode(data[name]).decode("ascii")
+    return data
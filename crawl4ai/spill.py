@@ -0,0 +1,85 @@
+"""
+Spilling of large crawl result fields to disk
+
+arun_many without streaming keeps every result until the batch ends, and a
+page's html, screenshot, PDF or MHTML can each take megabytes. With
+CrawlerRunConfig.spill_threshold set, values larger than the threshold are
+written to a file and the CrawlResult keeps a SpilledField handle instead.
+
+Reading the field (result.html) loads the value back for that access only.
+result.spilled("html").mmap() maps the file without copying it. The file is
+deleted when the handle is garbage collected, or by discard().
+"""
+
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Optional, Union
+
+
+def _unlink(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class SpilledField:
+    """
+    File-backed value of a large CrawlResult field.
+
+    Attributes:
+        path (str): File holding the value, UTF-8 encoded for text
+        is_text (bool): Whether the value is a str (else bytes)
+        size (int): Size of the file in bytes
+    """
+
+    __slots__ = ("path", "is_text", "size", "_finalizer", "__weakref__")
+
+    def __init__(self, path: str, is_text: bool, size: int):
+        self.path = path
+        self.is_text = is_text
+        self.size = size
+        self._finalizer = weakref.finalize(self, _unlink, path)
+
+    @classmethod
+    def write(cls, value: Union[str, bytes], directory: Optional[str] = None) -> "SpilledField":
+        """
+        Write value to a new file in directory.
+
+        Args:
+            value: The field value
+            directory: Where to create the file, the system temp directory if None
+
+        Returns:
+            SpilledField: Handle owning the new file
+        """
+        is_text = isinstance(value, str)
+        data = value.encode("utf-8") if is_text else value
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="crawl4ai-", suffix=".spill", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return cls(path, is_text, len(data))
+
+    def read(self) -> Union[str, bytes]:
+        """Load the value into memory."""
+        with open(self.path, "rb") as f:
+            data = f.read()
+        return data.decode("utf-8") if self.is_text else data
+
+    def mmap(self) -> Union[mmap.mmap, bytes]:
+        """Map the file read-only. Text is UTF-8 encoded, empty values give b""."""
+        if not self.size:
+            return b""
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def discard(self):
+        """Delete the file now instead of when the handle is garbage collected."""
+        self._finalizer()
+
+    def __repr__(self):
+        return f"SpilledField(path={self.path!r}, size={self.size}, is_text={self.is_text})"
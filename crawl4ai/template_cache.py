@@ -0,0 +1,198 @@
+"""
+Site template cache for Crawl4AI
+
+Pages of one site share navigation bars, headers, footers, cookie banners and
+sidebars, and every page pays to scrape, filter and convert them to markdown.
+SiteTemplateCache fingerprints the DOM subtrees of the first pages crawled on
+each host. Once it has sampled enough of them, the subtrees that recur on most
+of those pages are stripped from later pages before they are scraped.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from lxml import etree
+
+# Left out of fingerprints, their content often changes per page (nonces, JSON state)
+IGNORED_TAGS = frozenset(("script", "style", "noscript", "template", "link", "meta"))
+# Never stripped as a whole, they hold the page's own content
+PROTECTED_TAGS = frozenset(("html", "body", "main", "article"))
+
+# (structure hash, text hash) of a subtree
+Fingerprint = Tuple[int, int]
+
+
+def _normalize(text: Optional[str]) -> str:
+    return " ".join(text.split()) if text else ""
+
+
+class _HostTemplates:
+    """Sampling state, then the learned boilerplate, of one host."""
+
+    __slots__ = ("pages", "counts", "boilerplate")
+
+    def __init__(self):
+        self.pages = 0
+        self.counts: Dict[Fingerprint, int] = {}
+        self.boilerplate: Optional[Set[Fingerprint]] = None
+
+
+class SiteTemplateCache:
+    """
+    Learns the boilerplate subtrees of each host and strips them from later pages.
+
+    A subtree's fingerprint combines a structural hash (tag names, recursively)
+    with a hash of its whitespace-normalized text. Class names and ids are left
+    out, since navigation often marks the current page with them. The first
+    `sample_pages` pages of a host are only sampled. After that, subtrees whose
+    fingerprint appeared on at least `min_frequency` of the sampled pages are
+    removed, outermost first.
+
+    Links inside stripped subtrees are not reported for later pages. They were
+    already reported for the sampled pages.
+
+    Pass one instance through CrawlerRunConfig(template_cache=...) for the crawl.
+    """
+
+    def __init__(
+        self,
+        sample_pages: int = 8,
+        min_frequency: float = 0.6,
+        min_text_length: int = 32,
+        max_hosts: int = 1000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            sample_pages: Pages of a host sampled before stripping starts
+            min_frequency: Share of the sampled pages a subtree must appear on to be stripped
+            min_text_length: Subtrees with less normalized text than this are never stripped
+            max_hosts: Hosts kept in memory, least recently used are evicted
+        """
+        if sample_pages < 2:
+            raise ValueError("sample_pages must be at least 2")
+        self.sample_pages = sample_pages
+        self.min_frequency = min_frequency
+        self.min_text_length = min_text_length
+        self.max_hosts = max_hosts
+        self.stats: Dict[str, int] = {"sampled_pages": 0, "stripped_pages": 0, "stripped_elements": 0}
+        self._hosts: "OrderedDict[str, _HostTemplates]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _host(self, host: str) -> _HostTemplates:
+        templates = self._hosts.get(host)
+        if templates is None:
+            templates = self._hosts[host] = _HostTemplates()
+            if len(self._hosts) > self.max_hosts:
+                self._hosts.popitem(last=False)
+        else:
+            self._hosts.move_to_end(host)
+        return templates
+
+    def boilerplate(self, host: str) -> Optional[Set[Fingerprint]]:
+        """Fingerprints learned for a host, or None while it is still being sampled."""
+        templates = self._hosts.get(host)
+        return templates.boilerplate if templates else None
+
+    def fingerprints(self, body) -> Dict[etree._Element, Fingerprint]:
+        """
+        Fingerprint every subtree of body that could be stripped.
+
+        Args:
+            body: lxml element to walk
+
+        Returns:
+            Dict mapping elements with at least min_text_length characters of
+            text, other than protected ones, to their fingerprints.
+        """
+        result = {}
+        # element -> (structure hash, text hash, text length), until its parent is done
+        pending = {}
+        walker = etree.iterwalk(body, events=("start", "end"))
+        for event, el in walker:
+            if el.tag in IGNORED_TAGS:
+                if event == "start":
+                    walker.skip_subtree()
+                continue
+            if event == "start":
+                continue
+
+            text = _normalize(el.text)
+            texts = [text]
+            structure = []
+            length = len(text)
+            for child in el:
+                info = pending.pop(child, None)
+                if info is not None:
+                    structure.append(info[0])
+                    texts.append(info[1])
+                    length += info[2]
+                tail = _normalize(child.tail)
+                texts.append(tail)
+                length += len(tail)
+
+            fingerprint = (hash((el.tag, tuple(structure))), hash(tuple(texts)))
+            pending[el] = (fingerprint[0], fingerprint[1], length)
+            if length >= self.min_text_length and el.tag not in PROTECTED_TAGS and el is not body:
+                result[el] = fingerprint
+        return result
+
+    def strip(self, url: str, body) -> int:
+        """
+        Sample a page of the URL's host, or strip its learned boilerplate.
+
+        Args:
+            url: URL of the page, which selects the host
+            body: lxml body element, modified in place
+
+        Returns:
+            int: Number of subtrees removed
+        """
+        host = urlparse(url).netloc.lower()
+        if not host or body is None:
+            return 0
+
+        with self._lock:
+            boilerplate = self._host(host).boilerplate
+        if boilerplate is not None and not boilerplate:
+            return 0
+
+        fingerprints = self.fingerprints(body)
+        if boilerplate is None:
+            self._sample(host, set(fingerprints.values()))
+            return 0
+
+        removed = []
+        walker = etree.iterwalk(body, events=("start",))
+        for _, el in walker:
+            if fingerprints.get(el) in boilerplate:
+                removed.append(el)
+                walker.skip_subtree()
+        for el in removed:
+            el.drop_tree()
+
+        if removed:
+            with self._lock:
+                self.stats["stripped_pages"] += 1
+                self.stats["stripped_elements"] += len(removed)
+        return len(removed)
+
+    def _sample(self, host: str, fingerprints: Set[Fingerprint]) -> None:
+        with self._lock:
+            templates = self._host(host)
+            if templates.boilerplate is not None:
+                return
+            for fingerprint in fingerprints:
+                templates.counts[fingerprint] = templates.counts.get(fingerprint, 0) + 1
+            templates.pages += 1
+            self.stats["sampled_pages"] += 1
+            if templates.pages >= self.sample_pages:
+                needed = max(2, math.ceil(self.min_frequency * templates.pages))
+                templates.boilerplate = {
+                    fingerprint for fingerprint, count in templates.counts.items() if count >= needed
+                }
+                templates.counts = {}
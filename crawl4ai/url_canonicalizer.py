@@ -0,0 +1,229 @@
+"""
+URL canonicalization for Crawl4AI
+
+Scraping, deep crawling, URL seeding and the cache all need to decide whether
+two URLs name the same page. URLCanonicalizer gives them one answer. It
+resolves links against their page, lowercases the scheme and host, drops
+default ports, fragments and tracking parameters, sorts the query and
+normalizes the path.
+
+Links on a page are resolved against the same base, so the parsed base and the
+results for hrefs already seen are cached per base URL.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urljoin, urlsplit, urlunsplit
+
+TRACKING_PARAMS = frozenset((
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "gclid", "fbclid", "ref", "ref_src",
+))
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+# Characters RFC 3986 allows unescaped in a path, besides unreserved ones
+PATH_SAFE = "/:@!$&'()*+,;="
+
+
+class _Base:
+    """A parsed base URL and the canonical forms of hrefs resolved against it."""
+
+    __slots__ = ("url", "origin", "results")
+
+    def __init__(self, url: str):
+        self.url = url
+        parts = urlsplit(url)
+        self.origin = f"{parts.scheme}://{parts.netloc}" if parts.netloc else None
+        self.results: Dict[str, Optional[str]] = {}
+
+
+class URLCanonicalizer:
+    """
+    Turns URLs into one canonical form so equal pages compare equal.
+
+    http(s) URLs get a lowercase scheme and host, no default port, no trailing
+    slash (the root path is always "/"), a sorted query without tracking
+    parameters, and no fragment unless keep_fragment is set. Other schemes
+    (mailto:, data:, raw:, file: ...) are only resolved and stripped.
+
+    Canonicalizing a canonical URL returns it unchanged.
+    """
+
+    def __init__(
+        self,
+        drop_tracking_params: bool = True,
+        extra_drop_params: Optional[Iterable[str]] = None,
+        sort_query: bool = True,
+        keep_fragment: bool = False,
+        strip_trailing_slash: bool = True,
+        max_bases: int = 1024,
+        max_links_per_base: int = 4096,
+    ):
+        """
+        Initialize the canonicalizer.
+
+        Args:
+            drop_tracking_params: Remove utm_*, gclid, fbclid, ref and ref_src query parameters
+            extra_drop_params: More query parameters to remove, matched case-insensitively
+            sort_query: Sort query parameters by name
+            keep_fragment: Keep the #fragment
+            strip_trailing_slash: Remove a trailing "/" from paths other than the root
+            max_bases: Base URLs whose results are cached, least recently used are evicted
+            max_links_per_base: Cached results per base URL
+        """
+        self.drop_tracking_params = drop_tracking_params
+        self.extra_drop_params = extra_drop_params
+        self.sort_query = sort_query
+        self.keep_fragment = keep_fragment
+        self.strip_trailing_slash = strip_trailing_slash
+        self.max_bases = max_bases
+        self.max_links_per_base = max_links_per_base
+
+        self._drop = frozenset()
+        if drop_tracking_params:
+            self._drop = TRACKING_PARAMS
+        if extra_drop_params:
+            self._drop = self._drop | {p.lower() for p in extra_drop_params}
+        self._bases: "OrderedDict[str, _Base]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _base(self, base_url: str) -> _Base:
+        with self._lock:
+            base = self._bases.get(base_url)
+            if base is None:
+                base = self._bases[base_url] = _Base(base_url)
+                if len(self._bases) > self.max_bases:
+                    self._bases.popitem(last=False)
+            else:
+                self._bases.move_to_end(base_url)
+            return base
+
+    def canonicalize(self, href: str, base_url: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve href against base_url and return its canonical form.
+
+        Args:
+            href: URL or link as found on a page
+            base_url: URL of the page, used to resolve relative links
+
+        Returns:
+            str | None: The canonical URL, or None if href is empty
+
+        Raises:
+            ValueError: If href cannot be parsed, e.g. a malformed IPv6 host
+        """
+        if not href:
+            return None
+        href = href.strip()
+        if not href:
+            return None
+        if not base_url:
+            return self._canonical(href)
+
+        base = self._base(base_url)
+        result = base.results.get(href)
+        if result is None:
+            result = self._canonical(self._resolve(href, base))
+            if len(base.results) >= self.max_links_per_base:
+                base.results.clear()
+            base.results[href] = result
+        return result
+
+    def canonicalize_many(self, hrefs: Iterable[str], base_url: Optional[str] = None) -> List[Optional[str]]:
+        """
+        Canonicalize every link of a page in one call.
+
+        Args:
+            hrefs: Links as found on the page
+            base_url: URL of the page
+
+        Returns:
+            List[Optional[str]]: Canonical URLs in the order of hrefs, None for
+            empty or malformed links
+        """
+        if not base_url:
+            return [self._safe(href, None) for href in hrefs]
+
+        base = self._base(base_url)
+        results = base.results
+        canonical = []
+        for href in hrefs:
+            result = results.get(href)
+            if result is None:
+                result = self._safe(href, base_url)
+            canonical.append(result)
+        return canonical
+
+    def resolve(self, href: str, base_url: str) -> str:
+        """
+        Make href absolute against base_url, without canonicalizing it.
+
+        Args:
+            href: URL or link as found on a page
+            base_url: URL of the page
+
+        Returns:
+            str: The absolute URL
+        """
+        return self._resolve(href.strip(), self._base(base_url))
+
+    def _safe(self, href: str, base_url: Optional[str]) -> Optional[str]:
+        try:
+            return self.canonicalize(href, base_url)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _resolve(href: str, base: _Base) -> str:
+        # Root-relative paths are the most common links, join them without urljoin
+        if (
+            base.origin
+            and href.startswith("/")
+            and not href.startswith("//")
+            and "/." not in href
+        ):
+            return base.origin + href
+        return urljoin(base.url, href)
+
+    def _canonical(self, url: str) -> str:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS or not parts.netloc:
+            return url
+
+        netloc = parts.netloc.lower()
+        host, _, port = netloc.rpartition(":")
+        if port == DEFAULT_PORTS[scheme]:
+            netloc = host
+
+        path = quote(unquote(parts.path), safe=PATH_SAFE) or "/"
+        if self.strip_trailing_slash and len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+
+        query = parts.query
+        if query:
+            params = parse_qsl(query, keep_blank_values=True)
+            if self._drop:
+                params = [(k, v) for k, v in params if k.lower() not in self._drop]
+            if self.sort_query:
+                params.sort(key=lambda kv: kv[0])
+            query = urlencode(params, doseq=True)
+
+        fragment = parts.fragment if self.keep_fragment else ""
+        return urlunsplit((scheme, netloc, path, query, fragment))
+
+
+# Shared by scraping, deep crawling and URL seeding
+DEFAULT_CANONICALIZER = URLCanonicalizer()
+# Cache keys keep the fragment, single-page apps route on it
+CACHE_KEY_CANONICALIZER = URLCanonicalizer(keep_fragment=True)
+
+
+def canonicalize_url(href: str, base_url: Optional[str] = None) -> Optional[str]:
+    """Canonicalize one URL with the default canonicalizer."""
+    return DEFAULT_CANONICALIZER.canonicalize(href, base_url)
+
+
+def canonicalize_many(hrefs: Iterable[str], base_url: Optional[str] = None) -> List[Optional[str]]:
+    """Canonicalize a page's links with the default canonicalizer."""
+    return DEFAULT_CANONICALIZER.canonicalize_many(hrefs, base_url)
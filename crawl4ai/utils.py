@@ -1,4 +1,5 @@
 import time
+import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup, Comment, element, Tag, NavigableString
 import json
@@ -33,6 +34,9 @@ import hashlib
 from urllib.robotparser import RobotFileParser
 import aiohttp
 from functools import lru_cache
+from .url_canonicalizer import URLCanonicalizer, canonicalize_url
+from .llm_scheduler import estimate_tokens, get_llm_scheduler, retry_after_seconds
+from .llm_cache import get_llm_cache, llm_cache_key
 
 from packaging import version
 from . import __version__
@@ -1738,6 +1742,82 @@ def extract_xml_data(tags, string):
     return data
 
 
+def _completion_args(provider, prompt_with_variables, api_token, json_response, base_url, kwargs):
+    """Arguments of a litellm (a)completion call plus its estimated token count for the scheduler."""
+    extra_args = {"temperature": 0.01, "api_key": api_token, "base_url": base_url}
+    if json_response:
+        extra_args["response_format"] = {"type": "json_object"}
+
+    if kwargs.get("extra_args"):
+        extra_args.update(kwargs["extra_args"])
+
+    scheduler = get_llm_scheduler()
+    if kwargs.get("requests_per_minute") or kwargs.get("tokens_per_minute"):
+        scheduler.configure(
+            provider,
+            requests_per_minute=kwargs.get("requests_per_minute"),
+            tokens_per_minute=kwargs.get("tokens_per_minute"),
+        )
+    tokens = estimate_tokens(prompt_with_variables, extra_args.get("max_tokens"))
+    return (
+        dict(model=provider, messages=[{"role": "user", "content": prompt_with_variables}], **extra_args),
+        tokens,
+    )
+
+
+def _rate_limit_delay(provider, error, attempt, base_delay):
+    """Seconds to wait after a rate limit error, the Retry-After header or exponential backoff with jitter."""
+    delay = retry_after_seconds(error)
+    if delay is None:
+        delay = base_delay * (2**attempt) * random.uniform(0.5, 1.5)
+    # Hold every call to this provider, not only the one that was rejected
+    get_llm_scheduler().block(provider, delay)
+    return delay
+
+
+def _settle_usage(provider, response, tokens):
+    usage = getattr(response, "usage", None)
+    if usage is not None and getattr(usage, "total_tokens", None):
+        get_llm_scheduler().settle(provider, tokens, usage.total_tokens)
+
+
+def _response_cache(provider, prompt_with_variables, json_response, base_url, kwargs):
+    """The LLM response cache and the call's key in it, (None, None) when caching is off."""
+    cache = get_llm_cache()
+    if cache is None or not kwargs.get("use_cache", True):
+        return None, None
+    return cache, llm_cache_key(
+        provider, prompt_with_variables, json_response, base_url, kwargs.get("extra_args")
+    )
+
+
+def _cached_response(data):
+    """Rebuild a stored response, marked as a cache hit for TokenUsage.from_response."""
+    from litellm import ModelResponse
+
+    response = ModelResponse(**data)
+    response._hidden_params["llm_cache"] = "hit"
+    return response
+
+
+def _store_response(cache, key, provider, response):
+    try:
+        cache.set(key, provider, response.model_dump())
+    except Exception as e:
+        # A failing cache never fails the call
+        print("LLM cache write error:", str(e))
+    response._hidden_params["llm_cache"] = "miss"
+
+
+_RATE_LIMIT_ERROR_BLOCKS = [
+    {
+        "index": 0,
+        "tags": ["error"],
+        "content": ["Rate limit error. Please try again later."],
+    }
+]
+
+
 def perform_completion_with_backoff(
     provider,
     prompt_with_variables,
@@ -1750,9 +1830,11 @@ def perform_completion_with_backoff(
     Perform an API completion request with exponential backoff.
 
     How it works:
-    1. Sends a completion request to the API.
-    2. Retries on rate-limit errors with exponential delays.
-    3. Returns the API response or an error after all retries.
+    1. Returns the stored response if the LLM response cache has one (see crawl4ai.llm_cache).
+    2. Waits for the provider's request and token budget (see crawl4ai.llm_scheduler).
+    3. Sends a completion request to the API.
+    4. Retries on rate-limit errors after the Retry-After time or exponential delays.
+    5. Returns the API response or an error after all retries.
 
     Args:
         provider (str): The name of the API provider.
@@ -1760,7 +1842,10 @@ def perform_completion_with_backoff(
         api_token (str): The API token for authentication.
         json_response (bool): Whether to request a JSON response. Defaults to False.
         base_url (Optional[str]): The base URL for the API. Defaults to None.
-        **kwargs: Additional arguments for the API request.
+        **kwargs: Additional arguments for the API request. requests_per_minute and
+            tokens_per_minute set the provider's budget, owner (e.g. the page URL)
+            groups calls that take turns with other owners. use_cache=False skips
+            the LLM response cache.
 
     Returns:
         dict: The API response or an error message after all retries.
@@ -1772,52 +1857,84 @@ def perform_completion_with_backoff(
     max_attempts = 3
     base_delay = 2  # Base delay in seconds, you can adjust this based on your needs
 
-    extra_args = {"temperature": 0.01, "api_key": api_token, "base_url": base_url}
-    if json_response:
-        extra_args["response_format"] = {"type": "json_object"}
-
-    if kwargs.get("extra_args"):
-        extra_args.update(kwargs["extra_args"])
+    completion_args, tokens = _completion_args(
+        provider, prompt_with_variables, api_token, json_response, base_url, kwargs
+    )
+    cache, cache_key = _response_cache(provider, prompt_with_variables, json_response, base_url, kwargs)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return _cached_response(cached)
+    scheduler = get_llm_scheduler()
 
     for attempt in range(max_attempts):
+        scheduler.acquire_blocking(provider, tokens, owner=kwargs.get("owner"))
         try:
-            response = completion(
-                model=provider,
-                messages=[{"role": "user", "content": prompt_with_variables}],
-                **extra_args,
-            )
+            response = completion(**completion_args)
+            _settle_usage(provider, response, tokens)
+            if cache is not None:
+                _store_response(cache, cache_key, provider, response)
             return response  # Return the successful response
         except RateLimitError as e:
             print("Rate limit error:", str(e))
 
             # Check if we have exhausted our max attempts
             if attempt < max_attempts - 1:
-                # Calculate the delay and wait
-                delay = base_delay * (2**attempt)  # Exponential backoff formula
-                print(f"Waiting for {delay} seconds before retrying...")
-                time.sleep(delay)
+                delay = _rate_limit_delay(provider, e, attempt, base_delay)
+                print(f"Waiting for {delay:.1f} seconds before retrying...")
             else:
                 # Return an error response after exhausting all retries
-                return [
-                    {
-                        "index": 0,
-                        "tags": ["error"],
-                        "content": ["Rate limit error. Please try again later."],
-                    }
-                ]
+                return [dict(block) for block in _RATE_LIMIT_ERROR_BLOCKS]
         except Exception as e:
             raise e  # Raise any other exceptions immediately
-            # print("Error during completion request:", str(e))
-            # error_message = e.message
-            # return [
-            #     {
-            #         "index": 0,
-            #         "tags": ["error"],
-            #         "content": [
-            #             f"Error during LLM completion request. {error_message}"
-            #         ],
-            #     }
-            # ]
+
+
+async def aperform_completion_with_backoff(
+    provider,
+    prompt_with_variables,
+    api_token,
+    json_response=False,
+    base_url=None,
+    **kwargs,
+):
+    """
+    perform_completion_with_backoff() on litellm's acompletion.
+
+    Waiting for the budget and between retries does not block the event loop,
+    so many pages can extract concurrently under one provider budget.
+    """
+
+    from litellm import acompletion
+    from litellm.exceptions import RateLimitError
+
+    max_attempts = 3
+    base_delay = 2
+
+    completion_args, tokens = _completion_args(
+        provider, prompt_with_variables, api_token, json_response, base_url, kwargs
+    )
+    cache, cache_key = _response_cache(provider, prompt_with_variables, json_response, base_url, kwargs)
+    if cache is not None:
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            return _cached_response(cached)
+    scheduler = get_llm_scheduler()
+
+    for attempt in range(max_attempts):
+        await scheduler.acquire(provider, tokens, owner=kwargs.get("owner"))
+        try:
+            response = await acompletion(**completion_args)
+            _settle_usage(provider, response, tokens)
+            if cache is not None:
+                await asyncio.to_thread(_store_response, cache, cache_key, provider, response)
+            return response
+        except RateLimitError as e:
+            print("Rate limit error:", str(e))
+            if attempt < max_attempts - 1:
+                delay = _rate_limit_delay(provider, e, attempt, base_delay)
+                print(f"Waiting for {delay:.1f} seconds before retrying...")
+            else:
+                return [dict(block) for block in _RATE_LIMIT_ERROR_BLOCKS]
 
 
 def extract_blocks(url, html, provider=DEFAULT_PROVIDER, api_token=None, base_url=None):
@@ -2119,24 +2236,14 @@ def fast_format_html(html_string):
     return "\n".join(formatted)
 
 
-def normalize_url(href, base_url):
-    """Normalize URLs to ensure consistent format"""
-    from urllib.parse import urljoin, urlparse
-
-    # Parse base URL to get components
-    parsed_base = urlparse(base_url)
-    if not parsed_base.scheme or not parsed_base.netloc:
-        raise ValueError(f"Invalid base URL format: {base_url}")
-    
-    if  parsed_base.scheme.lower() not in ["http", "https"]:
-        # Handle special protocols
-        raise ValueError(f"Invalid base URL format: {base_url}")
-    cleaned_href = href.strip()
-
-    # Use urljoin to handle all cases
-    return urljoin(base_url, cleaned_href)
-
-
+@lru_cache(maxsize=32)
+def _url_canonicalizer(drop_query_tracking, sort_query, keep_fragment, extra_drop_params):
+    return URLCanonicalizer(
+        drop_tracking_params=drop_query_tracking,
+        extra_drop_params=extra_drop_params,
+        sort_query=sort_query,
+        keep_fragment=keep_fragment,
+    )
 
 
 def normalize_url(
@@ -2149,7 +2256,10 @@ def normalize_url(
     extra_drop_params=None
 ):
     """
-    Extended URL normalizer
+    Resolve a link against its page and return the canonical URL.
+
+    Uses the same URLCanonicalizer as deep crawling, URL seeding and the cache,
+    so a link found while scraping compares equal to the URL crawled for it.
 
     Parameters
     ----------
@@ -2171,170 +2281,22 @@ def normalize_url(
     str | None
         A clean, canonical URL or None if href is empty/None.
     """
-    if not href:
-        return None
-
-    # Resolve relative paths first
-    full_url = urljoin(base_url, href.strip())
-
-    # Parse once, edit parts, then rebuild
-    parsed = urlparse(full_url)
-
-    # ── netloc ──
-    netloc = parsed.netloc.lower()
-
-    # ── path ──
-    # Strip duplicate slashes and trailing “/” (except root)
-    path = quote(unquote(parsed.path))
-    if path.endswith('/') and path != '/':
-        path = path.rstrip('/')
-
-    # ── query ──
-    query = parsed.query
-    if query:
-        # explode, mutate, then rebuild
-        params = [(k.lower(), v) for k, v in parse_qsl(query, keep_blank_values=True)]
-
-        if drop_query_tracking:
-            default_tracking = {
-                'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
-                'utm_content', 'gclid', 'fbclid', 'ref', 'ref_src'
-            }
-            if extra_drop_params:
-                default_tracking |= {p.lower() for p in extra_drop_params}
-            params = [(k, v) for k, v in params if k not in default_tracking]
-
-        if sort_query:
-            params.sort(key=lambda kv: kv[0])
-
-        query = urlencode(params, doseq=True) if params else ''
-
-    # ── fragment ──
-    fragment = parsed.fragment if keep_fragment else ''
-
-    # Re-assemble
-    normalized = urlunparse((
-        parsed.scheme,
-        netloc,
-        path,
-        parsed.params,
-        query,
-        fragment
-    ))
-
-    return normalized
+    if drop_query_tracking and sort_query and not keep_fragment and not extra_drop_params:
+        return canonicalize_url(href, base_url)
+    canonicalizer = _url_canonicalizer(
+        drop_query_tracking, sort_query, keep_fragment, tuple(extra_drop_params or ())
+    )
+    return canonicalizer.canonicalize(href, base_url)
 
 
 def normalize_url_for_deep_crawl(href, base_url):
-    """Normalize URLs to ensure consistent format"""
-    from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
+    """Canonicalize a discovered link. Kept for compatibility, same as canonicalize_url."""
+    return canonicalize_url(href, base_url)
 
-    # Handle None or empty values
-    if not href:
-        return None
-
-    # Use urljoin to handle relative URLs
-    full_url = urljoin(base_url, href.strip())
-    
-    # Parse the URL for normalization
-    parsed = urlparse(full_url)
-    
-    # Convert hostname to lowercase
-    netloc = parsed.netloc.lower()
-    
-    # Remove fragment entirely
-    fragment = ''
-    
-    # Normalize query parameters if needed
-    query = parsed.query
-    if query:
-        # Parse query parameters
-        params = parse_qs(query)
-        
-        # Remove tracking parameters (example - customize as needed)
-        tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'ref', 'fbclid']
-        for param in tracking_params:
-            if param in params:
-                del params[param]
-                
-        # Rebuild query string, sorted for consistency
-        query = urlencode(params, doseq=True) if params else ''
-    
-    # Build normalized URL
-    normalized = urlunparse((
-        parsed.scheme,
-        netloc,
-        parsed.path.rstrip('/'),  # Normalize trailing slash
-        parsed.params,
-        query,
-        fragment
-    ))
-    
-    return normalized
 
-@lru_cache(maxsize=10000)
 def efficient_normalize_url_for_deep_crawl(href, base_url):
-    """Efficient URL normalization with proper parsing"""
-    from urllib.parse import urljoin
-    
-    if not href:
-        return None
-    
-    # Resolve relative URLs
-    full_url = urljoin(base_url, href.strip())
-    
-    # Use proper URL parsing
-    parsed = urlparse(full_url)
-    
-    # Only perform the most critical normalizations
-    # 1. Lowercase hostname
-    # 2. Remove fragment
-    normalized = urlunparse((
-        parsed.scheme,
-        parsed.netloc.lower(),
-        parsed.path.rstrip('/'),
-        parsed.params,
-        parsed.query,
-        ''  # Remove fragment
-    ))
-    
-    return normalized
-
-
-def normalize_url_tmp(href, base_url):
-    """Normalize URLs to ensure consistent format"""
-    # Extract protocol and domain from base URL
-    try:
-        base_parts = base_url.split("/")
-        protocol = base_parts[0]
-        domain = base_parts[2]
-    except IndexError:
-        raise ValueError(f"Invalid base URL format: {base_url}")
-
-    # Handle special protocols
-    special_protocols = {"mailto:", "tel:", "ftp:", "file:", "data:", "javascript:"}
-    if any(href.lower().startswith(proto) for proto in special_protocols):
-        return href.strip()
-
-    # Handle anchor links
-    if href.startswith("#"):
-        return f"{base_url}{href}"
-
-    # Handle protocol-relative URLs
-    if href.startswith("//"):
-        return f"{protocol}{href}"
-
-    # Handle root-relative URLs
-    if href.startswith("/"):
-        return f"{protocol}//{domain}{href}"
-
-    # Handle relative URLs
-    if not href.startswith(("http://", "https://")):
-        # Remove leading './' if present
-        href = href.lstrip("./")
-        return f"{protocol}//{domain}/{href}"
-
-    return href.strip()
+    """Canonicalize a discovered link. Kept for compatibility, same as canonicalize_url."""
+    return canonicalize_url(href, base_url)
 
 
 def get_base_domain(url: str) -> str:
@@ -2422,6 +2384,39 @@ def is_external_url(url: str, base_domain: str) -> bool:
         return False
 
 
+# Scheme and authority of a URL, the only part link classification depends on
+URL_AUTHORITY_REGEX = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://[^/?#]*")
+
+
+def classify_links(urls: List[str], base_domain: str) -> Tuple[List[str], List[bool]]:
+    """
+    Classify a page's links as internal or external, in one pass.
+
+    Gives the same answers as get_base_domain and is_external_url per URL, but
+    both only depend on the scheme and host, so they are computed once per
+    distinct host of the page.
+
+    Args:
+        urls (List[str]): Absolute URLs of the page's links.
+        base_domain (str): Base domain of the page.
+
+    Returns:
+        Tuple[List[str], List[bool]]: Base domain and external flag of each URL.
+    """
+    cache = {}
+    domains = []
+    external = []
+    for url in urls:
+        match = URL_AUTHORITY_REGEX.match(url)
+        key = match.group(0) if match else url
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = (get_base_domain(key), is_external_url(key, base_domain))
+        domains.append(result[0])
+        external.append(result[1])
+    return domains, external
+
+
 def clean_tokens(tokens: list[str]) -> list[str]:
     """
     Clean a list of tokens by removing noise, stop words, and short tokens.
@@ -3140,6 +3135,117 @@ def extract_page_context(page_title: str, headlines_text: str, meta_description:
     return context
 
 
+LINK_WORD_STRIP = '.,!?;:"()[]{}'
+
+
+def _link_attribute_score(title_attr: str, class_attr: str, rel_attr: str) -> float:
+    """Score of a link's title, class and rel attributes."""
+    score = 0.0
+    if title_attr and len(title_attr.strip()) > 3:
+        score += 1.0
+
+    class_str = (class_attr or '').lower()
+    # Navigation/important classes boost score
+    if any(nav_class in class_str for nav_class in ['nav', 'menu', 'primary', 'main', 'important']):
+        score += 1.5
+    # Marketing/ad classes reduce score
+    if any(bad_class in class_str for bad_class in ['ad', 'sponsor', 'track', 'promo', 'banner']):
+        score -= 1.0
+
+    rel_str = (rel_attr or '').lower()
+    # Semantic rel values
+    if any(good_rel in rel_str for good_rel in ['canonical', 'next', 'prev', 'chapter']):
+        score += 1.0
+    if any(bad_rel in rel_str for bad_rel in ['nofollow', 'sponsored', 'ugc']):
+        score -= 0.5
+    return score
+
+
+def _link_url_score(url: str) -> float:
+    """Score of a link's URL structure."""
+    score = 0.0
+    url_lower = url.lower()
+
+    # High-value path patterns
+    if any(good_path in url_lower for good_path in ['/docs/', '/api/', '/guide/', '/tutorial/', '/reference/', '/manual/']):
+        score += 2.0
+    elif any(medium_path in url_lower for medium_path in ['/blog/', '/article/', '/post/', '/news/']):
+        score += 1.0
+
+    # Penalize certain patterns
+    if any(bad_path in url_lower for bad_path in ['/admin/', '/login/', '/cart/', '/checkout/', '/track/', '/click/']):
+        score -= 1.5
+
+    # URL depth (shallow URLs often more important)
+    url_depth = url.count('/') - 2  # Subtract protocol and domain
+    if url_depth <= 2:
+        score += 1.0
+    elif url_depth > 5:
+        score -= 0.5
+
+    # HTTPS bonus
+    if url.startswith('https://'):
+        score += 0.5
+    return score
+
+
+def _link_text_scores(link_text: str, page_context: dict) -> Tuple[float, float, float]:
+    """
+    Scores of a link's text: (text quality, relevance to the page, docs site bonus).
+
+    Kept apart because the relevance score is the only fractional one, and it
+    must be added after the others to give the same float as a single sum.
+    """
+    quality = relevance = docs_bonus = 0.0
+    if link_text:
+        text_clean = link_text.strip()
+        if len(text_clean) > 3:
+            quality += 1.0
+
+        # Multi-word links are usually more descriptive
+        word_count = len(text_clean.split())
+        if word_count >= 2:
+            quality += 0.5
+        if word_count >= 4:
+            quality += 0.5
+
+        # Avoid generic link text
+        generic_texts = ['click here', 'read more', 'more info', 'link', 'here']
+        if text_clean.lower() in generic_texts:
+            quality -= 1.0
+
+    # Contextual relevance (pre-computed page terms)
+    if page_context.get('terms') and link_text:
+        link_words = set(word.strip(LINK_WORD_STRIP).lower()
+                       for word in link_text.split()
+                       if len(word.strip(LINK_WORD_STRIP)) > 2)
+
+        if link_words:
+            # Calculate word overlap ratio
+            overlap = len(link_words & page_context['terms'])
+            if overlap > 0:
+                relevance_ratio = overlap / min(len(link_words), 10)  # Cap to avoid over-weighting
+                relevance = relevance_ratio * 2.0  # Up to 2 points for relevance
+
+    # Documentation sites: prioritize internal navigation
+    if page_context.get('is_docs_site', False):
+        if link_text and any(doc_keyword in link_text.lower()
+                           for doc_keyword in ['api', 'reference', 'guide', 'tutorial', 'example']):
+            docs_bonus = 1.0
+    return quality, relevance, docs_bonus
+
+
+def _combine_link_scores(attribute: float, url: float, text: Tuple[float, float, float]) -> float:
+    quality, relevance, docs_bonus = text
+    score = attribute + url + quality
+    if relevance:
+        score += relevance
+    if docs_bonus:
+        score += docs_bonus
+    # Ensure score is within reasonable bounds
+    return max(0.0, min(score, 10.0))
+
+
 def calculate_link_intrinsic_score(
     link_text: str, 
     url: str, 
@@ -3163,96 +3269,60 @@ def calculate_link_intrinsic_score(
     Returns:
         Quality score (0.0 - 10.0), higher is better
     """
-    score = 0.0
-    
     try:
-        # 1. ATTRIBUTE QUALITY (string analysis - very fast)
-        if title_attr and len(title_attr.strip()) > 3:
-            score += 1.0
-            
-        class_str = (class_attr or '').lower()
-        # Navigation/important classes boost score
-        if any(nav_class in class_str for nav_class in ['nav', 'menu', 'primary', 'main', 'important']):
-            score += 1.5
-        # Marketing/ad classes reduce score  
-        if any(bad_class in class_str for bad_class in ['ad', 'sponsor', 'track', 'promo', 'banner']):
-            score -= 1.0
-            
-        rel_str = (rel_attr or '').lower()
-        # Semantic rel values
-        if any(good_rel in rel_str for good_rel in ['canonical', 'next', 'prev', 'chapter']):
-            score += 1.0
-        if any(bad_rel in rel_str for bad_rel in ['nofollow', 'sponsored', 'ugc']):
-            score -= 0.5
-            
-        # 2. URL STRUCTURE QUALITY (string operations - very fast)
-        url_lower = url.lower()
-        
-        # High-value path patterns
-        if any(good_path in url_lower for good_path in ['/docs/', '/api/', '/guide/', '/tutorial/', '/reference/', '/manual/']):
-            score += 2.0
-        elif any(medium_path in url_lower for medium_path in ['/blog/', '/article/', '/post/', '/news/']):
-            score += 1.0
-            
-        # Penalize certain patterns
-        if any(bad_path in url_lower for bad_path in ['/admin/', '/login/', '/cart/', '/checkout/', '/track/', '/click/']):
-            score -= 1.5
-            
-        # URL depth (shallow URLs often more important)
-        url_depth = url.count('/') - 2  # Subtract protocol and domain
-        if url_depth <= 2:
-            score += 1.0
-        elif url_depth > 5:
-            score -= 0.5
-            
-        # HTTPS bonus
-        if url.startswith('https://'):
-            score += 0.5
-            
-        # 3. TEXT QUALITY (string analysis - very fast)
-        if link_text:
-            text_clean = link_text.strip()
-            if len(text_clean) > 3:
-                score += 1.0
-                
-            # Multi-word links are usually more descriptive
-            word_count = len(text_clean.split())
-            if word_count >= 2:
-                score += 0.5
-            if word_count >= 4:
-                score += 0.5
-                
-            # Avoid generic link text
-            generic_texts = ['click here', 'read more', 'more info', 'link', 'here']
-            if text_clean.lower() in generic_texts:
-                score -= 1.0
-                
-        # 4. CONTEXTUAL RELEVANCE (pre-computed page terms - very fast)
-        if page_context.get('terms') and link_text:
-            link_words = set(word.strip('.,!?;:"()[]{}').lower() 
-                           for word in link_text.split() 
-                           if len(word.strip('.,!?;:"()[]{}')) > 2)
-            
-            if link_words:
-                # Calculate word overlap ratio
-                overlap = len(link_words & page_context['terms'])
-                if overlap > 0:
-                    relevance_ratio = overlap / min(len(link_words), 10)  # Cap to avoid over-weighting
-                    score += relevance_ratio * 2.0  # Up to 2 points for relevance
-                    
-        # 5. DOMAIN CONTEXT BONUSES (very fast string checks)
-        if page_context.get('is_docs_site', False):
-            # Documentation sites: prioritize internal navigation
-            if link_text and any(doc_keyword in link_text.lower() 
-                               for doc_keyword in ['api', 'reference', 'guide', 'tutorial', 'example']):
-                score += 1.0
-                
+        return _combine_link_scores(
+            _link_attribute_score(title_attr, class_attr, rel_attr),
+            _link_url_score(url),
+            _link_text_scores(link_text, page_context),
+        )
     except Exception:
         # Fail gracefully - return minimal score
-        score = 0.5
-        
-    # Ensure score is within reasonable bounds
-    return max(0.0, min(score, 10.0))
+        return 0.5
+
+
+def calculate_link_intrinsic_scores(
+    link_texts: List[str],
+    urls: List[str],
+    title_attrs: List[str],
+    class_attrs: List[str],
+    rel_attrs: List[str],
+    page_context: dict,
+) -> List[float]:
+    """
+    Score all links of a page, as calculate_link_intrinsic_score does one by one.
+
+    Navigation and listing links repeat the same attributes and texts, so the
+    attribute and text scores are computed once per distinct value.
+
+    Args:
+        link_texts: Text content of each link
+        urls: URL of each link
+        title_attrs: Title attribute of each link
+        class_attrs: Class attribute of each link
+        rel_attrs: Rel attribute of each link
+        page_context: Pre-computed page context from extract_page_context()
+
+    Returns:
+        List[float]: Quality score (0.0 - 10.0) of each link
+    """
+    attribute_scores = {}
+    text_scores = {}
+    scores = []
+    for link_text, url, title_attr, class_attr, rel_attr in zip(
+        link_texts, urls, title_attrs, class_attrs, rel_attrs
+    ):
+        try:
+            attributes = (title_attr, class_attr, rel_attr)
+            attribute = attribute_scores.get(attributes)
+            if attribute is None:
+                attribute = attribute_scores[attributes] = _link_attribute_score(*attributes)
+            text = text_scores.get(link_text)
+            if text is None:
+                text = text_scores[link_text] = _link_text_scores(link_text, page_context)
+            scores.append(_combine_link_scores(attribute, _link_url_score(url), text))
+        except Exception:
+            scores.append(0.5)
+    return scores
 
 
 def calculate_total_score(
@@ -5,7 +5,6 @@ from typing import List, Tuple, Dict
 from functools import partial
 from uuid import uuid4
 from datetime import datetime
-from base64 import b64encode
 
 import logging
 from typing import Optional, AsyncGenerator
@@ -26,6 +25,7 @@ from crawl4ai import (
     LLMConfig
 )
 from crawl4ai.utils import perform_completion_with_backoff
+from crawl4ai.serialization import json_dumps, json_dumps_str, result_to_dict
 from crawl4ai.content_filter_strategy import (
     PruningContentFilter,
     BM25ContentFilter,
@@ -156,13 +156,12 @@ async def process_llm_extraction(
             })
             return
 
-        try:
-            content = json.loads(result.extracted_content)
-        except json.JSONDecodeError:
+        content = result.extracted_data
+        if content is None:
             content = result.extracted_content
         await redis.hset(f"task:{task_id}", mapping={
             "status": TaskStatus.COMPLETED,
-            "result": json.dumps(content)
+            "result": json_dumps_str(content)
         })
 
     except Exception as e:
@@ -384,27 +383,21 @@ def create_task_response(task: dict, task_id: str, base_url: str) -> dict:
 
 async def stream_results(crawler: AsyncWebCrawler, results_gen: AsyncGenerator) -> AsyncGenerator[bytes, None]:
     """Stream results with heartbeats and completion markers."""
-    import json
-    from utils import datetime_handler
-
     try:
         async for result in results_gen:
             try:
                 server_memory_mb = _get_memory_mb()
-                result_dict = result.model_dump()
+                # PDF bytes are base64 encoded, extracted content stays compact
+                result_dict = result_to_dict(result)
                 result_dict['server_memory_mb'] = server_memory_mb
-                # If PDF exists, encode it to base64
-                if result_dict.get('pdf') is not None:
-                    result_dict['pdf'] = b64encode(result_dict['pdf']).decode('utf-8')
                 logger.info(f"Streaming result for {result_dict.get('url', 'unknown')}")
-                data = json.dumps(result_dict, default=datetime_handler) + "\n"
-                yield data.encode('utf-8')
+                yield json_dumps(result_dict) + b"\n"
             except Exception as e:
                 logger.error(f"Serialization error: {e}")
                 error_response = {"error": str(e), "url": getattr(result, 'url', 'unknown')}
-                yield (json.dumps(error_response) + "\n").encode('utf-8')
+                yield json_dumps(error_response) + b"\n"
 
-        yield json.dumps({"status": "completed"}).encode('utf-8')
+        yield json_dumps({"status": "completed"})
         
     except asyncio.CancelledError:
         logger.warning("Client disconnected during streaming")
@@ -419,9 +412,10 @@ async def handle_crawl_request(
     urls: List[str],
     browser_config: dict,
     crawler_config: dict,
-    config: dict
+    config: dict,
+    binary: bool = False
 ) -> dict:
-    """Handle non-streaming crawl requests."""
+    """Handle non-streaming crawl requests. binary keeps PDF bytes unencoded for msgpack responses."""
     start_mem_mb = _get_memory_mb() # <--- Get memory before
     start_time = time.time()
     mem_delta_mb = None
@@ -470,13 +464,7 @@ async def handle_crawl_request(
         logger.info(f"Memory usage: Start: {start_mem_mb} MB, End: {end_mem_mb} MB, Delta: {mem_delta_mb} MB, Peak: {peak_mem_mb} MB")
 
         # Process results to handle PDF bytes
-        processed_results = []
-        for result in results:
-            result_dict = result.model_dump()
-            # If PDF exists, encode it to base64
-            if result_dict.get('pdf') is not None:
-                result_dict['pdf'] = b64encode(result_dict['pdf']).decode('utf-8')
-            processed_results.append(result_dict)
+        processed_results = [result_to_dict(result, binary=binary) for result in results]
             
         return {
             "success": True,
@@ -592,7 +580,7 @@ async def handle_crawl_job(
             )
             await redis.hset(f"task:{task_id}", mapping={
                 "status": TaskStatus.COMPLETED,
-                "result": json.dumps(result),
+                "result": json_dumps_str(result),
             })
             await asyncio.sleep(5)  # Give Redis time to process the update
         except Exception as exc:
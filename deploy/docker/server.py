@@ -48,8 +48,9 @@ from fastapi import (
 )
 from rank_bm25 import BM25Okapi
 from fastapi.responses import (
-    StreamingResponse, RedirectResponse, PlainTextResponse, JSONResponse
+    StreamingResponse, RedirectResponse, PlainTextResponse, JSONResponse, Response
 )
+from crawl4ai.serialization import HAS_MSGPACK, json_dumps, msgpack_dumps
 from fastapi.middleware.httpsredirect import HTTPSRedirectMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -434,16 +435,21 @@ async def crawl(
 ):
     """
     Crawl a list of URLs and return the results as JSON.
+    Clients that send Accept: application/msgpack get msgpack instead.
     """
     if not crawl_request.urls:
         raise HTTPException(400, "At least one URL required")
+    use_msgpack = HAS_MSGPACK and "application/msgpack" in request.headers.get("accept", "")
     res = await handle_crawl_request(
         urls=crawl_request.urls,
         browser_config=crawl_request.browser_config,
         crawler_config=crawl_request.crawler_config,
         config=config,
+        binary=use_msgpack,
     )
-    return JSONResponse(res)
+    if use_msgpack:
+        return Response(msgpack_dumps(res), media_type="application/msgpack")
+    return Response(json_dumps(res), media_type="application/json")
 
 
 @app.post("/crawl/stream")
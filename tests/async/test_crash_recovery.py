@@ -0,0 +1,80 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai import BrowserConfig, CrawlerRunConfig, MemoryAdaptiveDispatcher
+from crawl4ai.browser_manager import BrowserManager
+from crawl4ai.models import CrawlResult
+
+
+class CrashingCrawler:
+    """Fake crawler whose browser 'crashes' on the first attempt for each URL."""
+
+    def __init__(self):
+        self.crawler_strategy = SimpleNamespace(
+            browser_manager=SimpleNamespace(crash_generation=0)
+        )
+        self.attempts = {}
+
+    async def arun(self, url, config=None, **kwargs):
+        self.attempts[url] = self.attempts.get(url, 0) + 1
+        if self.attempts[url] == 1:
+            self.crawler_strategy.browser_manager.crash_generation += 1
+            return CrawlResult(
+                url=url, html="", success=False,
+                error_message="Page.content: Target crashed",
+            )
+        return CrawlResult(url=url, html="<p>ok</p>", success=True)
+
+
+@pytest.mark.asyncio
+async def test_crashed_urls_are_requeued():
+    crawler = CrashingCrawler()
+    dispatcher = MemoryAdaptiveDispatcher(
+        memory_threshold_percent=100.0,
+        critical_threshold_percent=100.0,
+        max_session_permit=2,
+        check_interval=0.05,
+    )
+    urls = ["https://example.com/a", "https://example.com/b"]
+    results = await dispatcher.run_urls(urls, crawler, CrawlerRunConfig())
+
+    assert sorted(r.url for r in results) == urls
+    assert all(r.result.success for r in results)
+    assert all(r.retry_count == 1 for r in results)
+    assert dispatcher.crash_requeues == 2
+
+
+@pytest.mark.asyncio
+async def test_crash_retries_are_bounded():
+    crawler = CrashingCrawler()
+
+    async def always_crash(url, config=None, **kwargs):
+        crawler.crawler_strategy.browser_manager.crash_generation += 1
+        return CrawlResult(url=url, html="", success=False, error_message="Browser has been closed")
+
+    crawler.arun = always_crash
+    dispatcher = MemoryAdaptiveDispatcher(
+        memory_threshold_percent=100.0,
+        critical_threshold_percent=100.0,
+        check_interval=0.05,
+        max_crash_retries=2,
+    )
+    results = await dispatcher.run_urls(["https://example.com/a"], crawler, CrawlerRunConfig())
+
+    assert len(results) == 1
+    assert not results[0].result.success
+    assert results[0].retry_count == 2
+
+
+@pytest.mark.asyncio
+async def test_restart_is_rate_limited():
+    manager = BrowserManager(
+        BrowserConfig(crash_recovery=True, max_browser_restarts=1, browser_restart_window=60)
+    )
+    manager._restart_times.append(time.time())
+
+    with pytest.raises(RuntimeError, match="restart limit"):
+        await manager.restart()
+    assert manager.crash_stats["restarts_rejected"] == 1
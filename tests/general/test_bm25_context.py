@@ -0,0 +1,80 @@
+"""
+Tests for BM25 scoring and the crawl-wide BM25Context.
+"""
+import math
+
+import numpy as np
+import pytest
+from rank_bm25 import BM25Okapi
+
+from crawl4ai import BM25ContentFilter, BM25Context
+from crawl4ai.content_filter_strategy import _bm25_scores, _okapi_idf
+
+CORPUS = [
+    ["appl", "pie", "recip", "appl"],
+    ["bake", "crust", "golden"],
+    ["appl", "orchard", "harvest", "season", "fruit"],
+    [],
+    ["pie", "dough", "butter", "flour", "cold", "water"],
+]
+
+
+def _page(i):
+    return (
+        "<html><body><div class='promo'><p>Compare pricing plans and get a quote from sales</p></div>"
+        f"<article><h2>Topic {i}</h2><p>Article {i} explains usage pricing for product line {i} "
+        f"with worked examples.</p><p>Shipping times, returns and warehouse logistics in region {i}.</p>"
+        "</article></body></html>"
+    )
+
+
+@pytest.mark.parametrize(
+    "query", [["appl"], ["appl", "pie"], ["pie", "pie", "crust"], ["missing"], []]
+)
+def test_scores_match_rank_bm25(query):
+    avgdl = sum(map(len, CORPUS)) / len(CORPUS)
+    scores = _bm25_scores(CORPUS, query, _okapi_idf(CORPUS), avgdl, k1=1.5, b=0.75)
+    assert np.array_equal(scores, BM25Okapi(CORPUS).get_scores(query))
+
+
+def test_empty_tokens_score_zero():
+    corpus = [[], []]
+    assert _okapi_idf(corpus) == {}
+    assert list(_bm25_scores(corpus, ["x"], {}, 0, k1=1.5, b=0.75)) == [0, 0]
+
+
+def test_context_idf_spans_pages():
+    context = BM25Context()
+    context.get_scores([["a", "b"], ["c"]], ["a"])
+    scores = context.get_scores([["a"], ["d"]], ["a"])
+
+    # Four chunks so far, two of them contain "a"
+    idf = math.log(1 + (4 - 2 + 0.5) / (2 + 0.5))
+    avgdl = 5 / 4
+    expected = idf * (1 * 2.5) / (1 + 1.5 * (1 - 0.75 + 0.75 * 1 / avgdl))
+    assert scores[0] == pytest.approx(expected)
+    assert scores[1] == 0
+    assert (context.pages, context.num_documents, context.total_length) == (2, 4, 5)
+    assert context.document_frequencies["a"] == 2
+
+
+def test_filters_share_context_statistics_and_stems():
+    context = BM25Context()
+    first = BM25ContentFilter(user_query="pricing", context=context)
+    second = BM25ContentFilter(user_query="pricing plans", context=context)
+    first.filter_content(_page(1))
+    second.filter_content(_page(2))
+
+    assert context.pages == 2
+    assert context.stem_cache("english") is first._stems is second._stems
+    assert context.stem_cache("english")["pricing"] == "price"
+
+
+def test_small_pages_are_scored_with_site_statistics():
+    # On a page this small, BM25Okapi's per-page IDF floors every query term
+    plain = BM25ContentFilter(user_query="pricing plans")
+    assert plain.filter_content(_page(1)) == []
+
+    shared = BM25ContentFilter(user_query="pricing plans", context=BM25Context())
+    for i in range(5):
+        assert shared.filter_content(_page(i))
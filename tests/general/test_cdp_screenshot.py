@@ -0,0 +1,56 @@
+"""
+Tests for CDP-based screenshots configured through ScreenshotConfig.
+"""
+import base64
+import os
+
+import pytest
+
+from crawl4ai import AsyncWebCrawler, ScreenshotConfig
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+
+TALL_HTML = "<html><body>" + "".join(
+    f"<div style='height:500px'>block {i}</div>" for i in range(20)
+) + "</body></html>"
+
+
+def test_screenshot_config_validation():
+    with pytest.raises(ValueError):
+        ScreenshotConfig(format="gif")
+    with pytest.raises(ValueError):
+        ScreenshotConfig(quality=101)
+    with pytest.raises(ValueError):
+        ScreenshotConfig(output="stream")
+
+    config = CrawlerRunConfig(screenshot=True, screenshot_config={"format": "webp", "scale": 0.5})
+    assert isinstance(config.screenshot_config, ScreenshotConfig)
+    cloned = config.clone()
+    assert cloned.screenshot_config.format == "webp"
+    assert cloned.screenshot_config.scale == 0.5
+
+
+def test_write_screenshot_to_content_store(tmp_path):
+    raw = b"\xff\xd8\xff fake jpeg payload"
+    config = ScreenshotConfig(output="file", output_dir=str(tmp_path))
+    path = AsyncPlaywrightCrawlerStrategy._write_screenshot(
+        base64.b64encode(raw).decode("utf-8"), config
+    )
+    assert path.endswith(".jpeg")
+    assert os.path.dirname(path) == str(tmp_path)
+    with open(path, "rb") as f:
+        assert f.read() == raw
+
+
+@pytest.mark.asyncio
+async def test_cdp_screenshot_bytes():
+    config = CrawlerRunConfig(
+        screenshot=True,
+        screenshot_config=ScreenshotConfig(format="jpeg", quality=60, scale=0.5, output="bytes"),
+    )
+    async with AsyncWebCrawler() as crawler:
+        result = await crawler.arun(f"raw:{TALL_HTML}", config=config)
+
+    assert result.success
+    assert isinstance(result.screenshot, bytes)
+    assert result.screenshot[:2] == b"\xff\xd8"
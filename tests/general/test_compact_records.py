@@ -0,0 +1,76 @@
+"""
+Tests for the compact link and media records passed from the scraper to the crawl result.
+"""
+import pickle
+
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+from crawl4ai.models import CrawlResult, Link, LinkRecord, MediaItem, MediaRecord
+
+HTML = (
+    "<html><head><title>Records</title></head><body>"
+    "<p>A paragraph about records with <a href='/docs' title='Docs'>documentation</a> and "
+    "<a href='https://other.org/x'>a partner</a>.</p>"
+    "<div><p>A photo of the team at work</p>"
+    "<img src='/team.jpg' alt='The team' width='400' srcset='/team-800.jpg 800w, /team-bad.jpg xw'></div>"
+    "<video src='/intro.mp4'><source src='/intro.webm'></video>"
+    "</body></html>"
+)
+
+
+def scrape():
+    return LXMLWebScrapingStrategy().scrap("https://example.com/", HTML, score_links=True)
+
+
+def test_records_match_model_dumps():
+    record = LinkRecord(href="https://example.com/a", text="A", intrinsic_score=1.0)
+    assert record.to_dict() == Link(**record).model_dump()
+    assert record.to_model() == Link(**record.to_dict())
+    assert record["href"] == record.get("href") == "https://example.com/a"
+    assert record.get("missing", 1) == 1
+
+    media = MediaRecord(src="/a.png", alt="A", score=3, width=300)
+    assert media.to_dict() == MediaItem(**media.to_dict()).model_dump()
+    assert pickle.loads(pickle.dumps(media)) == media
+
+
+def test_scraping_result_builds_models_only_when_read():
+    result = scrape()
+    links = result.dump_links()
+    assert all(isinstance(link, LinkRecord) for link in links["internal"] + links["external"])
+    assert result._links is not None and not hasattr(result._links, "internal")
+
+    assert [link.href for link in result.links.internal] == ["https://example.com/docs"]
+    assert isinstance(result.links.internal[0], Link)
+    assert result.dump_links()["internal"][0] == result.links.internal[0].model_dump()
+
+    widths = {image.src: image.width for image in result.media.images}
+    assert widths == {"/team.jpg": None, "/team-800.jpg": 800, "/team-bad.jpg": None}
+    assert [video.src for video in result.media.videos] == ["/intro.mp4", "/intro.webm"]
+
+
+def test_crawl_result_converts_records_to_dicts_on_first_read():
+    scraped = scrape()
+    media = scraped.dump_media()
+    media.pop("tables")
+    result = CrawlResult(url="https://example.com/", html=HTML, success=True, links=scraped.dump_links(), media=media)
+
+    assert result._pending_records
+    internal = result.links["internal"]
+    assert not result._pending_records
+    assert internal == [link.model_dump() for link in scraped.links.internal]
+    assert result.media["images"][0] == scraped.media.images[0].model_dump()
+
+    # Mutations stick, dumps are copies
+    result.links["internal"].append({"href": "https://example.com/new"})
+    dumped = result.model_dump()
+    assert dumped["links"]["internal"][-1] == {"href": "https://example.com/new"}
+    dumped["links"]["internal"][0]["text"] = "changed"
+    assert result.links["internal"][0]["text"] != "changed"
+    assert "links" not in result.model_dump(exclude={"links"})
+
+
+def test_plain_dicts_are_still_accepted():
+    result = CrawlResult(url="u", html="", success=True, links={"internal": [{"href": "https://a.example/"}]})
+    assert result.links == {"internal": [{"href": "https://a.example/"}]}
+    assert result.media == {}
+    assert CrawlResult(**result.model_dump()).links == result.links
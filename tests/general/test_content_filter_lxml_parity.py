@@ -0,0 +1,175 @@
+"""
+Parity tests for the lxml implementations of PruningContentFilter and
+BM25ContentFilter against the BeautifulSoup measures they replace.
+"""
+import os
+
+import pytest
+from bs4 import BeautifulSoup, Comment
+from lxml import etree
+
+from crawl4ai.content_filter_strategy import (
+    BM25ContentFilter,
+    PruningContentFilter,
+    _parse_body,
+)
+from crawl4ai.parsed_document import ParsedDocument
+
+CORPUS = {
+    "article": "<html><head><title>Apple pie recipes</title></head><body>"
+               "<nav><a href='/'>Home</a> <a href='/r'>Recipes</a></nav>"
+               "<article><h1>Apple pie</h1><p>Classic apple pie with a flaky crust and cinnamon apples, "
+               "baked until golden.</p><p>Peel the apples, slice them and mix with sugar.</p></article>"
+               "<footer>Copyright</footer></body></html>",
+    "entities": "<div><p>a &amp; b &lt;c&gt; &quot;d&quot; caf\xe9 &nbsp; e</p>"
+                "<p title='say \"hi\"' data-x=\"it's\" data-y='a&amp;b<c'>quoted attrs</p></div>",
+    "whitespace": "<div>\n    <p>one</p>\n\n    <p>  two  words  </p>\n  </div>"
+                  "<pre>\n  keep   this\n</pre><textarea>\n\n</textarea>",
+    "comments": "<div>before<!-- gone -->after <!---->x<span>in<!--c-->side</span></div>",
+    "excluded": "<div>lead<script>var x;</script>tail<style>p{}</style> more "
+                "<form><input name='q'></form>end</div><aside>side</aside><p>para text here</p>",
+    "void_and_booleans": "<div><img src='a.png' alt='A'><br>line<hr><input disabled>"
+                        "<select><option selected>One</option></select></div>",
+    "list_attributes": "<div class='  a   b  ' id='main'><a rel='nofollow  noopener' href='/x'>link</a>"
+                       "<td headers='h1   h2'>cell</td></div>",
+    "links": "<div><a href='/a'>Only</a> text <a href='/b'><b>nested</b></a> "
+             "<a href='/c'>two <i>parts</i></a><a href='/d'><!--c-->after comment</a></div>",
+    "negative_classes": "<div class='sidebar'>Side links</div><div id='ads-top'>Buy</div>"
+                        "<div class='content'>Main body text that should score well enough.</div>",
+    "containers": "<div><template><p>hidden template text</p></template>"
+                  "<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby> visible</div>",
+    "fragment": "<li>item one</li><li>item <a href='/two'>two</a></li>",
+}
+
+
+def _sample_page():
+    path = os.path.join(os.path.dirname(__file__), "..", "async", "sample_wikipedia.html")
+    with open(path, encoding="utf-8") as f:
+        # lxml can't tell disabled="disabled" from a bare disabled, which
+        # BeautifulSoup stores as an empty value
+        return f.read().replace('disabled="disabled"', "disabled")
+
+
+def _documents():
+    return list(CORPUS.items()) + [("wikipedia", _sample_page())]
+
+
+def _bs4_pruning_tree(html, content_filter):
+    soup = BeautifulSoup(html, "lxml")
+    if not soup.body:
+        soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+    for comment in soup(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    for tag in content_filter.excluded_tags:
+        for element in soup.find_all(tag):
+            element.decompose()
+    return soup.find("body")
+
+
+def _lxml_elements(body, content_filter):
+    """Elements of the body in document order, skipping what pruning removes."""
+    elements = []
+    walker = etree.iterwalk(body, events=("start",))
+    for _, node in walker:
+        if node.tag in content_filter.excluded_tags:
+            walker.skip_subtree()
+            continue
+        elements.append(node)
+    return elements
+
+
+def _pair(html, content_filter):
+    bs4_body = _bs4_pruning_tree(html, content_filter)
+    _, body = _parse_body(html)
+    bs4_elements = [bs4_body] + bs4_body.find_all(True)
+    elements = _lxml_elements(body, content_filter)
+    assert [e.name for e in bs4_elements] == [e.tag for e in elements]
+    return body, list(zip(bs4_elements, elements))
+
+
+@pytest.mark.parametrize("name,html", _documents(), ids=[n for n, _ in _documents()])
+def test_pruning_metrics_match_beautifulsoup(name, html):
+    content_filter = PruningContentFilter()
+    body, pairs = _pair(html, content_filter)
+    metrics = content_filter._compute_metrics(body)
+
+    for tag, element in pairs:
+        text = tag.get_text(strip=True)
+        expected = (len(text), text.count(" "), len(tag.encode_contents().decode("utf-8")))
+        assert metrics[element] == expected, tag.name
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"threshold_type": "dynamic"}, {"min_word_threshold": 4}])
+@pytest.mark.parametrize("name,html", _documents(), ids=[n for n, _ in _documents()])
+def test_pruning_decisions_match_beautifulsoup(name, html, kwargs):
+    content_filter = PruningContentFilter(**kwargs)
+    body, pairs = _pair(html, content_filter)
+    metrics = content_filter._compute_metrics(body)
+    removed = {id(e) for e in content_filter._prune_tree(body, metrics)}
+
+    # Reference decisions from the BeautifulSoup measures, walking top-down
+    lxml_of = {id(tag): element for tag, element in pairs}
+    expected = set()
+    stack = [pairs[0][0]]
+    while stack:
+        tag = stack.pop()
+        text = tag.get_text(strip=True)
+        text_len, tag_len = len(text), len(tag.encode_contents().decode("utf-8"))
+        link_text_len = sum(
+            len(s.strip()) for s in (a.string for a in tag.find_all("a", recursive=False)) if s
+        )
+        element = lxml_of[id(tag)]
+        node_metrics = {"node": element, "tag_name": tag.name, "word_count": text.count(" ") + 1}
+        score = content_filter._compute_composite_score(node_metrics, text_len, tag_len, link_text_len)
+        threshold = content_filter.threshold
+        if content_filter.threshold_type == "dynamic":
+            if content_filter.tag_importance.get(tag.name, 0.7) > 1:
+                threshold *= 0.8
+            if (text_len / tag_len if tag_len > 0 else 0) > 0.4:
+                threshold *= 0.9
+            if (link_text_len / text_len if text_len > 0 else 1) > 0.6:
+                threshold *= 1.2
+        if score < threshold:
+            expected.add(id(element))
+        else:
+            stack.extend(tag.find_all(True, recursive=False))
+
+    assert removed == expected
+
+
+def test_pruning_output_blocks():
+    blocks = PruningContentFilter().filter_content(CORPUS["article"])
+    assert len(blocks) == 1 and blocks[0].startswith("<article>")
+    assert "Home" not in blocks[0] and "Copyright" not in blocks[0]
+    assert PruningContentFilter().filter_content("   ") == []
+
+
+@pytest.mark.parametrize("name,html", _documents(), ids=[n for n, _ in _documents()])
+def test_bm25_chunks_and_query_match_beautifulsoup(name, html):
+    content_filter = BM25ContentFilter()
+    soup = BeautifulSoup(html, "lxml")
+    if not soup.body:
+        soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+    root, body = _parse_body(html)
+
+    assert content_filter.extract_page_query(root, body) == content_filter.extract_page_query(
+        soup, soup.find("body")
+    )
+
+    expected = content_filter.extract_text_chunks(soup.find("body"))
+    chunks = content_filter.extract_text_chunks(body)
+    assert [c[:3] for c in chunks] == [c[:3] for c in expected]
+    assert [e.tag for *_, e in chunks] == [t.name for *_, t in expected]
+    for (*_, element), (*_, tag) in zip(chunks, expected):
+        assert content_filter.clean_element(element) == content_filter.clean_element(tag)
+
+
+def test_bm25_filter_document_reads_shared_tree():
+    document = ParsedDocument(CORPUS["article"])
+    document.set_cleaned(CORPUS["article"])
+    content_filter = BM25ContentFilter(user_query="apple pie")
+    expected = content_filter.filter_content(CORPUS["article"])
+
+    assert expected
+    assert content_filter.filter_document(document) == expected
+    assert document.parse_count == 1
@@ -0,0 +1,64 @@
+"""
+Tests for the DOM-quiescence wait (wait_for_quiescence) in AsyncPlaywrightCrawlerStrategy.
+"""
+import pytest
+
+from crawl4ai import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+
+# Appends one paragraph every 100ms for 1s, then goes quiet
+MUTATING_HTML = """
+<html><body>
+<div id="feed"></div>
+<script>
+    let n = 0;
+    const timer = setInterval(() => {
+        const p = document.createElement('p');
+        p.textContent = 'item ' + (++n);
+        document.getElementById('feed').appendChild(p);
+        if (n >= 10) clearInterval(timer);
+    }, 100);
+</script>
+</body></html>
+"""
+
+
+def test_quiescence_config_roundtrip():
+    config = CrawlerRunConfig(
+        wait_for_quiescence=True, quiescence_idle_ms=250, quiescence_timeout=3000
+    )
+    cloned = config.clone()
+    assert cloned.wait_for_quiescence is True
+    assert cloned.quiescence_idle_ms == 250
+    assert cloned.quiescence_timeout == 3000
+
+    loaded = CrawlerRunConfig.load(config.dump())
+    assert loaded.quiescence_idle_ms == 250
+
+
+@pytest.mark.asyncio
+async def test_quiescence_waits_for_mutations():
+    config = CrawlerRunConfig(
+        wait_for_quiescence=True, quiescence_idle_ms=300, quiescence_timeout=5000
+    )
+    async with AsyncWebCrawler() as crawler:
+        result = await crawler.arun(f"raw:{MUTATING_HTML}", config=config)
+
+    assert result.success
+    assert result.wait_stats["settled"] is True
+    assert result.wait_stats["waited_ms"] < 5000
+    assert "item 10" in result.html
+
+
+@pytest.mark.asyncio
+async def test_quiescence_respects_hard_cap():
+    never_quiet = "<html><body><script>setInterval(() => document.body.appendChild(document.createElement('i')), 20);</script></body></html>"
+    config = CrawlerRunConfig(
+        wait_for_quiescence=True, quiescence_idle_ms=500, quiescence_timeout=1000
+    )
+    async with AsyncWebCrawler() as crawler:
+        result = await crawler.arun(f"raw:{never_quiet}", config=config)
+
+    assert result.success
+    assert result.wait_stats["settled"] is False
+    assert result.wait_stats["waited_ms"] >= 1000
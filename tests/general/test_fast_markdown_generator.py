@@ -0,0 +1,138 @@
+"""
+Parity tests for FastMarkdownGenerator against DefaultMarkdownGenerator.
+"""
+import os
+import re
+
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, FastMarkdownGenerator
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.content_filter_strategy import PruningContentFilter
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.parsed_document import ParsedDocument
+
+BASE_URL = "https://example.com/docs/"
+
+CORPUS = {
+    "headings": "<h1>Title</h1><h2>Sub</h2><h6>Deep</h6><p>Body</p>",
+    "paragraphs": "<p>One</p>\n<p>Two <span>spans</span>   and\n  breaks</p><div>Div</div>",
+    "emphasis": "<p>Hello <b>bold</b> and <em>it</em>alic, <strong>x</strong><strong>y</strong> <del>gone</del> <u>under</u></p>",
+    "links": '<p>See <a href="/a">A link</a> and <a href="https://x.com/b" title="Tee">B</a>, '
+             '<a href="/a">again</a>. <a href="mailto:x@y.z">mail</a> <a href="#top">top</a> '
+             '<a href="rel/page">relative</a> <a href="https://auto.example/">https://auto.example/</a> '
+             '<a href="/empty"></a> <a>no href</a></p>',
+    "link_spacing": '<ul><li><a href="/one"> One </a></li><li><a href="/two">Two <b>bold</b> </a></li></ul>',
+    "images": '<p><img src="/i.png" alt="Pic"> text <img src="nosrc.png"> <img alt="no src"></p>',
+    "lists": "<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>"
+             '<ol start="3"><li>third</li><li>fourth<ul><li>mixed</li></ul></li></ol><p>after</p>',
+    "pre": "<p>code:</p><pre><code>x = 1\n  y = 2\n</code></pre><p>inline <code>a_b *c*</code> <kbd>Ctrl</kbd></p>",
+    "blockquote": "<blockquote><p>quoted text</p><p>more<br>lines</p></blockquote><p>x</p>",
+    "table": "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr><tr><td>3</td><td>4</td></tr></table>",
+    "definitions": "<dl><dt>Term</dt><dd>Meaning</dd><dt>Other</dt><dd>Second</dd></dl>",
+    "misc": "<p>line1<br>line2</p><hr><p><q>quoted</q> <abbr title='HyperText'>HTML</abbr> a&amp;b &lt;tag&gt;</p>",
+    "escaping": "<p>1. not a list * star _under_ # hash back\\slash \\*</p>",
+    "whitespace": "<div>\n  <span>a</span>\n  <span>b</span>\n</div><div>c \xa0 d</div>",
+    "comments": "<div><!---->Kept<!-- hidden --> text</div>",
+    "quiet": "<head><title>T</title><style>p{}</style></head><body><script>var x;</script><p>Shown</p></body>",
+    "heading_in_link": '<a href="/card"><h3>Card title</h3></a><p>after</p>',
+    "code_in_link": '<p><a href="/api"><code>api()</code></a></p>',
+}
+
+FIELDS = ("raw_markdown", "markdown_with_citations", "references_markdown")
+
+
+def _both(html, **kwargs):
+    default = DefaultMarkdownGenerator(**kwargs).generate_markdown(html, base_url=BASE_URL)
+    fast = FastMarkdownGenerator(**kwargs).generate_markdown(html, base_url=BASE_URL)
+    return default, fast
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_parity_with_default_generator(name):
+    default, fast = _both(CORPUS[name])
+    for field in FIELDS:
+        assert getattr(fast, field) == getattr(default, field), field
+
+
+@pytest.mark.parametrize("html", ["", "   ", "<!-- only a comment -->"])
+def test_parity_on_empty_input(html):
+    default, fast = _both(html)
+    for field in FIELDS:
+        assert getattr(fast, field) == getattr(default, field)
+
+
+def test_parity_on_real_page():
+    path = os.path.join(os.path.dirname(__file__), "..", "async", "sample_wikipedia.html")
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    cleaned = LXMLWebScrapingStrategy().scrap(BASE_URL, html).cleaned_html
+
+    default, fast = _both(cleaned)
+    assert fast.raw_markdown == default.raw_markdown
+    assert len(fast.references_markdown.splitlines()) >= len(default.references_markdown.splitlines())
+
+
+def test_parity_with_options_and_filter():
+    html = CORPUS["links"] + CORPUS["emphasis"] + "<p>" + "Long relevant paragraph text. " * 20 + "</p>"
+    options = {"ignore_links": True, "ignore_emphasis": True}
+    default = DefaultMarkdownGenerator(content_filter=PruningContentFilter(), options=options)
+    fast = FastMarkdownGenerator(content_filter=PruningContentFilter(), options=options)
+    expected = default.generate_markdown(html, base_url=BASE_URL)
+    result = fast.generate_markdown(html, base_url=BASE_URL)
+
+    for field in FIELDS + ("fit_markdown", "fit_html"):
+        assert getattr(result, field) == getattr(expected, field), field
+
+    result = fast.generate_markdown(html, base_url=BASE_URL, citations=False)
+    assert result.markdown_with_citations == result.raw_markdown
+    assert result.references_markdown == ""
+
+
+def test_image_inside_link_is_cited_separately():
+    html = '<p><a href="/product"><img src="/thumb.png" alt="Thumb"></a></p>'
+    result = FastMarkdownGenerator().generate_markdown(html, base_url=BASE_URL)
+
+    assert result.raw_markdown == DefaultMarkdownGenerator().generate_markdown(html, base_url=BASE_URL).raw_markdown
+    assert result.markdown_with_citations.strip() == "![Thumb⟨1⟩]⟨2⟩"
+    assert "⟨1⟩ https://example.com/thumb.png: Thumb" in result.references_markdown
+    assert "⟨2⟩ https://example.com/product" in result.references_markdown
+
+
+def test_unsupported_options_fall_back():
+    html = "<p>" + "word " * 40 + "</p><table><tr><td>a</td></tr></table>"
+    options = {"body_width": 40, "bypass_tables": True}
+    default, fast = _both(html, options=options)
+    for field in FIELDS:
+        assert getattr(fast, field) == getattr(default, field)
+
+
+def test_walks_document_tree_without_parsing():
+    html = "<html><body><main>" + CORPUS["lists"] + CORPUS["links"] + "</main></body></html>"
+    document = ParsedDocument(html, url=BASE_URL)
+    cleaned = LXMLWebScrapingStrategy().scrap(BASE_URL, html, document=document).cleaned_html
+    parses = document.parse_count
+
+    result = FastMarkdownGenerator().generate_markdown(cleaned, base_url=BASE_URL, document=document)
+    expected = DefaultMarkdownGenerator().generate_markdown(cleaned, base_url=BASE_URL)
+
+    assert document.parse_count == parses
+    # The tree lacks the whitespace pretty-printing adds to the serialized HTML
+    for field in FIELDS:
+        assert re.sub(r"\s+", "", getattr(result, field)) == re.sub(r"\s+", "", getattr(expected, field))
+
+
+@pytest.mark.asyncio
+async def test_crawler_with_fast_generator():
+    html = "<html><body><h1>Hello</h1><p>See <a href='https://example.com/x'>x</a>.</p></body></html>"
+    results = {}
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        for generator in (DefaultMarkdownGenerator(), FastMarkdownGenerator()):
+            config = CrawlerRunConfig(markdown_generator=generator)
+            result = await crawler.arun(f"raw:{html}", config=config)
+            assert result.success
+            results[type(generator)] = result.markdown
+
+    assert results[FastMarkdownGenerator].raw_markdown == results[DefaultMarkdownGenerator].raw_markdown
+    assert "x⟨1⟩" in results[FastMarkdownGenerator].markdown_with_citations
@@ -0,0 +1,89 @@
+"""
+Tests for per-host limits, compression, HTTP/2 backend and body caps in AsyncHTTPCrawlerStrategy.
+"""
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.async_configs import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy, BodyTooLargeError
+
+PAGE = "<html><body>" + "<p>compressible paragraph</p>" * 2000 + "</body></html>"
+
+
+@pytest_asyncio.fixture
+async def server():
+    state = {"active": 0, "peak": 0, "encodings": []}
+
+    async def page(request):
+        state["encodings"].append(request.headers.get("Accept-Encoding", ""))
+        response = web.Response(text=PAGE, content_type="text/html")
+        response.enable_compression()
+        return response
+
+    async def slow(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.2)
+        state["active"] -= 1
+        return web.Response(text="<html><body>slow</body></html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    app.router.add_get("/slow/{n}", slow)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", state
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_compressed_response_is_decoded(server, http2):
+    base, state = server
+    async with AsyncHTTPCrawlerStrategy(http2=http2) as crawler:
+        response = await crawler.crawl(f"{base}/page", config=CrawlerRunConfig())
+        assert response.html == PAGE
+        assert "br" in state["encodings"][-1]
+        assert crawler.stats["requests"] == 1
+        assert crawler.stats["bytes"] == len(PAGE)
+        assert crawler.stats["time_total"] >= crawler.stats["time_to_headers"] > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_max_body_bytes(server, http2):
+    base, _ = server
+    truncate = HTTPCrawlerConfig(max_body_bytes=1000, max_body_action="truncate")
+    async with AsyncHTTPCrawlerStrategy(browser_config=truncate, http2=http2) as crawler:
+        response = await crawler.crawl(f"{base}/page", config=CrawlerRunConfig())
+        assert response.html == PAGE[:1000]
+        assert crawler.stats["truncated"] == 1
+
+    abort = HTTPCrawlerConfig(max_body_bytes=1000)
+    async with AsyncHTTPCrawlerStrategy(browser_config=abort, http2=http2) as crawler:
+        with pytest.raises(BodyTooLargeError):
+            await crawler.crawl(f"{base}/page", config=CrawlerRunConfig())
+        assert crawler.stats["aborted"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("http2", [False, True])
+async def test_per_host_connection_limit(server, http2):
+    base, state = server
+    async with AsyncHTTPCrawlerStrategy(max_connections_per_host=2, http2=http2) as crawler:
+        await asyncio.gather(
+            *(crawler.crawl(f"{base}/slow/{i}", config=CrawlerRunConfig()) for i in range(6))
+        )
+    assert state["peak"] == 2
+
+
+def test_max_body_action_validation():
+    with pytest.raises(ValueError):
+        HTTPCrawlerConfig(max_body_action="drop")
+    assert HTTPCrawlerConfig(max_body_bytes=10).clone().max_body_bytes == 10
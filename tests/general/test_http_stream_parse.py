@@ -0,0 +1,63 @@
+"""
+Tests for incremental parsing of HTTP responses (HTTPCrawlerConfig.stream_parse).
+"""
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+PAGE = """<html><head><title>Streaming</title><meta charset="iso-8859-1"></head>
+<body><nav><a href="/home">Home</a></nav>
+<article><h1>Caf\xe9 report</h1>{}</article>
+<script>var x = 1;</script></body></html>""".format(
+    "".join(f"<p>Paragraph {i} with enough words to survive the threshold filter.</p>" for i in range(400))
+)
+
+
+@pytest_asyncio.fixture
+async def server():
+    async def page(request):
+        # No charset in the header, the parser has to honour <meta charset>
+        return web.Response(body=PAGE.encode("iso-8859-1"), headers={"Content-Type": "text/html"})
+
+    app = web.Application()
+    app.router.add_get("/page", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_stream_parse_builds_tree(server):
+    config = HTTPCrawlerConfig(stream_parse=True)
+    async with AsyncHTTPCrawlerStrategy(browser_config=config, chunk_size=1024) as crawler:
+        response = await crawler.crawl(f"{server}/page", config=CrawlerRunConfig())
+    tree = response.html_tree
+    assert tree is not None
+    assert tree.findtext(".//title") == "Streaming"
+    assert tree.findtext(".//h1") == "Caf\xe9 report"
+    assert len(tree.findall(".//p")) == 400
+    assert "html_tree" not in response.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_stream_parse_matches_string_parse(server):
+    run_config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+    results = []
+    for stream_parse in (False, True):
+        strategy = AsyncHTTPCrawlerStrategy(browser_config=HTTPCrawlerConfig(stream_parse=stream_parse))
+        async with AsyncWebCrawler(crawler_strategy=strategy) as crawler:
+            results.append(await crawler.arun(f"{server}/page", config=run_config))
+
+    plain, streamed = results
+    assert streamed.success
+    assert streamed.cleaned_html == plain.cleaned_html
+    assert streamed.markdown.raw_markdown == plain.markdown.raw_markdown
+    assert streamed.links == plain.links
+    assert streamed.metadata == plain.metadata
@@ -0,0 +1,138 @@
+"""
+Tests for HybridCrawlerStrategy and its JS-required detector.
+"""
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import (
+    HTTPStatusError,
+    HybridCrawlerStrategy,
+    JSRequiredDetector,
+)
+from crawl4ai.models import AsyncCrawlResponse
+
+ARTICLE = "<html><body><article><p>{}</p></article></body></html>".format(
+    " ".join(f"word{i}" for i in range(120))
+)
+SPA_SHELL = '<html><body><div id="root"></div><script src="/bundle.js"></script></body></html>'
+NOSCRIPT = (
+    "<html><body><noscript>You need to enable JavaScript to run this app.</noscript>"
+    "<div id='main'>{}</div></body></html>".format(" ".join(["text"] * 100))
+)
+
+
+def test_detector_accepts_server_rendered_page():
+    assert JSRequiredDetector().detect(ARTICLE) is None
+
+
+@pytest.mark.parametrize(
+    "html, reason",
+    [
+        ("", "empty_body"),
+        ("<html><body><script>render()</script></body></html>", "empty_body"),
+        (SPA_SHELL, "spa_shell"),
+        (NOSCRIPT, "noscript"),
+        ("<html><body><p>Loading...</p></body></html>", "word_count"),
+    ],
+)
+def test_detector_fires(html, reason):
+    assert JSRequiredDetector().detect(html) == reason
+
+
+def test_detector_required_selectors():
+    pytest.importorskip("cssselect")
+    detector = JSRequiredDetector(required_selectors=["article p"])
+    assert detector.detect(ARTICLE) is None
+    assert JSRequiredDetector(required_selectors=[".price"]).detect(ARTICLE) == "missing_selector"
+
+
+class _FakeStrategy:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.calls.append(url)
+        page = self.pages(url)
+        if isinstance(page, Exception):
+            raise page
+        return AsyncCrawlResponse(html=page, response_headers={}, status_code=200)
+
+
+def _hybrid(http_pages, **kwargs):
+    strategy = HybridCrawlerStrategy(**kwargs)
+    strategy.http_strategy = _FakeStrategy(http_pages)
+    strategy.browser_strategy = _FakeStrategy(lambda url: ARTICLE)
+    strategy._browser_started = True
+    return strategy
+
+
+@pytest.mark.asyncio
+async def test_server_rendered_page_stays_on_http():
+    strategy = _hybrid(lambda url: ARTICLE)
+    response = await strategy.crawl("https://example.com/a", config=CrawlerRunConfig())
+    assert response.html == ARTICLE
+    assert strategy.browser_strategy.calls == []
+    assert strategy.escalation_rate("example.com") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_spa_shell_escalates_to_browser():
+    strategy = _hybrid(lambda url: SPA_SHELL)
+    await strategy.crawl("https://spa.example/a", config=CrawlerRunConfig())
+    assert strategy.http_strategy.calls == ["https://spa.example/a"]
+    assert strategy.browser_strategy.calls == ["https://spa.example/a"]
+    assert strategy.stats["escalated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_status_error_escalates_to_browser():
+    strategy = _hybrid(lambda url: HTTPStatusError(403, "Forbidden"))
+    response = await strategy.crawl("https://blocked.example/", config=CrawlerRunConfig())
+    assert response.html == ARTICLE
+    assert strategy.browser_strategy.calls == ["https://blocked.example/"]
+
+
+@pytest.mark.asyncio
+async def test_browser_only_options_skip_http():
+    strategy = _hybrid(lambda url: ARTICLE)
+    await strategy.crawl("https://example.com/", config=CrawlerRunConfig(screenshot=True))
+    assert strategy.http_strategy.calls == []
+    assert strategy.browser_strategy.calls == ["https://example.com/"]
+
+
+@pytest.mark.asyncio
+async def test_js_domain_learns_to_skip_http():
+    strategy = _hybrid(
+        lambda url: SPA_SHELL if "spa.example" in url else ARTICLE,
+        min_domain_samples=3,
+        escalation_threshold=0.8,
+        reprobe_interval=4,
+    )
+    config = CrawlerRunConfig()
+    for i in range(3):
+        await strategy.crawl(f"https://spa.example/{i}", config=config)
+    assert len(strategy.http_strategy.calls) == 3
+
+    # Learned: next pages on the domain go straight to the browser
+    for i in range(3, 7):
+        await strategy.crawl(f"https://spa.example/{i}", config=config)
+    assert len(strategy.http_strategy.calls) == 3
+    assert strategy.stats["skipped_http"] == 4
+
+    # After reprobe_interval skipped crawls, HTTP is tried once more
+    await strategy.crawl("https://spa.example/7", config=config)
+    assert strategy.http_strategy.calls[-1] == "https://spa.example/7"
+
+    # Other domains are unaffected
+    await strategy.crawl("https://news.example/", config=config)
+    assert strategy.http_strategy.calls[-1] == "https://news.example/"
+
+
+@pytest.mark.asyncio
+async def test_raw_content_never_starts_browser():
+    strategy = HybridCrawlerStrategy()
+    async with strategy:
+        response = await strategy.crawl(f"raw:{ARTICLE}", config=CrawlerRunConfig())
+    assert response.html == ARTICLE
+    assert strategy._browser_started is False
@@ -0,0 +1,54 @@
+"""
+Tests that fit_html is only built when something asks for it.
+"""
+import pytest
+
+import crawl4ai.async_webcrawler as webcrawler_module
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.utils import preprocess_html_for_schema
+
+PAGE = "<html><head><title>t</title></head><body><h1>Lazy</h1><p>Some paragraph text.</p></body></html>"
+
+
+@pytest.fixture
+def preprocess_calls(monkeypatch):
+    calls = []
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return preprocess_html_for_schema(*args, **kwargs)
+
+    monkeypatch.setattr(webcrawler_module, "preprocess_html_for_schema", counting)
+    return calls
+
+
+async def _crawl(config):
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        return await crawler.arun(f"raw:{PAGE}", config=config)
+
+
+@pytest.mark.asyncio
+async def test_default_config_defers_fit_html(preprocess_calls):
+    result = await _crawl(CrawlerRunConfig(cache_mode=CacheMode.BYPASS))
+    assert result.success
+    assert preprocess_calls == []
+
+    assert "Lazy" in result.fit_html
+    assert result.fit_html == preprocess_html_for_schema(PAGE, text_threshold=500, max_size=300_000)
+    assert preprocess_calls == [1]
+    assert result.model_dump()["fit_html"] == result.fit_html
+
+
+@pytest.mark.asyncio
+async def test_fit_html_markdown_source_computes_once(preprocess_calls):
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        markdown_generator=DefaultMarkdownGenerator(content_source="fit_html"),
+    )
+    result = await _crawl(config)
+    assert "Lazy" in result.markdown.raw_markdown
+    assert preprocess_calls == [1]
+    assert "Lazy" in result.fit_html
+    assert preprocess_calls == [1]
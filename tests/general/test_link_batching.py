@@ -0,0 +1,62 @@
+"""
+Tests for the batched link classification and scoring used by the scraper.
+"""
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+from crawl4ai.utils import (
+    calculate_link_intrinsic_score,
+    calculate_link_intrinsic_scores,
+    classify_links,
+    extract_page_context,
+    get_base_domain,
+    is_external_url,
+)
+
+URLS = [
+    "https://example.com/docs",
+    "https://www.example.com/",
+    "https://blog.example.com/post/1",
+    "https://other.co.uk/a",
+    "http://other.co.uk:8080/b",
+    "mailto:someone@example.com",
+    "ftp://example.com/file",
+    "javascript:void(0)",
+    "about:blank",
+]
+
+
+def test_classify_links_matches_per_url_checks():
+    domains, external = classify_links(URLS, "example.com")
+    assert domains == [get_base_domain(url) for url in URLS]
+    assert external == [is_external_url(url, "example.com") for url in URLS]
+
+
+def test_batch_scores_match_single_scores():
+    context = extract_page_context(
+        "API reference guide", "Getting started with the client", "", "https://docs.example.com/"
+    )
+    links = [
+        ("API reference for clients", "https://docs.example.com/api/client", "", "nav-link", ""),
+        ("Read more", "https://docs.example.com/blog/x", "More", "promo", "nofollow"),
+        ("API reference for clients", "http://docs.example.com/a/b/c/d/e/f", "Client API", "nav-link", "next"),
+        ("", "https://docs.example.com/", "", "", ""),
+    ]
+    batch = calculate_link_intrinsic_scores(*map(list, zip(*links)), context)
+    assert batch == [calculate_link_intrinsic_score(*link, context) for link in links]
+
+
+def test_scraper_reports_first_occurrence_and_drops_excluded_links():
+    html = (
+        "<html><head><title>Index</title></head><body>"
+        "<a href='/docs/'>Docs</a><a href='/docs'>Docs again</a>"
+        "<a href='https://ads.tracker.net/x'>Ad</a><a href='https://partner.org/p'>Partner</a>"
+        "<a href='https://ads.tracker.net/y'>Ad 2</a></body></html>"
+    )
+    result = LXMLWebScrapingStrategy().scrap(
+        "https://example.com/", html, exclude_domains=["tracker.net"], score_links=True
+    )
+
+    assert [(link.href, link.text) for link in result.links.internal] == [("https://example.com/docs", "Docs")]
+    assert [link.href for link in result.links.external] == ["https://partner.org/p"]
+    assert result.links.external[0].base_domain == "partner.org"
+    assert result.links.internal[0].intrinsic_score > 0
+    assert "tracker.net" not in result.cleaned_html
@@ -0,0 +1,88 @@
+"""
+Tests for the link preview stage of AsyncWebCrawler and its crawl-wide head cache.
+"""
+from collections import Counter
+
+import httpx
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LinkPreviewConfig
+from crawl4ai.async_url_seeder import AsyncUrlSeeder
+
+
+def page(title, links):
+    anchors = "".join(f"<a href='{href}'>{text}</a>" for href, text in links)
+    return f"<html><head><title>{title}</title></head><body><nav>{anchors}</nav><p>{title} body</p></body></html>"
+
+
+NAV = [("/docs", "Docs"), ("/pricing", "Pricing")]
+
+
+@pytest.fixture
+def requests():
+    return Counter()
+
+
+@pytest.fixture
+def crawler(tmp_path, requests):
+    def handler(request):
+        requests[request.url.path] += 1
+        title = request.url.path.strip("/").capitalize()
+        return httpx.Response(
+            200,
+            html=f"<html><head><title>{title} page</title><meta name='description' content='About {title}'></head></html>",
+        )
+
+    crawler = AsyncWebCrawler(base_directory=str(tmp_path))
+    crawler.url_seeder = AsyncUrlSeeder(base_directory=tmp_path, cache_root=tmp_path / "seeder")
+    # Keep the seeder's ownership of its client, only route it to the handler
+    crawler.url_seeder.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return crawler
+
+
+async def process(crawler, url, html, config):
+    return await crawler.aprocess_html(
+        url=url, html=html, extracted_content="", config=config,
+        screenshot_data=None, pdf_data=None, verbose=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_nav_links_are_fetched_once_per_crawl(crawler, requests):
+    config = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True))
+
+    first = await process(crawler, "https://example.com/", page("Home", NAV), config)
+    second = await process(crawler, "https://example.com/blog", page("Blog", NAV + [("/about", "About")]), config)
+
+    assert requests == {"/docs": 1, "/pricing": 1, "/about": 1}
+    for result in (first, second):
+        docs = next(link for link in result.links["internal"] if link["href"] == "https://example.com/docs")
+        assert docs["head_extraction_status"] == "valid"
+        assert docs["head_data"]["title"] == "Docs page"
+
+
+@pytest.mark.asyncio
+async def test_scores_do_not_leak_between_queries(crawler, requests):
+    html = page("Home", NAV)
+    docs_config = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True, query="docs"))
+    plain_config = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True))
+
+    scored = await process(crawler, "https://example.com/", html, docs_config)
+    plain = await process(crawler, "https://example.com/", html, plain_config)
+
+    assert sum(requests.values()) == 2
+    assert any(link["contextual_score"] is not None for link in scored.links["internal"])
+    assert all(link["contextual_score"] is None for link in plain.links["internal"])
+    assert all("relevance_score" not in link["head_data"] for link in plain.links["internal"])
+
+
+@pytest.mark.asyncio
+async def test_close_releases_seeder_and_cache(crawler):
+    config = CrawlerRunConfig(link_preview_config=LinkPreviewConfig(include_internal=True))
+    await process(crawler, "https://example.com/", page("Home", NAV), config)
+    client = crawler.url_seeder.client
+
+    await crawler.close()
+
+    assert crawler.link_preview is None and crawler.url_seeder is None
+    assert client.is_closed
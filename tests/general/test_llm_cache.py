@@ -0,0 +1,84 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+import litellm
+
+from crawl4ai import LLMConfig, LLMExtractionStrategy, SQLiteLLMCache, set_llm_cache
+from crawl4ai.models import TokenUsage
+from crawl4ai.utils import perform_completion_with_backoff
+
+
+def fake_response(content, total_tokens=30):
+    return litellm.ModelResponse(
+        choices=[{"message": {"content": content, "role": "assistant"}, "index": 0, "finish_reason": "stop"}],
+        usage={"prompt_tokens": total_tokens - 10, "completion_tokens": 10, "total_tokens": total_tokens},
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SQLiteLLMCache(str(tmp_path / "llm_cache.db"))
+    set_llm_cache(cache)
+    yield cache
+    set_llm_cache(None)
+    cache.close()
+
+
+def test_calls_are_answered_from_the_cache(cache, monkeypatch, tmp_path):
+    prompts = []
+
+    def fake_completion(model, messages, **kwargs):
+        prompts.append(messages[0]["content"])
+        return fake_response(f"answer {len(prompts)}")
+
+    monkeypatch.setattr(litellm, "completion", fake_completion)
+    first = perform_completion_with_backoff("openai/gpt-4o-mini", "Extract\n  {schema}", "key")
+    # Whitespace differences and the API key do not change the answer
+    second = perform_completion_with_backoff("openai/gpt-4o-mini", "Extract {schema}  ", "other key")
+    other_model = perform_completion_with_backoff("openai/gpt-4o", "Extract {schema}", "key")
+    uncached = perform_completion_with_backoff("openai/gpt-4o-mini", "Extract {schema}", "key", use_cache=False)
+
+    assert len(prompts) == 3
+    assert second.choices[0].message.content == first.choices[0].message.content == "answer 1"
+    assert other_model.choices[0].message.content == "answer 2"
+    assert uncached.choices[0].message.content == "answer 3"
+    assert (cache.hits, cache.misses, cache.saved_tokens) == (1, 2, 30)
+
+    assert TokenUsage.from_response(first) == TokenUsage(10, 20, 30, {}, {}, cache_misses=1)
+    assert TokenUsage.from_response(second) == TokenUsage(cache_hits=1, saved_tokens=30)
+
+    # Persistent across processes
+    reopened = SQLiteLLMCache(cache.path)
+    set_llm_cache(reopened)
+    assert perform_completion_with_backoff("openai/gpt-4o-mini", "Extract {schema}", "key").choices[0].message.content == "answer 1"
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_rerunning_an_extraction_reports_saved_tokens(cache, monkeypatch):
+    calls = []
+
+    async def fake_acompletion(model, messages, **kwargs):
+        calls.append(model)
+        return fake_response('[{"title": "Hello"}]', total_tokens=50)
+
+    monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+    llm_config = LLMConfig(provider="openai/gpt-4o-mini", api_token="key")
+
+    first = LLMExtractionStrategy(llm_config=llm_config, schema={"title": "string"}, force_json_response=True)
+    assert await first.arun("https://example.com/", ["Hello world"]) == [{"title": "Hello", "error": False}]
+    second = LLMExtractionStrategy(llm_config=llm_config, schema={"title": "string"}, force_json_response=True)
+    assert await second.arun("https://example.com/", ["Hello world"]) == [{"title": "Hello", "error": False}]
+    changed = LLMExtractionStrategy(llm_config=llm_config, schema={"title": "string", "price": "number"}, force_json_response=True)
+    await changed.arun("https://example.com/", ["Hello world"])
+
+    assert len(calls) == 2
+    assert (first.total_usage.total_tokens, first.total_usage.cache_misses) == (50, 1)
+    assert (second.total_usage.total_tokens, second.total_usage.cache_hits, second.total_usage.saved_tokens) == (0, 1, 50)
+    assert changed.total_usage.cache_misses == 1
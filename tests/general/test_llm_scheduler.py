@@ -0,0 +1,165 @@
+"""
+Tests for the process-wide LLM rate limit scheduler and async (batched) LLM extraction.
+"""
+import asyncio
+import os
+import re
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+from crawl4ai import LLMConfig, LLMExtractionStrategy
+from crawl4ai import extraction_strategy
+from crawl4ai.llm_scheduler import LLMBudget, LLMScheduler, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_budget_spaces_requests_and_tokens():
+    clock = FakeClock()
+    budget = LLMBudget(requests_per_minute=60, window=2.0, clock=clock)
+    # Two seconds of budget go out at once, then one request per second
+    assert [budget.reserve() for _ in range(4)] == [0, 0, 1.0, 2.0]
+    clock.now += 10
+    assert budget.reserve() == 0
+
+    budget = LLMBudget(tokens_per_minute=6000, window=0, clock=clock)
+    assert budget.reserve(100) == pytest.approx(1.0)
+    # The call used 200 tokens instead of 100, the next one waits for both
+    budget.settle(100, 200)
+    assert budget.reserve(100) == pytest.approx(3.0)
+
+
+def test_retry_after_blocks_the_budget():
+    clock = FakeClock()
+    budget = LLMBudget(clock=clock)
+    budget.block(5)
+    assert budget.reserve() == 5
+    clock.now += 5
+    assert budget.reserve() == 0
+
+    assert retry_after_seconds(SimpleNamespace(headers={"retry-after": "7"})) == 7
+    response = SimpleNamespace(headers={"retry-after-ms": "1500"})
+    assert retry_after_seconds(SimpleNamespace(headers=None, response=response)) == 1.5
+    assert retry_after_seconds(SimpleNamespace(headers={"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) is None
+    assert retry_after_seconds(ValueError()) is None
+
+
+@pytest.mark.asyncio
+async def test_pages_take_turns_on_a_shared_budget():
+    scheduler = LLMScheduler()
+    scheduler.configure("test/model", requests_per_minute=6000, window=0)
+    order = []
+
+    async def call(owner, name):
+        await scheduler.acquire("test/model", owner=owner)
+        order.append(name)
+
+    # A large page queues four calls before a small page queues its one
+    await asyncio.gather(*[call("a", f"a{i}") for i in range(4)], call("b", "b0"))
+    assert order == ["a0", "b0", "a1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_arun_extracts_chunks_concurrently_in_order(monkeypatch):
+    in_flight = []
+    calls = []
+
+    async def fake_completion(provider, prompt, api_token, **kwargs):
+        calls.append(kwargs)
+        section = next(word for word in ("zzalpha", "zzbeta", "zzomega") if word in prompt)
+        in_flight.append(1)
+        # The first chunk finishes last
+        await asyncio.sleep(0.03 if section == "zzalpha" else 0.01)
+        concurrent = len(in_flight)
+        in_flight.pop()
+        usage = SimpleNamespace(
+            completion_tokens=1, prompt_tokens=2, total_tokens=3,
+            completion_tokens_details=None, prompt_tokens_details=None,
+        )
+        message = SimpleNamespace(content=f'[{{"section": "{section}", "concurrent": {concurrent}}}]')
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(extraction_strategy, "aperform_completion_with_backoff", fake_completion)
+    strategy = LLMExtractionStrategy(
+        llm_config=LLMConfig(provider="openai/gpt-4o-mini", api_token="key", requests_per_minute=100),
+        force_json_response=True,
+        chunk_token_threshold=1,
+        overlap_rate=0,
+    )
+    blocks = await strategy.arun("https://example.com/", ["zzalpha", "zzbeta", "zzomega"])
+
+    assert [block["section"] for block in blocks] == ["zzalpha", "zzbeta", "zzomega"]
+    assert max(block["concurrent"] for block in blocks) == 3
+    assert strategy.total_usage.total_tokens == 9
+    assert calls[0]["owner"] == "https://example.com/"
+    assert calls[0]["requests_per_minute"] == 100
+
+
+def batching_strategy(monkeypatch, answer_batch, **kwargs):
+    """LLMExtractionStrategy whose LLM answers batches with answer_batch(documents) and pages on their own."""
+    calls = []
+
+    async def fake_completion(provider, prompt, api_token, **call_kwargs):
+        documents = re.findall(r'<document id="(\d+)" url="[^"]+">\n(\w+)', prompt)
+        calls.append([page for _, page in documents] or "single")
+        if documents:
+            content = answer_batch(documents)
+        else:
+            page = re.search(r"example\.com/(zz\w+)", prompt).group(1)
+            content = f'<blocks>[{{"page": "{page}", "batched": false}}]</blocks>'
+        usage = SimpleNamespace(
+            completion_tokens=1, prompt_tokens=2, total_tokens=3,
+            completion_tokens_details=None, prompt_tokens_details=None,
+        )
+        return SimpleNamespace(usage=usage, choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    monkeypatch.setattr(extraction_strategy, "aperform_completion_with_backoff", fake_completion)
+    strategy = LLMExtractionStrategy(
+        llm_config=LLMConfig(provider="openai/gpt-4o-mini", api_token="key"), batch_wait=0.05, **kwargs
+    )
+    return strategy, calls
+
+
+async def extract_pages(strategy, pages):
+    results = await asyncio.gather(*[strategy.arun(f"https://example.com/{page}", [page]) for page in pages])
+    return {page: blocks for page, blocks in zip(pages, results)}
+
+
+@pytest.mark.asyncio
+async def test_small_pages_share_batched_calls(monkeypatch):
+    def answer_batch(documents):
+        # The answer leaves out the last document, which is extracted on its own
+        return "\n".join(
+            f'<blocks document="{ix}">[{{"page": "{page}", "batched": true}}]</blocks>' for ix, page in documents[:-1]
+        )
+
+    strategy, calls = batching_strategy(monkeypatch, answer_batch, batch_token_budget=1000)
+    pages = ["zzalpha", "zzbeta", "zzgamma"]
+    results = await extract_pages(strategy, pages)
+
+    assert calls == [pages, "single"]
+    for page in pages:
+        assert [block["page"] for block in results[page]] == [page]
+    assert [results[page][0]["batched"] for page in pages] == [True, True, False]
+    assert strategy.total_usage.total_tokens == 6
+
+
+@pytest.mark.asyncio
+async def test_batches_respect_the_budget_and_fall_back_when_malformed(monkeypatch):
+    strategy, calls = batching_strategy(monkeypatch, lambda documents: "<blocks>not json", batch_token_budget=2)
+    # Each page is one estimated token, two fill a batch
+    pages = ["zzalpha", "zzbravo", "zzgamma"]
+    results = await extract_pages(strategy, pages)
+
+    assert sorted(call for call in calls if call != "single") == [["zzalpha", "zzbravo"]]
+    assert calls.count("single") == 3
+    assert {page: results[page][0]["page"] for page in pages} == {page: page for page in pages}
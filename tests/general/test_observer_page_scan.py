@@ -0,0 +1,49 @@
+"""
+Tests for scan_full_page with scan_mode="observer".
+"""
+import pytest
+
+from crawl4ai import AsyncWebCrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+
+# Each time the sentinel scrolls into view, another tall section is appended
+INFINITE_FEED_HTML = """
+<html><body style="margin:0">
+<div id="feed"></div>
+<div id="sentinel" style="height:10px"></div>
+<script>
+    const feed = document.getElementById('feed');
+    const add = () => {
+        const section = document.createElement('section');
+        section.style.height = '1000px';
+        section.textContent = 'section ' + feed.children.length;
+        feed.appendChild(section);
+    };
+    add();
+    new IntersectionObserver((entries) => {
+        if (entries[0].isIntersecting) add();
+    }).observe(document.getElementById('sentinel'));
+</script>
+</body></html>
+"""
+
+
+def test_scan_mode_validation():
+    assert CrawlerRunConfig(scan_mode="observer").clone().scan_mode == "observer"
+    with pytest.raises(ValueError):
+        CrawlerRunConfig(scan_mode="fast")
+
+
+@pytest.mark.asyncio
+async def test_observer_scan_stops_on_growth_budget():
+    config = CrawlerRunConfig(
+        scan_full_page=True,
+        scan_mode="observer",
+        scan_growth_budget=3000,
+    )
+    async with AsyncWebCrawler() as crawler:
+        result = await crawler.arun(f"raw:{INFINITE_FEED_HTML}", config=config)
+
+    assert result.success
+    assert "section 3" in result.html
+    assert "section 20" not in result.html
@@ -0,0 +1,91 @@
+"""
+Tests for the ParsedDocument shared across scraping, filters, markdown and extraction.
+"""
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.content_filter_strategy import PruningContentFilter
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+from crawl4ai.extraction_strategy import JsonXPathExtractionStrategy
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.parsed_document import ParsedDocument
+
+PAGE = """<!DOCTYPE html><html><head><title>Products</title></head><body>
+<nav><a href="/">Home</a> | <a href="/about">About</a></nav>
+<main>
+  <h1>Catalogue</h1>
+  <div class="product"><h2>Kettle</h2><span class="price">$25</span>
+    <p>A stainless steel kettle that boils a litre of water in under three minutes.</p></div>
+  <div class="product"><h2>Toaster</h2><span class="price">$40</span>
+    <p>Four slots, seven browning levels and a defrost setting for frozen bread.</p></div>
+</main>
+<footer>Copyright</footer>
+</body></html>"""
+
+SCHEMA = {
+    "name": "products",
+    "baseSelector": "//div[@class='product']",
+    "fields": [
+        {"name": "name", "selector": ".//h2", "type": "text"},
+        {"name": "price", "selector": ".//span[@class='price']", "type": "text"},
+    ],
+}
+
+
+def test_scraper_uses_and_records_document():
+    document = ParsedDocument(PAGE, url="https://shop.example")
+    result = LXMLWebScrapingStrategy().scrap("https://shop.example", PAGE, document=document)
+
+    assert document.parse_count == 1
+    assert document.cleaned_html == result.cleaned_html
+    # The scraper's own tree is reused, no parse of cleaned_html
+    assert document.cleaned_tree.findtext(".//h1") == "Catalogue"
+    assert document.parse_count == 1
+
+
+def test_scraper_without_document_is_unchanged():
+    with_doc = LXMLWebScrapingStrategy().scrap(
+        "https://shop.example", PAGE, document=ParsedDocument(PAGE)
+    )
+    without_doc = LXMLWebScrapingStrategy().scrap("https://shop.example", PAGE)
+    assert with_doc.cleaned_html == without_doc.cleaned_html
+    assert with_doc.links == without_doc.links
+
+
+def test_retained_tree_survives_scraping():
+    document = ParsedDocument(PAGE, retain_tree=True)
+    LXMLWebScrapingStrategy().scrap("https://shop.example", PAGE, document=document)
+    # The scraper removed <nav> from its copy, the shared raw tree still has it
+    assert document.tree.find(".//nav") is not None
+
+    extracted = JsonXPathExtractionStrategy(SCHEMA).run(
+        "https://shop.example", [PAGE], document=document
+    )
+    assert extracted == [{"name": "Kettle", "price": "$25"}, {"name": "Toaster", "price": "$40"}]
+    assert document.parse_count == 1
+
+
+def test_filter_document_matches_filter_content():
+    document = ParsedDocument(PAGE)
+    LXMLWebScrapingStrategy().scrap("https://shop.example", PAGE, document=document)
+    content_filter = PruningContentFilter()
+    assert content_filter.filter_document(document) == content_filter.filter_content(
+        document.cleaned_html
+    )
+
+
+@pytest.mark.asyncio
+async def test_pipeline_output_is_unchanged():
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        markdown_generator=DefaultMarkdownGenerator(content_filter=PruningContentFilter()),
+        extraction_strategy=JsonXPathExtractionStrategy(SCHEMA),
+    )
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        result = await crawler.arun(f"raw:{PAGE}", config=config)
+
+    assert result.success
+    assert "Catalogue" in result.markdown.raw_markdown
+    assert "Kettle" in result.markdown.fit_markdown
+    assert '"price": "$40"' in result.extracted_content
@@ -0,0 +1,141 @@
+"""
+Tests for the content-type preflight (PreflightConfig / ContentTypePreflight).
+"""
+import os
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig, PreflightConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.preflight import (
+    ContentTypePreflight,
+    category_from_bytes,
+    category_from_content_type,
+)
+
+PAGE = "<html><body><p>Hello preflight</p></body></html>"
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 2048
+
+
+@pytest_asyncio.fixture
+async def server():
+    hits = {"head": 0, "get": 0}
+
+    async def page(request):
+        hits[request.method.lower()] = hits.get(request.method.lower(), 0) + 1
+        return web.Response(text=PAGE, content_type="text/html")
+
+    async def image(request):
+        hits[request.method.lower()] = hits.get(request.method.lower(), 0) + 1
+        # Generic content type, the bytes tell the truth
+        return web.Response(body=PNG, content_type="application/octet-stream")
+
+    async def no_head(request):
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        return web.Response(body=b"%PDF-1.4\n" + b"0" * 100, content_type="application/octet-stream")
+
+    app = web.Application()
+    app.router.add_route("*", "/article/{name}", page)
+    app.router.add_route("*", "/media/{name}", image)
+    app.router.add_route("*", "/nohead", no_head)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await runner.cleanup()
+
+
+def test_content_type_and_magic_number_mapping():
+    assert category_from_content_type("text/html; charset=utf-8") == "html"
+    assert category_from_content_type("application/pdf") == "pdf"
+    assert category_from_content_type("image/webp") == "image"
+    assert category_from_content_type("application/zip") == "archive"
+    assert category_from_content_type("application/rss+xml") == "feed"
+    assert category_from_bytes(b"%PDF-1.7") == "pdf"
+    assert category_from_bytes(PNG) == "image"
+    assert category_from_bytes(b"<!DOCTYPE html><html>") == "html"
+
+
+def test_preflight_config_validation():
+    with pytest.raises(ValueError):
+        PreflightConfig(probe="options")
+    with pytest.raises(ValueError):
+        PreflightConfig(routes={"pdf": "print"})
+    config = CrawlerRunConfig(preflight_config={"routes": {"video": "download"}})
+    assert config.preflight_config.routes["video"] == "download"
+    assert config.clone().preflight_config.routes["pdf"] == "pdf"
+
+
+@pytest.mark.asyncio
+async def test_extension_needs_no_network():
+    preflight = ContentTypePreflight()
+    result = await preflight.check("https://example.invalid/report.PDF", PreflightConfig())
+    assert (result.category, result.action, result.source) == ("pdf", "pdf", "extension")
+    await preflight.close()
+
+
+@pytest.mark.asyncio
+async def test_probe_and_host_rules(server):
+    base, hits = server
+    preflight = ContentTypePreflight()
+    config = PreflightConfig(host_rule_min_samples=2)
+
+    for i in range(2):
+        result = await preflight.check(f"{base}/article/{i}", config)
+        assert (result.category, result.source) == ("html", "probe")
+    assert hits["head"] == 2
+
+    # The host has now served extensionless HTML consistently, stop probing
+    result = await preflight.check(f"{base}/article/99", config)
+    assert (result.category, result.action, result.source) == ("html", "browser", "host_rule")
+    assert hits["head"] == 2
+
+    # Generic content type is resolved by sniffing the first bytes
+    result = await preflight.check(f"{base}/media/photo", PreflightConfig(probe="range"))
+    assert (result.category, result.action) == ("image", "download")
+
+    # HEAD rejected, fall back to a ranged GET
+    result = await preflight.check(f"{base}/nohead", config)
+    assert result.category == "pdf"
+    await preflight.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_host_falls_back_to_browser():
+    preflight = ContentTypePreflight()
+    result = await preflight.check("http://127.0.0.1:9/page", PreflightConfig(timeout=2))
+    assert (result.category, result.action, result.source) == ("unknown", "browser", "fallback")
+    await preflight.close()
+
+
+@pytest.mark.asyncio
+async def test_arun_routes_download_and_skip(server, tmp_path):
+    base, _ = server
+    config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        preflight_config=PreflightConfig(probe="range", download_dir=str(tmp_path)),
+    )
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        image = await crawler.arun(f"{base}/media/photo", config=config)
+        assert image.success
+        assert len(image.downloaded_files) == 1
+        with open(image.downloaded_files[0], "rb") as f:
+            assert f.read() == PNG
+
+        skip_config = config.clone(
+            preflight_config=config.preflight_config.clone(routes={"image": "skip"})
+        )
+        skipped = await crawler.arun(f"{base}/media/other", config=skip_config)
+        assert not skipped.success
+        assert "preflight" in skipped.error_message
+
+        page = await crawler.arun(f"{base}/article/a", config=config)
+        assert page.success
+        assert "Hello preflight" in page.markdown
+
+    assert os.listdir(tmp_path) == [os.path.basename(image.downloaded_files[0])]
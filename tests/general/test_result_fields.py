@@ -0,0 +1,120 @@
+"""
+Tests for CrawlerRunConfig.result_fields projection and spilling large result fields to disk.
+"""
+import gc
+import os
+
+import pytest
+
+from crawl4ai import AsyncWebCrawler, CacheMode, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.models import CrawlResult
+from crawl4ai.spill import SpilledField
+from crawl4ai.utils import ensure_content_dirs
+
+PAGE = (
+    "<html><head><title>Spill</title></head><body><main><h1>Results</h1>"
+    + "".join(f"<p>Paragraph {i} with <a href='/p/{i}'>a link</a> and some words to keep it.</p>" for i in range(200))
+    + "</main></body></html>"
+)
+
+
+class CountingGenerator(DefaultMarkdownGenerator):
+    calls = 0
+
+    def generate_markdown(self, *args, **kwargs):
+        CountingGenerator.calls += 1
+        return super().generate_markdown(*args, **kwargs)
+
+
+async def crawl(**options):
+    config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS, **options)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy()) as crawler:
+        return await crawler.arun(f"raw:{PAGE}", config=config)
+
+
+def test_unknown_result_fields_are_rejected():
+    with pytest.raises(ValueError, match="Unknown result_fields"):
+        CrawlerRunConfig(result_fields=["markdown", "body"])
+
+
+@pytest.mark.asyncio
+async def test_projection_keeps_requested_fields_only():
+    result = await crawl(result_fields=["links"])
+
+    assert result.success and result.status_code == 200
+    assert len(result.links["internal"]) == 200
+    assert result.html == "" and result.cleaned_html is None
+    assert result.markdown is None and result.fit_html is None
+    assert result.media == {} and result.metadata is None
+
+
+@pytest.mark.asyncio
+async def test_markdown_is_only_generated_when_needed():
+    CountingGenerator.calls = 0
+    await crawl(result_fields=["links"], markdown_generator=CountingGenerator())
+    assert CountingGenerator.calls == 0
+
+    schema = {"name": "p", "baseSelector": "p", "fields": [{"name": "text", "selector": "a", "type": "text"}]}
+    result = await crawl(
+        result_fields=["extracted_content"],
+        markdown_generator=CountingGenerator(),
+        extraction_strategy=JsonCssExtractionStrategy(schema),
+    )
+    assert CountingGenerator.calls == 0
+    assert '"text": "a link"' in result.extracted_content
+
+    result = await crawl(result_fields=["markdown"], markdown_generator=CountingGenerator())
+    assert CountingGenerator.calls == 1
+    assert "Paragraph 199" in result.markdown.raw_markdown
+
+
+@pytest.mark.asyncio
+async def test_large_fields_are_spilled(tmp_path):
+    full = await crawl()
+    result = await crawl(spill_threshold=1024, spill_dir=str(tmp_path))
+
+    for name in ("html", "cleaned_html"):
+        handle = result.spilled(name)
+        assert isinstance(handle, SpilledField) and os.path.dirname(handle.path) == str(tmp_path)
+        assert getattr(result, name) == getattr(full, name)
+        assert bytes(handle.mmap()[:6]) == getattr(full, name)[:6].encode()
+    assert result.markdown.raw_markdown == full.markdown.raw_markdown
+    # The deferred fit_html reads the spilled HTML instead of holding on to it
+    assert result.fit_html == full.fit_html
+    assert result.model_dump()["html"] == full.html
+
+    paths = [result.spilled(name).path for name in ("html", "cleaned_html")]
+    del result, handle
+    gc.collect()
+    assert not any(os.path.exists(path) for path in paths)
+
+
+def test_crawl_result_round_trips_with_spilled_fields(tmp_path):
+    result = CrawlResult(url="u", html="<p>x</p>", success=True, screenshot="aGVsbG8=", pdf=b"%PDF")
+    result.pdf = SpilledField.write(b"%PDF-1.7", str(tmp_path))
+    dumped = result.model_dump()
+    assert dumped["pdf"] == b"%PDF-1.7" and dumped["screenshot"] == "aGVsbG8="
+    assert CrawlResult(**dumped).pdf == b"%PDF-1.7"
+    assert CrawlResult(url="u", success=False).html == ""
+
+
+@pytest.mark.asyncio
+async def test_cached_results_keep_property_backed_fields(tmp_path):
+    db = AsyncDatabaseManager()
+    db.db_path = str(tmp_path / "cache.db")
+    db.content_paths = ensure_content_dirs(str(tmp_path))
+    await db.initialize()
+    result = await crawl()
+    try:
+        await db.acache_url(result)
+        cached = await db.aget_cached_url(result.url)
+    finally:
+        await db.cleanup()
+
+    assert cached.html == result.html and cached.cleaned_html == result.cleaned_html
+    assert cached.links == result.links and cached.media["images"] == result.media["images"]
+    assert cached.markdown.raw_markdown == result.markdown.raw_markdown
@@ -0,0 +1,138 @@
+"""
+Tests for the streaming result sinks and dispatcher backpressure.
+"""
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig, FileTreeSink, JSONLSink, MemoryAdaptiveDispatcher, ParquetSink, SemaphoreDispatcher
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+from crawl4ai.result_sinks import ResultSink, sink_for_path
+
+
+def make_result(url, **fields):
+    markdown = MarkdownGenerationResult(raw_markdown="Hello", markdown_with_citations="Hello", references_markdown="")
+    return CrawlResult(url=url, html="<p>Hello</p>", success=True, status_code=200, markdown=markdown, **fields)
+
+
+class FakeCrawler:
+    """Finishes crawls instantly, so only the sink limits the pace."""
+
+    def __init__(self):
+        self.finished = 0
+
+    async def arun(self, url, config=None, session_id=None):
+        await asyncio.sleep(0)
+        self.finished += 1
+        return make_result(url)
+
+
+class SlowSink(ResultSink):
+    def __init__(self, crawler, **kwargs):
+        super().__init__(**kwargs)
+        self.crawler = crawler
+        self.urls = []
+        self.max_held = 0
+
+    def _open(self):
+        pass
+
+    def _write(self, results):
+        self.max_held = max(self.max_held, self.crawler.finished - len(self.urls))
+        time.sleep(0.01)
+        self.urls.extend(result.url for result in results)
+
+
+class FailingSink(ResultSink):
+    def _open(self):
+        pass
+
+    def _write(self, results):
+        raise OSError("disk full")
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink_writes_one_record_per_line(tmp_path):
+    path = tmp_path / "out" / "results.jsonl"
+    async with JSONLSink(str(path)) as sink:
+        for i in range(5):
+            await sink.put(make_result(f"https://example.com/{i}", pdf=b"%PDF"))
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert sink.written == 5
+    assert [record["url"] for record in records] == [f"https://example.com/{i}" for i in range(5)]
+    assert records[0]["markdown"]["raw_markdown"] == "Hello"
+    assert records[0]["pdf"] == "JVBERg=="
+
+
+@pytest.mark.asyncio
+async def test_zstd_and_parquet_sinks(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    results = [make_result(f"https://example.com/{i}", metadata={"i": i}) for i in range(5)]
+    sinks = [sink_for_path(str(tmp_path / "results.jsonl.zst")), ParquetSink(str(tmp_path / "results.parquet"), row_group_size=2)]
+    assert isinstance(sinks[0], JSONLSink) and sinks[0].compression == "zstd"
+    for sink in sinks:
+        async with sink:
+            for result in results:
+                await sink.put(result)
+
+    with open(tmp_path / "results.jsonl.zst", "rb") as f:
+        lines = zstandard.ZstdDecompressor().stream_reader(f).read().decode().splitlines()
+    assert [json.loads(line)["url"] for line in lines] == [result.url for result in results]
+
+    assert pq.ParquetFile(tmp_path / "results.parquet").num_row_groups == 3
+    table = pq.read_table(tmp_path / "results.parquet")
+    assert table.column("url").to_pylist() == [result.url for result in results]
+    assert table.column("raw_markdown").to_pylist() == ["Hello"] * 5
+    assert json.loads(table.column("metadata")[4].as_py()) == {"i": 4}
+
+
+@pytest.mark.asyncio
+async def test_file_tree_sink_writes_a_directory_per_url(tmp_path):
+    sink = FileTreeSink(str(tmp_path))
+    result = make_result("https://example.com/a?b=1", extracted_content='[{"a": 1}]', screenshot="aGVsbG8=")
+    async with sink:
+        await sink.put(result)
+
+    directory = sink.path_for(result.url)
+    assert os.path.dirname(directory) == str(tmp_path / "example.com")
+    with open(os.path.join(directory, "result.json")) as f:
+        record = json.load(f)
+    assert record["url"] == result.url and "html" not in record
+    assert sorted(record["files"]) == ["extracted.json", "page.html", "page.md", "screenshot.png"]
+    with open(os.path.join(directory, "screenshot.png"), "rb") as f:
+        assert f.read() == b"hello"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dispatcher_class", [MemoryAdaptiveDispatcher, SemaphoreDispatcher])
+async def test_dispatchers_wait_for_a_slow_sink(dispatcher_class):
+    crawler = FakeCrawler()
+    urls = [f"https://example.com/{i}" for i in range(40)]
+    sink = SlowSink(crawler, max_pending=2, batch_size=2)
+    if dispatcher_class is MemoryAdaptiveDispatcher:
+        dispatcher = dispatcher_class(max_session_permit=4, check_interval=0.05, result_sink=sink)
+    else:
+        dispatcher = dispatcher_class(semaphore_count=4, result_sink=sink)
+
+    async with sink:
+        results = await dispatcher.run_urls(crawler=crawler, urls=urls, config=CrawlerRunConfig())
+
+    assert results == []
+    assert sorted(sink.urls) == sorted(urls)
+    # Queue, one batch being written and the crawls in flight
+    assert sink.max_held <= 2 + 2 + 4
+
+
+@pytest.mark.asyncio
+async def test_writer_errors_surface_in_put():
+    sink = FailingSink(max_pending=1, batch_size=1)
+    with pytest.raises(RuntimeError, match="disk full"):
+        async with sink:
+            for i in range(10):
+                await sink.put(make_result(f"https://example.com/{i}"))
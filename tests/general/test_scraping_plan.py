@@ -0,0 +1,54 @@
+"""
+Tests for ScrapingPlan, the compiled selectors and removal passes shared by pages
+scraped with the same options.
+"""
+from lxml import html as lhtml
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy, ScrapingPlan
+
+HTML = (
+    "<html><head><title>Plan</title><style>p {}</style></head><body>"
+    "<!-- tracking --><nav><a href='/home'>Home</a></nav>"
+    "<main><p>First paragraph with <em>some <b>bold</b> text</em> inside it.</p>"
+    "<form><input name='q'></form><img src='https://cdn.example.com/a.jpg' alt='A photo' width='400'>"
+    "<script>var x = 1;</script></main><footer>Footer text</footer></body></html>"
+)
+
+
+def test_plans_are_shared_across_pages_and_configs():
+    first = CrawlerRunConfig(excluded_tags=["nav", "footer"], remove_forms=True)
+    second = first.clone()
+    reordered = CrawlerRunConfig(excluded_tags=["footer", "nav"], remove_forms=True)
+
+    plan = ScrapingPlan.for_options(**first.__dict__)
+    assert ScrapingPlan.for_options(**second.__dict__) is plan
+    assert ScrapingPlan.for_options(**reordered.__dict__) is plan
+    assert ScrapingPlan.for_options(**CrawlerRunConfig().__dict__) is not plan
+
+
+def test_removals_are_merged_into_single_passes():
+    plan = ScrapingPlan.for_options(
+        excluded_tags=["nav"], remove_comments=True, exclude_all_images=True, remove_forms=True
+    )
+    root = lhtml.document_fromstring(HTML)
+    plan.remove(root, plan.early_removals)
+    plan.remove(root, plan.late_removals)
+
+    html = lhtml.tostring(root, encoding="unicode")
+    for removed in ("<nav", "<!--", "<img", "<form", "<script", "<style"):
+        assert removed not in html
+    assert "<footer>" in html
+
+
+def test_scrap_output_is_unchanged_by_options_order():
+    strategy = LXMLWebScrapingStrategy()
+    options = dict(excluded_tags=["nav", "footer"], remove_comments=True, remove_forms=True, only_text=True)
+    first = strategy.scrap("https://example.com/", HTML, **options)
+    again = strategy.scrap("https://example.com/", HTML, **{**options, "excluded_tags": ["footer", "nav"]})
+
+    assert first.cleaned_html == again.cleaned_html
+    assert "Home" not in first.cleaned_html and "Footer text" not in first.cleaned_html
+    # only_text still flattens inner tags before outer ones
+    assert "<span>some bold</span>" in first.cleaned_html
+    assert [img.src for img in first.media.images] == ["https://cdn.example.com/a.jpg"]
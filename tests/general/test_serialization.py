@@ -0,0 +1,72 @@
+"""
+Tests for the orjson/msgpack serialization layer and structured extracted content.
+"""
+import json
+from datetime import datetime
+
+import pytest
+
+from crawl4ai import serialization
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+from crawl4ai.serialization import json_dumps, json_loads, result_to_dict
+
+DATA = [{"title": "Café", "price": 3.5, "tags": ["a", "b"], "count": None}]
+
+
+def make_result(**fields):
+    markdown = MarkdownGenerationResult(raw_markdown="# Hi", markdown_with_citations="# Hi", references_markdown="")
+    return CrawlResult(
+        url="https://example.com/", html="<h1>Hi</h1>", success=True, status_code=200, markdown=markdown, **fields
+    )
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_json_matches_standard_library(monkeypatch, has_orjson):
+    if has_orjson and not serialization.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(serialization, "HAS_ORJSON", has_orjson)
+    value = {"pdf": b"%PDF", "when": datetime(2024, 1, 2, 3, 4, 5), 1: "int key", "text": "naïve", "list": DATA}
+
+    decoded = json.loads(json_dumps(value))
+    assert decoded == {
+        "pdf": "JVBERg==", "when": "2024-01-02T03:04:05", "1": "int key", "text": "naïve", "list": DATA,
+    }
+    assert json.loads(json_dumps(value, indent=True)) == decoded
+    assert json_dumps(value, indent=True).startswith(b"{\n  ")
+    assert json_loads(json_dumps(DATA)) == DATA
+
+
+def test_extracted_content_is_rendered_on_first_read():
+    result = make_result(extracted_data=DATA)
+    assert result.extracted_content_deferred
+    assert result.extracted_data is DATA
+
+    assert json.loads(result.extracted_content) == DATA
+    assert not result.extracted_content_deferred
+    assert CrawlResult(**result.model_dump()).extracted_data == DATA
+
+    result.extracted_content = '[{"a": 1}]'
+    assert result.extracted_data == [{"a": 1}]
+    result.extracted_content = "not json"
+    assert result.extracted_data is None and result.extracted_content == "not json"
+
+
+def test_result_to_dict_keeps_extraction_compact():
+    result = make_result(extracted_data=DATA, pdf=b"%PDF")
+    data = result_to_dict(result)
+
+    assert data["extracted_content"] == json.dumps(DATA, ensure_ascii=False, separators=(",", ":"))
+    assert result.extracted_content_deferred
+    assert data["pdf"] == "JVBERg=="
+    assert data["markdown"]["raw_markdown"] == "# Hi"
+    assert "extracted_content" not in result_to_dict(result, exclude={"extracted_content"})
+    assert "extracted_content" not in result_to_dict(result, include={"url"})
+    assert json_loads(json_dumps(data))["html"] == "<h1>Hi</h1>"
+
+
+def test_msgpack_keeps_bytes_binary():
+    pytest.importorskip("msgpack")
+    result = make_result(extracted_data=DATA, pdf=b"%PDF")
+    decoded = serialization.msgpack_loads(serialization.msgpack_dumps(result_to_dict(result, binary=True)))
+    assert decoded["pdf"] == b"%PDF"
+    assert json.loads(decoded["extracted_content"]) == DATA
@@ -0,0 +1,89 @@
+"""
+Tests for SiteTemplateCache and its use in LXMLWebScrapingStrategy.
+"""
+import pytest
+from lxml import html as lhtml
+
+from crawl4ai import CrawlerRunConfig, SiteTemplateCache
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+
+NAV = (
+    "<nav><ul><li class='{home}'><a href='/'>Home page of the shop</a></li>"
+    "<li class='{docs}'><a href='/docs'>Documentation and guides</a></li></ul></nav>"
+)
+FOOTER = "<footer><p>Copyright Example Shop Ltd. All rights reserved worldwide.</p></footer>"
+BANNER = "<div class='cookies'><p>We use cookies to improve your experience on this site.</p></div>"
+
+
+def _page(i, host_nav=True):
+    nav = NAV.format(home="active" if i % 2 else "", docs="" if i % 2 else "active")
+    return (
+        f"<html><head><title>Page {i}</title></head><body>{BANNER}{nav if host_nav else ''}"
+        f"<main><h1>Article {i}</h1><p>This is the unique body text of article number {i}, "
+        f"written for testing template stripping.</p><p>Read more</p></main>{FOOTER}</body></html>"
+    )
+
+
+def _scrap(cache, url, html):
+    return LXMLWebScrapingStrategy().scrap(url, html, template_cache=cache)
+
+
+def test_sampled_pages_are_untouched_and_later_pages_stripped():
+    cache = SiteTemplateCache(sample_pages=4)
+    for i in range(4):
+        result = _scrap(cache, f"https://shop.example/p/{i}", _page(i))
+        assert "Copyright" in result.cleaned_html
+        assert "We use cookies" in result.cleaned_html
+
+    result = _scrap(cache, "https://shop.example/p/9", _page(9))
+    html = result.cleaned_html
+    assert "Copyright" not in html
+    assert "We use cookies" not in html
+    assert "Documentation and guides" not in html
+    assert "unique body text of article number 9" in html
+    # Too short to count as a template block
+    assert "Read more" in html
+    assert cache.stats["sampled_pages"] == 4
+    assert cache.stats["stripped_pages"] == 1
+    assert cache.stats["stripped_elements"] == 3
+
+
+def test_hosts_are_learned_separately():
+    cache = SiteTemplateCache(sample_pages=3)
+    for i in range(3):
+        _scrap(cache, f"https://shop.example/p/{i}", _page(i))
+
+    assert cache.boilerplate("shop.example")
+    assert cache.boilerplate("other.example") is None
+    html = _scrap(cache, "https://other.example/p/1", _page(1)).cleaned_html
+    assert "Copyright" in html
+
+
+def test_blocks_below_min_frequency_are_kept():
+    cache = SiteTemplateCache(sample_pages=4, min_frequency=0.75)
+    # The nav only appears on two of the four sampled pages
+    for i in range(4):
+        _scrap(cache, f"https://shop.example/p/{i}", _page(i, host_nav=i < 2))
+
+    html = _scrap(cache, "https://shop.example/p/9", _page(9)).cleaned_html
+    assert "Documentation and guides" in html
+    assert "Copyright" not in html
+
+
+def test_fingerprints_ignore_classes_and_scripts():
+    cache = SiteTemplateCache()
+    first = lhtml.fromstring(NAV.format(home="active", docs="") + "<script>var n = 1;</script>")
+    second = lhtml.fromstring(NAV.format(home="", docs="active") + "<script>var n = 2;</script>")
+    assert set(cache.fingerprints(first).values()) == set(cache.fingerprints(second).values())
+
+
+def test_rejects_single_page_sample():
+    with pytest.raises(ValueError):
+        SiteTemplateCache(sample_pages=1)
+
+
+def test_config_carries_cache():
+    cache = SiteTemplateCache()
+    config = CrawlerRunConfig(template_cache=cache)
+    assert config.template_cache is cache
+    assert config.clone().template_cache is cache
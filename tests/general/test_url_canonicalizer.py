@@ -0,0 +1,104 @@
+"""
+Tests for URLCanonicalizer and the subsystems that share it.
+"""
+import pytest
+
+from crawl4ai import URLCanonicalizer, canonicalize_url
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+from crawl4ai.models import CrawlResult
+from crawl4ai.utils import normalize_url, normalize_url_for_deep_crawl
+
+BASE = "https://Example.com:443/docs/intro/"
+
+
+@pytest.mark.parametrize(
+    "href, expected",
+    [
+        ("/guide/", "https://example.com/guide"),
+        ("setup", "https://example.com/docs/intro/setup"),
+        ("../api#section", "https://example.com/docs/api"),
+        ("?utm_source=x&b=2&a=1", "https://example.com/docs/intro?a=1&b=2"),
+        ("/p?UTM_Medium=x&Page=2", "https://example.com/p?Page=2"),
+        ("HTTP://EXAMPLE.COM:80", "http://example.com/"),
+        ("https://example.com", "https://example.com/"),
+        ("/wiki/File:Logo.png", "https://example.com/wiki/File:Logo.png"),
+        ("/a b", "https://example.com/a%20b"),
+        ("mailto:Someone@Example.com", "mailto:Someone@Example.com"),
+        ("  /trimmed  ", "https://example.com/trimmed"),
+    ],
+)
+def test_canonical_forms(href, expected):
+    canonical = canonicalize_url(href, BASE)
+    assert canonical == expected
+    assert canonicalize_url(canonical) == canonical
+
+
+def test_options():
+    keep = URLCanonicalizer(keep_fragment=True, drop_tracking_params=False, sort_query=False)
+    assert keep.canonicalize("/a/?utm_source=x&b=1#top", BASE) == "https://example.com/a?utm_source=x&b=1#top"
+    extra = URLCanonicalizer(extra_drop_params=["SessionID"])
+    assert extra.canonicalize("/a?sessionid=1&q=2", BASE) == "https://example.com/a?q=2"
+
+
+def test_canonicalize_many_keeps_order_and_skips_bad_links():
+    hrefs = ["/a", "", None, "http://[::1", "/a/", "b"]
+    assert URLCanonicalizer().canonicalize_many(hrefs, BASE) == [
+        "https://example.com/a",
+        None,
+        None,
+        None,
+        "https://example.com/a",
+        "https://example.com/docs/intro/b",
+    ]
+
+
+def test_results_are_cached_per_base():
+    canonicalizer = URLCanonicalizer(max_bases=2)
+    canonicalizer.canonicalize_many(["/a", "/b"], "https://one.example/")
+    canonicalizer.canonicalize("/a", "https://two.example/")
+    assert canonicalizer._bases["https://one.example/"].results["/b"] == "https://one.example/b"
+
+    canonicalizer.canonicalize("/a", "https://three.example/")
+    assert list(canonicalizer._bases) == ["https://two.example/", "https://three.example/"]
+
+
+def test_resolve_only_joins():
+    canonicalizer = URLCanonicalizer()
+    assert canonicalizer.resolve("/x/?utm_source=y#f", "https://a.example/docs/page") == "https://a.example/x/?utm_source=y#f"
+    assert canonicalizer.resolve("img.png", "https://a.example/docs/page") == "https://a.example/docs/img.png"
+
+
+def test_legacy_normalizers_agree():
+    href = "/Guide/?utm_campaign=z#part"
+    assert normalize_url(href, BASE) == normalize_url_for_deep_crawl(href, BASE) == canonicalize_url(href, BASE)
+    assert normalize_url(href, BASE, keep_fragment=True) == "https://example.com/Guide#part"
+
+
+def test_cache_keys_keep_fragments_and_other_schemes():
+    assert AsyncDatabaseManager.cache_key("https://Example.com/app/?utm_source=x#/route") == "https://example.com/app#/route"
+    assert AsyncDatabaseManager.cache_key("raw:<html></html>") == "raw:<html></html>"
+
+
+@pytest.mark.asyncio
+async def test_deep_crawl_visits_each_spelling_once():
+    strategy = BFSDeepCrawlStrategy(max_depth=2)
+    start = "https://example.com"
+    visited = set(strategy.canonicalizer.canonicalize_many([start]))
+    result = CrawlResult(
+        url=start,
+        html="",
+        success=True,
+        links={
+            "internal": [
+                {"href": "https://example.com/"},
+                {"href": "https://example.com/docs/"},
+                {"href": "https://EXAMPLE.com/docs?utm_source=feed"},
+                {"href": "https://example.com/docs#install"},
+            ]
+        },
+    )
+    next_level, depths = [], {}
+    await strategy.link_discovery(result, start, 0, visited, next_level, depths)
+
+    assert next_level == [("https://example.com/docs", start)]